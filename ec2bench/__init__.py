@@ -0,0 +1 @@
+"""EKS EC2 벤치마크 저장소의 통합 CLI(ec2bench.cli). 패키지 import만으로는 저장소 모듈을 읽지 않는다."""
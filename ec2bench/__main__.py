@@ -0,0 +1,5 @@
+import sys
+
+from ec2bench.cli import main
+
+sys.exit(main())
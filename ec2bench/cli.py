@@ -0,0 +1,108 @@
+"""ec2bench — 저장소 스크립트들의 단일 진입점. 서브커맨드는 호출될 때만 로드한다.
+
+    ec2bench --help                       # 저장소 모듈을 하나도 import하지 않는다
+    ec2bench build --sizes=xlarge,2xlarge # = python scripts/dashboard/build_data.py --sizes=...
+    ec2bench plan gaps --out plan.json    # = python scripts/campaign/gaps.py --out plan.json
+    ec2bench report kafka                 # = python scripts/generate-kafka-report.py
+
+서브커맨드 = (스크립트 경로, 설명) 표. 실행은 그 스크립트의 디렉터리를 sys.path 맨 앞에 넣고
+runpy로 __main__ 실행 — 스크립트를 직접 돌린 것과 같은 argv/import 경로/종료 코드라 기존 스크립트는
+고칠 필요가 없다(각자의 --help도 그대로).
+
+로그 파싱 캐시(scripts/dashboard/.cache, cache.ParseCache)는 일부만 공유한다: run 건강도 판정
+(health.run_status)은 build/serve/validate/history와 plan gaps/adaptive가 같은 캐시를 쓰고, 로그 값
+캐시는 build/serve의 iperf3/redis/stress-ng 파서와 하드웨어 지문뿐이다. sysbench/nginx/elasticsearch/springboot
+파서, run 단위 값(runs.py — plan adaptive, history, api /runs), report 스크립트는 매번 로그를 다시 읽는다.
+
+저장소 위치: 이 패키지의 상위 디렉터리(pip install -e . 또는 저장소 루트에서 python -m ec2bench).
+다른 곳에 설치했다면 EC2BENCH_HOME으로 저장소 루트를 지정.
+"""
+import os
+import sys
+from pathlib import Path
+
+DASH = "scripts/dashboard"
+CAMPAIGN = "scripts/campaign"
+
+# 이름 -> (스크립트, 설명). 그룹 커맨드(plan/report/campaign/serve)는 두 번째 단어로 고른다.
+COMMANDS = {
+    "build": (f"{DASH}/build_data.py", "원시 로그 -> site/data 빌드 (--sizes= --region= --price-mix= --utilization= --compact --snapshot)"),
+    "validate": (f"{DASH}/validate.py", "site/data를 legacy/ 정답지와 대조 (벤치마크 지정 가능)"),
+    "legacy": (f"{DASH}/extract_legacy.py", "reports/*.html -> legacy/*.json 정답지 추출"),
+    "publish": (f"{DASH}/publish.py", "site/ -> 배포 트리(dist/, 해시 파일명 + 사전 압축)"),
+    "query": (f"{DASH}/query.py", "제약/목표로 인스턴스 고르기 (query columns = 컬럼 목록)"),
+    "history": (f"{DASH}/history.py", "run 값 스냅샷 save|list|diff"),
+    "pricing": (f"{DASH}/pricing.py", "구매 옵션별 가성비 rank | import-spot"),
+}
+GROUPS = {
+    "serve": ("로컬 서버", {
+        "site": (f"{DASH}/serve.py", "site/ 서빙 + 변경 감시 증분 재빌드 + 라이브 리로드 (기본)"),
+        "api": (f"{DASH}/api.py", "읽기 전용 HTTP JSON API (LRU + ETag)"),
+    }, "site"),
+    "plan": ("캠페인 계획 -> orchestrate --plan", {
+        "schedule": (f"{CAMPAIGN}/schedule.py", "노드시간 최소화 인스턴스별 체인 + 시뮬레이션"),
+        "adaptive": (f"{CAMPAIGN}/adaptive.py", "CI 목표 미달 단위만 추가 run"),
+        "gaps": (f"{CAMPAIGN}/gaps.py", "커버리지 구멍 -> 최소 재실행"),
+    }, None),
+    "campaign": ("클러스터 캠페인", {
+        "run": (f"{CAMPAIGN}/orchestrate.py", "병렬 캠페인 실행(--plan 지원)"),
+        "collect": (f"{CAMPAIGN}/collect.py", "완료 Job 로그 수집 + 증분 재빌드"),
+        "render": (f"{CAMPAIGN}/render.py", "매니페스트 렌더 + 용량 검증"),
+    }, None),
+    "report": ("레거시 HTML 리포트 생성", {
+        "clickhouse": ("scripts/generate-clickhouse-report.py", "results/clickhouse -> reports/"),
+        "geekbench": ("scripts/generate-geekbench-report.py", "Geekbench 리포트"),
+        "kafka": ("scripts/generate-kafka-report.py", "results/kafka -> data.json + reports/"),
+        "passmark": ("scripts/generate-passmark-report.py", "PassMark 리포트"),
+        "redis": ("scripts/generate-redis-report.py", "Redis 리포트"),
+        "redis-data": ("scripts/parse_redis_for_report.py", "Redis 리포트용 JSON"),
+        "stress-ng": ("scripts/generate-stress-ng-report.py", "stress-ng 리포트"),
+        "sysbench": ("scripts/generate-sysbench-report.py", "Sysbench 리포트"),
+    }, None),
+}
+
+
+def repo_root():
+    for root in (os.environ.get("EC2BENCH_HOME"), Path(__file__).resolve().parent.parent):
+        if root and (Path(root) / DASH / "build_data.py").is_file():
+            return Path(root)
+    raise SystemExit("저장소 루트를 찾지 못함 — 저장소에서 pip install -e . 하거나 EC2BENCH_HOME 지정")
+
+
+def usage():
+    lines = ["사용법: ec2bench <커맨드> [인자 ...]   (각 커맨드의 인자는 ec2bench <커맨드> --help)", ""]
+    lines += [f"  {name:<10} {desc}" for name, (_, desc) in COMMANDS.items()]
+    for name, (desc, subs, default) in GROUPS.items():
+        lines.append(f"  {name:<10} {desc}: {'|'.join(subs)}" + (f" (기본 {default})" if default else ""))
+    return "\n".join(lines)
+
+
+def resolve(argv):
+    """argv -> (스크립트 상대경로, 스크립트에 넘길 인자). 모르는 커맨드는 SystemExit(2)."""
+    if not argv or argv[0] in ("-h", "--help", "help"):
+        print(usage())
+        raise SystemExit(0)
+    name, rest = argv[0], argv[1:]
+    if name in COMMANDS:
+        return COMMANDS[name][0], rest
+    if name in GROUPS:
+        desc, subs, default = GROUPS[name]
+        if rest and rest[0] in subs:
+            return subs[rest[0]][0], rest[1:]
+        if default and not (rest and rest[0] in ("-h", "--help")):
+            return subs[default][0], rest
+        print(f"ec2bench {name} <{'|'.join(subs)}> — {desc}")
+        print("\n".join(f"  {sub:<12} {d}" for sub, (_, d) in subs.items()))
+        raise SystemExit(0 if rest[:1] in (["-h"], ["--help"]) else 2)
+    print(f"알 수 없는 커맨드: {name}\n\n{usage()}", file=sys.stderr)
+    raise SystemExit(2)
+
+
+def main(argv=None):
+    script, args = resolve(sys.argv[1:] if argv is None else argv)
+    path = repo_root() / script
+    import runpy
+    sys.argv = [str(path), *args]
+    sys.path.insert(0, str(path.parent))
+    runpy.run_path(str(path), run_name="__main__")
+    return 0
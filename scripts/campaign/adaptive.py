@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""적응형 run 수 — (벤치마크, 인스턴스)마다 지금까지의 run으로 신뢰구간을 보고 더 돌릴지 결정.
+
+    python scripts/campaign/adaptive.py [benchmark ...] [--instances a,b] [--sizes xlarge]
+        [--target 0.02] [--min-runs 3] [--max-runs 10] [--out plan.json]
+    python scripts/campaign/orchestrate.py --plan plan.json      # 'more'인 단위만, 인스턴스별 체인으로
+
+- 값: results/<dir>/<inst>/<log>의 run별 헤드라인(dashboard/runs.py RUN_METRICS — 대시보드 파서의
+  로그 단위 함수 재사용). health가 failed로 판정한 run은 제외. 헤드라인을 run 단위로 뽑을 수 없는
+  벤치마크(geekbench — 원시 로그의 MULTI_CORE_SCORE가 0)는 고정 run 수(DEFAULT_RUNS)를 그대로 둔다.
+- 판정: n ≥ min_runs이고 상대 CI 반폭 t(0.975, n-1)·s/√n / |평균| ≤ target이면 done. max_runs에
+  닿으면 capped. 아니면 more — 필요한 총 run 수 n* = ⌈(t·s / (target·|평균|))²⌉(max_runs 상한)를
+  지금 추정치로 잡고, 모자란 run만 계획에 넣는다. 다음 호출에서 다시 판정(순차 정지).
+- 정지 규칙을 매 run마다 보면 CI가 우연히 좁아진 순간 멈추는 편향이 생긴다 — min_runs 하한과
+  배치 단위(계획 → 실행 → 재판정)로 완화한다.
+- 계획 JSON은 schedule.py와 같은 chains 형식(인스턴스별 step 목록 + step별 runs = 목표 총 run 수)이라
+  orchestrate.py --plan이 그대로 읽는다. step의 rerun은 gaps.py와 같은 run 번호 목록 — 쓸 수 있는 run이
+  없는 자리(로그 없음/빈 로그/failed)를 번호가 낮은 것부터 모자란 수만큼 채운다. orchestrate는 rerun
+  run만 (깨진 로그를 덮어쓰며) 돌리므로 failed run이 끼어 있어도 끝나면 쓸 수 있는 run이 runs개가 된다.
+- 요약의 retro는 run이 DEFAULT_RUNS개 이상 모인 단위에 같은 규칙을 앞에서부터 적용했을 때 쓰였을
+  run 수(고정 DEFAULT_RUNS 대비 절감률)와 그때의 상대 CI — 규칙의 효과를 기존 데이터로 확인.
+- rerun 번호는 max_runs(기본 10)까지 올라가 orchestrate의 기본 run 범위(DEFAULT_RUNS)를 넘는다. 그런 Job을
+  collect.py로 받을 때는 `collect.py --plan <계획>` — Job 이름 대응 범위를 계획의 run 번호에서 잡는다.
+"""
+import argparse
+import json
+import math
+import sys
+from pathlib import Path
+
+import orchestrate
+from orchestrate import BENCHMARKS, DEFAULT_RUNS, RESULTS_DIR
+
+sys.path.insert(0, str(orchestrate.BASE_DIR / "scripts" / "dashboard"))
+from runs import RUN_METRICS, run_values  # noqa: E402
+
+DEFAULT_TARGET = 0.02
+DEFAULT_MIN_RUNS = 3
+DEFAULT_MAX_RUNS = 10
+# t 분포 0.975 분위수, 자유도 1..30 (그 이상은 1.96)
+T975 = [12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228, 2.201, 2.179, 2.160, 2.145, 2.131,
+        2.120, 2.110, 2.101, 2.093, 2.086, 2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042]
+
+
+def t975(df):
+    return T975[df - 1] if df <= len(T975) else 1.96
+
+
+def rel_ci(values):
+    """상대 CI 반폭(t·s/√n / |평균|). 표본 2개 미만/평균 0이면 None."""
+    n = len(values)
+    if n < 2:
+        return None
+    m = math.fsum(values) / n
+    if not m:
+        return None
+    s = math.sqrt(math.fsum((v - m) ** 2 for v in values) / (n - 1))
+    return t975(n - 1) * s / math.sqrt(n) / abs(m)
+
+
+def nonempty_runs(bench, instance, results_dir, max_runs=DEFAULT_MAX_RUNS):
+    """run 단위 값이 없는 벤치마크 — run1..max_runs 중 비어 있지 않은 로그의 run 번호."""
+    spec = BENCHMARKS[bench]
+    return [run for run in range(1, max_runs + 1)
+            if (p := orchestrate.log_path(results_dir, spec, instance, run)).exists() and p.stat().st_size > 0]
+
+
+def free_slots(have, count):
+    """쓸 수 있는 run 번호 집합 have 밖에서 번호가 낮은 자리 count개 — 깨진/빈 자리부터 채움."""
+    out, run = [], 1
+    while len(out) < count:
+        if run not in have:
+            out.append(run)
+        run += 1
+    return out
+
+
+def decide(values, target, min_runs, max_runs):
+    """run 값 목록 -> {n, mean, rel_ci, status(done|more|capped), runs(목표 총 run 수)}."""
+    n = len(values)
+    ci = rel_ci(values)
+    mean = math.fsum(values) / n if n else None
+    if n >= max_runs:
+        status, total = ("done" if ci is not None and ci <= target else "capped"), n
+    elif n >= min_runs and ci is not None and ci <= target:
+        status, total = "done", n
+    else:
+        need = min_runs
+        if ci is not None and n >= 2:
+            need = max(need, math.ceil((ci * math.sqrt(n) / target) ** 2))  # ci·√n = t·s/|평균| — t는 현재 자유도로 고정
+        status, total = "more", min(max(need, n + 1), max_runs)
+    return {"n": n, "mean": None if mean is None else round(mean, 4),
+            "rel_ci": None if ci is None else round(ci, 4), "status": status, "runs": total}
+
+
+def retro(values, target, min_runs):
+    """기존 run 앞에서부터 규칙 적용 — (쓰였을 run 수, 그때의 rel_ci)."""
+    for k in range(min_runs, len(values) + 1):
+        ci = rel_ci(values[:k])
+        if ci is not None and ci <= target:
+            return k, ci
+    return len(values), rel_ci(values)
+
+
+def plan(benchmarks, instances, results_dir=RESULTS_DIR, target=DEFAULT_TARGET, min_runs=DEFAULT_MIN_RUNS,
+         max_runs=DEFAULT_MAX_RUNS):
+    decisions, chains = {}, {}
+    used = fixed = 0
+    retro_cis = []
+    for bench in benchmarks:
+        for instance, _ in instances:
+            if bench not in RUN_METRICS:
+                have = nonempty_runs(bench, instance, results_dir, max_runs)
+                runs = len(have)
+                d = {"n": runs, "mean": None, "rel_ci": None, "status": "fixed" if runs >= DEFAULT_RUNS else "more",
+                     "runs": max(runs, DEFAULT_RUNS)}
+            else:
+                pairs = run_values(bench, instance, results_dir)
+                have = [run for run, _ in pairs]
+                values = [v for _, v in pairs]
+                d = decide(values, target, min_runs, max_runs)
+                if len(values) >= DEFAULT_RUNS:
+                    k, ci = retro(values[:DEFAULT_RUNS], target, min_runs)
+                    used += k
+                    fixed += DEFAULT_RUNS
+                    if ci is not None:
+                        retro_cis.append(ci)
+            decisions.setdefault(bench, {})[instance] = d
+            if d["status"] == "more":
+                chains.setdefault(instance, []).append({"bench": bench, "runs": d["runs"], "have": d["n"],
+                                                        "rerun": free_slots(set(have), d["runs"] - d["n"])})
+    counts = {}
+    for per_inst in decisions.values():
+        for d in per_inst.values():
+            counts[d["status"]] = counts.get(d["status"], 0) + 1
+    return {
+        "params": {"runs": DEFAULT_RUNS, "limits": {}, "target_rel_ci": target, "min_runs": min_runs,
+                   "max_runs": max_runs},
+        "chains": [{"instance": inst, "steps": steps} for inst, steps in chains.items()],
+        "decisions": decisions,
+        "summary": {
+            "counts": counts,
+            "runs_planned": sum(len(s["rerun"]) for steps in chains.values() for s in steps),
+            "retro": {"units": fixed // DEFAULT_RUNS, "fixed_runs": fixed, "adaptive_runs": used,
+                      "saving": round(1 - used / fixed, 4) if fixed else None,
+                      "median_rel_ci": round(sorted(retro_cis)[len(retro_cis) // 2], 4) if retro_cis else None},
+        },
+    }
+
+
+def parse_args(argv):
+    p = argparse.ArgumentParser(description="적응형 run 수 — CI 목표까지 필요한 run만 계획")
+    p.add_argument("benchmarks", nargs="*", help=f"기본: 전부 ({', '.join(BENCHMARKS)})")
+    p.add_argument("--instances", help="쉼표 구분 부분집합(기본: --sizes 인스턴스 파일 전체)")
+    p.add_argument("--sizes", default=orchestrate.BASE_SIZE, help="쉼표 구분 크기(xlarge, 2xlarge)")
+    p.add_argument("--target", type=float, default=DEFAULT_TARGET, help="상대 CI 반폭 목표(0.02 = 평균의 ±2%%)")
+    p.add_argument("--min-runs", type=int, default=DEFAULT_MIN_RUNS)
+    p.add_argument("--max-runs", type=int, default=DEFAULT_MAX_RUNS)
+    p.add_argument("--results", type=Path, default=RESULTS_DIR)
+    p.add_argument("--out", type=Path, help="계획 JSON(orchestrate.py --plan 입력)")
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    unknown = [b for b in args.benchmarks if b not in BENCHMARKS]
+    if unknown:
+        raise SystemExit(f"알 수 없는 벤치마크: {', '.join(unknown)} (가능: {', '.join(BENCHMARKS)})")
+    if not 2 <= args.min_runs <= args.max_runs:
+        raise SystemExit("2 ≤ --min-runs ≤ --max-runs 이어야 함")
+    instances = orchestrate.load_instances(orchestrate.parse_sizes(args.sizes))
+    if args.instances:
+        wanted = set(args.instances.split(","))
+        instances = [(n, a) for n, a in instances if n in wanted]
+    result = plan(args.benchmarks or list(BENCHMARKS), instances, args.results.resolve(), args.target,
+                  args.min_runs, args.max_runs)
+
+    s = result["summary"]
+    print("판정: " + ", ".join(f"{k} {v}" for k, v in sorted(s["counts"].items()))
+          + f" — 추가 run {s['runs_planned']}회, 인스턴스 {len(result['chains'])}개")
+    r = s["retro"]
+    if r["fixed_runs"]:
+        print(f"기존 데이터 재적용: 고정 {r['fixed_runs']}회 -> 적응형 {r['adaptive_runs']}회 "
+              f"({r['saving']:.0%} 절감, 정지 시점 상대 CI 중앙값 ±{r['median_rel_ci']:.1%})")
+    if args.out:
+        orchestrate.write_atomic(args.out, json.dumps(result, indent=2, ensure_ascii=False))
+        print(f"-> {args.out}")
+        if result["chains"]:
+            print(f"실행: orchestrate.py --plan {args.out} / 남은 Job 수집: collect.py --plan {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""완료된 벤치마크 Job 로그 동시 수집 — collect-and-report.sh의 인스턴스별 순차 kubectl logs 루프 대체.
+
+    python scripts/campaign/collect.py [benchmark ...] [--instances a,b] [--runs 5] [--plan PLAN.json] [--jobs 16]
+        [--kubectl PATH] [--results DIR] [--gzip] [--force] [--no-build]
+
+- 클러스터의 Job 목록(kubectl get jobs)을 orchestrate.job_index()로 결과 경로에 대응시킨다 — Job 이름
+  규칙을 orchestrate.py와 공유하므로 두 스크립트가 어긋나지 않는다. 대응되지 않는 Job(kafka-max 등
+  이 도구가 모르는 템플릿)과 아직 끝나지 않은 Job은 건너뛰되 개수를 출력한다.
+- Job 이름 대응 run 범위는 1..--runs(기본 DEFAULT_RUNS). --plan(adaptive.py/gaps.py/schedule.py 계획)이면
+  벤치마크/인스턴스를 계획에서 가져오고 범위를 계획의 runs/rerun 최대 번호까지 넓힌다 — adaptive는
+  max_runs(기본 10)까지 계획하므로 --runs 5 고정이면 run6+ Job이 unmapped로 남아 수집되지 않는다.
+- --jobs개까지 동시에 `kubectl logs`를 chunk 단위로 스트리밍해 임시 파일(.<name>.tmp)에 쓰고, 끝까지
+  받은 것만 rename — 중단돼도 반쯤 받은 로그가 결과로 보이지 않는다. --gzip이면 <log>.gz로 압축 저장
+  (보관/전송용 — 대시보드 파서는 평문 .log만 읽으므로 이 모드에서는 재빌드를 하지 않는다).
+- 재개 매니페스트(<results>/.collect-manifest.json): Job 이름 -> completionTime/경로/크기.
+  같은 completionTime의 Job을 이미 받았고 파일도 그대로면 다시 받지 않는다(Job을 다시 돌려
+  completionTime이 바뀌면 새로 받음). FLUSH_EVERY개마다, 그리고 중단(Ctrl+C) 시에도 저장.
+  매니페스트에 없는데 로그가 이미 있으면(셸 스크립트 시절 수집분 등) 덮어쓰지 않는다 — --force로 덮어씀.
+- 새 로그가 들어온 results/<dir>만 common.RESULTS_TO_BENCH로 골라 `build_data.py <bench...>` 재빌드.
+  kafka(-max/-ramp)/clickhouse는 파서가 results/<x>/data.json만 읽으므로 먼저 common.REPORT_SCRIPTS의
+  generate-*-report.py로 data.json을 다시 만든다. 로그 단위 파싱 캐시(cache.py)를 쓰는 iperf3/redis/
+  stress-ng 파서와 health/hardware는 새로 받은 로그만 다시 파싱하고, sysbench/nginx/elasticsearch/
+  springboot 파서와 리포트 스크립트는 그 벤치마크의 로그를 전부 다시 읽는다.
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import orchestrate
+from kube import Kubectl
+from orchestrate import BENCHMARKS, RESULTS_DIR, load_instances
+
+sys.path.insert(0, str(orchestrate.BASE_DIR / "scripts" / "dashboard"))
+from common import RESULTS_TO_BENCH, SCRIPT_DIR as DASHBOARD_DIR, report_scripts  # noqa: E402
+
+MANIFEST_NAME = ".collect-manifest.json"
+FLUSH_EVERY = 20
+
+
+class Collector:
+    def __init__(self, kube, index, results_dir=RESULTS_DIR, jobs=16, compress=False, force=False):
+        self.kube = kube
+        self.index = index
+        self.results_dir = results_dir
+        self.sem = asyncio.Semaphore(jobs)
+        self.compress = compress
+        self.force = force
+        self.manifest_path = results_dir / MANIFEST_NAME
+        self.manifest = json.loads(self.manifest_path.read_text()) if self.manifest_path.exists() else {}
+        self.counts = {}
+        self.new_dirs = set()
+        self.failed = []
+        self.pending = 0
+
+    def count(self, key):
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def target(self, job):
+        path = self.index[job][3]
+        return path.with_name(path.name + ".gz") if self.compress else path
+
+    def up_to_date(self, job, completion, path):
+        entry = self.manifest.get(job)
+        if entry:
+            return entry["completion"] == completion and path.exists() and path.stat().st_size == entry["bytes"]
+        return not self.force and path.exists() and path.stat().st_size > 0
+
+    def flush(self):
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        tmp.write_text(json.dumps(self.manifest, indent=1, sort_keys=True))
+        os.replace(tmp, self.manifest_path)
+        self.pending = 0
+
+    async def fetch(self, job, completion):
+        path = self.target(job)
+        async with self.sem:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.tmp")
+            try:
+                with (gzip.open(tmp, "wb", compresslevel=6) if self.compress else open(tmp, "wb")) as sink:
+                    rc = await self.kube.stream_logs(job, sink)
+                if rc != 0 or tmp.stat().st_size == 0:
+                    raise OSError(f"kubectl logs rc={rc}" if rc else "빈 로그")
+                os.replace(tmp, path)
+            except BaseException as e:
+                tmp.unlink(missing_ok=True)
+                if not isinstance(e, Exception):
+                    raise
+                self.failed.append((job, str(e)))
+                self.count("failed")
+                return
+        self.manifest[job] = {
+            "completion": completion, "path": path.relative_to(self.results_dir).as_posix(), "bytes": path.stat().st_size,
+        }
+        self.new_dirs.add(path.relative_to(self.results_dir).parts[0])
+        self.count("collected")
+        self.pending += 1
+        if self.pending >= FLUSH_EVERY:
+            self.flush()
+
+    async def run(self):
+        tasks = []
+        for name, succeeded, completion in await self.kube.list_jobs():
+            if name not in self.index:
+                self.count("unmapped")
+            elif not succeeded:
+                self.count("not complete")
+            elif self.up_to_date(name, completion, self.target(name)):
+                self.count("up to date")
+            else:
+                tasks.append(self.fetch(name, completion))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            self.flush()
+
+
+def plan_units(plan):
+    """계획 JSON -> (벤치마크 목록, 인스턴스명 목록, 가장 큰 run 번호)."""
+    steps = [(c["instance"], s) for c in plan["chains"] for s in c["steps"]]
+    top = max([plan["params"].get("runs", 0), *(s.get("runs", 0) for _, s in steps),
+               *(r for _, s in steps for r in s.get("rerun", []))])
+    return (list(dict.fromkeys(s["bench"] for _, s in steps)), list(dict.fromkeys(i for i, _ in steps)), top)
+
+
+def rebuild(result_dirs):
+    """새 로그가 생긴 results/<dir>를 읽는 벤치마크만 재빌드(data.json 기반이면 리포트 스크립트 먼저)."""
+    benches = sorted({b for d in result_dirs for b in RESULTS_TO_BENCH.get(d, [])})
+    if not benches:
+        return
+    for script in report_scripts(result_dirs):
+        print(f"data.json 재생성: {script.name}")
+        subprocess.run([sys.executable, str(script)], cwd=script.parent, check=True)
+    print(f"대시보드 증분 재빌드: {', '.join(benches)}")
+    subprocess.run([sys.executable, "build_data.py", *benches], cwd=DASHBOARD_DIR, check=True)
+
+
+def parse_args(argv):
+    p = argparse.ArgumentParser(description="완료된 벤치마크 Job 로그 동시 수집")
+    p.add_argument("benchmarks", nargs="*", help=f"기본: 전부 ({', '.join(BENCHMARKS)})")
+    p.add_argument("--instances", help="쉼표 구분 부분집합(기본: --sizes 인스턴스 파일 전체)")
+    p.add_argument("--sizes", default=orchestrate.BASE_SIZE, help="쉼표 구분 크기(xlarge, 2xlarge)")
+    p.add_argument("--runs", type=int, help=f"Job 이름 대응에 쓸 run 범위(기본 {orchestrate.DEFAULT_RUNS}, "
+                                            "--plan이면 계획의 최대 run 번호까지)")
+    p.add_argument("--plan", type=Path, help="adaptive.py/gaps.py/schedule.py --out 계획 — 벤치마크/인스턴스/run 범위를 계획에서")
+    p.add_argument("--jobs", type=int, default=16, help="동시 kubectl logs 수")
+    p.add_argument("--kubectl", help="kubectl 실행 파일(테스트용 fake 등)")
+    p.add_argument("--results", type=Path, default=RESULTS_DIR)
+    p.add_argument("--gzip", action="store_true", help="<log>.gz로 압축 저장(재빌드 생략)")
+    p.add_argument("--force", action="store_true", help="매니페스트에 없는 기존 로그도 덮어씀")
+    p.add_argument("--no-build", action="store_true", help="대시보드 재빌드 생략")
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    unknown = [b for b in args.benchmarks if b not in BENCHMARKS]
+    if unknown:
+        raise SystemExit(f"알 수 없는 벤치마크: {', '.join(unknown)} (가능: {', '.join(BENCHMARKS)})")
+    instances = load_instances(orchestrate.parse_sizes(args.sizes))
+    runs = args.runs or orchestrate.DEFAULT_RUNS
+    if args.plan:
+        if args.benchmarks or args.instances:
+            raise SystemExit("--plan은 벤치마크/인스턴스를 계획에서 가져옴 — 함께 지정하지 말 것")
+        args.benchmarks, names, top = plan_units(json.loads(args.plan.read_text()))
+        args.instances = ",".join(names)
+        instances = load_instances(list(orchestrate.INSTANCE_FILES))
+        runs = max(runs, top)
+    if args.instances:
+        wanted = set(args.instances.split(","))
+        instances = [(n, a) for n, a in instances if n in wanted]
+    results_dir = args.results.resolve()
+    index = orchestrate.job_index(args.benchmarks or list(BENCHMARKS), instances, runs, results_dir)
+    collector = Collector(Kubectl(args.kubectl), index, results_dir, args.jobs, args.gzip, args.force)
+    t0 = time.monotonic()
+    asyncio.run(collector.run())
+    print(", ".join(f"{k} {v}" for k, v in sorted(collector.counts.items())) or "수집할 Job 없음",
+          f"({time.monotonic() - t0:.1f}s) -> {collector.manifest_path}")
+    for job, error in collector.failed:
+        print(f"  FAILED {job}: {error}")
+    if collector.new_dirs and not (args.no_build or args.gzip or results_dir != RESULTS_DIR):
+        rebuild(collector.new_dirs)
+    return 1 if collector.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
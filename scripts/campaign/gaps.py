@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""커버리지 구멍 — 재실행이 필요한 (벤치마크, 인스턴스, run) 집합과 인스턴스별 재실행 계획.
+
+    python scripts/campaign/gaps.py [benchmark ...] [--instances a,b] [--sizes xlarge] [--runs 5] [--partial] [--out plan.json]
+    python scripts/campaign/orchestrate.py --plan plan.json      # 구멍 난 run만, 인스턴스마다 노드 1번
+
+build_data.py는 'WARN coverage 51/54'만 찍는다. 여기서는 canonical_instances() × 벤치마크별 기대 로그
+(orchestrate.BENCHMARKS의 runN/wrkN/rallyN/coldstartN/setN + MANUAL의 <codec>-runN) × health 판정을
+교차해 run 하나하나를 본다.
+- 단위마다 usable run이 --runs개 미만이면 모자란 만큼만 재실행(번호가 낮은 구멍부터).
+- missing: 로그 없음 또는 빈 파일. failed: 헤드라인 마커 없음(집계에서 빠지는 run).
+  partial(헤드라인은 있으나 오류 시그니처/잘린 푸터)은 집계에 쓰이므로 --partial일 때만 재실행 대상.
+- 계획 JSON은 schedule.py/adaptive.py와 같은 chains 형식 — 인스턴스마다 step 하나씩(벤치마크), step의
+  rerun이 다시 돌릴 run 번호. orchestrate는 rerun run만 (깨진 로그를 덮어쓰며) 돌리고, 체인이라
+  한 인스턴스의 구멍은 노드 하나에서 몰아서 끝난다.
+- MANUAL(kafka-max처럼 orchestrate에 없는 벤치마크)은 chains에 넣지 않고 manual에 run 목록 + 실행
+  스크립트만 남긴다.
+- summary.whole_unit_runs는 구멍이 하나라도 있는 (벤치마크, 인스턴스)를 통째로 다시 돌릴 때의 run 수 —
+  targeted(rerun 합)와 비교용.
+"""
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+import orchestrate
+from orchestrate import BENCHMARKS, DEFAULT_RUNS, RESULTS_DIR, RUN_DIR_ALIASES
+
+sys.path.insert(0, str(orchestrate.BASE_DIR / "scripts" / "dashboard"))
+from common import canonical_instances, set_sizes  # noqa: E402
+from health import run_status  # noqa: E402
+from parsers.kafka import CODECS  # noqa: E402
+
+# orchestrate가 돌리지 않는 벤치마크 — 결과 디렉터리, 로그 패턴들, 재실행 스크립트
+MANUAL = {
+    "kafka-max": {"results": "kafka-max", "logs": [f"{codec}-run{{run}}.log" for codec in CODECS],
+                  "command": "scripts/generate-kafka-max-benchmark.sh"},
+}
+
+
+def expected_logs(bench):
+    """-> (결과 디렉터리, [로그 패턴])."""
+    if bench in BENCHMARKS:
+        return BENCHMARKS[bench]["results"], [BENCHMARKS[bench]["log"]]
+    return MANUAL[bench]["results"], MANUAL[bench]["logs"]
+
+
+def unit_gaps(results_dir, bench, instance, runs=DEFAULT_RUNS, partial=False):
+    """-> {run: [(로그 파일명, 사유)]} — 로그 패턴마다 usable run이 runs개가 되도록 모자란 만큼만,
+    번호가 낮은 구멍부터. 실패한 run1 대신 run6을 돌려 둔 단위(passmark 등)는 구멍이 아니다."""
+    results, patterns = expected_logs(bench)
+    inst_dir = results_dir / results / RUN_DIR_ALIASES.get((results, instance), instance)
+    out = {}
+    for pattern in patterns:
+        prefix, _, suffix = pattern.partition("{run}")
+        numbered = re.compile(rf"{re.escape(prefix)}(\d+){re.escape(suffix)}")
+        found = [int(m.group(1)) for p in inst_dir.glob(pattern.format(run="*")) if (m := numbered.fullmatch(p.name))]
+        bad, usable = [], 0
+        for run in range(1, max([runs, *found]) + 1):
+            path = inst_dir / pattern.format(run=run)
+            if not path.exists() or path.stat().st_size == 0:
+                bad.append((run, path.name, "missing"))
+                continue
+            status = run_status(results, path)
+            if status["status"] == "failed" or (partial and status["status"] == "partial"):
+                bad.append((run, path.name, f"{status['status']}: {', '.join(status['reasons'])}"))
+            else:
+                usable += 1
+        for run, name, reason in bad[:max(0, runs - usable)]:
+            out.setdefault(run, []).append((name, reason))
+    return out
+
+
+def find_gaps(benchmarks, instances, results_dir=RESULTS_DIR, runs=DEFAULT_RUNS, partial=False):
+    """-> {instance: {bench: {run: [(로그, 사유)]}}} — 구멍이 있는 것만."""
+    gaps = {}
+    for instance in instances:
+        for bench in benchmarks:
+            by_run = unit_gaps(results_dir, bench, instance, runs, partial)
+            if by_run:
+                gaps.setdefault(instance, {})[bench] = by_run
+    return gaps
+
+
+def plan(gaps, runs=DEFAULT_RUNS):
+    chains, manual = [], {}
+    counts, targeted, whole = {}, 0, 0
+    for instance, benches in gaps.items():
+        steps = []
+        for bench, by_run in benches.items():
+            for bad in by_run.values():
+                for _, reason in bad:
+                    kind = reason.split(":")[0]
+                    counts.setdefault(bench, {}).setdefault(kind, 0)
+                    counts[bench][kind] += 1
+            reasons = {str(run): [f"{log} {reason}" for log, reason in bad] for run, bad in by_run.items()}
+            if bench in MANUAL:
+                manual.setdefault(bench, {"command": MANUAL[bench]["command"], "instances": {}})
+                manual[bench]["instances"][instance] = reasons
+                continue
+            steps.append({"bench": bench, "rerun": sorted(by_run), "reasons": reasons})
+            targeted += len(by_run)
+            whole += runs
+        if steps:
+            chains.append({"instance": instance, "steps": steps})
+    return {
+        "params": {"runs": runs, "limits": {}},
+        "chains": chains,
+        "manual": manual,
+        "summary": {
+            "counts": counts,
+            "instances": len(chains),
+            "targeted_runs": targeted,
+            "whole_unit_runs": whole,
+        },
+    }
+
+
+def parse_args(argv):
+    p = argparse.ArgumentParser(description="커버리지 구멍 -> 인스턴스별 최소 재실행 계획")
+    p.add_argument("benchmarks", nargs="*", help=f"기본: 전부 ({', '.join([*BENCHMARKS, *MANUAL])})")
+    p.add_argument("--instances", help="쉼표 구분 부분집합(기본: canonical_instances() 전체)")
+    p.add_argument("--sizes", default=orchestrate.BASE_SIZE, help="쉼표 구분 크기(xlarge, 2xlarge)")
+    p.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="단위당 기대 run 수")
+    p.add_argument("--partial", action="store_true", help="partial run도 재실행 대상")
+    p.add_argument("--results", type=Path, default=RESULTS_DIR)
+    p.add_argument("--out", type=Path, help="계획 JSON(orchestrate.py --plan 입력)")
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    known = [*BENCHMARKS, *MANUAL]
+    unknown = [b for b in args.benchmarks if b not in known]
+    if unknown:
+        raise SystemExit(f"알 수 없는 벤치마크: {', '.join(unknown)} (가능: {', '.join(known)})")
+    set_sizes(orchestrate.parse_sizes(args.sizes))
+    instances = canonical_instances()
+    if args.instances:
+        missing = [w for w in args.instances.split(",") if w not in instances]
+        if missing:
+            raise SystemExit(f"인스턴스 파일({args.sizes})에 없는 인스턴스: {', '.join(missing)}")
+        instances = args.instances.split(",")
+    gaps = find_gaps(args.benchmarks or known, instances, args.results.resolve(), args.runs, args.partial)
+    result = plan(gaps, args.runs)
+
+    for chain in result["chains"]:
+        print(f"{chain['instance']}: " + ", ".join(f"{s['bench']} run{','.join(map(str, s['rerun']))}"
+                                                   for s in chain["steps"]))
+    for bench, m in result["manual"].items():
+        print(f"[수동] {bench}: {len(m['instances'])}개 인스턴스 — {m['command']}")
+    s = result["summary"]
+    print("구멍: " + ", ".join(f"{b} " + "/".join(f"{k} {v}" for k, v in sorted(c.items()))
+                                for b, c in sorted(s["counts"].items())) if s["counts"] else "구멍 없음")
+    if s["instances"]:
+        print(f"재실행: 인스턴스 {s['instances']}개(노드 세션 1개씩), run {s['targeted_runs']}회 "
+              f"(단위 통째 재실행이면 {s['whole_unit_runs']}회)")
+    if args.out:
+        orchestrate.write_atomic(args.out, json.dumps(result, indent=2, ensure_ascii=False))
+        print(f"-> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
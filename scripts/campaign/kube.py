@@ -0,0 +1,98 @@
+"""kubectl 비동기 래퍼 — 오케스트레이터가 쓰는 명령만.
+
+실행 파일은 인자(기본: 환경변수 KUBECTL, 없으면 'kubectl')로 바꿀 수 있다. 테스트는
+tests/campaign/fake-kubectl(같은 인터페이스를 흉내 내는 스크립트)을 넘겨 라이브 클러스터 없이
+돌린다 — 여기서 쓰는 서브커맨드/플래그를 늘리면 fake-kubectl도 함께 늘릴 것.
+"""
+import asyncio
+import os
+
+NAMESPACE = "benchmark"
+
+
+class KubectlError(RuntimeError):
+    pass
+
+
+class Kubectl:
+    def __init__(self, binary=None, namespace=NAMESPACE):
+        self.binary = binary or os.environ.get("KUBECTL", "kubectl")
+        self.namespace = namespace
+
+    async def run(self, *args, stdin=None, check=True):
+        """-> (returncode, stdout, stderr). check=True면 rc != 0에서 KubectlError."""
+        proc = await asyncio.create_subprocess_exec(
+            self.binary, *args,
+            stdin=asyncio.subprocess.PIPE if stdin is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        )
+        out, err = await proc.communicate(stdin.encode() if stdin is not None else None)
+        out, err = out.decode(errors="replace"), err.decode(errors="replace")
+        if check and proc.returncode != 0:
+            raise KubectlError(f"kubectl {' '.join(args[:3])}: rc={proc.returncode} {err.strip()[:200]}")
+        return proc.returncode, out, err
+
+    async def apply(self, manifest):
+        await self.run("apply", "-n", self.namespace, "-f", "-", stdin=manifest)
+
+    async def delete(self, manifest):
+        await self.run("delete", "-n", self.namespace, "--ignore-not-found", "--wait=false", "-f", "-",
+                       stdin=manifest, check=False)
+
+    async def delete_job(self, name):
+        await self.run("delete", "job", name, "-n", self.namespace, "--ignore-not-found", check=False)
+
+    async def job_status(self, name):
+        """-> 'succeeded' | 'failed' | 'active' | 'missing'."""
+        rc, out, _ = await self.run(
+            "get", "job", name, "-n", self.namespace,
+            "-o", "jsonpath={.status.succeeded},{.status.failed}", check=False,
+        )
+        if rc != 0:
+            return "missing"
+        succeeded, _, failed = out.strip().partition(",")
+        if succeeded not in ("", "0"):
+            return "succeeded"
+        if failed not in ("", "0"):
+            return "failed"
+        return "active"
+
+    async def list_jobs(self):
+        """-> [(name, succeeded: bool, completionTime 문자열)] — 네임스페이스의 모든 Job."""
+        _, out, _ = await self.run(
+            "get", "jobs", "-n", self.namespace, "-o",
+            r'jsonpath={range .items[*]}{.metadata.name}{"\t"}{.status.succeeded}{"\t"}{.status.completionTime}{"\n"}{end}',
+        )
+        jobs = []
+        for line in out.splitlines():
+            name, succeeded, completion = (line.split("\t") + ["", ""])[:3]
+            if name:
+                jobs.append((name, succeeded not in ("", "0"), completion))
+        return jobs
+
+    async def stream_logs(self, job, sink, chunk_size=1 << 16):
+        """kubectl logs 출력을 chunk 단위로 sink.write()에 흘린다(전체를 메모리에 올리지 않음). -> rc."""
+        proc = await asyncio.create_subprocess_exec(
+            self.binary, "logs", "-n", self.namespace, f"job/{job}",
+            stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            while chunk := await proc.stdout.read(chunk_size):
+                sink.write(chunk)
+        except BaseException:  # 취소(Ctrl+C)/쓰기 실패 — 자식 프로세스를 남기지 않음
+            proc.kill()
+            await proc.wait()
+            raise
+        return await proc.wait()
+
+    async def logs(self, job):
+        _, out, _ = await self.run("logs", "-n", self.namespace, f"job/{job}", check=False)
+        return out
+
+    async def rollout(self, deployment, timeout_s):
+        rc, _, err = await self.run(
+            "rollout", "status", f"deployment/{deployment}", "-n", self.namespace, f"--timeout={timeout_s}s",
+            check=False,
+        )
+        if rc != 0:
+            raise KubectlError(f"deployment/{deployment} 준비 실패: {err.strip()[:200]}")
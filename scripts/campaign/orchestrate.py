@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""벤치마크 캠페인 오케스트레이터(asyncio) — run-benchmarks-parallel.sh 대체.
+
+    python scripts/campaign/orchestrate.py [benchmark ...] [--instances c8g.xlarge,...]
+        [--sizes xlarge,2xlarge] [--runs 5] [--limit benchmark-server=20 --limit benchmark-client=16]
+        [--retries 2] [--kubectl PATH] [--results DIR] [--plan PLAN.json] [--force] [--dry-run]
+
+- 인스턴스 목록은 config/instances-<N>vcpu.txt가 유일한 출처(셸 스크립트의 하드코딩 51개 목록은
+  54개 설정과 드리프트했음). --sizes로 크기(xlarge=4vcpu, 2xlarge=8vcpu — common.INSTANCE_FILES)를
+  고른다. 형식이 깨진 줄은 건너뛰지 않고 에러로 중단한다.
+- 작업 단위 = (벤치마크, 인스턴스). 한 단위 안의 run 1..N은 순차(같은 서버/노드 재사용), 단위끼리는
+  nodepool별 세마포어(--limit) 한도 안에서 동시에 돈다. 서버-클라이언트형 벤치마크는
+  benchmark-server와 benchmark-client 슬롯을 함께 잡는다.
+- --plan(schedule.py 산출물)이면 인스턴스마다 benchmark-server 슬롯 하나를 잡은 채 그 인스턴스의
+  벤치마크를 계획 순서대로 이어 돌린다 — 벤치마크마다 노드를 새로 띄우지 않는다. step에 runs가
+  있으면 그 단위만 run 1..runs까지 돈다. step에 rerun(run 번호 목록, gaps.py/adaptive.py 산출물)이
+  있으면 runs 대신 그 run만 — 로그가 있어도(깨진 로그) 덮어쓴다.
+- run마다: 매니페스트 렌더 -> 이전 Job 삭제 -> apply -> 완료/실패/타임아웃까지 폴링 -> 로그를
+  results/<dir>/<inst>/<log>로 원자적 저장(임시 파일 + rename) -> Job 삭제. 실패/타임아웃/빈 로그는
+  지수 백오프로 --retries회 재시도.
+- 이미 비어 있지 않은 로그가 있는 run은 건너뛴다(--force면 다시 측정). 건너뛴 run도 상태에 남는다.
+- 끝나면 (벤치마크, 인스턴스, run)별 상태를 logs/campaign-<시각>.json에 쓰고, 실패가 하나라도
+  있으면 목록을 출력하고 종료 코드 1 — 조용히 빠지는 인스턴스가 없게.
+
+템플릿 렌더는 render.py(타입 있는 placeholder 단일 패스 치환, 값이 빠지면 RenderError)에 맡긴다. Job 이름에
+run 번호가 없는 템플릿(sysbench-cpu-INSTANCE_SAFE 등)은 run마다 '-run<N>'을 붙여 이름 충돌을 피한다.
+템플릿에 RUN_NUMBER가 없으면 Job 이외 문서(Service/Deployment 등)는 인스턴스 단위로 1번 apply하고
+단위가 끝날 때 지운다(인스턴스명이 든 것만 — 공유 ConfigMap은 남김).
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from kube import Kubectl, KubectlError
+from render import RenderError, load_instance_specs, load_template
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BASE_DIR / "scripts" / "dashboard"))
+from common import BASE_SIZE, INSTANCE_FILES, RUN_DIR_ALIASES  # noqa: E402 — 대시보드 파서와 같은 규칙
+BENCH_DIR = BASE_DIR / "benchmarks"
+RESULTS_DIR = BASE_DIR / "results"
+LOGS_DIR = BASE_DIR / "logs"
+
+SERVER_POOL = "benchmark-server"
+CLIENT_POOL = "benchmark-client"
+# client: nodepool-benchmark-client limits.cpu 512 / c6in.8xlarge 32 vCPU = 16 노드
+DEFAULT_LIMITS = {SERVER_POOL: 20, CLIENT_POOL: 16}
+DEFAULT_RUNS = 5
+# scripts/generate-{kafka,clickhouse}-benchmark.sh와 동일
+VERSIONS = {"KAFKA_VERSION": "3.9.1", "CLICKHOUSE_VERSION": "24.8.14.39"}
+
+# template/server: benchmarks/ 기준 경로. client=True면 Job이 benchmark-client 노드에서 돈다.
+BENCHMARKS = {
+    "sysbench-cpu": {"template": "system/sysbench-cpu.yaml", "results": "sysbench-cpu", "log": "run{run}.log", "timeout": 900},
+    "sysbench-memory": {"template": "system/sysbench-memory.yaml", "results": "sysbench-memory", "log": "run{run}.log", "timeout": 900},
+    "stress-ng": {"template": "system/stress-ng.yaml", "results": "stress-ng", "log": "run{run}.log", "timeout": 1200},
+    "geekbench": {"template": "system/geekbench.yaml", "results": "geekbench", "log": "run{run}.log", "timeout": 2400},
+    "passmark": {"template": "system/passmark.yaml", "results": "passmark", "log": "run{run}.log", "timeout": 1800},
+    "iperf3": {"template": "system/iperf3-network.yaml", "results": "iperf3", "log": "run{run}.log", "timeout": 900},
+    "redis": {"server": "redis/redis-server.yaml", "template": "redis/redis-benchmark.yaml", "results": "redis",
+              "log": "run{run}.log", "timeout": 600, "client": True, "crlf": True},
+    "nginx": {"server": "nginx/nginx-server.yaml", "template": "nginx/nginx-benchmark.yaml", "results": "nginx",
+              "log": "run{run}.log", "timeout": 900, "client": True},
+    "springboot": {"server": "springboot/springboot-server.yaml", "template": "springboot/springboot-benchmark.yaml",
+                   "results": "springboot", "log": "wrk{run}.log", "timeout": 1200, "client": True},
+    "springboot-coldstart": {"template": "springboot/springboot-coldstart.yaml", "results": "springboot",
+                             "log": "coldstart{run}.log", "timeout": 600},
+    "elasticsearch": {"server": "elasticsearch/elasticsearch-server.yaml", "template": "elasticsearch/elasticsearch-rally.yaml",
+                      "results": "elasticsearch", "log": "rally{run}.log", "timeout": 3600, "client": True},
+    "elasticsearch-coldstart": {"template": "elasticsearch/elasticsearch-coldstart.yaml", "results": "elasticsearch",
+                                "log": "coldstart{run}.log", "timeout": 900},
+    "kafka": {"server": "kafka/kafka-server.yaml", "template": "kafka/kafka-benchmark.yaml", "results": "kafka",
+              "log": "run{run}.log", "timeout": 1200, "client": True},
+    "clickhouse": {"template": "clickhouse/clickhouse-clickbench.yaml", "results": "clickhouse", "log": "set{run}.log",
+                   "timeout": 2400},
+}
+
+KIND_LINE = re.compile(r"^kind:\s*(\S+)", re.M)
+META_NAME = re.compile(r"^metadata:\s*\n(?:[ \t]+.*\n)*?[ \t]+name:\s*(\S+)", re.M)
+
+
+def load_instances(sizes=(BASE_SIZE,)):
+    """크기별 instances-<N>vcpu.txt -> [(name, k8s arch)]. 형식이 깨진 줄은 ValueError(건너뛰지 않음)."""
+    return [(name, spec["arch"]) for size in sizes for name, spec in load_instance_specs(INSTANCE_FILES[size]).items()]
+
+
+def parse_sizes(text):
+    """--sizes 'xlarge,2xlarge' -> ['xlarge', '2xlarge']. 모르는 크기는 SystemExit."""
+    sizes = text.split(",")
+    unknown = [s for s in sizes if s not in INSTANCE_FILES]
+    if unknown:
+        raise SystemExit(f"알 수 없는 크기: {', '.join(unknown)} (가능: {', '.join(INSTANCE_FILES)})")
+    return sizes
+
+
+def values(instance, arch, run=None, job=None, extra=None):
+    """render.Template.render에 넘길 placeholder 값 — 기존 셸 스크립트 sed 치환과 같은 집합."""
+    vals = {"INSTANCE_TYPE": instance, "INSTANCE_SAFE": instance.replace(".", "-"), "ARCH": arch, **VERSIONS}
+    if job is not None:
+        vals["JOB_NAME"] = job
+    if run is not None:
+        vals["RUN_NUMBER"] = run
+    vals.update(extra or {})
+    return vals
+
+
+def split_docs(text):
+    docs = re.split(r"^---[ \t]*$", text, flags=re.M)
+    return [d.strip("\n") + "\n" for d in docs if KIND_LINE.search(d)]
+
+
+def doc_kind(doc):
+    return KIND_LINE.search(doc).group(1)
+
+
+def doc_name(doc):
+    m = META_NAME.search(doc)
+    return m.group(1) if m else None
+
+
+def log_path(results_dir, spec, instance, run):
+    """results/<dir>/<inst>/<log> — 파서가 읽는 경로 그대로(RUN_DIR_ALIASES 포함)."""
+    inst_dir = RUN_DIR_ALIASES.get((spec["results"], instance), instance)
+    return results_dir / spec["results"] / inst_dir / spec["log"].format(run=run)
+
+
+def join_docs(docs):
+    return "".join(f"---\n{d}" for d in docs)
+
+
+def unit_manifests(spec, instance, arch, extra=None):
+    """-> (인스턴스 단위 문서들, run -> (run 단위 매니페스트, Job 이름) 함수). extra = 추가 placeholder 값."""
+    job_tpl = load_template(BENCH_DIR / spec["template"])
+    per_run_all = "RUN_NUMBER" in job_tpl.used
+    base = values(instance, arch, extra=extra)
+    unit_docs = []
+    if spec.get("server"):
+        unit_docs += split_docs(load_template(BENCH_DIR / spec["server"]).render(base))
+    if not per_run_all:
+        job_only = ("JOB_NAME",)  # Job 문서는 여기서 버리고 run마다 다시 렌더
+        unit_docs += [d for d in split_docs(job_tpl.render(base, allow_missing=job_only)) if doc_kind(d) != "Job"]
+
+    def for_run(run):
+        safe = instance.replace(".", "-")
+        job = f"{Path(spec['template']).stem.split('-')[0]}-bench-{safe}-run{run}" if "JOB_NAME" in job_tpl.used else None
+        docs = split_docs(job_tpl.render(values(instance, arch, run=run, job=job, extra=extra)))
+        if not per_run_all:
+            docs = [d for d in docs if doc_kind(d) == "Job"]
+        job_docs = [d for d in docs if doc_kind(d) == "Job"]
+        if len(job_docs) != 1:
+            raise RenderError(f"{spec['template']}: Job 문서가 {len(job_docs)}개 — 정확히 1개여야 함")
+        name = doc_name(job_docs[0])
+        if not re.search(rf"run-?{run}$", name):
+            renamed = f"{name}-run{run}"
+            docs = [d.replace(f"name: {name}\n", f"name: {renamed}\n", 1) if d is job_docs[0] else d for d in docs]
+            name = renamed
+        return join_docs(docs), name
+
+    return unit_docs, for_run
+
+
+def job_index(benchmarks, instances, runs, results_dir=RESULTS_DIR):
+    """Job 이름 -> (벤치마크, 인스턴스, run, 로그 경로). collect.py가 클러스터의 Job을 결과 파일에 대응시킬 때 사용."""
+    index = {}
+    for bench in benchmarks:
+        spec = BENCHMARKS[bench]
+        for instance, arch in instances:
+            _, for_run = unit_manifests(spec, instance, arch)
+            for run in range(1, runs + 1):
+                index[for_run(run)[1]] = (bench, instance, run, log_path(results_dir, spec, instance, run))
+    return index
+
+
+class Campaign:
+    def __init__(self, kube, benchmarks, instances, runs=DEFAULT_RUNS, limits=None, retries=2, backoff_s=30.0,
+                 poll_s=10.0, results_dir=RESULTS_DIR, force=False, dry_run=False, run_counts=None, reruns=None):
+        self.kube = kube
+        self.benchmarks = benchmarks
+        self.instances = instances
+        self.runs = runs
+        self.run_counts = run_counts or {}  # (벤치마크, 인스턴스) -> run 수(없으면 runs)
+        self.reruns = reruns or {}  # (벤치마크, 인스턴스) -> 다시 돌릴 run 번호(기존 로그 무시)
+        self.limits = {**DEFAULT_LIMITS, **(limits or {})}
+        self.retries = retries
+        self.backoff_s = backoff_s
+        self.poll_s = poll_s
+        self.results_dir = results_dir
+        self.force = force
+        self.dry_run = dry_run
+        self.state = {}
+        self.sems = {}
+
+    def record(self, bench, instance, run, **info):
+        self.state.setdefault(bench, {}).setdefault(instance, {})[str(run)] = info
+
+    # ------------------------------------------------------------------ execution
+
+    async def wait_job(self, job, timeout_s):
+        deadline = time.monotonic() + timeout_s
+        while time.monotonic() < deadline:
+            status = await self.kube.job_status(job)
+            if status in ("succeeded", "failed"):
+                return status
+            await asyncio.sleep(self.poll_s)
+        return "timeout"
+
+    async def run_once(self, spec, bench, instance, run, for_run, path):
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(self.backoff_s * 2 ** (attempt - 1))
+            manifest, job = for_run(run)
+            started = time.monotonic()
+            try:
+                await self.kube.delete_job(job)
+                await self.kube.apply(manifest)
+                status = await self.wait_job(job, spec["timeout"])
+                text = await self.kube.logs(job)
+            except KubectlError as e:
+                status, text = "error", ""
+                error = str(e)
+            finally:
+                await self.kube.delete(manifest)
+            if spec.get("crlf"):
+                text = text.replace("\r", "\n")
+            if status == "succeeded" and text.strip():
+                write_atomic(path, text)
+                self.record(bench, instance, run, status="done", attempts=attempt + 1,
+                            elapsed_s=round(time.monotonic() - started, 1), log=str(path.relative_to(self.results_dir)))
+                return True
+            error = error if status == "error" else f"job {status}" + ("" if text.strip() else ", empty log")
+            print(f"  [{bench}] {instance} run{run} 시도 {attempt + 1}/{self.retries + 1} 실패 — {error}")
+        self.record(bench, instance, run, status="failed", attempts=self.retries + 1, error=error)
+        return False
+
+    async def run_unit(self, bench, instance, arch, server_held=False):
+        spec = BENCHMARKS[bench]
+        pools = sorted([SERVER_POOL, CLIENT_POOL] if spec.get("client") else [SERVER_POOL])
+        if server_held:  # run_chain이 인스턴스 노드 슬롯을 이미 잡고 있음
+            pools.remove(SERVER_POOL)
+        todo = []
+        rerun = self.reruns.get((bench, instance))
+        for run in rerun or range(1, self.run_counts.get((bench, instance), self.runs) + 1):
+            path = log_path(self.results_dir, spec, instance, run)
+            if not self.force and not rerun and path.exists() and path.stat().st_size > 0:
+                self.record(bench, instance, run, status="skipped", reason="log exists")
+            else:
+                todo.append((run, path))
+        if not todo:
+            return
+        try:
+            unit_docs, for_run = unit_manifests(spec, instance, arch)
+            for run, _ in todo:
+                for_run(run)
+        except RenderError as e:  # 재시도해도 같은 결과 — 노드를 띄우기 전에 실패로 기록
+            for run, _ in todo:
+                self.record(bench, instance, run, status="failed", attempts=0, error=str(e))
+            print(f"  [{bench}] {instance} 매니페스트 렌더 실패 — {e}")
+            return
+        if self.dry_run:
+            for run, path in todo:
+                _, job = for_run(run)
+                self.record(bench, instance, run, status="planned", job=job, log=str(path.relative_to(self.results_dir)))
+            return
+        for pool in pools:  # 항상 같은 순서로 잡아 교착 방지
+            await self.sems[pool].acquire()
+        safe = instance.replace(".", "-")
+        try:
+            if unit_docs:
+                await self.kube.apply(join_docs(unit_docs))
+                for d in unit_docs:
+                    if doc_kind(d) == "Deployment":
+                        await self.kube.rollout(doc_name(d), 300)
+            for run, path in todo:
+                await self.run_once(spec, bench, instance, run, for_run, path)
+        except KubectlError as e:
+            for run, _ in todo:
+                if str(run) not in self.state.get(bench, {}).get(instance, {}):
+                    self.record(bench, instance, run, status="failed", attempts=0, error=str(e))
+            print(f"  [{bench}] {instance} 서버 준비 실패 — {e}")
+        finally:
+            owned = [d for d in unit_docs if safe in (doc_name(d) or "")]
+            if owned:
+                await self.kube.delete(join_docs(owned))
+            for pool in reversed(pools):
+                self.sems[pool].release()
+        done = sum(1 for r in self.state[bench][instance].values() if r["status"] == "done")
+        print(f"[{bench}] {instance}: {done}/{len(todo)} run 완료")
+
+    async def run_chain(self, instance, arch, benches):
+        """schedule.py 계획의 인스턴스 체인 — 노드 슬롯 하나를 잡은 채 벤치마크를 순서대로(노드 재사용)."""
+        async with self.sems[SERVER_POOL]:
+            for bench in benches:
+                await self.run_unit(bench, instance, arch, server_held=True)
+
+    async def run(self, chains=None):
+        """chains=None이면 (벤치마크, 인스턴스) 단위 전부 동시, 아니면 [(instance, [bench...])] 체인 순서대로."""
+        self.sems = {pool: asyncio.Semaphore(n) for pool, n in self.limits.items()}
+        if chains is None:
+            units = [self.run_unit(b, name, arch) for b in self.benchmarks for name, arch in self.instances]
+        else:
+            arches = dict(self.instances)
+            units = [self.run_chain(name, arches[name], benches) for name, benches in chains]
+        await asyncio.gather(*units)
+        return self.state
+
+    def failures(self):
+        return [(b, inst, run, r.get("error")) for b, insts in self.state.items() for inst, runs in insts.items()
+                for run, r in runs.items() if r["status"] == "failed"]
+
+
+def write_atomic(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+def parse_args(argv):
+    p = argparse.ArgumentParser(description="EKS 벤치마크 캠페인 오케스트레이터")
+    p.add_argument("benchmarks", nargs="*", help=f"기본: 전부 ({', '.join(BENCHMARKS)})")
+    p.add_argument("--instances", help="쉼표 구분 부분집합(기본: --sizes 인스턴스 파일 전체)")
+    p.add_argument("--sizes", default=BASE_SIZE, help=f"쉼표 구분 크기({', '.join(INSTANCE_FILES)}, 기본 {BASE_SIZE})")
+    p.add_argument("--runs", type=int, help=f"기본: {DEFAULT_RUNS}(--plan이면 계획의 runs)")
+    p.add_argument("--limit", action="append", default=[], metavar="POOL=N", help="nodepool별 동시 작업 단위 수")
+    p.add_argument("--retries", type=int, default=2)
+    p.add_argument("--backoff", type=float, default=30.0, help="첫 재시도 대기(초), 이후 2배씩")
+    p.add_argument("--poll", type=float, default=10.0, help="Job 상태 폴링 간격(초)")
+    p.add_argument("--kubectl", help="kubectl 실행 파일(테스트용 fake 등)")
+    p.add_argument("--results", type=Path, default=RESULTS_DIR)
+    p.add_argument("--state", type=Path, help="상태 JSON 경로(기본: logs/campaign-<시각>.json)")
+    p.add_argument("--plan", type=Path, help="schedule.py --out 계획 — 인스턴스별 체인(노드 재사용) 순서로 실행")
+    p.add_argument("--force", action="store_true", help="기존 로그가 있어도 다시 측정")
+    p.add_argument("--dry-run", action="store_true", help="kubectl 없이 계획만 출력")
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    unknown = [b for b in args.benchmarks if b not in BENCHMARKS]
+    if unknown:
+        raise SystemExit(f"알 수 없는 벤치마크: {', '.join(unknown)} (가능: {', '.join(BENCHMARKS)})")
+    instances = load_instances(parse_sizes(args.sizes))
+    chains, run_counts, reruns = None, {}, {}
+    if args.plan:
+        instances = load_instances(list(INSTANCE_FILES))
+        if args.benchmarks or args.instances:
+            raise SystemExit("--plan은 벤치마크/인스턴스를 계획에서 가져옴 — 함께 지정하지 말 것")
+        plan = json.loads(args.plan.read_text())
+        chains = [(c["instance"], [s["bench"] for s in c["steps"]]) for c in plan["chains"]]
+        run_counts = {(s["bench"], c["instance"]): s["runs"] for c in plan["chains"] for s in c["steps"] if "runs" in s}
+        reruns = {(s["bench"], c["instance"]): s["rerun"] for c in plan["chains"] for s in c["steps"] if s.get("rerun")}
+        args.benchmarks = list(dict.fromkeys(b for _, benches in chains for b in benches))
+        args.instances = ",".join(name for name, _ in chains)
+        args.runs = args.runs or plan["params"]["runs"]
+        limits = plan["params"]["limits"]
+    args.runs = args.runs or DEFAULT_RUNS
+    if args.instances:
+        wanted = args.instances.split(",")
+        known = {name for name, _ in instances}
+        missing = [w for w in wanted if w not in known]
+        if missing:
+            raise SystemExit(f"인스턴스 파일({args.sizes})에 없는 인스턴스: {', '.join(missing)}")
+        instances = [(n, a) for n, a in instances if n in wanted]
+    limits = limits if args.plan else {}
+    for item in args.limit:
+        pool, _, n = item.partition("=")
+        limits[pool] = int(n)
+
+    campaign = Campaign(
+        Kubectl(args.kubectl), args.benchmarks or list(BENCHMARKS), instances, runs=args.runs, limits=limits,
+        retries=args.retries, backoff_s=args.backoff, poll_s=args.poll, results_dir=args.results.resolve(),
+        force=args.force, dry_run=args.dry_run, run_counts=run_counts, reruns=reruns,
+    )
+    t0 = time.monotonic()
+    state = asyncio.run(campaign.run(chains))
+    counts = {}
+    for insts in state.values():
+        for runs in insts.values():
+            for r in runs.values():
+                counts[r["status"]] = counts.get(r["status"], 0) + 1
+    state_path = args.state or LOGS_DIR / f"campaign-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    write_atomic(state_path, json.dumps({
+        "benchmarks": campaign.benchmarks, "instances": [n for n, _ in instances], "runs": args.runs,
+        "limits": campaign.limits, "elapsed_s": round(time.monotonic() - t0, 1), "counts": counts, "state": state,
+    }, indent=2, ensure_ascii=False))
+    print(f"\n{len(campaign.benchmarks)}개 벤치마크 × {len(instances)}개 인스턴스 — "
+          + ", ".join(f"{k} {v}" for k, v in sorted(counts.items())) + f" -> {state_path}")
+    failures = campaign.failures()
+    for bench, inst, run, error in failures:
+        print(f"  FAILED {bench} {inst} run{run}: {error}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
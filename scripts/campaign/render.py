@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""벤치마크 YAML 템플릿 단일 패스 렌더러 + 인스턴스 용량 검증 — `sed -e s/.../g` 파이프라인 대체.
+
+    python scripts/campaign/render.py [benchmark ...] [--instances a,b] [--runs 5]
+        [--instance-file config/instances-4vcpu.txt] [--out DIR | --out -] [--set KEY=VALUE ...]
+    python scripts/campaign/render.py --template benchmarks/kafka/kafka-benchmark-max.yaml \
+        --instances c8g.xlarge --runs 1 --set CODEC=lz4 | kubectl apply -f -    # 셸 스크립트용 단건 렌더
+
+- 템플릿은 파일마다 1번만 읽어 주석 줄/본문 조각으로 나눠 둔다(load_template, 캐시). 렌더 =
+  본문 조각에 정규식 1개로 단일 패스 치환 — 치환된 값이 다른 placeholder로 다시 치환되는 일이 없다.
+- placeholder는 PLACEHOLDERS에 선언된 것만, 타입 검사(TYPES)를 통과한 값으로만 치환한다.
+  - 토큰 경계: 앞뒤가 대문자/숫자/_가 아니어야 함(소문자는 허용 — `runRUN_NUMBER`). 셸 변수 문맥
+    (`$NAME`, `${NAME}`, `NAME=`)은 템플릿 스크립트의 진짜 변수라 건드리지 않는다. 예외로
+    `${INSTANCE_TYPE}`는 템플릿들이 placeholder로 써 온 형태라 그대로 치환.
+  - ARCH는 context="value": YAML 값 위치(`kubernetes.io/arch: ARCH`)에서만. 예전 sed의 전역 s/ARCH/는
+    clickhouse 스크립트의 `ARCH="$(uname -m)"`/`echo "ARCH: ..."`(로그 계약)까지 바꿔 버렸다.
+  - 전체 줄 주석(`# ...`)은 치환하지 않는다(템플릿 머리말의 placeholder 설명이 그대로 남음).
+  - 템플릿에 있는 placeholder의 값이 없으면 RenderError — 덜 렌더된 매니페스트가 나가지 않게.
+- validate(): 렌더된 Job/Deployment의 nodeSelector와 resources.requests를 인스턴스 사양(instances-*.txt의
+  arch/mem_mb, 파일명의 vCPU)과 대조한다. 인스턴스에 고정된 pod는 그 인스턴스의 allocatable,
+  benchmark-client pod는 CLIENT_SPEC 기준. allocatable = EKS AMI kube-reserved 공식(cpu: 코어별 비율,
+  memory: 255Mi + 11Mi × max-pods) + eviction 100Mi를 뺀 값. YAML은 들여쓰기 기반 최소 파서로 읽는다
+  (표준 라이브러리만 — block scalar(|)인 스크립트 본문은 건너뜀).
+"""
+import argparse
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+BENCH_DIR = BASE_DIR / "benchmarks"
+INSTANCE_FILE = BASE_DIR / "config" / "instances-4vcpu.txt"
+K8S_ARCH = {"x86_64": "amd64", "arm64": "arm64"}
+
+TYPES = {
+    "instance": re.compile(r"[a-z][a-z0-9-]*\.[0-9]*x?large|[a-z][a-z0-9-]*\.(metal|medium|small|micro|nano)"),
+    "dns": re.compile(r"[a-z0-9]([-a-z0-9]{0,61}[a-z0-9])?"),
+    "int": re.compile(r"[1-9][0-9]*"),
+    "number": re.compile(r"[0-9]+(\.[0-9]+)?"),
+    "arch": re.compile(r"amd64|arm64"),
+    "version": re.compile(r"[0-9]+(\.[0-9]+)+"),
+    "codec": re.compile(r"uncompressed|lz4|zstd|gzip|snappy"),
+}
+# 이름 -> (타입, 문맥). 문맥 "token" = 토큰 경계 어디서나, "value" = YAML 값 위치에서만.
+PLACEHOLDERS = {
+    "${INSTANCE_TYPE}": ("instance", "literal"),
+    "INSTANCE_TYPE": ("instance", "token"),
+    "INSTANCE_SAFE": ("dns", "token"),
+    "ARCH": ("arch", "value"),
+    "RUN_NUMBER": ("int", "token"),
+    "JOB_NAME": ("dns", "token"),
+    "KAFKA_VERSION": ("version", "token"),
+    "CLICKHOUSE_VERSION": ("version", "token"),
+    "CODEC": ("codec", "token"),
+    "BASELINE_MB": ("number", "token"),
+}
+
+
+def _pattern():
+    parts = []
+    for name, (_, context) in sorted(PLACEHOLDERS.items(), key=lambda kv: -len(kv[0])):
+        if context == "literal":
+            parts.append(re.escape(name))
+        elif context == "value":
+            parts.append(rf"(?<=: ){name}(?=[ \t]*$)")
+        else:
+            parts.append(rf"(?<![A-Z0-9_$\{{]){name}(?![A-Z0-9_=])")
+    return re.compile("|".join(parts), re.M)
+
+
+PATTERN = _pattern()
+COMMENT_LINE = re.compile(r"^[ \t]*#.*\n?", re.M)
+
+# benchmark-client NodePool 인스턴스(nodepool-benchmark-client.yaml / 라이브 c6in.8xlarge)
+CLIENT_SPEC = {"name": "c6in.8xlarge", "arch": "amd64", "vcpu": 32, "mem_mb": 65536}
+MAX_PODS = 58           # xlarge/2xlarge ENI 기준 max-pods
+EVICTION_MI = 100
+
+
+class RenderError(ValueError):
+    pass
+
+
+def load_instance_specs(path=INSTANCE_FILE):
+    """instances-<N>vcpu.txt -> {name: {"arch": k8s arch, "mem_mb", "vcpu"}}. 형식이 깨진 줄은 ValueError."""
+    m = re.search(r"(\d+)vcpu", path.name)
+    if not m:
+        raise ValueError(f"{path.name}: 파일명에서 vCPU 수를 알 수 없음(instances-<N>vcpu.txt)")
+    specs = {}
+    for lineno, line in enumerate(path.read_text().splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = line.split()
+        if len(parts) < 3 or parts[1] not in K8S_ARCH or not parts[2].isdigit():
+            raise ValueError(f"{path.name}:{lineno}: 'name arch mem_mb' 형식이 아님 — {line!r}")
+        specs[parts[0]] = {"arch": K8S_ARCH[parts[1]], "mem_mb": int(parts[2]), "vcpu": int(m.group(1))}
+    return specs
+
+
+class Template:
+    """템플릿 1개 — 읽을 때 주석 줄/본문 조각으로 나누고 쓰인 placeholder를 미리 찾아 둔다."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        text = self.path.read_text()
+        self.chunks = []  # [(is_comment, text)]
+        pos = 0
+        for m in COMMENT_LINE.finditer(text):
+            if m.start() > pos:
+                self.chunks.append((False, text[pos:m.start()]))
+            self.chunks.append((True, m.group(0)))
+            pos = m.end()
+        if pos < len(text):
+            self.chunks.append((False, text[pos:]))
+        self.used = {m.group(0) for is_comment, chunk in self.chunks if not is_comment for m in PATTERN.finditer(chunk)}
+
+    def render(self, values, allow_missing=()):
+        """values: {placeholder 이름: 값}. ${INSTANCE_TYPE}는 INSTANCE_TYPE 값을 쓴다.
+        allow_missing에 든 placeholder는 값이 없으면 그대로 둔다(버릴 문서에만 있는 것 — 예: Job의 JOB_NAME)."""
+        lookup = {}
+        for name in self.used:
+            key = "INSTANCE_TYPE" if name == "${INSTANCE_TYPE}" else name
+            if key not in values:
+                continue
+            value = str(values[key])
+            kind = PLACEHOLDERS[name][0]
+            if not TYPES[kind].fullmatch(value):
+                raise RenderError(f"{self.path.name}: {key}={value!r} — {kind} 형식이 아님")
+            lookup[name] = value
+        missing = sorted(self.used - lookup.keys() - set(allow_missing))
+        if missing:
+            raise RenderError(f"{self.path.name}: 값이 없는 placeholder {', '.join(missing)}")
+        return "".join(chunk if is_comment else PATTERN.sub(lambda m: lookup.get(m.group(0), m.group(0)), chunk)
+                       for is_comment, chunk in self.chunks)
+
+
+@lru_cache(maxsize=None)
+def load_template(path):
+    return Template(path)
+
+
+# ---------------------------------------------------------------------- validation
+
+def parse_quantity(value, unit):
+    """k8s quantity -> cpu milli / memory Mi."""
+    value = value.strip().strip("\"'")
+    if unit == "cpu":
+        return float(value[:-1]) if value.endswith("m") else float(value) * 1000
+    scale = {"Ki": 1 / 1024, "Mi": 1, "Gi": 1024, "Ti": 1024 ** 2, "K": 1000 / 1024 ** 2, "M": 1000 ** 2 / 1024 ** 2,
+             "G": 1000 ** 3 / 1024 ** 2}
+    for suffix, factor in sorted(scale.items(), key=lambda kv: -len(kv[0])):
+        if value.endswith(suffix):
+            return float(value[: -len(suffix)]) * factor
+    return float(value) / 1024 ** 2
+
+
+def pod_spec(doc):
+    """렌더된 문서 1개 -> (nodeSelector dict, {(kind, idx): {"cpu": m, "memory": Mi}}). kind = containers|initContainers."""
+    selectors, requests = {}, {}
+    stack = []  # [(indent, key)]
+    block_indent = None
+    counters = {}
+    current = {}
+    for line in doc.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        indent = len(line) - len(line.lstrip(" "))
+        if block_indent is not None:
+            if indent > block_indent:
+                continue
+            block_indent = None
+        if stripped.startswith("- ") or stripped == "-":
+            while stack and stack[-1][0] > indent:
+                stack.pop()
+            parent = stack[-1][1] if stack else None
+            if parent in ("containers", "initContainers"):
+                counters[parent] = counters.get(parent, -1) + 1
+                current[parent] = counters[parent]
+            stripped = stripped[2:].strip()
+            indent += 2
+            if not stripped:
+                continue
+        key, sep, value = stripped.partition(":")
+        if not sep:
+            continue
+        key, value = key.strip().strip("\"'"), value.strip()
+        while stack and stack[-1][0] >= indent:
+            stack.pop()
+        path = [k for _, k in stack]
+        if value in ("|", "|-", "|+", ">", ">-", ">+"):
+            block_indent = indent
+        if path and path[-1] == "nodeSelector":
+            selectors[key] = value.strip("\"'")
+        elif path[-2:] == ["resources", "requests"] and key in ("cpu", "memory"):
+            kind = next((k for k in reversed(path) if k in ("containers", "initContainers")), None)
+            if kind is not None:
+                requests.setdefault((kind, current.get(kind, 0)), {})[key] = parse_quantity(value, key)
+        stack.append((indent, key))
+    return selectors, requests
+
+
+def allocatable(spec):
+    """EKS AMI kube-reserved 공식 기준 (cpu milli, memory Mi)."""
+    v = spec["vcpu"]
+    cpu_reserved = 60 + (10 if v >= 2 else 0) + 5 * min(max(v - 2, 0), 2) + 2.5 * max(v - 4, 0)
+    mem_reserved = 255 + 11 * MAX_PODS + EVICTION_MI
+    return v * 1000 - cpu_reserved, spec["mem_mb"] - mem_reserved
+
+
+def validate(manifest, instance, spec):
+    """렌더된 멀티 문서 -> 문제 목록 [str]. 빈 리스트면 통과."""
+    from orchestrate import doc_kind, doc_name, split_docs
+
+    issues = []
+    for doc in split_docs(manifest):
+        kind, name = doc_kind(doc), doc_name(doc) or "?"
+        if name != "?" and (len(name) > 63 or not TYPES["dns"].fullmatch(name)):
+            issues.append(f"{kind}/{name}: 이름이 DNS-1123 label(≤63자)이 아님")
+        if kind not in ("Job", "Deployment", "StatefulSet", "Pod"):
+            continue
+        selectors, requests = pod_spec(doc)
+        if selectors.get("node-type") == "benchmark-client":
+            target = CLIENT_SPEC
+        elif "node.kubernetes.io/instance-type" in selectors:
+            pinned = selectors["node.kubernetes.io/instance-type"]
+            if pinned != instance:
+                issues.append(f"{kind}/{name}: instance-type nodeSelector {pinned} ≠ {instance}")
+            target = {**spec, "name": instance}
+        else:
+            issues.append(f"{kind}/{name}: nodeSelector에 instance-type/node-type이 없음 — 어느 노드에 뜰지 모름")
+            continue
+        arch = selectors.get("kubernetes.io/arch")
+        if arch is not None and arch != target["arch"]:
+            issues.append(f"{kind}/{name}: kubernetes.io/arch {arch} ≠ {target['name']}({target['arch']})")
+        cpu_alloc, mem_alloc = allocatable(target)
+        for res, alloc, unit in (("cpu", cpu_alloc, "m"), ("memory", mem_alloc, "Mi")):
+            main = sum(r.get(res, 0) for (k, _), r in requests.items() if k == "containers")
+            init = max((r.get(res, 0) for (k, _), r in requests.items() if k == "initContainers"), default=0)
+            need = max(main, init)
+            if need > alloc:
+                issues.append(f"{kind}/{name}: requests.{res} {need:.0f}{unit} > {target['name']} allocatable {alloc:.0f}{unit}")
+    return issues
+
+
+# ---------------------------------------------------------------------- CLI
+
+def render_one(args, specs, extra):
+    """--template: generate-*.sh가 sed 파이프 대신 쓰는 단건 렌더. run 번호 = --runs."""
+    from orchestrate import values
+
+    if len(specs) != 1:
+        raise SystemExit("--template에는 --instances로 인스턴스를 정확히 1개 지정")
+    (instance, spec), = specs.items()
+    try:
+        manifest = load_template(args.template.resolve()).render(values(instance, spec["arch"], run=args.runs, extra=extra))
+    except RenderError as e:
+        print(f"  INVALID {e}", file=sys.stderr)
+        return 1
+    issues = validate(manifest, instance, spec)
+    for issue in issues:
+        print(f"  INVALID {instance}: {issue}", file=sys.stderr)
+    if issues:
+        return 1
+    sys.stdout.write(manifest)
+    return 0
+
+
+def parse_args(argv):
+    from orchestrate import BENCHMARKS, DEFAULT_RUNS
+
+    p = argparse.ArgumentParser(description="벤치마크 매니페스트 렌더 + 인스턴스 용량 검증")
+    p.add_argument("benchmarks", nargs="*", help=f"기본: 전부 ({', '.join(BENCHMARKS)})")
+    p.add_argument("--instances", help="쉼표 구분 부분집합(기본: 인스턴스 파일 전체)")
+    p.add_argument("--instance-file", type=Path, default=INSTANCE_FILE)
+    p.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    p.add_argument("--out", help="'-'면 stdout 멀티 문서, 디렉터리면 <bench>/<inst>[-run<N>].yaml (기본: 검증만)")
+    p.add_argument("--set", action="append", default=[], metavar="KEY=VALUE", help="추가 placeholder 값(CODEC 등)")
+    p.add_argument("--template", type=Path, help="템플릿 1개를 인스턴스 1개 × run --runs 하나로 렌더해 stdout으로(검증 실패면 종료 코드 1)")
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    from orchestrate import BENCHMARKS, unit_manifests
+
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    unknown = [b for b in args.benchmarks if b not in BENCHMARKS]
+    if unknown:
+        raise SystemExit(f"알 수 없는 벤치마크: {', '.join(unknown)} (가능: {', '.join(BENCHMARKS)})")
+    specs = load_instance_specs(args.instance_file)
+    if args.instances:
+        wanted = args.instances.split(",")
+        missing = [w for w in wanted if w not in specs]
+        if missing:
+            raise SystemExit(f"{args.instance_file.name}에 없는 인스턴스: {', '.join(missing)}")
+        specs = {n: s for n, s in specs.items() if n in wanted}
+    extra = dict(item.partition("=")[::2] for item in args.set)
+    if args.template:
+        return render_one(args, specs, extra)
+    out_dir = Path(args.out) if args.out not in (None, "-") else None
+    n_docs, problems = 0, []
+    for bench in args.benchmarks or list(BENCHMARKS):
+        for instance, spec in specs.items():
+            try:
+                unit_docs, for_run = unit_manifests(BENCHMARKS[bench], instance, spec["arch"], extra)
+                rendered = [("", "".join(f"---\n{d}" for d in unit_docs))] if unit_docs else []
+                rendered += [(f"-run{run}", for_run(run)[0]) for run in range(1, args.runs + 1)]
+            except RenderError as e:
+                problems.append(f"[{bench}] {instance}: {e}")
+                continue
+            for suffix, manifest in rendered:
+                problems += [f"[{bench}] {instance}: {msg}" for msg in validate(manifest, instance, spec)]
+                n_docs += manifest.count("\n---\n") + manifest.startswith("---\n")
+                if args.out == "-":
+                    sys.stdout.write(manifest)
+                elif out_dir is not None:
+                    dest = out_dir / bench / f"{instance}{suffix}.yaml"
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    dest.write_text(manifest)
+    summary = f"{len(args.benchmarks or BENCHMARKS)}개 벤치마크 × {len(specs)}개 인스턴스 × {args.runs} run — 문서 {n_docs}개"
+    print(summary + (f" -> {out_dir}" if out_dir else ""), file=sys.stderr)
+    for problem in problems:
+        print(f"  INVALID {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
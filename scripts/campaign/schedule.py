@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""노드 시간 최소화 스케줄러 + 시뮬레이터 — 인스턴스 타입마다 노드를 한 번만 띄워 벤치마크를 이어 돌린다.
+
+    python scripts/campaign/schedule.py [benchmark ...] [--instances a,b] [--runs 5]
+        [--limit benchmark-server=20 --limit benchmark-client=16] [--out PLAN.json]
+    python scripts/campaign/orchestrate.py --plan PLAN.json
+
+현행(벤치마크별 캠페인)은 (벤치마크, 인스턴스)마다 노드를 새로 띄우고 끝나면 consolidation으로
+내린다 — 타입당 프로비저닝 ~14회. 벤치마크 pod는 모두 `benchmark` 라벨 hostname anti-affinity라
+노드를 독점하므로 같은 노드에 동시에 올릴 수는 없지만, 순서대로 이어 붙이면 노드 하나로 충분하다.
+
+모델(simulate):
+- server 노드: 체인 시작 시 생성 -> PROVISION_S 뒤 Ready -> step들을 순서대로 -> 마지막 step 뒤
+  CONSOLIDATE_S까지 과금. 동시 노드 수 = benchmark-server 한도.
+- step = 한 벤치마크의 run 전부: runs × job_s(+ 서버형이면 SERVER_READY_S). 클라이언트형(redis/
+  nginx/springboot/elasticsearch/kafka)은 step 동안 benchmark-client 노드 하나를 독점한다.
+  client 노드는 필요할 때 생성(PROVISION_S 대기), 비면 CLIENT_KEEP_S 안에 다음 요청이 오면 재사용,
+  아니면 종료. iperf3는 서버 pod가 같은 타입 노드를 하나 더 쓴다(PEER_BENCHES — 별도 과금).
+- 체인 내 순서는 시뮬레이션 중 결정: client 노드가 남아 있으면 클라이언트형 step을, 아니면
+  server 단독 step을 먼저(가장 긴 것부터) — client 대기로 server 노드가 노는 시간을 줄인다.
+  체인 자체는 총 시간이 긴 인스턴스부터(LPT) 슬롯에 배정.
+- 현행 모델 = 벤치마크마다 단계(phase)를 나눠 (벤치마크, 인스턴스)를 한 step짜리 체인으로 같은 엔진에.
+
+job_s(run 1회의 Job wall time) 학습 순서: logs/campaign-*.json의 elapsed_s(orchestrate.py가 기록) >
+로그 안 ISO 타임스탬프 첫-끝 간격 + JOB_OVERHEAD_S(redis Start/End, springboot 기동 로그 등
+간격이 있는 로그만; MAX_SPAN_S 넘는 간격은 ES 데이터셋 날짜 같은 잡음이라 버림) > DEFAULT_JOB_S
+(템플릿 측정 시간 합 + 설치/pull 여유로 잡은 추정치). 인스턴스별 표본이 있으면 그 중앙값,
+없으면 벤치마크 전체 중앙값.
+
+benchmark-server NodePool의 consolidateAfter가 step 사이 공백(수 초)보다 짧으면 체인 중간에 노드가
+내려갈 수 있다 — 체인 실행 시 consolidateAfter ≥ CONSOLIDATE_S로 둘 것.
+"""
+import argparse
+import heapq
+import json
+import re
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import orchestrate
+from orchestrate import BENCHMARKS, CLIENT_POOL, DEFAULT_LIMITS, DEFAULT_RUNS, LOGS_DIR, RESULTS_DIR, SERVER_POOL
+
+sys.path.insert(0, str(orchestrate.BASE_DIR / "scripts" / "dashboard"))
+from common import PRICE, RUN_DIR_ALIASES  # noqa: E402
+
+PROVISION_S = 90        # Karpenter NodeClaim 생성 ~ 노드 Ready
+CONSOLIDATE_S = 60      # 마지막 pod 종료 ~ 인스턴스 종료까지 과금 꼬리
+CLIENT_KEEP_S = 30      # nodepool-benchmark-client.yaml consolidateAfter
+JOB_OVERHEAD_S = 30     # run마다 pod 스케줄/컨테이너 시작/로그 수집
+SERVER_READY_S = 60     # 서버형 Deployment rollout
+MAX_SPAN_S = 6 * 3600
+SPAN_READ_BYTES = 1 << 16
+CLIENT_INSTANCE = "c6in.8xlarge"
+CLIENT_PRICE = PRICE["c6in.xlarge"] * 8  # 같은 패밀리는 vCPU에 비례
+PEER_BENCHES = {"iperf3"}
+# run 1회 Job wall time 추정(초) — 학습 표본이 없을 때만
+DEFAULT_JOB_S = {
+    "sysbench-cpu": 420, "sysbench-memory": 420, "stress-ng": 600, "geekbench": 600, "passmark": 420,
+    "iperf3": 300, "redis": 1800, "nginx": 420, "springboot": 600, "springboot-coldstart": 90,
+    "elasticsearch": 1800, "elasticsearch-coldstart": 180, "kafka": 900, "clickhouse": 1500,
+}
+ISO_TS = re.compile(r"(\d{4}-\d{2}-\d{2})T(\d{2}:\d{2}:\d{2})")
+
+
+# ---------------------------------------------------------------------- durations
+
+def log_span(path):
+    """로그 안 ISO 타임스탬프 첫-끝 간격(초). 없거나 1개거나 MAX_SPAN_S 초과면 None.
+
+    첫/끝 타임스탬프만 필요하므로 앞뒤 SPAN_READ_BYTES만 읽는다(ES/kafka 로그는 수 MB).
+    """
+    with path.open("rb") as f:
+        head = f.read(SPAN_READ_BYTES)
+        f.seek(max(f.seek(0, 2) - SPAN_READ_BYTES, len(head)))
+        text = (head + b"\n" + f.read()).decode(errors="replace")
+    stamps = [datetime.fromisoformat(f"{d}T{t}") for d, t in ISO_TS.findall(text)]
+    if len(stamps) < 2:
+        return None
+    span = (max(stamps) - min(stamps)).total_seconds()
+    return span if 0 < span <= MAX_SPAN_S else None
+
+
+def learn_durations(benchmarks, instances, results_dir=RESULTS_DIR, logs_dir=LOGS_DIR):
+    """-> {bench: {"default": job_s, "source": ..., "samples": n, "per_instance": {inst: job_s}}}."""
+    samples = {b: {} for b in benchmarks}
+    sources = {b: set() for b in benchmarks}
+    for state_file in sorted(logs_dir.glob("campaign-*.json")):
+        state = json.loads(state_file.read_text()).get("state", {})
+        for bench in benchmarks:
+            for inst, runs in state.get(bench, {}).items():
+                for r in runs.values():
+                    if r.get("status") == "done" and r.get("elapsed_s"):
+                        samples[bench].setdefault(inst, []).append(r["elapsed_s"])
+                        sources[bench].add("campaign")
+    names = [n for n, _ in instances]
+    for bench in benchmarks:
+        if sources[bench]:
+            continue  # 실측 wall time이 있으면 로그 간격(작업 구간만)은 쓰지 않음
+        spec = BENCHMARKS[bench]
+        pattern = spec["log"].replace("{run}", "*")
+        for inst in names:
+            inst_dir = results_dir / spec["results"] / RUN_DIR_ALIASES.get((spec["results"], inst), inst)
+            for lp in sorted(inst_dir.glob(pattern)) if inst_dir.is_dir() else []:
+                span = log_span(lp)
+                if span is not None:
+                    samples[bench].setdefault(inst, []).append(span + JOB_OVERHEAD_S)
+                    sources[bench].add("log-span")
+    out = {}
+    for bench in benchmarks:
+        per_inst = {inst: statistics.median(v) for inst, v in samples[bench].items()}
+        n = sum(len(v) for v in samples[bench].values())
+        out[bench] = {
+            "default": statistics.median(per_inst.values()) if per_inst else DEFAULT_JOB_S[bench],
+            "source": "+".join(sorted(sources[bench])) or "default",
+            "samples": n,
+            "per_instance": {k: round(v, 1) for k, v in per_inst.items()},
+        }
+    return out
+
+
+def step_seconds(bench, instance, durations, runs):
+    d = durations[bench]
+    job_s = d["per_instance"].get(instance, d["default"])
+    return runs * job_s + (SERVER_READY_S if BENCHMARKS[bench].get("server") else 0)
+
+
+# ---------------------------------------------------------------------- simulation
+
+class ClientPool:
+    """benchmark-client 노드 — 한도 안에서 필요 시 생성, CLIENT_KEEP_S 안에 다시 쓰이면 재사용."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.busy = 0
+        self.idle = []          # [(free_at, born)]
+        self.node_s = 0.0
+        self.provisions = 0
+
+    def expire(self, now):
+        alive = []
+        for free_at, born in self.idle:
+            if free_at + CLIENT_KEEP_S < now:
+                self.node_s += free_at + CLIENT_KEEP_S - born
+            else:
+                alive.append((free_at, born))
+        self.idle = alive
+
+    def available(self, now):
+        self.expire(now)
+        return bool(self.idle) or self.busy + len(self.idle) < self.limit
+
+    def acquire(self, now):
+        """-> (Ready 시각, born)."""
+        self.busy += 1
+        if self.idle:
+            self.idle.sort()
+            _, born = self.idle.pop()
+            return now, born
+        self.provisions += 1
+        return now + PROVISION_S, now
+
+    def release(self, now, born):
+        self.busy -= 1
+        self.idle.append((now, born))
+
+    def close(self):
+        for free_at, born in self.idle:
+            self.node_s += free_at + CLIENT_KEEP_S - born
+        self.idle = []
+
+
+def simulate(phases, client_limit):
+    """phases = [(server 한도, [(instance, [(bench, seconds)...])...])...] — phase는 순서대로, phase 안 체인은 동시.
+
+    -> {"server_node_s": {inst: s}, "client_node_s", "makespan_s", "provisions", "chains": [...]}.
+    """
+    clients = ClientPool(client_limit)
+    server_node_s = {}
+    provisions = 0
+    timeline = []
+    now = 0.0
+    for server_limit, phase in phases:
+        queue = sorted(phase, key=lambda c: -sum(s for _, s in c[1]))
+        events = []  # (time, seq, chain_idx, client_born | None)
+        seq = 0
+        chains = []
+        waiting = []
+        active = 0
+
+        def start(chain, at):
+            nonlocal active, provisions, seq
+            instance, steps = chain
+            active += 1
+            provisions += 1
+            chains.append({"instance": instance, "start_s": at, "remaining": list(steps), "steps": []})
+            seq += 1
+            heapq.heappush(events, (at + PROVISION_S, seq, len(chains) - 1, None))
+
+        def advance(idx, at):
+            nonlocal active, seq, provisions
+            ch = chains[idx]
+            if not ch["remaining"]:
+                ch["end_s"] = at
+                server_node_s[ch["instance"]] = server_node_s.get(ch["instance"], 0.0) + at - ch["start_s"] + CONSOLIDATE_S
+                active -= 1
+                if queue:
+                    start(queue.pop(0), at)
+                return
+            client_steps = [s for s in ch["remaining"] if BENCHMARKS[s[0]].get("client")]
+            server_steps = [s for s in ch["remaining"] if not BENCHMARKS[s[0]].get("client")]
+            if client_steps and clients.available(at):
+                step = max(client_steps, key=lambda s: s[1])
+                ready, born = clients.acquire(at)
+            elif server_steps:
+                step, ready, born = max(server_steps, key=lambda s: s[1]), at, None
+            else:
+                waiting.append(idx)  # client 대기 — server 노드는 놀면서 과금
+                return
+            ch["remaining"].remove(step)
+            bench, seconds = step
+            begin = max(at, ready)
+            ch["steps"].append({"bench": bench, "start_s": round(begin, 1), "end_s": round(begin + seconds, 1)})
+            if bench in PEER_BENCHES:
+                server_node_s[ch["instance"]] = server_node_s.get(ch["instance"], 0.0) + PROVISION_S + seconds + CONSOLIDATE_S
+                provisions += 1
+            seq += 1
+            heapq.heappush(events, (begin + seconds, seq, idx, born))
+
+        while queue and active < server_limit:
+            start(queue.pop(0), now)
+        while events:
+            at, _, idx, born = heapq.heappop(events)
+            if born is not None:
+                clients.release(at, born)
+                retry, waiting[:] = list(waiting), []
+                for w in retry:
+                    advance(w, at)
+            advance(idx, at)
+            now = max(now, at)
+        timeline.extend(chains)
+    clients.close()
+    return {
+        "server_node_s": server_node_s,
+        "client_node_s": clients.node_s,
+        "makespan_s": now,
+        "provisions": provisions + clients.provisions,
+        "chains": [
+            {"instance": c["instance"], "start_s": round(c["start_s"], 1), "end_s": round(c["end_s"], 1), "steps": c["steps"]}
+            for c in timeline
+        ],
+    }
+
+
+def summarize(sim):
+    server_h = sum(sim["server_node_s"].values()) / 3600
+    client_h = sim["client_node_s"] / 3600
+    cost = sum(s / 3600 * PRICE[i] for i, s in sim["server_node_s"].items()) + client_h * CLIENT_PRICE
+    return {
+        "server_node_h": round(server_h, 2), "client_node_h": round(client_h, 2), "cost_usd": round(cost, 2),
+        "makespan_h": round(sim["makespan_s"] / 3600, 2), "provisions": sim["provisions"],
+    }
+
+
+def plan(benchmarks, instances, runs=DEFAULT_RUNS, limits=None, durations=None):
+    """-> (계획 dict, 현행 요약, 체인 요약)."""
+    limits = {**DEFAULT_LIMITS, **(limits or {})}
+    durations = durations or learn_durations(benchmarks, instances)
+    steps = {name: [(b, step_seconds(b, name, durations, runs)) for b in benchmarks] for name, _ in instances}
+    # 현행: orchestrate.py 기본 모드처럼 클라이언트형은 server/client 슬롯을 함께 잡은 뒤에야 노드를 띄움
+    baseline = simulate([
+        (min(limits[SERVER_POOL], limits[CLIENT_POOL]) if BENCHMARKS[b].get("client") else limits[SERVER_POOL],
+         [(name, [steps[name][i]]) for name, _ in instances])
+        for i, b in enumerate(benchmarks)
+    ], limits[CLIENT_POOL])
+    chained = simulate([(limits[SERVER_POOL], [(name, steps[name]) for name, _ in instances])], limits[CLIENT_POOL])
+    out = {
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "params": {
+            "runs": runs, "limits": limits, "provision_s": PROVISION_S, "consolidate_s": CONSOLIDATE_S,
+            "client_keep_s": CLIENT_KEEP_S, "job_overhead_s": JOB_OVERHEAD_S, "server_ready_s": SERVER_READY_S,
+            "client_instance": CLIENT_INSTANCE,
+        },
+        "durations": {b: {k: d[k] for k in ("default", "source", "samples")} for b, d in durations.items()},
+        "summary": {"baseline": summarize(baseline), "chained": summarize(chained)},
+        "chains": sorted(chained["chains"], key=lambda c: c["start_s"]),
+    }
+    return out
+
+
+def parse_args(argv):
+    p = argparse.ArgumentParser(description="노드 시간 최소화 캠페인 계획 + 시뮬레이션")
+    p.add_argument("benchmarks", nargs="*", help=f"기본: 전부 ({', '.join(BENCHMARKS)})")
+    p.add_argument("--instances", help="쉼표 구분 부분집합(기본: --sizes 인스턴스 파일 전체)")
+    p.add_argument("--sizes", default=orchestrate.BASE_SIZE, help="쉼표 구분 크기(xlarge, 2xlarge)")
+    p.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    p.add_argument("--limit", action="append", default=[], metavar="POOL=N", help="nodepool별 동시 노드 수")
+    p.add_argument("--out", type=Path, help="계획 JSON(orchestrate.py --plan 입력)")
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    unknown = [b for b in args.benchmarks if b not in BENCHMARKS]
+    if unknown:
+        raise SystemExit(f"알 수 없는 벤치마크: {', '.join(unknown)} (가능: {', '.join(BENCHMARKS)})")
+    instances = orchestrate.load_instances(orchestrate.parse_sizes(args.sizes))
+    if args.instances:
+        wanted = set(args.instances.split(","))
+        instances = [(n, a) for n, a in instances if n in wanted]
+    limits = {pool: int(n) for pool, _, n in (item.partition("=") for item in args.limit)}
+    result = plan(args.benchmarks or list(BENCHMARKS), instances, args.runs, limits)
+
+    print(f"{'벤치마크':<24}{'run당(s)':>10}  출처(표본)")
+    for bench, d in result["durations"].items():
+        print(f"{bench:<24}{d['default']:>10.0f}  {d['source']}({d['samples']})")
+    print(f"\n{'':<22}{'server 노드h':>12}{'client 노드h':>12}{'비용 USD':>10}{'makespan h':>12}{'노드 생성':>10}")
+    for label, key in (("벤치마크별(현행)", "baseline"), ("인스턴스 체인", "chained")):
+        s = result["summary"][key]
+        print(f"{label:<22}{s['server_node_h']:>12.1f}{s['client_node_h']:>12.1f}{s['cost_usd']:>10.2f}"
+              f"{s['makespan_h']:>12.1f}{s['provisions']:>10}")
+    base, chained = result["summary"]["baseline"], result["summary"]["chained"]
+    if base["cost_usd"]:
+        print(f"\n체인 계획: 비용 {(1 - chained['cost_usd'] / base['cost_usd']) * 100:.1f}% 절감, "
+              f"노드 생성 {base['provisions']} -> {chained['provisions']}")
+    if args.out:
+        orchestrate.write_atomic(args.out, json.dumps(result, indent=1, ensure_ascii=False))
+        print(f"-> {args.out} (python scripts/campaign/orchestrate.py --plan {args.out})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 #!/bin/bash
 # 벤치마크 결과 수집 및 HTML 리포트 생성
+# 로그 수집은 scripts/campaign/collect.py로 대체됨(동시 수집·재개·증분 재빌드)
 
 RESULTS_DIR="/home/ec2-user/benchmark/results"
 BENCHMARK_TYPE=${1:-all}  # all, geekbench, passmark, coldstart
@@ -0,0 +1,112 @@
+"""봉투 `aggregates` 키 — 탭마다 브라우저가 다시 계산하던 그룹 집계를 빌드 시 1회 계산.
+
+site/js/shared.js의 aggregateByGenArch/metricTabChart(arch × gen 평균), familyChart(C/M/R × arch
+평균), genImprovement(세대 간 개선율), perDollar(값 / canonical 가격)와 같은 규칙:
+- 그룹 키(arch/gen/family/price)는 instances.json(canonical) 값 — 클라이언트 조인과 동일.
+- 평균은 값이 있는(null 아닌) 인스턴스만. 빈 그룹은 null.
+- 개선율: intel 5→6→7→8, graviton 6→7→8 연속 세대 쌍, (cur - prev) / prev × 100을 소수 1자리
+  (JS Math.round와 같은 반올림).
+
+집계 대상 지표 = 인스턴스 dict의 숫자 leaf 중 깊이 ≤ 2(dot-path 'rally.throughput'까지)이고,
+상위 dict 키가 MAP_MAX_KEYS 이하인 것(clickhouse per_query_ms 같은 쿼리별 맵은 차트 지표가
+아님). canonical 메타데이터(price/mem_mb 등)는 제외. 평균/가성비는 유효숫자 SIG_DIGITS자리로
+저장(warmup_cost_usd처럼 값이 작은 지표가 있어 소수 자릿수 고정 반올림은 부적합), 개선율은
+반올림 전 평균으로 계산.
+per_dollar는 봉투 instances와 같은 순서의 배열(인스턴스명 반복을 피함 — 값/가격이 없으면 null).
+그룹 평균/개선율은 기준 크기(BASE_SIZE, xlarge) 인스턴스만 — --sizes로 2xlarge가 섞여도 세대×아키텍처
+비교가 크기 차이로 오염되지 않게. 크기 간 비교는 scaling.py(_scaling.json) 몫.
+
+JS 헬퍼는 loadData()가 만든 rows 그대로 넘어왔을 때만 이 값을 쓰고, 탭이 rows를 거르거나
+가공하면(새 배열/새 객체) 예전처럼 직접 계산한다 — 부분집합에 전체 집계를 쓰는 일이 없도록.
+"""
+import math
+
+from common import BASE_SIZE, build_instances, is_number
+
+GENS = [5, 6, 7, 8]
+ARCHES = ["intel", "amd", "graviton"]
+FAMILIES = ["C", "M", "R"]
+UPLIFT_ARCHES = {"intel": GENS, "graviton": GENS[1:]}
+MAP_MAX_KEYS = 12
+SIG_DIGITS = 6
+
+
+def metric_paths(instances, exclude):
+    """집계 대상 dot-path 목록(첫 등장 순)."""
+    paths = {}
+    for metrics in instances.values():
+        for key, value in metrics.items():
+            if key in exclude:
+                continue
+            if isinstance(value, dict) and 0 < len(value) <= MAP_MAX_KEYS:
+                for sub, v in value.items():
+                    if is_number(v):
+                        paths.setdefault(f"{key}.{sub}", None)
+            elif is_number(value):
+                paths.setdefault(key, None)
+    return list(paths)
+
+
+def dget(obj, path):
+    for k in path.split("."):
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(k)
+    return obj
+
+
+def sig(x):
+    return None if x is None else float(f"{x:.{SIG_DIGITS}g}")
+
+
+def _avg(values):
+    return math.fsum(values) / len(values) if values else None
+
+
+def _pct(prev, cur):
+    return math.floor((cur - prev) / prev * 1000 + 0.5) / 10
+
+
+def aggregate_metric(values, meta, order):
+    """values: {instance: 값}(null 제외) -> {gen_arch, family, uplift, per_dollar}. order = 봉투 인스턴스 순서."""
+    by_gen = {g: {a: [] for a in ARCHES} for g in GENS}
+    by_family = {f: {a: [] for a in ARCHES} for f in FAMILIES}
+    for name, v in values.items():
+        m = meta.get(name)
+        if not m or m["size"] != BASE_SIZE:
+            continue
+        if m["gen"] in by_gen and m["arch"] in ARCHES:
+            by_gen[m["gen"]][m["arch"]].append(v)
+        if m["family"] in by_family and m["arch"] in ARCHES:
+            by_family[m["family"]][m["arch"]].append(v)
+    per_dollar = [
+        sig(values[name] / meta[name]["price"])
+        if name in values and (meta.get(name) or {}).get("price") else None
+        for name in order
+    ]
+    gen_means = {g: {a: _avg(vs) for a, vs in arches.items()} for g, arches in by_gen.items()}
+    uplift = []
+    for arch, gens in UPLIFT_ARCHES.items():
+        for prev_gen, cur_gen in zip(gens, gens[1:]):
+            prev, cur = gen_means[prev_gen][arch], gen_means[cur_gen][arch]
+            if prev is None or cur is None or prev == 0:
+                continue
+            uplift.append({"arch": arch, "from": prev_gen, "to": cur_gen, "pct": _pct(prev, cur)})
+    return {
+        "gen_arch": {str(g): {a: sig(v) for a, v in arches.items()} for g, arches in gen_means.items()},
+        "family": {f: {a: sig(_avg(vs)) for a, vs in arches.items()} for f, arches in by_family.items()},
+        "uplift": uplift,
+        "per_dollar": per_dollar,
+    }
+
+
+def build(instances, meta=None):
+    """봉투 instances -> aggregates dict."""
+    meta = meta or build_instances()
+    exclude = set(next(iter(meta.values()), {}))
+    out = {}
+    for path in metric_paths(instances, exclude):
+        values = {name: v for name, m in instances.items() if is_number(v := dget(m, path))}
+        if values:
+            out[path] = aggregate_metric(values, meta, list(instances))
+    return {"gens": GENS, "arches": ARCHES, "families": FAMILIES, "metrics": out}
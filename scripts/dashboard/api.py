@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""읽기 전용 로컬 HTTP JSON API — site/data 빌드 산출물 위의 질의 엔드포인트(표준 라이브러리만).
+
+    python scripts/dashboard/api.py [--port 8001] [--host 127.0.0.1]
+    curl 'http://127.0.0.1:8001/api/metrics/redis/set_p99_ms?arch=graviton&sort=asc&limit=5'
+
+정적 site/data/*.json(전체 ~400KB)을 통째로 받는 대신 질문 하나에 필요한 만큼만 돌려준다.
+- GET /api                                  엔드포인트 목록 + 벤치마크/지표 키 + 빌드 hash
+- GET /api/instances?<필터>                  instances.json 속성
+- GET /api/instances/<name>                  한 인스턴스의 전체 프로필(속성 + 벤치마크별 지표 + 단위 비용/순위)
+- GET /api/metrics/<bench>/<path>?<필터>&sort=asc|desc&limit=N
+                                            지표 하나를 인스턴스별로(가격, 값/가격 포함). path는 dot-path
+- GET /api/runs/<metric>/<name>              run 단위 원시 값(runs.RUN_METRICS 키 — 원시 로그를 다시 읽음)
+- GET /api/aggregates/<bench>/<path>?by=arch|gen|family|size&<필터>
+                                            그룹별 n/mean/median/min/max
+- GET /api/query?c=<제약>&c=...&objective=min:price&top=10
+                                            query.py와 같은 제약/목표 질의
+<필터> = arch, gen, family, size, flex, instance(쉼표 = 여러 값 중 하나, 대소문자 무시).
+
+캐시/버전:
+- 빌드 버전 = site/data/_manifest.json의 hash(build_data.write_manifest — 내용 해시라 같은 데이터면 같은 값).
+  요청마다 manifest의 (mtime_ns, size)만 보고, 바뀌었으면 데이터를 다시 읽고 응답 캐시를 비운다.
+- 응답 본문은 (빌드 hash, 정규화한 경로+쿼리) 키로 메모리 LRU(LRU_SIZE개)에 둔다.
+- ETag = "<빌드 hash>-<요청 키 해시>" — If-None-Match가 같으면 본문을 만들지도 읽지도 않고 304.
+  Cache-Control: no-cache(항상 재검증)라 빌드가 바뀌면 다음 요청에서 바로 새 값.
+- 예외: /api/runs는 site/data가 아니라 results/ 원시 로그를 읽지만 캐시/ETag는 같은 빌드 hash에 묶인다.
+  로그만 바뀌고 빌드를 다시 하지 않으면(build_data.py 또는 serve.py 재빌드) 다음 빌드까지 이전 값을 준다.
+오류는 {"error": ...} + 400(잘못된 파라미터 — 음수 limit/top 포함)/404(없는 리소스)/405(GET/HEAD 외)/503(빌드 전)/
+500(그 밖의 예외 — 빌드 도중 반쯤 쓰인 JSON을 읽은 경우 등. 캐시하지 않으므로 빌드가 끝나면 다음 요청에서 정상).
+"""
+import hashlib
+import json
+import statistics
+import sys
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlencode, urlsplit
+
+import query
+import runs
+from aggregates import dget
+from build_data import BENCHMARKS, MANIFEST_NAME
+from columnar import decode_table, is_table
+from common import SITE_DATA_DIR, is_number
+from scaling import load_envelopes
+
+DEFAULT_PORT = 8001
+LRU_SIZE = 512
+FILTERS = ["arch", "gen", "family", "size", "flex"]
+GROUP_KEYS = ["arch", "gen", "family", "size"]
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class LRU:
+    """(키 -> 본문 bytes) 최근 사용 순 캐시 — 스레드 서버에서 공유하므로 잠금."""
+
+    def __init__(self, size=LRU_SIZE):
+        self.size = size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, make):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+        value = make()
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class Store:
+    """site/data 빌드 산출물 + manifest hash. 빌드가 바뀌면(manifest 서명 변경) 다시 읽는다."""
+
+    def __init__(self, cache_size=LRU_SIZE):
+        self.cache = LRU(cache_size)
+        self.lock = threading.Lock()
+        self.sig = None
+        self.hash = None
+
+    def refresh(self):
+        path = SITE_DATA_DIR / MANIFEST_NAME
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            raise ApiError(503, f"{MANIFEST_NAME} 없음 — build_data.py를 먼저 실행") from None
+        sig = (st.st_mtime_ns, st.st_size)
+        with self.lock:
+            if sig == self.sig:
+                return self.hash
+            manifest = json.loads(path.read_text())
+            instances = json.loads((SITE_DATA_DIR / "instances.json").read_text())
+            self.instances = decode_table(instances) if is_table(instances) else instances
+            self.envelopes = load_envelopes(BENCHMARKS)
+            self.index = json.loads((SITE_DATA_DIR / query.INDEX_NAME).read_text())
+            self.sig, self.hash = sig, manifest["hash"]
+            self.cache.clear()
+            return self.hash
+
+
+def _values(params, key):
+    return [v.strip().lower() for raw in params.get(key, []) for v in raw.split(",") if v.strip()]
+
+
+def select(instances, params):
+    """필터(arch/gen/family/size/flex/instance)를 통과한 인스턴스명(이름순)."""
+    wanted = {k: set(_values(params, k)) for k in [*FILTERS, "instance"] if _values(params, k)}
+    out = []
+    for name, attrs in sorted(instances.items()):
+        row = {**{k: str(attrs.get(k)).lower() for k in FILTERS}, "instance": name.lower()}
+        if all(row[k] in vs for k, vs in wanted.items()):
+            out.append(name)
+    return out
+
+
+def _int(params, key, default):
+    """음이 아닌 정수 파라미터 — 음수는 슬라이스 rows[:-1]처럼 조용히 뒤를 잘라 버리므로 400."""
+    raw = params.get(key, [None])[-1]
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ApiError(400, f"{key}는 정수여야 함: {raw!r}") from None
+    if value < 0:
+        raise ApiError(400, f"{key}는 0 이상이어야 함: {value}")
+    return value
+
+
+def _envelope(store, bench):
+    env = store.envelopes.get(bench)
+    if env is None:
+        raise ApiError(404, f"알 수 없는 벤치마크: {bench} (가능: {', '.join(store.envelopes)})")
+    return env
+
+
+def _series(store, bench, path, params):
+    """(봉투, [(인스턴스, 값)]) — 필터 통과 + 값이 숫자인 것만."""
+    env = _envelope(store, bench)
+    names = select(store.instances, params)
+    rows = [(n, v) for n in names if is_number(v := dget(env["instances"].get(n), path))]
+    if not rows and not any(is_number(dget(m, path)) for m in env["instances"].values()):
+        raise ApiError(404, f"{bench}에 숫자 지표 {path} 없음")
+    return env, rows
+
+
+def ep_index(store, params):
+    return {
+        "build": store.hash,
+        "endpoints": ["/api/instances", "/api/instances/<name>", "/api/metrics/<bench>/<path>",
+                      "/api/runs/<metric>/<name>", "/api/aggregates/<bench>/<path>", "/api/query"],
+        "filters": [*FILTERS, "instance"],
+        "benchmarks": list(store.envelopes),
+        "run_metrics": list(runs.RUN_METRICS),
+        "instances": len(store.instances),
+    }
+
+
+def ep_instances(store, params):
+    names = select(store.instances, params)
+    return {"count": len(names), "instances": {n: store.instances[n] for n in names}}
+
+
+def ep_instance(store, params, name):
+    if name not in store.instances:
+        raise ApiError(404, f"알 수 없는 인스턴스: {name}")
+    benchmarks, unit_cost = {}, {}
+    for bench, env in store.envelopes.items():
+        if name not in env["instances"]:
+            continue
+        benchmarks[bench] = env["instances"][name]
+        i = list(env["instances"]).index(name)
+        costs = {key: {"label": m["label"], "value": m["values"][i], "rank": m["rank"][i]}
+                 for key, m in ((env.get("unit_cost") or {}).get("metrics") or {}).items()}
+        if costs:
+            unit_cost[bench] = costs
+    return {"instance": name, "attrs": store.instances[name], "benchmarks": benchmarks, "unit_cost": unit_cost}
+
+
+def ep_metric(store, params, bench, path):
+    env, rows = _series(store, bench, path, params)
+    head = env.get("headline") or {}
+    direction = head.get("direction", "max") if path == head.get("field") else query.default_direction(path)
+    order = params.get("sort", ["desc" if direction == "max" else "asc"])[-1]
+    if order not in ("asc", "desc"):
+        raise ApiError(400, f"sort는 asc|desc: {order!r}")
+    rows.sort(key=lambda r: (r[1], r[0]), reverse=order == "desc")
+    limit = _int(params, "limit", len(rows))
+    out = []
+    for name, v in rows[:limit]:
+        price = store.instances[name]["price"]
+        out.append({"instance": name, "value": v, "price": price, "per_dollar": v / price if price else None})
+    return {"benchmark": bench, "field": path, "direction": direction, "count": len(rows), "rows": out}
+
+
+def ep_runs(store, params, metric, name):
+    if metric not in runs.RUN_METRICS:
+        raise ApiError(404, f"알 수 없는 run 지표: {metric} (가능: {', '.join(runs.RUN_METRICS)})")
+    if name not in store.instances:
+        raise ApiError(404, f"알 수 없는 인스턴스: {name}")
+    spec = runs.RUN_METRICS[metric]
+    values = runs.run_values(metric, name)
+    nums = [v for _, v in values]
+    return {
+        "metric": metric, "instance": name, "label": spec["label"], "direction": spec["direction"],
+        "runs": [{"run": r, "value": v} for r, v in values],
+        "mean": statistics.fmean(nums) if nums else None,
+        "stdev": statistics.stdev(nums) if len(nums) > 1 else None,
+    }
+
+
+def ep_aggregates(store, params, bench, path):
+    by = params.get("by", ["arch"])[-1]
+    if by not in GROUP_KEYS:
+        raise ApiError(400, f"by는 {'|'.join(GROUP_KEYS)} 중 하나: {by!r}")
+    _, rows = _series(store, bench, path, params)
+    groups = {}
+    for name, v in rows:
+        groups.setdefault(str(store.instances[name][by]), []).append(v)
+    return {
+        "benchmark": bench, "field": path, "by": by,
+        "groups": {k: {"n": len(vs), "mean": statistics.fmean(vs), "median": statistics.median(vs),
+                       "min": min(vs), "max": max(vs)} for k, vs in sorted(groups.items())},
+    }
+
+
+def ep_query(store, params):
+    try:
+        return query.query(store.index, params.get("c", []), params.get("objective", [query.DEFAULT_OBJECTIVE])[-1],
+                           _int(params, "top", 10))
+    except ValueError as e:
+        raise ApiError(400, str(e)) from None
+
+
+def route(store, path, params):
+    parts = [unquote(p) for p in path.strip("/").split("/")]
+    if parts[0] != "api":
+        raise ApiError(404, "엔드포인트는 /api 아래")
+    rest = parts[1:]
+    table = {
+        (): ep_index, ("instances",): ep_instances, ("query",): ep_query,
+    }
+    if tuple(rest) in table:
+        return table[tuple(rest)](store, params)
+    if rest[0] == "instances" and len(rest) == 2:
+        return ep_instance(store, params, rest[1])
+    if rest[0] == "metrics" and len(rest) == 3:
+        return ep_metric(store, params, rest[1], rest[2])
+    if rest[0] == "runs" and len(rest) == 3:
+        return ep_runs(store, params, rest[1], rest[2])
+    if rest[0] == "aggregates" and len(rest) == 3:
+        return ep_aggregates(store, params, rest[1], rest[2])
+    raise ApiError(404, f"알 수 없는 경로: {path}")
+
+
+def request_key(path, params):
+    """경로 + 정렬한 쿼리 — 파라미터 순서가 달라도 같은 캐시 항목/ETag."""
+    return path.rstrip("/") + "?" + urlencode(sorted((k, v) for k, vs in params.items() for v in vs))
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    store = None  # main()/테스트가 Store 주입
+
+    def do_GET(self, head=False):
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+        try:
+            build = self.store.refresh()
+            key = request_key(url.path, params)
+            etag = f'"{build}-{hashlib.sha256(key.encode()).hexdigest()[:12]}"'
+            if etag in [t.strip() for t in self.headers.get("If-None-Match", "").split(",")]:
+                return self.reply(304, b"", etag)
+            body = self.store.cache.get((build, key), lambda: json.dumps(
+                route(self.store, url.path, params), ensure_ascii=False, separators=(",", ":")).encode())
+            return self.reply(200, body, etag, head)
+        except ApiError as e:
+            return self.reply(e.status, json.dumps({"error": str(e)}, ensure_ascii=False).encode(), None, head)
+        except Exception as e:  # 엔드포인트 버그/빌드 중 읽기 — 연결을 끊지 않고 JSON 500(다음 요청에서 다시 시도)
+            self.log_error("%s 처리 실패 — %s: %s", self.path, type(e).__name__, e)
+            body = json.dumps({"error": f"내부 오류 — {type(e).__name__}: {e}"}, ensure_ascii=False).encode()
+            return self.reply(500, body, None, head)
+
+    def do_HEAD(self):
+        return self.do_GET(head=True)
+
+    def reply(self, status, body, etag, head=False):
+        self.send_response(status)
+        if status != 304:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if body and not head:
+            self.wfile.write(body)
+
+    def method_not_allowed(self):
+        self.reply(405, json.dumps({"error": "읽기 전용 — GET/HEAD만"}, ensure_ascii=False).encode(), None)
+
+    do_POST = do_PUT = do_DELETE = do_PATCH = method_not_allowed
+
+
+def main():
+    args = sys.argv[1:]
+    port = int(args[args.index("--port") + 1]) if "--port" in args else DEFAULT_PORT
+    host = args[args.index("--host") + 1] if "--host" in args else "127.0.0.1"
+    ApiHandler.store = Store()
+    server = ThreadingHTTPServer((host, port), ApiHandler)
+    server.daemon_threads = True
+    print(f"http://{host}:{port}/api 서빙 중 (site/data, 읽기 전용) — Ctrl+C로 종료")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
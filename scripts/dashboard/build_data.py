@@ -4,11 +4,49 @@
 각 벤치마크는 parsers/<name>.py의 build() -> dict(공통 봉투 스키마)를 site/data/<name>.json으로
 저장. 커버리지가 기대치(54, 또는 51 — 레거시 3종)에 못 미치면 경고만 출력(원시 로그 자체가 51개뿐인
 벤치마크가 있으므로 하드 실패시키지 않음 — 상세는 각 파서의 docstring 참고).
+run 건강도(health.py -> site/data/_run_health.json)와 하드웨어 지문 인덱스(hardware.py ->
+site/data/_hardware.json)는 매 빌드마다 함께 갱신 — failed run은 파서 집계에서 자동 제외.
+
+봉투마다 aggregates 키(aggregates.py — arch×gen/패밀리 평균, 세대 개선율, 가성비)를 붙인다.
+처리량 벤치마크(nginx/springboot/redis/kafka/iperf3/clickhouse/elasticsearch)에는 unit_cost 키(unit_cost.py —
+$ / 1M 요청, $ / TB 등 작업 단위당 비용과 순위)도 붙는다. --utilization=0.7: 그 계산의 목표 사용률.
+
+--compact: instances.json과 벤치마크 봉투를 컬럼 지향(columnar.py, columnar-v1) + 공백 없는
+JSON으로 출력. 배포용 — 기본값(행 지향, indent=2)은 git diff/validate.py 가독성 때문에 유지하며,
+loadData()/validate.py는 두 형식을 모두 읽는다.
+
+--region=R, --price-mix=spot=0.7,on_demand=0.3: instances.json price와 모든 가성비(aggregates per_dollar,
+kafka codec_efficiency, _scaling.json)를 그 리전·구매 옵션 혼합의 실효 가격(pricing.py)으로 다시 계산.
+기본은 ap-northeast-2 On-Demand. _pricing.json(On-Demand 대비 fleet 혼합의 가성비/순위/파레토)은 매번 갱신.
+
+빌드 끝에 query.py가 전 벤치마크 × instances.json 통합 테이블의 질의 인덱스(site/data/_query_index.json —
+CLI와 사이트 '인스턴스 찾기' 탭 공용)를 다시 만들고, 마지막으로 site/data/*.json 내용 해시를
+_manifest.json에 쓴다(api.py가 응답 캐시 무효화와 ETag에 쓰는 빌드 버전).
+
+--snapshot[=라벨]: 빌드 끝에 run 단위 값 스냅샷을 history/에 저장(history.py — 수집 간 회귀 검정용).
+
+--sizes=xlarge,2xlarge: 빌드 대상 크기(common.INSTANCE_FILES, 기본 xlarge). 2xlarge 인스턴스는
+config/instances-8vcpu.txt에서 오고 results/<bench>/<c8g.2xlarge 등>/을 같은 파서가 읽는다.
+EXPECTED_COVERAGE는 xlarge 기준이라 다른 크기는 개수만 표시. 빌드 끝에 scaling.py가 크기 쌍의
+확장 효율(site/data/_scaling.json)을, predict.py가 결측 지표 회귀 예측(site/data/_predicted.json —
+봉투에는 섞지 않음)을 갱신한다.
 """
+import hashlib
 import json
 import sys
 
-from common import SITE_DATA_DIR, build_instances, BASE_DIR
+import aggregates
+import columnar
+import hardware
+import health
+import history
+import predict
+import pricing
+import query
+import scaling
+import unit_cost
+from common import (BASE_SIZE, DEFAULT_REGION, SITE_DATA_DIR, SIZES, build_instances, BASE_DIR, canonical_instances,
+                    instance_size, set_prices, set_sizes)
 
 EXPECTED_COVERAGE = {
     "sysbench": 54,
@@ -23,37 +61,102 @@ EXPECTED_COVERAGE = {
     "stress-ng": 51,
     "springboot": 54,
 }
+MANIFEST_NAME = "_manifest.json"
+BENCHMARKS = [
+    "sysbench", "iperf3", "nginx", "redis", "elasticsearch",
+    "kafka", "clickhouse", "geekbench", "passmark", "stress-ng",
+    "springboot",
+]
 
 
-def write_instances_json():
+def dump(payload, compact):
+    if compact:
+        return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    return json.dumps(payload, indent=2, ensure_ascii=False)
+
+
+def write_instances_json(compact=False, hardware_payload=None):
+    """instances.json — 속성 + (hardware.build() 결과가 있으면) heterogeneous/cpu_models."""
     SITE_DATA_DIR.mkdir(parents=True, exist_ok=True)
     payload = build_instances()
+    flags = hardware.instance_flags(hardware_payload) if hardware_payload else {}
+    for name, attrs in payload.items():
+        attrs.update(flags.get(name, {"heterogeneous": False, "cpu_models": []}))
     path = SITE_DATA_DIR / "instances.json"
-    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+    path.write_text(dump(columnar.encode_table(payload) if compact else payload, compact))
     print(f"instances.json: {len(payload)}개 인스턴스 -> {path.relative_to(BASE_DIR)}")
 
 
-def build_benchmark(name):
+def write_manifest():
+    """site/data/*.json 내용 해시 -> _manifest.json. 내용이 같으면 hash도 같다(api.py ETag 기준)."""
+    files = {p.name: hashlib.sha256(p.read_bytes()).hexdigest()[:16]
+             for p in sorted(SITE_DATA_DIR.glob("*.json")) if p.name != MANIFEST_NAME}
+    digest = hashlib.sha256(json.dumps(files, sort_keys=True).encode()).hexdigest()[:16]
+    (SITE_DATA_DIR / MANIFEST_NAME).write_text(json.dumps({"hash": digest, "files": files}, indent=2))
+    return digest
+
+
+def build_benchmark(name, compact=False, utilization=unit_cost.DEFAULT_UTILIZATION):
     module = __import__(f"parsers.{name.replace('-', '_')}", fromlist=["build"])
     data = module.build()
+    data["aggregates"] = aggregates.build(data["instances"])
+    costs = unit_cost.build(name, data["instances"], utilization)
+    if costs:
+        data["unit_cost"] = costs
     path = SITE_DATA_DIR / f"{name}.json"
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+    path.write_text(dump(columnar.encode_envelope(data) if compact else data, compact))
     expected = EXPECTED_COVERAGE.get(name)
+    by_size = {}
+    for inst in data["instances"]:
+        by_size[instance_size(inst)] = by_size.get(instance_size(inst), 0) + 1
+    base = by_size.get(BASE_SIZE, 0)
     status = "OK"
-    if expected and data["coverage"] < expected:
-        status = f"WARN coverage {data['coverage']}/{expected}"
-    print(f"{name}.json: coverage={data['coverage']} {status} -> {path.relative_to(BASE_DIR)}")
+    if expected and base < expected:
+        status = f"WARN coverage {base}/{expected} (재실행 계획: scripts/campaign/gaps.py)"
+    extra = "".join(f" {size}={n}" for size, n in by_size.items() if size != BASE_SIZE)
+    print(f"{name}.json: coverage={data['coverage']}{extra} {status} -> {path.relative_to(BASE_DIR)}")
+
+
+def build_derived(region=DEFAULT_REGION, mix=None):
+    """벤치마크 봉투를 읽어 만드는 교차 산출물 — _scaling/_predicted/_pricing/_query_index.json.
+    봉투가 하나라도 바뀌면 다시 돌려야 한다(serve.py 증분 재빌드도 이 함수를 부른다)."""
+    scaling.main(BENCHMARKS)
+    predict.main()
+    pricing.main(BENCHMARKS, region, mix)
+    query.main(BENCHMARKS)
 
 
 def main():
-    write_instances_json()
-    targets = sys.argv[1:] or [
-        "sysbench", "iperf3", "nginx", "redis", "elasticsearch",
-        "kafka", "clickhouse", "geekbench", "passmark", "stress-ng",
-        "springboot",
-    ]
+    args = sys.argv[1:]
+    compact = "--compact" in args
+    for a in args:
+        if a.startswith("--sizes="):
+            set_sizes(a.split("=", 1)[1].split(","))
+    if SIZES != [BASE_SIZE]:
+        print(f"크기: {', '.join(SIZES)}")
+    region = next((a.split("=", 1)[1] for a in args if a.startswith("--region=")), DEFAULT_REGION)
+    mix = next((pricing.parse_mix(a.split("=", 1)[1]) for a in args if a.startswith("--price-mix=")), None)
+    if mix or region != DEFAULT_REGION:
+        prices, fallback = pricing.effective_prices(pricing.load_tables(), canonical_instances(), region, mix)
+        set_prices(prices)
+        print(f"가격: {region} " + ", ".join(f"{k} {v:.0%}" for k, v in (mix or {"on_demand": 1}).items())
+              + (f" (on_demand 대체 {len(fallback)}개 인스턴스)" if fallback else ""))
+    utilization = next((float(a.split("=", 1)[1]) for a in args if a.startswith("--utilization=")),
+                       unit_cost.DEFAULT_UTILIZATION)
+    if not 0 < utilization <= 1:
+        raise SystemExit(f"--utilization은 (0, 1] 범위여야 함: {utilization}")
+    health.main()
+    write_instances_json(compact, hardware.main())
+    # 인자 순서와 무관하게 BENCHMARKS 순 — clickhouse/kafka는 먼저 빌드된 sysbench/iperf3 봉투를 읽는다
+    targets = sorted([a for a in args if not a.startswith("--")] or BENCHMARKS,
+                     key=lambda n: BENCHMARKS.index(n) if n in BENCHMARKS else len(BENCHMARKS))
     for name in targets:
-        build_benchmark(name)
+        build_benchmark(name, compact, utilization)
+    build_derived(region, mix)
+    print(f"{MANIFEST_NAME}: {write_manifest()}")
+    for a in args:
+        if a == "--snapshot" or a.startswith("--snapshot="):
+            history.save(a.partition("=")[2] or None)
 
 
 if __name__ == "__main__":
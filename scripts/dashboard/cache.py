@@ -0,0 +1,52 @@
+"""로그 단위 파싱 결과 캐시(증분 빌드용).
+
+키 = BASE_DIR 기준 상대경로, 서명 = (mtime_ns, size). 서명이 같으면 parse 함수를 다시 부르지 않고
+이전 결과를 돌려준다. 파서 로직을 바꾸면 그 파서의 PARSER_VERSION을 올릴 것 — 버전이 다르면
+캐시 파일 전체를 버린다. 캐시는 scripts/dashboard/.cache/<name>.json (git 제외)이며 지워도
+다음 빌드가 전체 재파싱할 뿐 결과는 같다.
+"""
+import json
+
+from common import BASE_DIR, SCRIPT_DIR
+
+CACHE_DIR = SCRIPT_DIR / ".cache"
+
+
+class ParseCache:
+    def __init__(self, name, version):
+        self.path = CACHE_DIR / f"{name}.json"
+        self.version = version
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        if self.path.exists():
+            try:
+                raw = json.loads(self.path.read_text())
+            except ValueError:
+                raw = {}
+            if raw.get("version") == version:
+                self.entries = raw.get("entries", {})
+        self._seen = set()
+
+    def get(self, log_path, parse):
+        """log_path의 parse(log_path) 결과 — 서명이 같으면 캐시 값. 결과는 JSON 직렬화 가능해야 함."""
+        key = str(log_path.relative_to(BASE_DIR))
+        st = log_path.stat()
+        sig = [st.st_mtime_ns, st.st_size]
+        self._seen.add(key)
+        hit = self.entries.get(key)
+        if hit and hit["sig"] == sig:
+            self.hits += 1
+            return hit["value"]
+        self.misses += 1
+        value = parse(log_path)
+        self.entries[key] = {"sig": sig, "value": value}
+        return value
+
+    def save(self):
+        """이번 빌드에서 본 로그만 남기고 저장(삭제된 로그의 엔트리는 정리)."""
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        entries = {k: v for k, v in self.entries.items() if k in self._seen}
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"version": self.version, "entries": entries}, ensure_ascii=False))
+        tmp.replace(self.path)
@@ -0,0 +1,133 @@
+"""site/data 컬럼 지향 압축 인코딩(columnar-v1) — build_data.py --compact 출력 모드.
+
+행 지향 봉투는 인스턴스 54개마다 같은 키 경로를 반복하고 indent=2로 들여쓴다. 여기서는
+{name: {...}} 매핑(봉투의 instances, instances.json)을 테이블 1개로 바꾼다:
+
+    {"format": "columnar-v1", "index": [인스턴스명...],
+     "columns": [{"k": [키 경로], "t": 타입, "v": [값...], "p"?: 존재 비트맵, "n"?: null 비트맵, "d"?: 사전}]}
+
+- 컬럼 = 중첩 dict를 펼친 leaf 경로 1개. dict가 아닌 값(숫자/문자열/리스트/null/빈 dict)이 leaf.
+  키 경로는 문자열이 아니라 배열 — 인스턴스명처럼 '.'이 든 키가 있어도 안전.
+- v에는 존재하고 null이 아닌 행의 값만 index 순서대로 들어간다. p(그 행에 경로가 있음)와
+  n(그 행의 값이 null)은 index 길이의 비트맵(LSB 우선, base64). p는 전 행에 있으면 생략, n은
+  null이 없으면 생략하고 전 행이 null이면 "*".
+- t: num(숫자) / str / enum(반복 많은 문자열 — d 사전의 인덱스로 저장) / any(리스트·bool·혼합, JSON 그대로).
+
+decode_table(encode_table(m)) == m 이 보장된다(키 순서는 컬럼 첫 등장 순). 브라우저 쪽 디코더는
+site/js/shared.js의 decodeTable — 두 구현을 함께 바꿀 것.
+"""
+import base64
+
+FORMAT = "columnar-v1"
+# 고유값이 행 수의 이 비율 이하인 문자열 컬럼은 enum(사전 인덱스)으로 저장
+ENUM_RATIO = 0.5
+
+_ABSENT = object()
+
+
+def _leaves(obj, prefix=()):
+    if isinstance(obj, dict) and obj:
+        for k, v in obj.items():
+            yield from _leaves(v, (*prefix, k))
+    else:
+        yield prefix, obj
+
+
+def _bitmap(flags):
+    """bool 리스트 -> base64 비트맵(LSB 우선). 전부 True면 None."""
+    if all(flags):
+        return None
+    buf = bytearray((len(flags) + 7) // 8)
+    for i, f in enumerate(flags):
+        if f:
+            buf[i >> 3] |= 1 << (i & 7)
+    return base64.b64encode(bytes(buf)).decode("ascii")
+
+
+def _unbitmap(b64, n):
+    if b64 is None:
+        return [True] * n
+    buf = base64.b64decode(b64)
+    return [bool(buf[i >> 3] >> (i & 7) & 1) for i in range(n)]
+
+
+def _column_type(values):
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        return "num"
+    if all(isinstance(v, str) for v in values):
+        return "enum" if len(set(values)) <= max(1, len(values) * ENUM_RATIO) and len(values) > 1 else "str"
+    return "any"
+
+
+def encode_table(mapping):
+    """{name: {...}} -> columnar-v1 테이블."""
+    index = list(mapping)
+    paths = {}  # 첫 등장 순서 유지
+    per_row = []
+    for name in index:
+        leaves = dict(_leaves(mapping[name]))
+        leaves.pop((), None)  # 행 자체가 빈 dict/비-dict — 컬럼 없음(디코드 시 {})
+        per_row.append(leaves)
+        for path in leaves:
+            paths.setdefault(path, None)
+
+    columns = []
+    for path in paths:
+        cells = [row.get(path, _ABSENT) for row in per_row]
+        present = [c is not _ABSENT for c in cells]
+        nulls = [c is None for c in cells]
+        values = [c for c in cells if c is not _ABSENT and c is not None]
+        col = {"k": list(path), "t": _column_type(values)}
+        if col["t"] == "enum":
+            col["d"] = list(dict.fromkeys(values))
+            lookup = {v: i for i, v in enumerate(col["d"])}
+            values = [lookup[v] for v in values]
+        col["v"] = values
+        p = _bitmap(present)
+        if p is not None:
+            col["p"] = p
+        if any(nulls):
+            col["n"] = "*" if all(nulls) else _bitmap(nulls)
+        columns.append(col)
+    return {"format": FORMAT, "index": index, "columns": columns}
+
+
+def decode_table(table):
+    """columnar-v1 테이블 -> {name: {...}}."""
+    index = table["index"]
+    n = len(index)
+    rows = [{} for _ in index]
+    for col in table["columns"]:
+        present = _unbitmap(col.get("p"), n)
+        nulls = [True] * n if col.get("n") == "*" else (_unbitmap(col["n"], n) if "n" in col else [False] * n)
+        values = iter(col["v"])
+        d = col.get("d")
+        *parents, leaf = col["k"]
+        for i in range(n):
+            if not present[i]:
+                continue
+            target = rows[i]
+            for k in parents:
+                target = target.setdefault(k, {})
+            if nulls[i]:
+                target[leaf] = None
+            else:
+                v = next(values)
+                target[leaf] = d[v] if d is not None else v
+    return dict(zip(index, rows))
+
+
+def is_table(obj):
+    return isinstance(obj, dict) and obj.get("format") == FORMAT
+
+
+def encode_envelope(envelope):
+    """봉투의 instances만 테이블로 교체(나머지 최상위 키는 그대로)."""
+    return {**envelope, "instances": encode_table(envelope["instances"])}
+
+
+def decode_envelope(payload):
+    """행 지향/컬럼 지향 어느 쪽이든 행 지향 봉투로."""
+    if is_table(payload.get("instances")):
+        return {**payload, "instances": decode_table(payload["instances"])}
+    return payload
@@ -5,6 +5,8 @@ instances.json 빌더 + 벤치마크별 파서가 공유하는 인스턴스 분
 gen_family()는 scripts/generate-kafka-report.py, scripts/generate-clickhouse-report.py와
 동일 규칙(검증됨: 54개 인스턴스 전수 확인) — 그대로 포팅, 재작성 아님.
 """
+import csv
+import math
 import re
 from pathlib import Path
 
@@ -13,42 +15,129 @@ BASE_DIR = SCRIPT_DIR.parent.parent
 RESULTS_DIR = BASE_DIR / "results"
 LEGACY_DIR = BASE_DIR / "legacy"
 SITE_DATA_DIR = BASE_DIR / "site" / "data"
-INSTANCE_FILE = BASE_DIR / "config" / "instances-4vcpu.txt"
+HISTORY_DIR = BASE_DIR / "history"  # 수집 스냅샷(history.py)
 REPORTS_DIR = BASE_DIR / "reports"
 
-# On-Demand 시간당 가격 (USD, ap-northeast-2) — scripts/generate-kafka-report.py의 PRICE dict과
-# 동일(54개 완비, aws pricing get-products 소스). 이 파일이 canonical — 다른 스크립트는 재사용.
-PRICE = {
-    "c5.xlarge": 0.192, "c5a.xlarge": 0.172, "c5d.xlarge": 0.220, "c5n.xlarge": 0.244,
-    "c6g.xlarge": 0.154, "c6gd.xlarge": 0.176, "c6gn.xlarge": 0.195, "c6i.xlarge": 0.192,
-    "c6id.xlarge": 0.231, "c6in.xlarge": 0.256, "c7g.xlarge": 0.163, "c7gd.xlarge": 0.208,
-    "c7i-flex.xlarge": 0.192, "c7i.xlarge": 0.202, "c8g.xlarge": 0.180, "c8gn.xlarge": 0.268,
-    "c8i-flex.xlarge": 0.201, "r8gd.xlarge": 0.353, "m8i-flex.xlarge": 0.247,
-    "c8i.xlarge": 0.212, "m5.xlarge": 0.236, "m5a.xlarge": 0.212, "m5ad.xlarge": 0.254,
-    "m5d.xlarge": 0.278, "m5zn.xlarge": 0.406, "m6g.xlarge": 0.188, "m6gd.xlarge": 0.222,
-    "m6i.xlarge": 0.236, "m6id.xlarge": 0.292, "m6idn.xlarge": 0.386, "m6in.xlarge": 0.337,
-    "m7g.xlarge": 0.201, "m7gd.xlarge": 0.263, "m7i-flex.xlarge": 0.235, "m7i.xlarge": 0.248,
-    "m8g.xlarge": 0.221, "m8i.xlarge": 0.260, "r5.xlarge": 0.304, "r5a.xlarge": 0.272,
-    "r5ad.xlarge": 0.316, "r5b.xlarge": 0.356, "r5d.xlarge": 0.346, "r5dn.xlarge": 0.398,
-    "r5n.xlarge": 0.356, "r6g.xlarge": 0.244, "r6gd.xlarge": 0.277, "r6i.xlarge": 0.304,
-    "r6id.xlarge": 0.363, "r7g.xlarge": 0.258, "r7gd.xlarge": 0.327, "r7i.xlarge": 0.319,
-    "r8g.xlarge": 0.284, "r8i-flex.xlarge": 0.318, "r8i.xlarge": 0.335,
+# 크기 차원: 크기 -> 인스턴스 목록 파일 / vCPU. results/<bench>/<inst>/는 인스턴스명에 크기가 들어
+# 있으므로(c8g.xlarge / c8g.2xlarge) 크기별로 이미 분리된 디렉터리다.
+INSTANCE_FILES = {
+    "xlarge": BASE_DIR / "config" / "instances-4vcpu.txt",
+    "2xlarge": BASE_DIR / "config" / "instances-8vcpu.txt",
 }
+SIZE_VCPU = {"xlarge": 4, "2xlarge": 8}
+BASE_SIZE = "xlarge"
+# 빌드 대상 크기(set_sizes / build_data.py --sizes). 기본은 xlarge만 — legacy 정답지와 사이트 탭이 4 vCPU 기준.
+SIZES = [BASE_SIZE]
+
+# 가격표(config/pricing/*.csv — pricing.py가 리전/구매 옵션/spot 이력까지 다룸). 여기서는 기본 리전의
+# On-Demand만 PRICE로 읽는다 — 예전 하드코딩 dict(generate-kafka/clickhouse-report.py 중복)의 대체.
+PRICING_DIR = BASE_DIR / "config" / "pricing"
+DEFAULT_REGION = "ap-northeast-2"
+
+
+def read_price_csv(path):
+    """'#' 주석 줄을 건너뛴 CSV -> dict 행 리스트(파일이 없으면 빈 리스트)."""
+    if not path.exists():
+        return []
+    lines = [line for line in path.read_text().splitlines() if line.strip() and not line.startswith("#")]
+    return list(csv.DictReader(lines))
+
+
+def with_larger_sizes(prices):
+    """{name: 가격}에 빠진 큰 크기를 xlarge × vCPU 배수로 채움 — On-Demand는 같은 패밀리 안에서 vCPU에 정비례."""
+    out = dict(prices)
+    for name, p in prices.items():
+        if name.endswith(f".{BASE_SIZE}"):
+            for size, vcpu in SIZE_VCPU.items():
+                out.setdefault(f"{name.split('.')[0]}.{size}", round(p * vcpu / SIZE_VCPU[BASE_SIZE], 3))
+    return out
+
+
+# On-Demand 시간당 가격(USD, DEFAULT_REGION) — 사이트의 price/가성비 기준. set_prices로 교체 가능.
+PRICE = with_larger_sizes({r["instance"]: float(r["usd_hour"]) for r in read_price_csv(PRICING_DIR / "on-demand.csv")
+                           if r["region"] == DEFAULT_REGION})
+
+
+def set_prices(prices):
+    """빌드 가격 교체(build_data.py --region/--price-mix — 실효 가격으로 전 가성비 재계산)."""
+    PRICE.clear()
+    PRICE.update(prices)
+
+
+# results/<dir> — 인스턴스별 run 로그가 쌓이는 디렉터리 전체(하드웨어 지문/run 건강도가 순회)
+RUN_LOG_DIRS = [
+    "sysbench-cpu", "sysbench-memory", "iperf3", "nginx", "redis", "elasticsearch",
+    "kafka", "kafka-max", "kafka-ramp", "clickhouse", "geekbench", "passmark",
+    "stress-ng", "springboot",
+]
+# results/<dir> -> 그 디렉터리를 읽는 벤치마크(다른 파서를 import해 쓰는 의존 포함) — serve.py/
+# scripts/campaign/collect.py가 바뀐 디렉터리만 증분 재빌드할 때 사용
+RESULTS_TO_BENCH = {
+    "sysbench-cpu": ["sysbench", "clickhouse"],
+    "sysbench-memory": ["sysbench", "clickhouse"],
+    "iperf3": ["iperf3", "kafka"],
+    "nginx": ["nginx"],
+    "redis": ["redis"],
+    "elasticsearch": ["elasticsearch"],
+    "springboot": ["springboot"],
+    "stress-ng": ["stress-ng"],
+    "kafka": ["kafka"],  # results/kafka/data.json(generate-kafka-report.py 산출물)
+    "kafka-max": ["kafka"],
+    "kafka-ramp": ["kafka"],
+    "clickhouse": ["clickhouse"],
+}
+# results/<dir> -> 그 로그를 data.json으로 모으는 리포트 스크립트(scripts/). kafka/clickhouse 파서는 원시 로그가
+# 아니라 data.json만 읽으므로, 새 로그를 봉투에 반영하려면 build_data.py 전에 이 스크립트를 먼저 돌려야 한다.
+REPORT_SCRIPTS = {
+    "kafka": "generate-kafka-report.py",
+    "kafka-max": "generate-kafka-report.py",
+    "kafka-ramp": "generate-kafka-report.py",
+    "clickhouse": "generate-clickhouse-report.py",
+}
+
+
+def report_scripts(result_dirs):
+    """바뀐 results/<dir>들 -> build_data.py 전에 돌릴 scripts/generate-*-report.py 경로(중복 없이 정렬)."""
+    return [BASE_DIR / "scripts" / s for s in sorted({REPORT_SCRIPTS[d] for d in result_dirs if d in REPORT_SCRIPTS})]
+
+
+# results/iperf3/ 디렉터리만 c7i-flex가 'c7i.flex'로 되어 있음(parsers/iperf3.py DIR_ALIASES와 동일)
+RUN_DIR_ALIASES = {("iperf3", "c7i-flex.xlarge"): "c7i.flex.xlarge"}
 
 # EC2 세대(6/7/8) -> Graviton 칩 세대(2/3/4). 예: c8g.xlarge는 EC2 8세대이자 Graviton4.
 GRAVITON_GEN_NUM = {6: 2, 7: 3, 8: 4}
 
 
-def load_instance_meta():
-    """instances-4vcpu.txt: 'name<TAB>arch<TAB>mem_mb' -> {name: {arch(x86_64/arm64), mem_mb}}."""
+def set_sizes(sizes):
+    """빌드 대상 크기 변경(순서 = INSTANCE_FILES 순서로 정규화). 모르는 크기는 ValueError."""
+    unknown = [s for s in sizes if s not in INSTANCE_FILES]
+    if unknown:
+        raise ValueError(f"알 수 없는 크기: {', '.join(unknown)} (가능: {', '.join(INSTANCE_FILES)})")
+    SIZES[:] = [s for s in INSTANCE_FILES if s in sizes]
+
+
+def instance_size(name):
+    """'c8g.2xlarge' -> '2xlarge'."""
+    return name.split(".", 1)[1]
+
+
+def instance_family(name):
+    """'c8g.2xlarge' -> 'c8g' — 크기 간 같은 패밀리를 잇는 키."""
+    return name.split(".", 1)[0]
+
+
+def load_instance_meta(sizes=None):
+    """instances-<N>vcpu.txt: 'name<TAB>arch<TAB>mem_mb' -> {name: {raw_arch(x86_64/arm64), mem_mb, size, vcpu}}.
+    sizes 기본값 = SIZES(빌드 대상 크기)."""
     meta = {}
-    for line in INSTANCE_FILE.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        parts = line.split()
-        if len(parts) >= 3:
-            meta[parts[0]] = {"raw_arch": parts[1], "mem_mb": int(parts[2])}
+    for size in sizes or SIZES:
+        for line in INSTANCE_FILES[size].read_text().splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            parts = line.split()
+            if len(parts) >= 3:
+                meta[parts[0]] = {"raw_arch": parts[1], "mem_mb": int(parts[2]), "size": size, "vcpu": SIZE_VCPU[size]}
     return meta
 
 
@@ -73,7 +162,7 @@ def gen_family(instance):
 
 
 def build_instances():
-    """instances.json 페이로드 생성: {name: {arch, gen, family, mem_mb, price, flex, graviton_gen}}."""
+    """instances.json 페이로드 생성: {name: {arch, gen, family, mem_mb, price, flex, graviton_gen, size, vcpu}}."""
     meta = load_instance_meta()
     out = {}
     for name, info in sorted(meta.items()):
@@ -89,15 +178,66 @@ def build_instances():
             "price": round(price, 4),
             "flex": cls["flex"],
             "graviton_gen": cls["graviton_gen"],
+            "size": info["size"],
+            "vcpu": info["vcpu"],
         }
     return out
 
 
 def canonical_instances():
-    """정본 54개 인스턴스명 리스트 (config/instances-4vcpu.txt 순서 보존 X, 정렬됨)."""
+    """빌드 대상 크기의 정본 인스턴스명 리스트(기본 xlarge 54개, 파일 순서 보존 X, 정렬됨)."""
     return sorted(load_instance_meta().keys())
 
 
+def instance_run_logs(bench, name):
+    """results/<bench>/<name>/*.log (정렬). 디렉터리가 없으면 빈 리스트."""
+    inst_dir = RESULTS_DIR / bench / RUN_DIR_ALIASES.get((bench, name), name)
+    return sorted(inst_dir.glob("*.log")) if inst_dir.is_dir() else []
+
+
+def is_number(v):
+    """봉투 값이 수치인지(bool 제외 — JSON true/false가 int로 섞이지 않게)."""
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
 def mean(values):
     values = [v for v in values if v is not None]
     return round(sum(values) / len(values), 4) if values else None
+
+
+def geomean(values):
+    """양수 값의 기하평균 — 속도비(speedup)처럼 비율 지표를 평균할 때 사용. 0/None은 제외."""
+    values = [v for v in values if v is not None and v > 0]
+    if not values:
+        return None
+    return round(math.exp(sum(math.log(v) for v in values) / len(values)), 4)
+
+
+def pearson(xs, ys):
+    """두 벡터의 피어슨 상관계수. 쌍 중 하나라도 None이면 그 쌍은 제외, 표본 3개 미만/분산 0이면 None."""
+    pairs = [(x, y) for x, y in zip(xs, ys) if x is not None and y is not None]
+    if len(pairs) < 3:
+        return None
+    mx = sum(x for x, _ in pairs) / len(pairs)
+    my = sum(y for _, y in pairs) / len(pairs)
+    sxy = sum((x - mx) * (y - my) for x, y in pairs)
+    sx = math.sqrt(sum((x - mx) ** 2 for x, _ in pairs))
+    sy = math.sqrt(sum((y - my) ** 2 for _, y in pairs))
+    if sx == 0 or sy == 0:
+        return None
+    return round(sxy / (sx * sy), 4)
+
+
+def stdev(values):
+    """표본 표준편차(n-1). 표본 2개 미만이면 None."""
+    values = [v for v in values if v is not None]
+    if len(values) < 2:
+        return None
+    m = sum(values) / len(values)
+    return round(math.sqrt(sum((v - m) ** 2 for v in values) / (len(values) - 1)), 4)
+
+
+def cv(values):
+    """변동계수(stdev/mean) — run간 편차를 인스턴스 간 비교 가능한 비율로."""
+    s, m = stdev(values), mean(values)
+    return round(s / m, 4) if (s is not None and m) else None
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""하드웨어 지문 인덱스 — 모든 벤치마크의 모든 run 로그에서 실제 관측된 CPU/커널/날짜를 추출.
+
+EC2 타입(c5/m5/r5 등)은 같은 이름이라도 다른 세대의 CPU에 배치될 수 있다(예: c5.xlarge 로그에
+8124M과 8275CL이 섞여 있음). 지금까지 모든 run을 인스턴스 이름으로만 평균했으므로, 여기서
+(instance, cpu_model)로 run을 묶어 이질적인 하드웨어가 섞인 인스턴스를 표시하고 모델별 하위
+결과(SUB_RESULTS의 헤드라인 필드)를 따로 낸다. 산출물: site/data/_hardware.json, 그리고 인스턴스별
+heterogeneous/cpu_models는 instances.json에도 들어가 탭이 조인한다(build_data.write_instances_json).
+
+CPU 모델은 로그 앞부분의 /proc/cpuinfo `model name`을 우선, 없으면 geekbench `CPU Information`의
+Name을 쓴다. Graviton은 `model name`이 없어 geekbench/passmark의 `ARM implementer ... part N`
+식별자로만 판별 가능(ARM_PARTS) — 식별자가 없는 로그는 cpu_model=None(이질성 판정에서 제외).
+nginx/elasticsearch/springboot 로그에는 시스템 정보 블록이 없어 날짜/커널만 잡힌다.
+그래서 모델별 하위 결과(SUB_RESULTS)는 CPU를 식별하는 로그에서 run 단위 값이 나오는 벤치마크 —
+sysbench-cpu, redis, passmark — 만 가능하다(geekbench 원시 로그는 점수가 0, 나머지는 CPU 식별 불가).
+하위 결과는 파서 집계와 같은 로그 집합을 쓴다: health.usable_logs로 failed run을 빼고, 디렉터리는
+instance_run_logs처럼 RUN_DIR_ALIASES로 푼다(c7i-flex의 iperf3는 results/iperf3/c7i.flex.xlarge).
+"""
+import fnmatch
+import json
+import re
+
+from cache import ParseCache
+from common import BASE_DIR, RUN_LOG_DIRS, SITE_DATA_DIR, canonical_instances, instance_run_logs, mean
+from health import usable_logs
+from runs import RUN_METRICS
+
+PARSER_VERSION = 1
+
+# ARM MIDR part 번호(10진) -> 코어명. 0xd0c/0xd40/0xd4f
+ARM_PARTS = {
+    3340: "AWS Graviton2 (Neoverse-N1)",
+    3392: "AWS Graviton3 (Neoverse-V1)",
+    3407: "AWS Graviton4 (Neoverse-V2)",
+}
+
+MODEL_NAME = re.compile(r"^model name\s*:\s*(.+)$", re.M)
+GB_NAME = re.compile(r"^CPU Information\n\s+Name\s+(.+)$", re.M)
+ARM_ID = re.compile(r"ARM implementer \d+ architecture \d+ variant \d+ part (\d+)")
+VCPUS = re.compile(r"^(?:vCPUs:|CPU cores:|CPUs:|CPU:)\s*(\d+)", re.M)
+MEM_FREE = re.compile(r"^Mem:\s+([\d.]+)(Gi|Mi)", re.M)
+MEM_GB = re.compile(r"^Memory:\s*([\d.]+)G\s*$", re.M)
+KERNEL = re.compile(r"Kernel:?\s+(?:Linux\s+)?(\d+\.\d+\.\d+\S*)|OS\[Linux/(\d+\.\d+\.\d+[^/\]]*)/")
+DATE = re.compile(r"^(?:Date|Timestamp):\s*(\d{4}-\d{2}-\d{2}T[\d:]+)", re.M)
+
+# (instance, cpu_model)별 하위 결과로 다시 집계할 헤드라인 — parsers/*의 로그 단위 파서를 재사용
+# (passmark 파서는 legacy를 재구성하므로 runs.py의 run 단위 추출 함수)
+SUB_RESULTS = {
+    "sysbench.cpu_mt": ("sysbench-cpu", "run*.log", "sysbench", lambda m, p: m.parse_cpu_log(p)[0]),
+    "sysbench.cpu_st": ("sysbench-cpu", "run*.log", "sysbench", lambda m, p: m.parse_cpu_log(p)[1]),
+    "redis.set_rps": ("redis", "run*.log", "redis", lambda m, p: m.parse_log(p)["set_rps"]),
+    "redis.get_rps": ("redis", "run*.log", "redis", lambda m, p: m.parse_log(p)["get_rps"]),
+    "redis.set_p99_ms": ("redis", "run*.log", "redis", lambda m, p: m.parse_log(p)["set_p99_ms"]),
+    "redis.get_p99_ms": ("redis", "run*.log", "redis", lambda m, p: m.parse_log(p)["get_p99_ms"]),
+    "passmark.cpu_mark": ("passmark", "run*.log", None, RUN_METRICS["passmark"]["extract"]),
+}
+
+
+def normalize_model(name):
+    """'Intel(R) Xeon(R) Platinum 8275CL CPU @ 3.00GHz' -> 'Intel Xeon Platinum 8275CL'."""
+    name = re.sub(r"\((R|TM)\)", "", name)
+    name = re.sub(r"\s+CPU\b|\s*@.*$", "", name)
+    return re.sub(r"\s+", " ", name).strip()
+
+
+def fingerprint(path):
+    """로그 1개 -> {cpu_model, vcpus, mem_gib, kernel, date} (없는 항목은 None)."""
+    text = path.read_text(errors="replace")
+    out = {"cpu_model": None, "vcpus": None, "mem_gib": None, "kernel": None, "date": None}
+    m = MODEL_NAME.search(text) or GB_NAME.search(text)
+    if m and not m.group(1).startswith("ARM"):
+        out["cpu_model"] = normalize_model(m.group(1))
+    else:
+        m = ARM_ID.search(text)
+        if m:
+            part = int(m.group(1))
+            out["cpu_model"] = ARM_PARTS.get(part, f"ARM part {part}")
+    m = VCPUS.search(text)
+    if m:
+        out["vcpus"] = int(m.group(1))
+    m = MEM_FREE.search(text)
+    if m:
+        out["mem_gib"] = round(float(m.group(1)) / (1024 if m.group(2) == "Mi" else 1), 1)
+    else:
+        m = MEM_GB.search(text)
+        if m:
+            out["mem_gib"] = float(m.group(1))
+    m = KERNEL.search(text)
+    if m:
+        out["kernel"] = m.group(1) or m.group(2)
+    m = DATE.search(text)
+    if m:
+        out["date"] = m.group(1)
+    return out
+
+
+def build_index(cache=None):
+    """-> {instance: [{bench, file, cpu_model, vcpus, mem_gib, kernel, date}, ...]}."""
+    own_cache = cache is None
+    cache = cache or ParseCache("hardware", PARSER_VERSION)
+    index = {}
+    for name in canonical_instances():
+        runs = []
+        for bench in RUN_LOG_DIRS:
+            for lp in instance_run_logs(bench, name):
+                runs.append({"bench": bench, "file": lp.name, **cache.get(lp, fingerprint)})
+        index[name] = runs
+    if own_cache:
+        cache.save()
+    return index
+
+
+def sub_results(name, models_by_file):
+    """이질 인스턴스의 SUB_RESULTS 헤드라인을 cpu_model별로 재집계(failed run 제외 — 파서 집계와 같은 로그)."""
+    out = {}
+    for field, (bench, pattern, parser, extract) in SUB_RESULTS.items():
+        module = __import__(f"parsers.{parser}", fromlist=["build"]) if parser else None
+        for lp in usable_logs(bench, [p for p in instance_run_logs(bench, name) if fnmatch.fnmatch(p.name, pattern)]):
+            model = models_by_file.get((bench, lp.name))
+            value = extract(module, lp)
+            if model and value is not None:
+                out.setdefault(model, {}).setdefault(field, []).append(value)
+    return {model: {f: mean(v) for f, v in fields.items()} for model, fields in out.items()}
+
+
+def build():
+    index = build_index()
+    instances = {}
+    for name, runs in index.items():
+        by_model = {}
+        for r in runs:
+            if r["cpu_model"]:
+                m = by_model.setdefault(r["cpu_model"], {"runs": 0, "benchmarks": set()})
+                m["runs"] += 1
+                m["benchmarks"].add(r["bench"])
+        dates = sorted(r["date"] for r in runs if r["date"])
+        entry = {
+            "runs": len(runs),
+            "identified_runs": sum(m["runs"] for m in by_model.values()),
+            "heterogeneous": len(by_model) > 1,
+            "cpu_models": {k: {"runs": v["runs"], "benchmarks": sorted(v["benchmarks"])} for k, v in sorted(by_model.items())},
+            "vcpus": sorted({r["vcpus"] for r in runs if r["vcpus"]}),
+            "kernels": sorted({r["kernel"] for r in runs if r["kernel"]}),
+            "first_date": dates[0] if dates else None,
+            "last_date": dates[-1] if dates else None,
+        }
+        if entry["heterogeneous"]:
+            models_by_file = {(r["bench"], r["file"]): r["cpu_model"] for r in runs}
+            entry["by_model"] = sub_results(name, models_by_file)
+        instances[name] = entry
+    return {
+        "notes": {
+            "method": "results/<bench>/<inst>/*.log 전체의 System Info 블록(model name/vCPUs/Mem), geekbench/passmark "
+                      "System·CPU Information, 로그 Date/Timestamp 헤더에서 추출. heterogeneous=true면 같은 인스턴스 "
+                      "이름의 run이 서로 다른 CPU 모델에서 측정됨 — by_model은 그 인스턴스의 모델별 하위 결과.",
+            "sub_results": sorted(SUB_RESULTS),
+        },
+        "heterogeneous": sorted(n for n, v in instances.items() if v["heterogeneous"]),
+        "instances": instances,
+    }
+
+
+def instance_flags(payload):
+    """build() 결과 -> {instance: {heterogeneous, cpu_models}} — instances.json에 합칠 속성."""
+    return {name: {"heterogeneous": v["heterogeneous"], "cpu_models": list(v["cpu_models"])}
+            for name, v in payload["instances"].items()}
+
+
+def main():
+    payload = build()
+    SITE_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    path = SITE_DATA_DIR / "_hardware.json"
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+    print(f"_hardware.json: 이질 하드웨어 {len(payload['heterogeneous'])}개 인스턴스 -> {path.relative_to(BASE_DIR)}")
+    return payload
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""run 건강도 분류기 — 로그마다 ok/partial/failed + 사유를 판정.
+
+손으로 관리하던 예외 목록(validate.py KNOWN_INCOMPLETE_SAMPLES, iperf3.py notes의 "Broken pipe"
+산문)을 대체한다. 판정 규칙:
+- failed: 빈 로그, 또는 그 벤치마크의 헤드라인 지표 마커(HEADLINE_MARKERS)가 아예 없음
+- partial: 헤드라인은 있지만 오류 시그니처(ERROR_SIGNATURES), FAILED:/SKIPPED 센티널,
+  '===== ... Complete' 푸터 누락(잘린 로그), clickhouse 측정 쿼리 수 < NQUERIES 중 하나 이상
+- ok: 그 외
+
+파서는 usable_logs()로 failed run을 집계에서 자동 제외한다. partial run은 파싱된 필드만 평균에
+들어간다(기존 동작 — 예: iperf3 Broken pipe run도 parallel_gbps는 정상 측정됨).
+산출물: site/data/_run_health.json.
+"""
+import json
+import re
+
+from cache import ParseCache
+from common import BASE_DIR, RUN_LOG_DIRS, SITE_DATA_DIR, canonical_instances, instance_run_logs
+
+PARSER_VERSION = 1
+NQUERIES = 43  # scripts/generate-clickhouse-report.py와 동일
+
+FOOTER = re.compile(r"^=====.*Complete.*=====\s*$", re.M)
+SENTINEL = re.compile(r"FAILED:\S*|(?<![\w-])SKIPPED(?![\w-])")
+CLICKHOUSE_QUERY = re.compile(r"^q\d+,\d+,\d+,\d+", re.M)
+ERROR_SIGNATURES = [
+    re.compile(r"iperf3: error - [^\n]+"),
+    re.compile(r"^ERROR: [^\n]+", re.M),
+]
+# 오류가 난 위치를 "--- TCP Bandwidth (Single Stream, 30s) ---" 같은 가장 가까운 섹션 헤더로 기록
+SECTION_HEADER = re.compile(r"^(?:---|===) (.+?) (?:---|===)\s*$", re.M)
+# (results 디렉터리, 파일명 접두어) -> 이 마커가 없으면 헤드라인을 뽑을 수 없는 run. 접두어 ""는 기본값.
+HEADLINE_MARKERS = {
+    ("sysbench-cpu", ""): r"events per second:",
+    ("sysbench-memory", ""): r"MiB/sec",
+    ("iperf3", ""): r"\ssender\s*$",
+    ("nginx", ""): r"8 threads, 400 connections, 30s\) ===\n(?:.*\n)*?Requests/sec:",
+    ("redis", ""): r'^"SET","[\d.]+"',
+    ("elasticsearch", "rally"): r"Mean Throughput \| index-append",
+    ("elasticsearch", "coldstart"): r"COLD_START_MS:\s*\d",
+    ("springboot", "wrk"): r"Requests/sec:",
+    ("springboot", "coldstart"): r"Started PetClinicApplication in",
+    ("springboot", ""): r"$^",  # cold_start1.log 같은 규칙 밖 파일 — 집계 glob에 안 걸리므로 failed로 표시만
+    ("geekbench", ""): r"MULTI_CORE_SCORE:",
+    ("passmark", ""): r"SUMM_CPU:",
+    ("kafka", ""): r"^PRODUCE_MB_PER_SEC:\s*[\d.]+",
+    ("kafka-max", ""): r"^PRODUCE_TOTAL_MB_PER_SEC:\s*[\d.]+",
+    ("kafka-ramp", ""): r"^STEP,",
+    ("clickhouse", ""): r"^q\d+,\d+,\d+,\d+",
+    ("stress-ng", ""): r"bogo ops/s",
+}
+
+
+def headline_marker(bench, filename):
+    for (b, prefix), pattern in HEADLINE_MARKERS.items():
+        if b == bench and prefix and filename.startswith(prefix):
+            return pattern
+    return HEADLINE_MARKERS.get((bench, ""))
+
+
+def classify(bench, path):
+    """로그 1개 -> {status, reasons, error_sections}. error_sections = 오류 시그니처가 나온 섹션 헤더들."""
+    text = path.read_text(errors="replace")
+    if not text.strip():
+        return {"status": "failed", "reasons": ["empty log"], "error_sections": []}
+    marker = headline_marker(bench, path.name)
+    if marker and not re.search(marker, text, re.M):
+        return {"status": "failed", "reasons": ["headline metric missing"], "error_sections": []}
+    headers = [(m.start(), m.group(1)) for m in SECTION_HEADER.finditer(text)]
+    reasons, sections = [], []
+    for sig in ERROR_SIGNATURES:
+        for m in sig.finditer(text):
+            section = next((h for pos, h in reversed(headers) if pos < m.start()), None)
+            reasons.append(f"{m.group(0).strip()} [{section}]" if section else m.group(0).strip())
+            if section:
+                sections.append(section)
+    sentinels = len(SENTINEL.findall(text))
+    if sentinels:
+        reasons.append(f"{sentinels} FAILED/SKIPPED sentinel(s)")
+    if bench == "clickhouse":
+        measured = len(CLICKHOUSE_QUERY.findall(text))
+        if measured < NQUERIES:
+            reasons.append(f"clickhouse queries {measured}/{NQUERIES}")
+    if not FOOTER.search(text):
+        reasons.append("truncated (no '===== Complete' footer)")
+    return {"status": "partial" if reasons else "ok", "reasons": reasons, "error_sections": sections}
+
+
+_cache = None
+
+
+def _run_cache():
+    global _cache
+    if _cache is None:
+        _cache = ParseCache("run-health", PARSER_VERSION)
+    return _cache
+
+
+def run_status(bench, path):
+    if not path.is_relative_to(BASE_DIR):  # 저장소 밖 결과(검증용 임시 디렉터리 등)는 캐시 키가 없음
+        return classify(bench, path)
+    return _run_cache().get(path, lambda p: classify(bench, p))
+
+
+def usable_logs(bench, paths):
+    """집계용 — failed run을 뺀 로그 경로 리스트(partial은 유지)."""
+    return [p for p in paths if run_status(bench, p)["status"] != "failed"]
+
+
+def build():
+    instances = {}
+    totals = {"ok": 0, "partial": 0, "failed": 0}
+    for name in canonical_instances():
+        bad = {}
+        for bench in RUN_LOG_DIRS:
+            for lp in instance_run_logs(bench, name):
+                r = run_status(bench, lp)
+                totals[r["status"]] += 1
+                if r["status"] != "ok":
+                    bad.setdefault(bench, {})[lp.name] = r
+        if bad:
+            instances[name] = bad
+    _run_cache().save()
+    return {
+        "notes": {
+            "method": "results/<bench>/<inst>/*.log 전체를 health.py 규칙으로 분류. failed run은 파서 집계에서 자동 제외, "
+                      "partial run은 파싱된 필드만 평균에 반영. instances에는 ok가 아닌 run만 나열.",
+        },
+        "totals": totals,
+        "instances": instances,
+    }
+
+
+def degraded(bench, name):
+    """(bench, instance)의 ok가 아닌 run {파일명: 판정} — validate.py/파서 notes용."""
+    out = {}
+    for lp in instance_run_logs(bench, name):
+        r = run_status(bench, lp)
+        if r["status"] != "ok":
+            out[lp.name] = r
+    return out
+
+
+def section_failed(bench, name, section_prefix):
+    """그 인스턴스의 run 중 section_prefix로 시작하는 섹션에서 오류가 났거나 failed인 run 파일명들."""
+    return sorted(
+        fn for fn, r in degraded(bench, name).items()
+        if r["status"] == "failed" or any(s.startswith(section_prefix) for s in r["error_sections"])
+    )
+
+
+def main():
+    payload = build()
+    SITE_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    path = SITE_DATA_DIR / "_run_health.json"
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+    t = payload["totals"]
+    print(f"_run_health.json: ok={t['ok']} partial={t['partial']} failed={t['failed']} -> {path.relative_to(BASE_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""수집(campaign) 스냅샷 이력 + 스냅샷 간 통계적 회귀 탐지.
+
+    python scripts/dashboard/build_data.py --snapshot[=라벨]          # 빌드 끝에 스냅샷 저장
+    python scripts/dashboard/history.py save [--label 라벨]
+    python scripts/dashboard/history.py list
+    python scripts/dashboard/history.py diff [A] [B] [--test welch|mwu] [--alpha 0.05] [--min-effect 0.03] [--json]
+
+봉투는 run 평균만 남겨 두 수집을 검정할 수 없고, validate.py 주석의 legacy 수치처럼 이전 수집이
+기록 없이 사라진다. 스냅샷 = history/<시각>.json:
+- runs: {지표: {인스턴스: [run 값...]}} — runs.py RUN_METRICS(failed run 제외, run 번호순).
+- campaign: 지표별 로그 'Date:' 헤더의 최초/최종 날짜(헤더를 남기는 건 redis뿐 — 나머지는 null).
+- commit: 저장 시점 git HEAD(없으면 null).
+diff는 (지표, 인스턴스)마다 A/B run 값을 검정한다.
+- welch: 등분산 가정 없는 t 검정(p는 정규화 불완전 베타로). mwu: Mann-Whitney U — 합친 표본
+  분할이 MWU_EXACT_MAX 이하면 정확 분포(동순위는 중간 순위), 넘으면 동순위 보정 정규 근사.
+  5 run끼리면 최소 p가 2/252라 수백 쌍 BH 보정을 못 넘는다 — mwu는 run이 많을 때(adaptive.py로
+  10회 이상 등), 기본은 welch.
+- 효과 크기: change = 평균 변화율(B/A - 1), welch는 Hedges' g, mwu는 Cliff's delta.
+- 수백 쌍을 한꺼번에 검정하므로 p는 Benjamini-Hochberg로 보정(q). q < alpha이고 |change| ≥
+  min-effect면 direction(runs.py)에 따라 regression/improvement로 표시 — 5% 느린 호스트/AMI를 잡되
+  run 간 잡음 수준의 변화는 넘긴다.
+B 자리에 'current'를 주면 저장하지 않고 지금 results/로 만든 스냅샷과 비교한다. 회귀가 있으면 종료 코드 1.
+"""
+import argparse
+import itertools
+import json
+import math
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from common import BASE_DIR, HISTORY_DIR, canonical_instances
+from runs import RUN_METRICS, run_date, run_logs, run_values
+
+SNAPSHOT_VERSION = 1
+DEFAULT_ALPHA = 0.05
+DEFAULT_MIN_EFFECT = 0.03
+MWU_EXACT_MAX = 20000  # C(n1+n2, n1)이 이 이하면 정확 분포(5 vs 5 = 252)
+
+
+# ------------------------------------------------------------------ snapshots
+
+def _git_head():
+    try:
+        out = subprocess.run(["git", "-C", str(BASE_DIR), "rev-parse", "--short", "HEAD"], capture_output=True,
+                             text=True, timeout=10)
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def snapshot(label=None, instances=None):
+    """지금 results/ -> 스냅샷 dict."""
+    instances = instances or canonical_instances()
+    runs, campaign = {}, {}
+    for metric in RUN_METRICS:
+        per_inst, dates = {}, []
+        for inst in instances:
+            values = [round(v, 4) for _, v in run_values(metric, inst)]
+            if values:
+                per_inst[inst] = values
+            dates += [d for _, p in run_logs(metric, inst) if (d := run_date(p))]
+        if per_inst:
+            runs[metric] = per_inst
+            campaign[metric] = {"first": min(dates), "last": max(dates)} if dates else None
+    return {
+        "version": SNAPSHOT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "label": label,
+        "commit": _git_head(),
+        "campaign": campaign,
+        "metrics": {m: {"label": RUN_METRICS[m]["label"], "direction": RUN_METRICS[m]["direction"]} for m in runs},
+        "runs": runs,
+    }
+
+
+def save(label=None):
+    snap = snapshot(label)
+    HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+    path = HISTORY_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}.json"
+    # run 값 목록은 한 줄에 — 스냅샷 수십 개가 쌓여도 git diff가 인스턴스 단위로 읽힌다
+    body = json.dumps(snap, indent=1, ensure_ascii=False)
+    path.write_text(_inline_lists(body) + "\n")
+    n = sum(len(v) for v in snap["runs"].values())
+    print(f"스냅샷: 지표 {len(snap['runs'])}개 × (지표, 인스턴스) {n}쌍 -> {path.relative_to(BASE_DIR)}")
+    return path
+
+
+def _inline_lists(body):
+    out, buf = [], None
+    for line in body.splitlines():
+        stripped = line.strip()
+        if buf is not None:
+            buf.append(stripped)
+            if stripped.startswith("]"):
+                out.append(buf[0] + " ".join(buf[1:-1]) + stripped)
+                buf = None
+            continue
+        if stripped.endswith("[") and not stripped.startswith("["):
+            buf = [line]
+            continue
+        out.append(line)
+    return "\n".join(out)
+
+
+def snapshots():
+    return sorted(HISTORY_DIR.glob("*.json")) if HISTORY_DIR.is_dir() else []
+
+
+def load(ref):
+    """'current' | 경로 | history/ 안 파일 이름(확장자 생략 가능) -> (이름, 스냅샷)."""
+    if ref == "current":
+        return "current", snapshot()
+    path = Path(ref)
+    if not path.exists():
+        path = HISTORY_DIR / (ref if ref.endswith(".json") else f"{ref}.json")
+    if not path.exists():
+        raise SystemExit(f"스냅샷 없음: {ref} (history.py list)")
+    return path.stem, json.loads(path.read_text())
+
+
+# ------------------------------------------------------------------ statistics
+
+def _mean_var(xs):
+    n = len(xs)
+    m = math.fsum(xs) / n
+    return m, math.fsum((x - m) ** 2 for x in xs) / (n - 1)
+
+
+def _betacf(a, b, x):
+    """정규화 불완전 베타의 연분수(Lentz)."""
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1)
+    d = 1 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 300):
+        for num in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                    -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1 + num * d
+            d = 1 / (d if abs(d) > tiny else tiny)
+            c = 1 + num / c
+            c = c if abs(c) > tiny else tiny
+            h *= d * c
+        if abs(d * c - 1) < 1e-12:
+            break
+    return h
+
+
+def betainc(a, b, x):
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x))
+    if x < (a + 1) / (a + b + 2):
+        return front * _betacf(a, b, x) / a
+    return 1 - front * _betacf(b, a, 1 - x) / b
+
+
+def welch(a, b):
+    """-> (p 양측, Hedges' g). 두 표본 모두 분산 0이면 평균이 같을 때 p=1, 다르면 p=0."""
+    ma, va = _mean_var(a)
+    mb, vb = _mean_var(b)
+    na, nb = len(a), len(b)
+    se2 = va / na + vb / nb
+    pooled = math.sqrt(((na - 1) * va + (nb - 1) * vb) / (na + nb - 2))
+    g = (mb - ma) / pooled * (1 - 3 / (4 * (na + nb) - 9)) if pooled else 0.0
+    if not se2:
+        return (1.0 if ma == mb else 0.0), g
+    t = (mb - ma) / math.sqrt(se2)
+    df = se2 ** 2 / ((va / na) ** 2 / (na - 1) + (vb / nb) ** 2 / (nb - 1))
+    return betainc(df / 2, 0.5, df / (df + t * t)), g
+
+
+def _ranks(values):
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        i = j + 1
+    return ranks
+
+
+def mann_whitney(a, b):
+    """-> (p 양측, Cliff's delta). delta > 0이면 B가 큰 쪽."""
+    na, nb = len(a), len(b)
+    delta = (sum((y > x) - (y < x) for x in a for y in b)) / (na * nb)
+    ranks = _ranks(list(a) + list(b))
+    u = sum(ranks[:na]) - na * (na + 1) / 2
+    mu = na * nb / 2
+    if math.comb(na + nb, na) <= MWU_EXACT_MAX:
+        total = extreme = 0
+        for idx in itertools.combinations(range(na + nb), na):
+            ui = sum(ranks[i] for i in idx) - na * (na + 1) / 2
+            total += 1
+            extreme += abs(ui - mu) >= abs(u - mu) - 1e-9
+        return extreme / total, delta
+    ties = {}
+    for r in ranks:
+        ties[r] = ties.get(r, 0) + 1
+    n = na + nb
+    var = na * nb / 12 * ((n + 1) - sum(t ** 3 - t for t in ties.values()) / (n * (n - 1)))
+    if not var:
+        return 1.0, delta
+    z = (abs(u - mu) - 0.5) / math.sqrt(var)
+    return math.erfc(max(z, 0) / math.sqrt(2)), delta
+
+
+def bh(pvalues):
+    """Benjamini-Hochberg q 값(입력 순서 유지)."""
+    m = len(pvalues)
+    order = sorted(range(m), key=pvalues.__getitem__)
+    q = [0.0] * m
+    prev = 1.0
+    for rank in range(m, 0, -1):
+        i = order[rank - 1]
+        prev = min(prev, pvalues[i] * m / rank)
+        q[i] = prev
+    return q
+
+
+# ------------------------------------------------------------------ diff
+
+def diff(old, new, test="welch", alpha=DEFAULT_ALPHA, min_effect=DEFAULT_MIN_EFFECT):
+    """두 스냅샷 -> [행] (지표, 인스턴스 순). 양쪽 다 run 2개 이상인 쌍만."""
+    rows = []
+    for metric, per_inst in new["runs"].items():
+        base = old["runs"].get(metric, {})
+        direction = new["metrics"][metric]["direction"]
+        for inst, b in per_inst.items():
+            a = base.get(inst)
+            if not a or len(a) < 2 or len(b) < 2:
+                continue
+            ma = math.fsum(a) / len(a)
+            mb = math.fsum(b) / len(b)
+            p, effect = welch(a, b) if test == "welch" else mann_whitney(a, b)
+            rows.append({"metric": metric, "instance": inst, "n": [len(a), len(b)], "mean": [round(ma, 4), round(mb, 4)],
+                         "change": round(mb / ma - 1, 4) if ma else None, "effect": round(effect, 3), "p": p})
+    for row, q in zip(rows, bh([r["p"] for r in rows])):
+        row["p"] = round(row["p"], 5)
+        row["q"] = round(q, 5)
+        change = row["change"]
+        row["flag"] = None
+        if q < alpha and change is not None and abs(change) >= min_effect:
+            better = change > 0 if new["metrics"][row["metric"]]["direction"] == "max" else change < 0
+            row["flag"] = "improvement" if better else "regression"
+    return rows
+
+
+def _describe(name, snap):
+    dates = sorted({d for c in snap["campaign"].values() if c for d in (c["first"], c["last"])})
+    when = f"수집 {dates[0]}~{dates[-1]}" if dates else "수집일 미상"
+    label = f" [{snap['label']}]" if snap.get("label") else ""
+    return f"{name}{label} ({when}, 저장 {snap['created'][:10]}, commit {snap.get('commit') or '-'})"
+
+
+def cmd_diff(args):
+    refs = [args.a, args.b]
+    if refs[0] is None:
+        found = snapshots()
+        if not found:
+            raise SystemExit("history/에 스냅샷이 없음 — history.py save 또는 build_data.py --snapshot")
+        refs = [found[-2].stem, found[-1].stem] if len(found) >= 2 else [found[-1].stem, "current"]
+    elif refs[1] is None:
+        refs[1] = "current"
+    (na, a), (nb, b) = load(refs[0]), load(refs[1])
+    rows = diff(a, b, args.test, args.alpha, args.min_effect)
+    flagged = [r for r in rows if r["flag"]]
+    if args.json:
+        print(json.dumps({"a": na, "b": nb, "test": args.test, "alpha": args.alpha, "min_effect": args.min_effect,
+                          "rows": rows}, indent=2, ensure_ascii=False))
+    else:
+        print(f"A: {_describe(na, a)}\nB: {_describe(nb, b)}")
+        print(f"{args.test} 검정, BH q < {args.alpha}, |변화| ≥ {args.min_effect:.0%} — {len(rows)}쌍 중 {len(flagged)}건")
+        effect = "g" if args.test == "welch" else "δ"
+        for r in sorted(flagged, key=lambda r: (r["flag"], r["metric"], r["instance"])):
+            print(f"  {r['flag']:<11} {r['metric']:<24} {r['instance']:<18} {r['mean'][0]:>12.5g} -> {r['mean'][1]:<12.5g}"
+                  f" {r['change']:+.1%}  {effect}={r['effect']:+.2f}  q={r['q']:.3g}  n={r['n'][0]}/{r['n'][1]}")
+    return 1 if any(r["flag"] == "regression" for r in flagged) else 0
+
+
+def cmd_list(_):
+    for path in snapshots():
+        print(_describe(path.stem, json.loads(path.read_text())))
+
+
+def parse_args(argv):
+    p = argparse.ArgumentParser(description="수집 스냅샷 이력 + 통계적 회귀 탐지")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    s = sub.add_parser("save", help="지금 results/의 run 값을 history/에 저장")
+    s.add_argument("--label")
+    sub.add_parser("list", help="저장된 스냅샷")
+    d = sub.add_parser("diff", help="두 스냅샷 비교(기본: 마지막 두 개, B 생략 시 current)")
+    d.add_argument("a", nargs="?")
+    d.add_argument("b", nargs="?")
+    d.add_argument("--test", choices=["welch", "mwu"], default="welch")
+    d.add_argument("--alpha", type=float, default=DEFAULT_ALPHA, help="BH 보정 q 임계")
+    d.add_argument("--min-effect", type=float, default=DEFAULT_MIN_EFFECT, help="표시할 최소 |평균 변화율|")
+    d.add_argument("--json", action="store_true")
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.cmd == "save":
+        save(args.label)
+        return 0
+    if args.cmd == "list":
+        cmd_list(args)
+        return 0
+    return cmd_diff(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
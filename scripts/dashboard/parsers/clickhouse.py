@@ -1,20 +1,143 @@
 """clickhouse는 재파싱하지 않는다 — 기존 generate-clickhouse-report.py가 만든
 results/clickhouse/data.json을 그대로 읽어 공통 봉투 필드(headline/coverage)만 추가한다.
 스키마(per_query_ms, queries 등)는 절대 변경하지 않는다 — 상위 설계 §3.5 "재사용 우선" 정책.
+
+그 위에 per-query 분석 단계(build_speedup)를 얹어 `speedup` 최상위 키를 추가한다(기존 키는
+손대지 않음): 인스턴스 × 쿼리 속도비 행렬(BASELINE 대비), 쿼리 클러스터링, 클러스터별 기하평균
+속도비. 클러스터는 쿼리의 log 속도비 벡터가 sysbench mem_seq_read(메모리 대역폭)/cpu_st(연산)
+및 mem_mb(메모리 용량 — 13.44GiB 데이터셋이 page cache에 들어가는지) 중 어느 것과 가장 강하게
+상관하는지로 결정한다. 인스턴스별 요약(speedup_geo)은 instances[<inst>]에도 넣어 탭에서
+rows 필드로 바로 쓸 수 있게 한다. sysbench 값은 이미 빌드된 site/data/sysbench.json 봉투에서 읽는다
+(scaling.load_envelopes와 같음 — 로그 재파싱 없음). build_data.BENCHMARKS와 serve.py 증분 재빌드 모두
+sysbench를 clickhouse보다 먼저 빌드하므로 봉투는 항상 최신이다.
+
+price/value/warmup_cost_usd는 data.json에 리포트 스크립트 시점의 On-Demand 가격으로 박혀 있으므로
+reprice()로 common.PRICE(build_data.py --region/--price-mix가 set_prices로 바꾼 실효 가격) 기준으로
+다시 계산한다 — 기본 가격이면 data.json 값과 같다. speedup의 per_dollar 승자도 같은 가격을 쓴다.
 """
 import json
+import math
 
-from common import BASE_DIR
+from common import BASE_DIR, PRICE, gen_family, geomean, pearson
+from parsers import sysbench
+from scaling import load_envelopes
 
 SRC = BASE_DIR / "results" / "clickhouse" / "data.json"
 
+# 속도비 기준 — 가장 오래된 세대의 Intel 범용 기준점(다른 탭의 세대 비교도 c5를 출발점으로 씀)
+BASELINE_INSTANCE = "c5.xlarge"
+CLUSTERS = {
+    "memory_bandwidth": "메모리 대역폭 바운드(sysbench mem_seq_read와 최대 상관)",
+    "compute": "연산 바운드(sysbench cpu_st와 최대 상관)",
+    "memory_capacity": "메모리 용량 바운드(mem_mb와 최대 상관 — 대형 GROUP BY, page cache 적중 여부)",
+}
+
+
+def _log(v):
+    return math.log(v) if v else None
+
+
+def sysbench_instances():
+    """site/data/sysbench.json 봉투의 instances. 봉투가 아직 없을 때(빈 site/data)만 파서로 직접 만든다."""
+    envelope = load_envelopes(["sysbench"]).get("sysbench") or sysbench.build()
+    return envelope["instances"]
+
+
+def build_speedup(instances, sb):
+    """instances(data.json 원본), sb(sysbench 봉투의 instances) -> speedup 분석 dict. per_query_ms 결측 셀은 None."""
+    base = instances.get(BASELINE_INSTANCE)
+    if not base or not base.get("per_query_ms"):
+        return None
+    names = sorted(instances)
+    queries = sorted(base["per_query_ms"])
+    base_ms = [base["per_query_ms"][q] for q in queries]
+
+    # 행렬은 행(인스턴스) 단위로 한 번에 만든다: speedup = baseline_ms / inst_ms (>1이면 빠름)
+    matrix = []
+    for name in names:
+        per_q = instances[name].get("per_query_ms") or {}
+        row = [per_q.get(q) for q in queries]
+        matrix.append([round(b / v, 4) if (b and v) else None for b, v in zip(base_ms, row)])
+
+    axes = {
+        "memory_bandwidth": [_log((sb.get(n) or {}).get("mem_seq_read")) for n in names],
+        "compute": [_log((sb.get(n) or {}).get("cpu_st")) for n in names],
+        "memory_capacity": [_log(instances[n].get("mem_mb")) for n in names],
+    }
+
+    profile = {}
+    members = {c: [] for c in CLUSTERS}
+    for j, q in enumerate(queries):
+        col = [_log(row[j]) for row in matrix]
+        corr = {c: pearson(col, xs) for c, xs in axes.items()}
+        ranked = sorted((v, c) for c, v in corr.items() if v is not None)
+        cluster = ranked[-1][1] if ranked else "compute"
+        members[cluster].append(q)
+
+        groups = {}
+        for name, row in zip(names, matrix):
+            cls = gen_family(name)
+            groups.setdefault(f"{cls['arch']}-{cls['gen']}", []).append(row[j])
+        group_geo = {g: geomean(v) for g, v in groups.items()}
+        best_idx = max((i for i, row in enumerate(matrix) if row[j] is not None), key=lambda i: matrix[i][j])
+        profile[q] = {
+            "cluster": cluster,
+            "corr": corr,
+            "winner": names[best_idx],
+            "winner_group": max((g for g in group_geo if group_geo[g] is not None), key=lambda g: group_geo[g]),
+        }
+
+    by_instance = {}
+    for name, row in zip(names, matrix):
+        cells = dict(zip(queries, row))
+        entry = {"all": geomean(row)}
+        for c, qs in members.items():
+            entry[c] = geomean([cells[q] for q in qs])
+        by_instance[name] = entry
+
+    winners = {}
+    for c in ["all", *CLUSTERS]:
+        scored = [(v[c], n) for n, v in by_instance.items() if v[c] is not None]
+        if not scored:
+            continue
+        per_dollar = [(s / PRICE[n], n) for s, n in scored if PRICE.get(n)]
+        winners[c] = {"speed": max(scored)[1], "per_dollar": max(per_dollar)[1] if per_dollar else None}
+
+    return {
+        "baseline": BASELINE_INSTANCE,
+        "queries": queries,
+        "instances": names,
+        "matrix": matrix,
+        "clusters": {c: {"label": label, "queries": members[c]} for c, label in CLUSTERS.items()},
+        "query_profile": profile,
+        "winners": winners,
+        "by_instance": by_instance,
+    }
+
+
+def reprice(instances):
+    """price/value(speed/$)/warmup_cost_usd를 common.PRICE로 다시 계산(generate-clickhouse-report.py와 같은 식)."""
+    for name, entry in instances.items():
+        price = PRICE.get(name)
+        entry["price"] = price
+        entry["value"] = round(entry["speed"] / price, 2) if (entry.get("speed") and price) else None
+        if entry.get("cold_total_ms") and entry.get("hot_total_ms"):
+            warmup_s = max(0.0, (entry["cold_total_ms"] - entry["hot_total_ms"]) / 1000)
+            entry["warmup_cost_usd"] = round(warmup_s / 3600 * price, 6) if price else None
+
 
 def build():
     data = json.loads(SRC.read_text())
+    reprice(data["instances"])
     data["benchmark"] = "clickhouse"
     data["coverage"] = len(data["instances"])
     data["headline"] = {
         "field": "hot_total_s", "direction": "min",
         "label": "Hot Query Total", "unit": "s",
     }
+    speedup = build_speedup(data["instances"], sysbench_instances())
+    if speedup:
+        data["speedup"] = speedup
+        for name, geo in speedup.pop("by_instance").items():
+            data["instances"][name]["speedup_geo"] = geo
     return data
@@ -10,6 +10,7 @@ nullable 규약: c8gn/r8gd.xlarge는 rally 로그가 없음(coldstart만 존재)
 import re
 
 from common import RESULTS_DIR, canonical_instances, mean
+from health import usable_logs
 
 RALLY_PATTERNS = {
     "throughput": r"Mean Throughput \| index-append \|\s*([\d.]+)",
@@ -55,7 +56,7 @@ def build():
             continue
 
         rally_runs = {k: [] for k in RALLY_PATTERNS}
-        for lp in sorted(inst_dir.glob("rally*.log")):
+        for lp in usable_logs("elasticsearch", sorted(inst_dir.glob("rally*.log"))):
             r = parse_rally_log(lp)
             for k, v in r.items():
                 if v is not None:
@@ -69,7 +70,7 @@ def build():
             }
 
         cold_runs = {k: [] for k in COLDSTART_PATTERNS}
-        for lp in sorted(inst_dir.glob("coldstart*.log")):
+        for lp in usable_logs("elasticsearch", sorted(inst_dir.glob("coldstart*.log"))):
             r = parse_coldstart_log(lp)
             for k, v in r.items():
                 if v is not None:
@@ -7,11 +7,14 @@ UDP는 크레딧 소진/타이밍 문제로 일부 run에서 완전히 실패(
 """
 import re
 
+from cache import ParseCache
 from common import RESULTS_DIR, canonical_instances, mean
+from health import section_failed, usable_logs
 
 # results/iperf3/ 디렉터리명이 이 벤치마크에서만 'c7i-flex.xlarge' 대신 'c7i.flex.xlarge'로
 # 되어 있음(다른 8개 벤치마크 디렉터리는 정상 하이픈 표기) — 원본 데이터는 보존하고 파서에서만 매핑.
 DIR_ALIASES = {"c7i-flex.xlarge": "c7i.flex.xlarge"}
+PARSER_VERSION = 1
 
 SECTION_PATTERN = re.compile(
     r"--- (TCP Bandwidth \([^)]+\)|UDP Bandwidth Test \([^)]+\)) ---\n(.*?)(?=\n---|\Z)",
@@ -65,15 +68,16 @@ def parse_log(path):
 
 def build():
     base = RESULTS_DIR / "iperf3"
+    cache = ParseCache("iperf3", PARSER_VERSION)
     instances = {}
     for name in canonical_instances():
         inst_dir = base / DIR_ALIASES.get(name, name)
         if not inst_dir.is_dir():
             continue
-        logs = sorted(inst_dir.glob("run*.log"))
+        logs = usable_logs("iperf3", sorted(inst_dir.glob("run*.log")))
         runs = {k: [] for k in ["single_gbps", "parallel_gbps", "reverse_gbps", "udp_mbps", "jitter_ms", "loss_pct"]}
         for lp in logs:
-            r = parse_log(lp)
+            r = cache.get(lp, parse_log)
             for k, v in r.items():
                 if v is not None:
                     runs[k].append(v)
@@ -81,7 +85,11 @@ def build():
             continue
         instances[name] = {k: mean(v) for k, v in runs.items()}
 
+    cache.save()
     coverage = sum(1 for v in instances.values() if v["parallel_gbps"] is not None)
+    # run 건강도(health.py)에서 TCP Single Stream 섹션 오류 run을 자동 수집 — 예전엔 손으로 쓴 산문
+    single_failed = {n: section_failed("iperf3", n, "TCP Bandwidth (Single") for n in instances}
+    single_failed = {n: runs for n, runs in single_failed.items() if runs}
     return {
         "benchmark": "iperf3",
         "coverage": coverage,
@@ -89,7 +97,10 @@ def build():
         "notes": {
             "method": "iperf3 TCP Single/8-Parallel/Reverse(30s) + UDP(1Gbps target, 30s), 5회 평균. sender 측 Bitrate 기준(UDP는 receiver 측 Jitter/Loss).",
             "udp_caveat": "UDP는 일부 run에서 소켓 오류로 완전 실패할 수 있어 평균 표본 수가 TCP보다 적을 수 있음",
-            "single_stream_caveat": "c7g/c7i/m8i.xlarge는 5회 중 1회가 'Broken pipe' 오류로 완전 실패해 TCP Single Stream이 4회 평균(다른 필드는 5회)",
+            "single_stream_caveat": (
+                "TCP Single Stream 섹션이 오류로 실패한 run이 있어 그 run을 뺀 평균(다른 필드는 정상 run 포함): "
+                + ", ".join(f"{n}({'/'.join(runs)})" for n, runs in sorted(single_failed.items()))
+            ) if single_failed else None,
         },
         "instances": instances,
     }
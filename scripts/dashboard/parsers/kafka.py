@@ -1,13 +1,94 @@
 """kafka는 재파싱하지 않는다 — 기존 generate-kafka-report.py가 만든 results/kafka/data.json을
 그대로 읽어 공통 봉투 필드(headline/coverage)만 추가한다. 스키마(중첩 max/ramp 등)는 절대
 변경하지 않는다 — 상위 설계 §3.5 "재사용 우선" 정책.
+
+파생 필드는 기존 키 옆에 추가만 한다: instances[<inst>]["codec_efficiency"] — kafka-max
+포화 시나리오의 codec별 uncompressed 대비 처리량 증감, MB/s per $, iperf3 8-way 대역폭 대비
+네트워크 사용률로 본 CPU/네트워크 바운드 분류와 codec 추천. iperf3 대역폭은 이미 빌드된
+site/data/iperf3.json 봉투에서 읽는다(BENCHMARKS 순서상 iperf3가 먼저 빌드됨 — 로그 재파싱 없음).
+
+price/value(produce MB/s per $)는 data.json에 리포트 스크립트 시점의 On-Demand 가격으로 박혀 있으므로
+common.PRICE(build_data.py --region/--price-mix의 실효 가격) 기준으로 다시 계산한다 — 기본 가격이면 같은 값.
 """
 import json
 
-from common import BASE_DIR
+from common import BASE_DIR, PRICE
+from parsers import iperf3
+from scaling import load_envelopes
 
 SRC = BASE_DIR / "results" / "kafka" / "data.json"
 
+CODECS = ["uncompressed", "lz4", "zstd"]
+# 압축 이득 판정 여유 — kafka-max 3회 중앙값의 run간 편차(~2%) 안쪽이면 "변화 없음"으로 본다
+GAIN_EPS = 0.02
+# uncompressed produce가 iperf3 8-way 대역폭의 이 비율 이상이면 압축과 무관하게 네트워크 바운드
+NET_SATURATION = 0.8
+# zstd가 lz4 처리량의 이 비율 이상이면 zstd 추천(압축률 1.87 vs 1.32 — 디스크/전송량 이득)
+ZSTD_TOLERANCE = 0.9
+
+
+def codec_efficiency(by_codec, price, iperf_gbps):
+    """instances[<inst>]["max"] -> codec_efficiency dict (uncompressed 결측이면 None)."""
+    base_mb = (by_codec.get("uncompressed") or {}).get("produce_mb_per_sec")
+    if not base_mb:
+        return None
+    codecs = {}
+    for codec in CODECS:
+        mb = (by_codec.get(codec) or {}).get("produce_mb_per_sec")
+        if mb is None:
+            continue
+        codecs[codec] = {
+            "produce_mb_per_sec": mb,
+            "gain_vs_uncompressed": round(mb / base_mb, 3),
+            "mb_per_dollar": round(mb / price, 2) if price else None,
+        }
+
+    wire_gbps = base_mb * 8 / 1000
+    net_util = round(wire_gbps / iperf_gbps, 3) if iperf_gbps else None
+    best_gain = max(v["gain_vs_uncompressed"] for c, v in codecs.items() if c != "uncompressed") if len(codecs) > 1 else None
+    # 압축해서 빨라졌다 = 줄어든 바이트만큼 전송 경로가 병목이었다; 느려졌다 = 브로커 CPU가 병목
+    if (net_util is not None and net_util >= NET_SATURATION) or (best_gain is not None and best_gain > 1 + GAIN_EPS):
+        bound = "network"
+    elif best_gain is not None and best_gain < 1 - GAIN_EPS:
+        bound = "cpu"
+    else:
+        bound = "balanced"
+
+    lz4 = codecs.get("lz4", {}).get("produce_mb_per_sec")
+    zstd = codecs.get("zstd", {}).get("produce_mb_per_sec")
+    if lz4 and zstd:
+        compressed = "zstd" if zstd >= lz4 * ZSTD_TOLERANCE else "lz4"
+    else:
+        compressed = "lz4" if lz4 else ("zstd" if zstd else None)
+    fastest = max(codecs, key=lambda c: codecs[c]["produce_mb_per_sec"])
+    # 압축 codec별 uncompressed 대비 증감(-0.011 = 1.1% 느림) — 균형 사유에 실제 편차를 적는 데 쓴다
+    spread = {c: round(v["gain_vs_uncompressed"] - 1, 3) for c, v in codecs.items() if c != "uncompressed"}
+    if bound == "cpu":
+        reason = f"CPU 바운드 — 압축 시 처리량 감소, 압축이 필요하면 {compressed}"
+    elif bound == "network" and fastest != "uncompressed":
+        reason = f"네트워크 바운드 — 압축으로 전송량을 줄이는 쪽이 유리({fastest} 최고 처리량)"
+    elif bound == "network" and not spread:
+        reason = "네트워크 포화 — 비교할 압축 codec 없음"
+    elif bound == "network":
+        reason = f"네트워크 포화 — 압축 이득 없음, 압축이 필요하면 {compressed}"
+    elif not spread:
+        reason = "비교할 압축 codec 없음(uncompressed만 측정)"
+    elif all(abs(g) <= GAIN_EPS for g in spread.values()):
+        reason = f"균형 — codec 간 처리량 차이가 ±{GAIN_EPS:.0%} 이내"
+    else:
+        # 최고 codec은 ±GAIN_EPS 안이지만 다른 codec은 크게 느린 경우 — 실제 편차를 그대로 적는다
+        best = max(spread, key=spread.get)
+        others = ", ".join(f"{c} {g:+.1%}" for c, g in spread.items() if c != best)
+        reason = f"균형 — {best}가 uncompressed와 ±{GAIN_EPS:.0%} 이내({spread[best]:+.1%}), {others}"
+    return {
+        "codecs": codecs,
+        "wire_gbps": round(wire_gbps, 3),
+        "iperf3_gbps": iperf_gbps,
+        "net_utilization": net_util,
+        "bound": bound,
+        "recommendation": {"codec": fastest, "compressed_codec": compressed, "reason": reason},
+    }
+
 
 def build():
     data = json.loads(SRC.read_text())
@@ -17,4 +98,13 @@ def build():
         "field": "produce_mb_per_sec", "direction": "max",
         "label": "Produce Throughput (Baseline)", "unit": "MB/s",
     }
+    envelope = load_envelopes(["iperf3"]).get("iperf3") or iperf3.build()  # 봉투가 아직 없을 때만 직접 파싱
+    bandwidth = {n: v.get("parallel_gbps") for n, v in envelope["instances"].items()}
+    for name, entry in data["instances"].items():
+        price = PRICE.get(name)
+        entry["price"] = price
+        mb = entry.get("produce_mb_per_sec")
+        entry["value"] = round(mb / price, 2) if (mb and price) else None
+        if entry.get("max"):
+            entry["codec_efficiency"] = codec_efficiency(entry["max"], PRICE.get(name), bandwidth.get(name))
     return data
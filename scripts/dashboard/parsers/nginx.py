@@ -7,6 +7,7 @@
 import re
 
 from common import RESULTS_DIR, canonical_instances, mean
+from health import usable_logs
 
 SECTION_PATTERN = re.compile(
     r"=== wrk Test \((\d+) threads, (\d+) connections, 30s\) ===\n(.*?)(?=\n===|\Z)", re.S
@@ -34,7 +35,7 @@ def build():
         if not inst_dir.is_dir():
             continue
         req_runs, lat_runs = [], []
-        for lp in sorted(inst_dir.glob("run*.log")):
+        for lp in usable_logs("nginx", sorted(inst_dir.glob("run*.log"))):
             req_sec, latency = parse_log(lp)
             if req_sec is not None:
                 req_runs.append(req_sec)
@@ -8,7 +8,9 @@ GET/Mixed 효율 차트는 레거시 리포트에서 조작값(SET×1.1/×1.05)
 """
 import re
 
+from cache import ParseCache
 from common import RESULTS_DIR, canonical_instances, mean
+from health import usable_logs
 
 SET_PATTERN = re.compile(
     r'--- Test 5: Latency Test SET.*?\n"test","rps".*?\n"SET","([\d.]+)","([\d.]+)","[\d.]+","[\d.]+","[\d.]+","([\d.]+)"',
@@ -18,6 +20,7 @@ GET_PATTERN = re.compile(
     r'--- Test 6: Latency Test GET.*?\n"test","rps".*?\n"GET","([\d.]+)","([\d.]+)","[\d.]+","[\d.]+","[\d.]+","([\d.]+)"',
     re.S,
 )
+PARSER_VERSION = 1
 
 
 def parse_log(path):
@@ -34,14 +37,15 @@ def parse_log(path):
 
 def build():
     base = RESULTS_DIR / "redis"
+    cache = ParseCache("redis", PARSER_VERSION)
     instances = {}
     for name in canonical_instances():
         inst_dir = base / name
         if not inst_dir.is_dir():
             continue
         runs = {k: [] for k in ["set_rps", "get_rps", "set_lat_ms", "get_lat_ms", "set_p99_ms", "get_p99_ms"]}
-        for lp in sorted(inst_dir.glob("run*.log")):
-            r = parse_log(lp)
+        for lp in usable_logs("redis", sorted(inst_dir.glob("run*.log"))):
+            r = cache.get(lp, parse_log)
             for k, v in r.items():
                 if v is not None:
                     runs[k].append(v)
@@ -55,6 +59,7 @@ def build():
             "get_rps_all": [round(v, 2) for v in runs["get_rps"]],
         }
 
+    cache.save()
     coverage = sum(1 for v in instances.values() if v["set_rps"] is not None)
     return {
         "benchmark": "redis",
@@ -8,6 +8,7 @@ import csv
 import re
 
 from common import BASE_DIR, RESULTS_DIR, canonical_instances, mean
+from health import usable_logs
 
 WRK_SECTIONS = {
     "rps50": "--- Main Page - 2 threads, 50 connections, 60s ---",
@@ -95,14 +96,14 @@ def build():
             continue
 
         wrk_runs = {k: [] for k in ["rps50", "rps100", "rps200", "lat50_ms", "lat99_ms"]}
-        for lp in sorted(inst_dir.glob("wrk*.log")):
+        for lp in usable_logs("springboot", sorted(inst_dir.glob("wrk*.log"))):
             parsed = parse_wrk_log(lp)
             for key, value in parsed.items():
                 if value is not None:
                     wrk_runs[key].append(value)
 
         cold_runs = []
-        for lp in sorted(inst_dir.glob("coldstart*.log")):
+        for lp in usable_logs("springboot", sorted(inst_dir.glob("coldstart*.log"))):
             cold_s = parse_coldstart_log(lp)
             if cold_s is not None:
                 cold_runs.append(cold_s)
@@ -1,28 +1,107 @@
-"""stress-ng는 원시 재파싱하지 않는다(51개 그대로). legacy/stress-ng.json을 표준 봉투로
-재구성. 레거시 필드 `switch`는 JS 예약어 인상을 피하려 `ctx_switch`로 개명(데이터 스키마
-설계 §3 결정).
+"""stress-ng: 헤드라인 필드는 legacy/stress-ng.json을 표준 봉투로 재구성(51개 그대로). 레거시 필드
+`switch`는 JS 예약어 인상을 피하려 `ctx_switch`로 개명(데이터 스키마 설계 §3 결정).
+
+stressors 필드는 results/stress-ng/<inst>/run*.log 원시 로그를 직접 파싱한 stressor별 분해값이다
+(bogo ops, real/usr/sys time, bogo ops/s real·usr+sys). 헤드라인을 원시값으로 바꾸지 않는 이유:
+matrix/float/int/memcpy/ctx_switch는 원시 5회 평균과 legacy가 일치하지만 cache/branch/total은
+legacy HTML 쪽 값이 원시 로그로 재현되지 않는다(validate.py 정답지 유지). cpu_util =
+(usr+sys)/(real×CPUs) — 1.0 미만이면 해당 stressor가 CPU를 다 쓰지 못한 것(steal/대기 시간).
 """
 import json
+import re
 
-from common import LEGACY_DIR
+from cache import ParseCache
+from common import LEGACY_DIR, RESULTS_DIR, mean
+from health import usable_logs
 
 SRC = LEGACY_DIR / "stress-ng.json"
+PARSER_VERSION = 1
+
+# 섹션 헤더 -> 봉투 필드명 (같은 `cpu` stressor가 float/int 두 번 나오므로 stressor명이 아닌 섹션으로 구분)
+SECTION_KEYS = {
+    "CPU Matrix Operations": "matrix",
+    "CPU Float Operations": "float",
+    "CPU Integer Operations": "int",
+    "Memory Bandwidth (memcpy)": "memcpy",
+    "Cache Performance": "cache",
+    "Context Switch": "ctx_switch",
+    "Branch Prediction": "branch",
+}
+SECTION_LINE = re.compile(r"^--- (.+) ---$")
+CPUS_LINE = re.compile(r"^CPUs:\s*(\d+)")
+# "stress-ng: info:  [305] matrix   484108   60.00   216.00   0.16   8068.47   2239.58"
+ROW_LINE = re.compile(
+    r"\]\s+([a-z][\w-]*)\s+(\d+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s*$"
+)
+ROW_FIELDS = ["bogo_ops", "real_s", "usr_s", "sys_s", "ops_real", "ops_cpu"]
+
+
+def parse_log(path):
+    """run<N>.log 한 줄씩 읽어 {cpus, stressors: {field: {bogo_ops, real_s, usr_s, sys_s, ops_real, ops_cpu}}}."""
+    out = {"cpus": None, "stressors": {}}
+    section = None
+    with path.open(errors="replace") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            m = SECTION_LINE.match(line)
+            if m:
+                section = m.group(1)
+                continue
+            m = CPUS_LINE.match(line)
+            if m:
+                out["cpus"] = int(m.group(1))
+                continue
+            m = ROW_LINE.search(line)
+            if m:
+                key = SECTION_KEYS.get(section, m.group(1))
+                out["stressors"][key] = dict(zip(ROW_FIELDS, (float(v) for v in m.groups()[1:])))
+    return out
+
+
+def build_stressors(name, cache):
+    inst_dir = RESULTS_DIR / "stress-ng" / name
+    if not inst_dir.is_dir():
+        return None
+    runs = {}
+    for lp in usable_logs("stress-ng", sorted(inst_dir.glob("run*.log"))):
+        parsed = cache.get(lp, parse_log)
+        cpus = parsed["cpus"]
+        for key, row in parsed["stressors"].items():
+            r = runs.setdefault(key, {f: [] for f in [*ROW_FIELDS, "cpu_util"]})
+            for f in ROW_FIELDS:
+                r[f].append(row[f])
+            if cpus and row["real_s"]:
+                r["cpu_util"].append((row["usr_s"] + row["sys_s"]) / (row["real_s"] * cpus))
+    if not runs:
+        return None
+    out = {}
+    for key, r in runs.items():
+        out[key] = {f: mean(v) for f, v in r.items()}
+        out[key]["runs"] = len(r["bogo_ops"])
+    return out
 
 
 def build():
     rows = json.loads(SRC.read_text())
-    instances = {
-        r["instance"]: {
+    cache = ParseCache("stress-ng", PARSER_VERSION)
+    instances = {}
+    for r in rows:
+        instances[r["instance"]] = {
             "matrix": r["matrix"], "float": r["float"], "int": r["int"],
             "memcpy": r["memcpy"], "cache": r["cache"], "ctx_switch": r["switch"],
             "branch": r["branch"], "total": r["total"],
+            "stressors": build_stressors(r["instance"], cache),
         }
-        for r in rows
-    }
+    cache.save()
     return {
         "benchmark": "stress-ng",
         "coverage": len(instances),
         "headline": {"field": "total", "direction": "max", "label": "종합 점수", "unit": "score"},
-        "notes": {"coverage_caveat": "51/54 — 신규 3개 인스턴스는 원시 로그 없음"},
+        "notes": {
+            "coverage_caveat": "51/54 — 신규 3개 인스턴스는 원시 로그 없음",
+            "stressors": "stressors.<field>는 원시 로그 run*.log의 stressor별 평균(runs = 그 stressor 행이 있는 "
+                         "로그 수 — 중간에 잘린 로그는 뒤쪽 stressor가 빠짐). ops_cpu = bogo ops/s(usr+sys), "
+                         "cpu_util = (usr+sys)/(real×CPUs).",
+        },
         "instances": instances,
     }
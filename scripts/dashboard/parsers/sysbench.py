@@ -6,21 +6,43 @@
 import re
 from pathlib import Path
 
-from common import RESULTS_DIR, canonical_instances, mean
+from common import RESULTS_DIR, canonical_instances, cv, mean, stdev
+from health import usable_logs
+
+
+RUN_PATTERNS = {
+    "events_per_sec": r"events per second:\s+(\d+\.?\d*)",
+    "lat_min_ms": r"min:\s+(\d+\.?\d*)",
+    "lat_avg_ms": r"avg:\s+(\d+\.?\d*)",
+    "lat_max_ms": r"max:\s+(\d+\.?\d*)",
+    "lat_p95_ms": r"95th percentile:\s+(\d+\.?\d*)",
+    "fairness_avg": r"events \(avg/stddev\):\s+(\d+\.?\d*)/",
+    "fairness_stddev": r"events \(avg/stddev\):\s+\d+\.?\d*/(\d+\.?\d*)",
+}
+
+
+def _parse_run(block):
+    out = {}
+    for key, pattern in RUN_PATTERNS.items():
+        m = re.search(pattern, block)
+        out[key] = float(m.group(1)) if m else None
+    return out
 
 
 def parse_cpu_log(path):
+    """-> (multi_thread, single_thread, runs). runs는 멀티스레드 "--- Run i/3 ---" 블록별
+    events/s·Latency(min/avg/max/p95)·Threads fairness(events avg/stddev) — 같은 파일 읽기에서 추출."""
     content = path.read_text(errors="replace")
-    mt_events = re.findall(r"events per second:\s+(\d+\.?\d*)", content)
     st_section = content.split("Single Thread Performance")
     single_thread = None
     if len(st_section) > 1:
         m = re.search(r"events per second:\s+(\d+\.?\d*)", st_section[1])
         if m:
             single_thread = float(m.group(1))
-    multi_values = [float(x) for x in mt_events[:3]] if mt_events else []
-    multi_thread = mean(multi_values)
-    return multi_thread, single_thread
+    blocks = re.split(r"--- Run \d+/\d+ ---", st_section[0])[1:]
+    runs = [r for r in (_parse_run(b) for b in blocks) if r["events_per_sec"] is not None][:3]
+    multi_thread = mean([r["events_per_sec"] for r in runs])
+    return multi_thread, single_thread, runs
 
 
 def parse_memory_log(path):
@@ -39,37 +61,64 @@ def parse_memory_log(path):
     return out
 
 
+def build_instance(name):
+    """results/sysbench-{cpu,memory}/<name> -> 인스턴스 엔트리(usable 로그가 없으면 None).
+    canonical 목록 밖의 새 인스턴스에도 쓸 수 있다(predict.py rank)."""
+    cpu_dir = RESULTS_DIR / "sysbench-cpu" / name
+    mem_dir = RESULTS_DIR / "sysbench-memory" / name
+    cpu_logs = sorted(cpu_dir.glob("run*.log")) if cpu_dir.is_dir() else []
+    mem_logs = sorted(mem_dir.glob("run*.log")) if mem_dir.is_dir() else []
+    cpu_logs, mem_logs = usable_logs("sysbench-cpu", cpu_logs), usable_logs("sysbench-memory", mem_logs)
+    if not cpu_logs and not mem_logs:
+        return None
+
+    mt_runs, st_runs, inner_runs = [], [], []
+    for lp in cpu_logs:
+        mt, st, runs = parse_cpu_log(lp)
+        if mt is not None:
+            mt_runs.append(mt)
+        if st is not None:
+            st_runs.append(st)
+        inner_runs.extend(runs)
+
+    mem_runs = {k: [] for k in ["mem_seq_write", "mem_seq_read", "mem_rnd_write", "mem_rnd_read", "mem_large_block"]}
+    for lp in mem_logs:
+        r = parse_memory_log(lp)
+        for k, v in r.items():
+            if v is not None:
+                mem_runs[k].append(v)
+
+    entry = {
+        "cpu_mt": mean(mt_runs),
+        "cpu_st": mean(st_runs),
+    }
+    # 3 inner run × N 로그 전체를 한 표본으로 — 평균은 cpu_mt와 같고 편차가 추가 정보
+    col = {k: [r[k] for r in inner_runs if r[k] is not None] for k in RUN_PATTERNS}
+    fairness_cv = [r["fairness_stddev"] / r["fairness_avg"] for r in inner_runs
+                   if r["fairness_stddev"] is not None and r["fairness_avg"]]
+    entry.update({
+        "cpu_mt_stddev": stdev(col["events_per_sec"]),
+        "cpu_mt_cv": cv(col["events_per_sec"]),
+        "cpu_latency_min_ms": min(col["lat_min_ms"]) if col["lat_min_ms"] else None,
+        "cpu_latency_avg_ms": mean(col["lat_avg_ms"]),
+        "cpu_latency_avg_stddev": stdev(col["lat_avg_ms"]),
+        "cpu_latency_p95_ms": mean(col["lat_p95_ms"]),
+        "cpu_latency_p95_stddev": stdev(col["lat_p95_ms"]),
+        "cpu_latency_max_ms": max(col["lat_max_ms"]) if col["lat_max_ms"] else None,
+        "cpu_fairness_stddev": mean(col["fairness_stddev"]),
+        "cpu_fairness_cv": mean(fairness_cv),
+        "cpu_mt_all": [round(v, 2) for v in col["events_per_sec"]],
+    })
+    entry.update({k: mean(v) for k, v in mem_runs.items()})
+    return entry
+
+
 def build():
-    cpu_dir = RESULTS_DIR / "sysbench-cpu"
-    mem_dir = RESULTS_DIR / "sysbench-memory"
     instances = {}
     for name in canonical_instances():
-        cpu_logs = sorted((cpu_dir / name).glob("run*.log")) if (cpu_dir / name).is_dir() else []
-        mem_logs = sorted((mem_dir / name).glob("run*.log")) if (mem_dir / name).is_dir() else []
-        if not cpu_logs and not mem_logs:
-            continue
-
-        mt_runs, st_runs = [], []
-        for lp in cpu_logs:
-            mt, st = parse_cpu_log(lp)
-            if mt is not None:
-                mt_runs.append(mt)
-            if st is not None:
-                st_runs.append(st)
-
-        mem_runs = {k: [] for k in ["mem_seq_write", "mem_seq_read", "mem_rnd_write", "mem_rnd_read", "mem_large_block"]}
-        for lp in mem_logs:
-            r = parse_memory_log(lp)
-            for k, v in r.items():
-                if v is not None:
-                    mem_runs[k].append(v)
-
-        entry = {
-            "cpu_mt": mean(mt_runs),
-            "cpu_st": mean(st_runs),
-        }
-        entry.update({k: mean(v) for k, v in mem_runs.items()})
-        instances[name] = entry
+        entry = build_instance(name)
+        if entry is not None:
+            instances[name] = entry
 
     coverage = sum(1 for v in instances.values() if v["cpu_mt"] is not None)
     return {
@@ -78,6 +127,9 @@ def build():
         "headline": {"field": "cpu_mt", "direction": "max", "label": "CPU Multi-thread", "unit": "events/s"},
         "notes": {
             "method": "sysbench CPU(4threads, 60s) 3회 평균 + Single Thread 1회, sysbench Memory 5종 블록 테스트 5회 평균",
+            "latency": "cpu_latency_*/cpu_fairness_*/cpu_mt_stddev·cv는 멀티스레드 inner run(3회 × 로그 5개 = 15표본) 기준. "
+                       "min/max는 전 표본의 극값, 나머지는 평균과 표본 표준편차. cpu_fairness_cv(스레드별 events stddev/avg)는 "
+                       "공유 호스트의 noisy-neighbour 간섭 지표. cpu_mt_all은 15개 원시값.",
         },
         "instances": instances,
     }
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""결측 지표 예측 — 있는 벤치마크로 없는 벤치마크 값을 회귀(ridge)로 추정.
+
+    python scripts/dashboard/predict.py                 # site/data/_predicted.json 갱신(build_data.py가 자동 실행)
+    python scripts/dashboard/predict.py rank c9g.xlarge  # results/sysbench-{cpu,memory}/<inst>만으로 전 지표 추정 + 순위
+
+geekbench/passmark/stress-ng는 51/54, ES rally는 c8gn/r8gd/m8i-flex가 없다. MODELS의 각 목표 지표를
+sysbench 지표(어느 인스턴스나 10분이면 측정) + 아키텍처(intel 기준 amd/graviton 더미) + 세대로 예측한다.
+- log(목표) ~ log(특성) 선형 — 성능 지표는 배율 관계라 로그 공간이 잔차가 고르다. 특성은 학습
+  집합 평균/표준편차로 표준화, 절편은 벌점 없음. λ는 LAMBDAS 중 LOO 오차 최소.
+- LOO(leave-one-out)는 hat 행렬 대각으로 닫힌 꼴 계산: e_i / (1 - h_ii). loo_mape = 원 공간 |예측-실측|/실측.
+  λ=0이면 하나씩 빼고 다시 적합한 값과 같고, λ>0은 표준화(평균/표준편차)를 전체 집합으로 고정한 근사.
+- 예측 구간(PI_LEVEL) = 로그 공간 ± z · s · sqrt(1 + h0), s = LOO 잔차 RMS. 원 공간으로 돌리면 비대칭.
+- 예측값은 봉투에 섞지 않는다(집계/가성비 오염 방지) — _predicted.json에 predicted=true로 따로 둔다.
+표준 라이브러리만: 특성이 몇 개뿐이라 정규방정식을 가우스 소거로 푼다.
+"""
+import json
+import math
+import sys
+from statistics import NormalDist
+
+from aggregates import dget
+from common import BASE_DIR, SITE_DATA_DIR, build_instances, gen_family, is_number
+from scaling import load_envelopes
+
+# 목표 "bench:field" -> 수치 특성(sysbench 봉투 필드, log 변환). 아키텍처 더미 + 세대는 공통.
+MODELS = {
+    "geekbench:single": ["cpu_st"],
+    "geekbench:multi": ["cpu_mt", "mem_seq_read"],
+    "passmark:single": ["cpu_st"],
+    "passmark:cpu_mark": ["cpu_mt", "mem_seq_read"],
+    "stress-ng:total": ["cpu_mt", "mem_rnd_read"],
+    "elasticsearch:rally.throughput": ["cpu_mt", "mem_rnd_read"],
+}
+ARCH_DUMMIES = ["amd", "graviton"]  # intel 기준
+LAMBDAS = [0.0, 0.1, 0.3, 1.0, 3.0]
+PI_LEVEL = 0.9
+MIN_TRAIN = 12
+
+
+def _solve(a, b):
+    """가우스 소거(부분 피벗). a: n×n, b: n×m -> x (n×m)."""
+    n = len(a)
+    m = [row[:] + brow[:] for row, brow in zip(a, b)]
+    for col in range(n):
+        piv = max(range(col, n), key=lambda r: abs(m[r][col]))
+        if abs(m[piv][col]) < 1e-12:
+            raise ValueError("특이 행렬 — 특성이 선형 종속")
+        m[col], m[piv] = m[piv], m[col]
+        for r in range(n):
+            if r != col and m[r][col]:
+                f = m[r][col] / m[col][col]
+                m[r] = [x - f * y for x, y in zip(m[r], m[col])]
+    return [[x / m[i][i] for x in m[i][n:]] for i in range(n)]
+
+
+def _dot(u, v):
+    return math.fsum(x * y for x, y in zip(u, v))
+
+
+def design_row(sysbench_entry, cls, features):
+    """-> 원시 특성 벡터(log 수치 + 아키텍처 더미 + 세대) 또는 값이 빠지면 None."""
+    row = []
+    for f in features:
+        v = sysbench_entry.get(f) if sysbench_entry else None
+        if not is_number(v) or v <= 0:
+            return None
+        row.append(math.log(v))
+    if cls["gen"] is None:
+        return None
+    return row + [1.0 if cls["arch"] == a else 0.0 for a in ARCH_DUMMIES] + [float(cls["gen"])]
+
+
+class Ridge:
+    """표준화 + 벌점 없는 절편 ridge. fit 후 loo 잔차, predict(x) -> (평균, h0)."""
+
+    def __init__(self, rows, ys, lam):
+        n, p = len(rows), len(rows[0])
+        self.mu = [math.fsum(r[j] for r in rows) / n for j in range(p)]
+        # 분산 0인 열(예: 학습 집합에 amd가 없음)은 1로 나눠 0열로 두고 벌점이 계수를 0으로 잡는다
+        self.sd = [math.sqrt(math.fsum((r[j] - self.mu[j]) ** 2 for r in rows) / n) or 1.0 for j in range(p)]
+        self.ybar = math.fsum(ys) / n
+        self.n = n
+        z = [self._z(r) for r in rows]
+        yc = [y - self.ybar for y in ys]
+        xtx = [[_dot([r[i] for r in z], [r[j] for r in z]) + (lam + 1e-9 if i == j else 0.0) for j in range(p)]
+               for i in range(p)]
+        xty = [[_dot([r[i] for r in z], yc)] for i in range(p)]
+        self.coef = [c[0] for c in _solve(xtx, xty)]
+        self.ainv = _solve(xtx, [[1.0 if i == j else 0.0 for j in range(p)] for i in range(p)])
+        self.loo = []
+        for zi, y in zip(z, ys):
+            h = self._h(zi)
+            self.loo.append((y - self.ybar - _dot(self.coef, zi)) / (1 - h))
+
+    def _z(self, row):
+        return [(x - m) / s for x, m, s in zip(row, self.mu, self.sd)]
+
+    def _h(self, z):
+        return _dot(z, [_dot(a, z) for a in self.ainv]) + 1 / self.n
+
+    def predict(self, row):
+        z = self._z(row)
+        return self.ybar + _dot(self.coef, z), self._h(z)
+
+
+def fit(target_rows):
+    """[(이름, 원시 특성, log y)] -> (최적 Ridge, λ, loo rmse)."""
+    rows = [r for _, r, _ in target_rows]
+    ys = [y for _, _, y in target_rows]
+    best = None
+    for lam in LAMBDAS:
+        try:
+            model = Ridge(rows, ys, lam)
+        except ValueError:
+            continue
+        rmse = math.sqrt(math.fsum(e * e for e in model.loo) / len(model.loo))
+        if best is None or rmse < best[2]:
+            best = (model, lam, rmse)
+    return best
+
+
+def _round(x):
+    return float(f"{x:.5g}")
+
+
+def build_models(envelopes, meta):
+    """-> {목표: {features, lambda, n_train, loo_rmse_log, loo_mape, predictions}}."""
+    sysbench = envelopes["sysbench"]["instances"]
+    z = NormalDist().inv_cdf(0.5 + PI_LEVEL / 2)
+    models = {}
+    for target, features in MODELS.items():
+        bench, field = target.split(":")
+        if bench not in envelopes:
+            continue
+        observed = envelopes[bench]["instances"]
+        train, gaps = [], []
+        for name, cls in meta.items():
+            row = design_row(sysbench.get(name), cls, features)
+            if row is None:
+                continue
+            y = dget(observed.get(name) or {}, field)
+            if is_number(y) and y > 0:
+                train.append((name, row, math.log(y)))
+            else:
+                gaps.append((name, row))
+        if len(train) < MIN_TRAIN:
+            continue
+        model, lam, rmse = fit(train)
+        mape = math.fsum(abs(math.exp(-e) - 1) for e in model.loo) / len(model.loo)
+        predictions = {}
+        for name, row in gaps:
+            mu, h0 = model.predict(row)
+            half = z * rmse * math.sqrt(1 + h0)
+            predictions[name] = {"value": _round(math.exp(mu)), "lo": _round(math.exp(mu - half)),
+                                 "hi": _round(math.exp(mu + half)), "predicted": True}
+        models[target] = {
+            "features": [*features, *(f"arch={a}" for a in ARCH_DUMMIES), "gen"],
+            "lambda": lam, "n_train": len(train),
+            "loo_rmse_log": round(rmse, 4), "loo_mape": round(mape, 4),
+            "model": model, "predictions": predictions,
+        }
+    return models
+
+
+def build(envelopes=None, meta=None):
+    envelopes = envelopes or load_envelopes(["sysbench", *{t.split(":")[0] for t in MODELS}])
+    meta = meta or {n: gen_family(n) for n in build_instances()}
+    models = build_models(envelopes, meta)
+    return {
+        "notes": {
+            "method": "log(목표) ~ log(sysbench 특성) + 아키텍처 더미 + 세대, 표준화 ridge(λ는 LOO 최소). "
+                      f"구간은 {PI_LEVEL:.0%} 예측 구간(LOO 잔차 RMS 기반). predicted=true 값은 실측이 아님 — "
+                      "봉투/집계에는 섞지 않는다.",
+            "pi_level": PI_LEVEL,
+        },
+        "models": {t: {k: v for k, v in m.items() if k != "model"} for t, m in models.items()},
+        "gaps": sorted({name for m in models.values() for name in m["predictions"]}),
+    }
+
+
+def rank(instance):
+    """새 인스턴스: sysbench 로그만으로 MODELS 전 지표 추정 + 실측 인스턴스 사이 순위."""
+    from parsers import sysbench
+
+    entry = sysbench.build_instance(instance)
+    if entry is None:
+        raise SystemExit(f"results/sysbench-cpu|memory/{instance}에 usable 로그가 없음")
+    envelopes = load_envelopes(["sysbench", *{t.split(":")[0] for t in MODELS}])
+    meta = {n: gen_family(n) for n in build_instances()}
+    meta.pop(instance, None)  # 이미 측정된 인스턴스를 넣어도 자기 자신은 학습에서 뺌
+    models = build_models(envelopes, meta)
+    cls = gen_family(instance)
+    z = NormalDist().inv_cdf(0.5 + PI_LEVEL / 2)
+    print(f"{instance}: sysbench cpu_st={entry['cpu_st']} cpu_mt={entry['cpu_mt']} ({cls['arch']} {cls['gen']}세대)")
+    for target, m in models.items():
+        row = design_row(entry, cls, MODELS[target])
+        if row is None:
+            print(f"  {target:<34} 특성 결측")
+            continue
+        bench, field = target.split(":")
+        mu, h0 = m["model"].predict(row)
+        half = z * m["loo_rmse_log"] * math.sqrt(1 + h0)
+        value = math.exp(mu)
+        measured = [v for n, e in envelopes[bench]["instances"].items() if n != instance and is_number(v := dget(e, field))]
+        pos = sum(1 for v in measured if v > value) + 1
+        print(f"  {target:<34} {value:>12.5g}  [{math.exp(mu - half):.5g} – {math.exp(mu + half):.5g}]"
+              f"  순위 {pos}/{len(measured) + 1}  (LOO MAPE {m['loo_mape']:.1%})")
+
+
+def main():
+    payload = build()
+    SITE_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    path = SITE_DATA_DIR / "_predicted.json"
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+    summary = ", ".join(f"{t} {m['loo_mape']:.1%}" for t, m in payload["models"].items())
+    print(f"_predicted.json: 예측 {sum(len(m['predictions']) for m in payload['models'].values())}건 "
+          f"(LOO MAPE {summary}) -> {path.relative_to(BASE_DIR)}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["rank"] and len(sys.argv) == 3:
+        rank(sys.argv[2])
+    elif len(sys.argv) == 1:
+        main()
+    else:
+        raise SystemExit("사용법: predict.py [rank <instance>]")
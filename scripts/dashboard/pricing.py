@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""가격 엔진 — 리전 × 구매 옵션(On-Demand / Savings Plans 1y·3y / Spot) 혼합의 실효 시간당 가격과 그 가격으로 본 가성비·파레토.
+
+    python scripts/dashboard/pricing.py                              # site/data/_pricing.json 갱신(build_data.py가 자동 실행)
+    python scripts/dashboard/pricing.py rank redis [--mix spot=0.7,on_demand=0.3] [--region R] [--max-interruption 10-15%]
+    python scripts/dashboard/pricing.py import-spot history.json     # aws ec2 describe-spot-price-history 출력 -> CSV
+    python scripts/dashboard/build_data.py --price-mix=spot=0.7,on_demand=0.3 [--region=R]   # 사이트 전체를 실효 가격으로
+
+가격표는 config/pricing/ 아래 로컬 CSV('#' 주석 허용):
+- on-demand.csv         region,instance,usd_hour
+- savings-plans.csv     region,instance,term(1y|3y),usd_hour   — No Upfront 실효 시간당
+- spot/*.csv            region,az,instance,timestamp,usd_hour  — describe-spot-price-history 이력(import-spot)
+- spot-interruption.csv region,instance,bucket                 — Spot Advisor 월 중단 빈도 버킷
+표에 없는 큰 크기(2xlarge)는 같은 패밀리 xlarge × vCPU 배수로 유도한다(common.with_larger_sizes와 같은 규칙).
+
+실효 가격 = Σ 비중 × 옵션 가격. spot 가격은 AZ마다 SPOT_WINDOW_DAYS 동안의 시간 가중 평균(가격은 다음
+기록까지 유지)을 AZ 평균한 값. 중단 버킷이 --max-interruption보다 높은 인스턴스와 가격표에 없는
+(리전, 인스턴스, 옵션)은 그 비중을 On-Demand로 메운다 — 플릿이 실제로 하는 대체와 같고, 무엇을
+대체했는지는 fallback에 남긴다. --spot-rework r을 주면 spot 가격에 (1 + 버킷 중앙값 × r)을 곱해
+중단으로 다시 하는 작업을 반영한다(기본 0).
+
+_pricing.json: 시나리오(on_demand, fleet = DEFAULT_FLEET_MIX 또는 --mix)별 가격 벡터를 한 번 만들고
+벤치마크 헤드라인 값 벡터와 원소별로 곱/나눠 가성비(score, 클수록 좋음 — direction=min 지표는
+1/(값 × 가격))·순위·파레토 전선(가격↓ × 성능↑에서 지배되지 않는 인스턴스)을 한 패스로 계산한다.
+"""
+import argparse
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from aggregates import dget
+from common import (BASE_DIR, BASE_SIZE, DEFAULT_REGION, PRICING_DIR, SITE_DATA_DIR, SIZE_VCPU, build_instances,
+                    canonical_instances, instance_family, instance_size, is_number, read_price_csv)
+from scaling import load_envelopes
+
+OPTIONS = ["on_demand", "sp1y", "sp3y", "spot"]
+INTERRUPTION_BUCKETS = {"<5%": 0.025, "5-10%": 0.075, "10-15%": 0.125, "15-20%": 0.175, ">20%": 0.25}  # 중앙값
+DEFAULT_FLEET_MIX = {"on_demand": 0.3, "spot": 0.7}
+DEFAULT_MAX_INTERRUPTION = "15-20%"
+SPOT_WINDOW_DAYS = 90
+
+
+# ------------------------------------------------------------------ tables
+
+def _time_weighted(points, start, end):
+    """[(시각, 가격)] 정렬 — [start, end] 구간의 시간 가중 평균(구간 시작 전 마지막 기록부터 유효)."""
+    current = None
+    total = weight = 0.0
+    for i, (t, p) in enumerate(points):
+        t_next = points[i + 1][0] if i + 1 < len(points) else end
+        lo, hi = max(t, start), min(t_next, end)
+        if hi > lo:
+            total += p * (hi - lo).total_seconds()
+            weight += (hi - lo).total_seconds()
+        if t <= end:
+            current = p
+    return total / weight if weight else current
+
+
+def spot_summary(rows, window_days=SPOT_WINDOW_DAYS):
+    """spot 이력 행 -> {(region, instance): {usd_hour, min, max, azs, from, to}}. 기준 시각은 이력의 마지막 기록."""
+    series = {}
+    for r in rows:
+        t = datetime.fromisoformat(r["timestamp"].replace("Z", "+00:00"))
+        series.setdefault((r["region"], r["instance"]), {}).setdefault(r["az"], []).append((t, float(r["usd_hour"])))
+    if not series:
+        return {}
+    end = max(t for azs in series.values() for pts in azs.values() for t, _ in pts)
+    start = end - timedelta(days=window_days)
+    out = {}
+    for key, azs in series.items():
+        per_az = [_time_weighted(sorted(pts), start, end) for pts in azs.values()]
+        per_az = [p for p in per_az if p is not None]
+        if per_az:
+            out[key] = {"usd_hour": round(sum(per_az) / len(per_az), 5), "min": min(per_az), "max": max(per_az),
+                        "azs": len(per_az), "from": start.date().isoformat(), "to": end.date().isoformat()}
+    return out
+
+
+def load_tables(pricing_dir=PRICING_DIR, window_days=SPOT_WINDOW_DAYS):
+    spot_rows = [r for path in sorted((pricing_dir / "spot").glob("*.csv")) for r in read_price_csv(path)]
+    return {
+        "on_demand": {(r["region"], r["instance"]): float(r["usd_hour"])
+                      for r in read_price_csv(pricing_dir / "on-demand.csv")},
+        "sp1y": {(r["region"], r["instance"]): float(r["usd_hour"])
+                 for r in read_price_csv(pricing_dir / "savings-plans.csv") if r["term"] == "1y"},
+        "sp3y": {(r["region"], r["instance"]): float(r["usd_hour"])
+                 for r in read_price_csv(pricing_dir / "savings-plans.csv") if r["term"] == "3y"},
+        "spot": {k: v["usd_hour"] for k, v in spot_summary(spot_rows, window_days).items()},
+        "interruption": {(r["region"], r["instance"]): r["bucket"]
+                         for r in read_price_csv(pricing_dir / "spot-interruption.csv")},
+    }
+
+
+def lookup(table, region, name):
+    """(가격, 유도 여부) — 없으면 같은 패밀리 xlarge × vCPU 배수, 그것도 없으면 (None, False)."""
+    if (region, name) in table:
+        return table[(region, name)], False
+    size = instance_size(name)
+    base = table.get((region, f"{instance_family(name)}.{BASE_SIZE}"))
+    if base is None or size not in SIZE_VCPU:
+        return None, False
+    return round(base * SIZE_VCPU[size] / SIZE_VCPU[BASE_SIZE], 5), True
+
+
+# ------------------------------------------------------------------ effective prices
+
+def parse_mix(text):
+    """'spot=0.7,on_demand=0.3' -> {옵션: 비중}. 합이 1이 아니거나 모르는 옵션이면 ValueError."""
+    mix = {}
+    for item in text.split(","):
+        option, _, weight = item.partition("=")
+        if option.strip() not in OPTIONS:
+            raise ValueError(f"알 수 없는 구매 옵션: {option} (가능: {', '.join(OPTIONS)})")
+        mix[option.strip()] = float(weight)
+    if abs(sum(mix.values()) - 1) > 1e-6 or any(w < 0 for w in mix.values()):
+        raise ValueError(f"비중 합이 1이 아님: {text}")
+    return mix
+
+
+def effective_prices(tables, instances, region=DEFAULT_REGION, mix=None, max_interruption=DEFAULT_MAX_INTERRUPTION,
+                     spot_rework=0.0):
+    """-> ({인스턴스: 실효 $/h}, {인스턴스: [대체/유도 메모]}). On-Demand가 없는 인스턴스는 ValueError."""
+    mix = mix or {"on_demand": 1.0}
+    limit = list(INTERRUPTION_BUCKETS).index(max_interruption)
+    prices, notes = {}, {}
+    missing = []
+    for name in instances:
+        od, derived = lookup(tables["on_demand"], region, name)
+        if od is None:
+            missing.append(name)
+            continue
+        total, memo = 0.0, (["on_demand 유도(xlarge × vCPU)"] if derived else [])
+        for option, weight in mix.items():
+            if not weight:
+                continue
+            price = od
+            if option != "on_demand":
+                price, derived = lookup(tables[option], region, name)
+                bucket = tables["interruption"].get((region, name))
+                if price is None:
+                    memo.append(f"{option} 가격 없음 -> on_demand")
+                    price = od
+                elif option == "spot" and bucket and list(INTERRUPTION_BUCKETS).index(bucket) > limit:
+                    memo.append(f"spot 중단 {bucket} > {max_interruption} -> on_demand")
+                    price = od
+                else:
+                    if derived:
+                        memo.append(f"{option} 유도(xlarge × vCPU)")
+                    if option == "spot" and spot_rework:
+                        price *= 1 + INTERRUPTION_BUCKETS.get(bucket, 0) * spot_rework
+            total += weight * price
+        prices[name] = round(total, 5)
+        if memo:
+            notes[name] = memo
+    if missing:
+        raise ValueError(f"{region} On-Demand 가격 없음: {', '.join(missing)} — config/pricing/on-demand.csv")
+    return prices, notes
+
+
+# ------------------------------------------------------------------ per-dollar / pareto
+
+def scores(values, prices, direction):
+    """원소별 가성비(클수록 좋음): max 지표는 값/가격, min 지표(시간)는 1/(값 × 가격). 결측은 None."""
+    return [None if v is None or not p or v <= 0 else (v / p if direction == "max" else 1 / (v * p))
+            for v, p in zip(values, prices)]
+
+
+def ranks(score_list):
+    order = sorted((s, i) for i, s in enumerate(score_list) if s is not None)
+    out = [None] * len(score_list)
+    for pos, (_, i) in enumerate(reversed(order), 1):
+        out[i] = pos
+    return out
+
+
+def pareto(names, values, prices, direction):
+    """가격↓ × 성능(direction)에서 지배되지 않는 인스턴스 — 가격 오름차순."""
+    sign = 1 if direction == "max" else -1
+    rows = sorted((p, -sign * v, n) for n, v, p in zip(names, values, prices) if v is not None and p)
+    front, best = [], None
+    for p, neg, name in rows:
+        if best is None or -neg > best:
+            front.append(name)
+            best = -neg
+    return front
+
+
+def _sig(x):
+    return None if x is None else float(f"{x:.5g}")
+
+
+def build(envelopes, tables, instances, region=DEFAULT_REGION, mix=None, max_interruption=DEFAULT_MAX_INTERRUPTION,
+          spot_rework=0.0):
+    """{bench: 봉투} -> _pricing.json 페이로드(시나리오: on_demand, fleet)."""
+    mix = mix or DEFAULT_FLEET_MIX
+    scenarios = {}
+    for name, m in [("on_demand", {"on_demand": 1.0}), ("fleet", mix)]:
+        prices, notes = effective_prices(tables, instances, region, m, max_interruption, spot_rework)
+        scenarios[name] = {"mix": m, "prices": [prices[n] for n in instances], "fallback": notes}
+    metrics = {}
+    for bench, env in envelopes.items():
+        head = env.get("headline") or {}
+        if not head.get("field"):
+            continue
+        values = [v if is_number(v := dget(env["instances"].get(n) or {}, head["field"])) else None for n in instances]
+        direction = head.get("direction", "max")
+        entry = {"field": head["field"], "direction": direction, "label": head.get("label"),
+                 "score": {}, "rank": {}, "pareto": {}}
+        for name, sc in scenarios.items():
+            s = scores(values, sc["prices"], direction)
+            entry["score"][name] = [_sig(x) for x in s]
+            entry["rank"][name] = ranks(s)
+            entry["pareto"][name] = pareto(instances, values, sc["prices"], direction)
+        metrics[bench] = entry
+    return {
+        "notes": {
+            "method": "실효 가격 = Σ 비중 × 옵션 가격(spot = AZ별 시간 가중 평균의 평균). 가격표에 없거나 중단 빈도가 "
+                      "한도를 넘는 옵션은 on_demand로 대체(fallback). score = 값/가격(min 지표는 1/(값×가격)), "
+                      "pareto = 가격↓×성능에서 지배되지 않는 인스턴스.",
+            "region": region, "max_interruption": max_interruption, "spot_rework": spot_rework,
+            "spot_window_days": SPOT_WINDOW_DAYS,
+        },
+        "instances": instances,
+        "scenarios": scenarios,
+        "metrics": metrics,
+    }
+
+
+def main(names, region=DEFAULT_REGION, mix=None):
+    payload = build(load_envelopes(names), load_tables(), sorted(build_instances()), region, mix)
+    SITE_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    path = SITE_DATA_DIR / "_pricing.json"
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+    fleet = payload["scenarios"]["fleet"]
+    mix_text = ", ".join(f"{k} {v:.0%}" for k, v in fleet["mix"].items())
+    print(f"_pricing.json: {region} fleet({mix_text}) — 대체 {len(fleet['fallback'])}개 인스턴스 "
+          f"-> {path.relative_to(BASE_DIR)}")
+
+
+# ------------------------------------------------------------------ CLI
+
+def import_spot(path, out=None):
+    """describe-spot-price-history JSON -> spot CSV 행(리전 = AZ에서 끝 글자 제거)."""
+    history = json.loads(Path(path).read_text())["SpotPriceHistory"]
+    lines = ["region,az,instance,timestamp,usd_hour"]
+    for h in sorted(history, key=lambda h: (h["AvailabilityZone"], h["InstanceType"], h["Timestamp"])):
+        lines.append(f"{h['AvailabilityZone'][:-1]},{h['AvailabilityZone']},{h['InstanceType']},{h['Timestamp']},"
+                     f"{h['SpotPrice']}")
+    text = "\n".join(lines) + "\n"
+    if out:
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(text)
+        print(f"spot 이력 {len(history)}행 -> {out}")
+    else:
+        sys.stdout.write(text)
+
+
+def rank(target, region, mix, max_interruption, spot_rework, top):
+    bench, _, field = target.partition(":")
+    envelopes = load_envelopes([bench])
+    if bench not in envelopes:
+        raise SystemExit(f"site/data/{bench}.json 없음")
+    env = envelopes[bench]
+    if field:
+        env = {**env, "headline": {**(env.get("headline") or {}), "field": field,
+                                   "direction": (env.get("headline") or {}).get("direction", "max")}}
+    payload = build({bench: env}, load_tables(), canonical_instances(), region, mix, max_interruption, spot_rework)
+    m = payload["metrics"][bench]
+    names = payload["instances"]
+    od_rank, fl_rank = m["rank"]["on_demand"], m["rank"]["fleet"]
+    fleet = payload["scenarios"]["fleet"]
+    print(f"{bench}:{m['field']} ({m['direction']}) — {region}, fleet = "
+          + ", ".join(f"{k} {v:.0%}" for k, v in fleet["mix"].items()))
+    order = sorted((r, i) for i, r in enumerate(fl_rank) if r is not None)[:top]
+    for r, i in order:
+        shift = od_rank[i] - r
+        flag = " *" if names[i] in m["pareto"]["fleet"] else ""
+        print(f"  {r:>3}. {names[i]:<18} ${fleet['prices'][i]:<8.4f} score {m['score']['fleet'][i]:<10.5g}"
+              f" (on-demand {od_rank[i]}위, {shift:+d}){flag}")
+    print("  * 파레토 전선")
+    reasons = {}
+    for memo in fleet["fallback"].values():
+        for line in memo:
+            reasons[line] = reasons.get(line, 0) + 1
+    for line, n in sorted(reasons.items()):
+        print(f"  대체: {line} — {n}개 인스턴스")
+
+
+def parse_args(argv):
+    p = argparse.ArgumentParser(description="가격 엔진 — 구매 옵션 혼합 실효 가격과 가성비/파레토")
+    sub = p.add_subparsers(dest="cmd")
+    r = sub.add_parser("rank", help="실효 가격 기준 가성비 순위(on-demand 순위 대비)")
+    r.add_argument("target", help="벤치마크[:필드] (기본 필드 = 봉투 headline)")
+    r.add_argument("--region", default=DEFAULT_REGION)
+    r.add_argument("--mix", type=parse_mix, default=DEFAULT_FLEET_MIX, help="예: spot=0.7,on_demand=0.3")
+    r.add_argument("--max-interruption", choices=list(INTERRUPTION_BUCKETS), default=DEFAULT_MAX_INTERRUPTION)
+    r.add_argument("--spot-rework", type=float, default=0.0)
+    r.add_argument("--top", type=int, default=15)
+    s = sub.add_parser("import-spot", help="describe-spot-price-history JSON -> config/pricing/spot/ CSV")
+    s.add_argument("json")
+    s.add_argument("--out", type=Path)
+    return p.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    if args.cmd == "rank":
+        rank(args.target, args.region, args.mix, args.max_interruption, args.spot_rework, args.top)
+    elif args.cmd == "import-spot":
+        import_spot(args.json, args.out)
+    else:
+        from build_data import BENCHMARKS
+
+        main(BENCHMARKS)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""site/ -> 배포용 정적 트리(기본 dist/) 생성: JSON 압축 + 콘텐츠 해시 파일명 + .gz/.br 사전 압축.
+
+    python build_data.py && python publish.py [--out DIR]
+
+- data/*.json: 공백 없는 JSON으로 다시 쓰고(벤치마크 봉투와 instances.json은 columnar-v1 —
+  columnar.py) data/<name>.<hash>.json으로 저장.
+- tabs/*.html: tabs/<id>.<hash>.html로 저장.
+- 해시 = 최종 바이트의 sha256 앞 HASH_LEN자리. 내용이 같으면 파일명도 같아 CDN에서
+  `Cache-Control: public, max-age=31536000, immutable`을 걸 수 있다. 해시가 없는 파일(index.html,
+  js/, css/, asset-manifest.json 등)은 `no-cache`(재검증)로 서빙할 것.
+- 논리 경로 -> 해시 경로 매니페스트를 asset-manifest.json으로 쓰고 index.html에도 인라인
+  (window.ASSET_MANIFEST) — shared.js assetUrl()이 이를 통해 fetch 경로를 푼다. 매니페스트가
+  없으면(site/ 직접 서빙) 논리 경로 그대로라 개발 흐름은 그대로다.
+- 텍스트 자산마다 .gz(항상)와 .br(brotli 모듈이 있을 때만 — 표준 라이브러리에 없음) 형제
+  파일을 쓴다. CDN/웹서버의 precompressed 서빙(예: nginx gzip_static/brotli_static)용.
+- 출력 디렉터리는 매번 통째로 지우고 다시 만든다. 그래서 publish가 쓴 표식 파일(MARKER_NAME)이 있는
+  디렉터리만 지운다 — `--out ~/work`처럼 비어 있지 않은 남의 디렉터리는 거부(비어 있으면 그대로 사용).
+"""
+import gzip
+import hashlib
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import columnar
+from common import BASE_DIR
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성 — 없으면 .gz만
+    brotli = None
+
+SITE_DIR = BASE_DIR / "site"
+DEFAULT_OUT = BASE_DIR / "dist"
+HASH_LEN = 10
+HASHED_DIRS = ("data", "tabs")
+COMPRESSIBLE = {".html", ".js", ".css", ".json", ".xml", ".txt", ".svg"}
+MANIFEST_NAME = "asset-manifest.json"
+MARKER_NAME = ".ec2bench-publish"
+APP_SCRIPT_TAG = '<script type="module" src="js/app.js"></script>'
+
+
+def minify_data(path):
+    """data/*.json -> 배포용 바이트. loadData()가 읽는 파일은 columnar-v1로 인코딩."""
+    payload = json.loads(path.read_text())
+    if path.name == "instances.json":
+        payload = columnar.encode_table(payload)
+    elif isinstance(payload.get("instances"), dict) and "benchmark" in payload:
+        payload = columnar.encode_envelope(payload)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:HASH_LEN]
+
+
+def write_asset(out_dir, rel, data, stats):
+    """rel 경로에 data를 쓰고 압축 가능한 확장자면 .gz/.br 형제 파일도."""
+    dest = out_dir / rel
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.write_bytes(data)
+    stats["raw"] += len(data)
+    if dest.suffix not in COMPRESSIBLE:
+        return
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    dest.with_name(dest.name + ".gz").write_bytes(gz)
+    stats["gz"] += len(gz)
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        dest.with_name(dest.name + ".br").write_bytes(br)
+        stats["br"] += len(br)
+
+
+def publish(out_dir=DEFAULT_OUT):
+    if out_dir in (SITE_DIR, BASE_DIR) or SITE_DIR.is_relative_to(out_dir) or out_dir.is_relative_to(SITE_DIR):
+        raise SystemExit(f"--out {out_dir}: site/ 원본과 겹치는 경로에는 쓰지 않음(출력 디렉터리는 통째로 지움)")
+    if out_dir.exists() and not out_dir.is_dir():
+        raise SystemExit(f"--out {out_dir}: 디렉터리가 아님")
+    if out_dir.exists() and any(out_dir.iterdir()) and not (out_dir / MARKER_NAME).is_file():
+        raise SystemExit(f"--out {out_dir}: 비어 있지 않고 publish 출력 표식({MARKER_NAME})이 없음 — 지우지 않음. "
+                         "빈 디렉터리나 새 경로를 지정할 것")
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    out_dir.mkdir(parents=True)
+    (out_dir / MARKER_NAME).write_text("publish.py 출력 — 다음 publish 때 통째로 지워짐\n")
+    manifest = {}
+    stats = {"raw": 0, "gz": 0, "br": 0}
+    for path in sorted(p for p in SITE_DIR.rglob("*") if p.is_file()):
+        rel = path.relative_to(SITE_DIR)
+        if rel.parts[0] in HASHED_DIRS:
+            data = minify_data(path) if rel.parts[0] == "data" and path.suffix == ".json" else path.read_bytes()
+            hashed = rel.with_name(f"{path.stem}.{content_hash(data)}{path.suffix}")
+            manifest[rel.as_posix()] = hashed.as_posix()
+            write_asset(out_dir, hashed, data, stats)
+        elif rel.as_posix() != "index.html":
+            write_asset(out_dir, rel, path.read_bytes(), stats)
+
+    manifest_json = json.dumps(manifest, separators=(",", ":"), sort_keys=True)
+    write_asset(out_dir, MANIFEST_NAME, manifest_json.encode(), stats)
+    index = (SITE_DIR / "index.html").read_text()
+    if APP_SCRIPT_TAG not in index:
+        raise SystemExit(f"index.html에 {APP_SCRIPT_TAG!r}가 없음 — 매니페스트를 심을 위치를 찾지 못함")
+    index = index.replace(APP_SCRIPT_TAG, f"<script>window.ASSET_MANIFEST={manifest_json};</script>\n    {APP_SCRIPT_TAG}")
+    write_asset(out_dir, "index.html", index.encode(), stats)
+    return manifest, stats
+
+
+def main():
+    args = sys.argv[1:]
+    out_dir = DEFAULT_OUT
+    if "--out" in args:
+        out_dir = Path(args[args.index("--out") + 1]).resolve()
+    manifest, stats = publish(out_dir)
+    br = f", br {stats['br'] / 1024:.0f}KB" if brotli is not None else " (.br 생략 — brotli 모듈 없음)"
+    print(f"{len(manifest)}개 해시 자산 -> {out_dir}: raw {stats['raw'] / 1024:.0f}KB, gz {stats['gz'] / 1024:.0f}KB{br}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""제약 기반 인스턴스 질의 — "redis p99 < 1ms이고 nginx ≥ 80k인 가장 싼 타입".
+
+    python scripts/dashboard/query.py "redis.set_p99_ms<1" "nginx.req_sec>=80000" "arch!=intel" [--objective min:price] [--top 10]
+    python scripts/dashboard/query.py ... --objective max:nginx.req_sec,redis.set_rps   # 복합 점수
+    python scripts/dashboard/query.py columns [부분문자열]                               # 컬럼 목록
+
+통합 테이블 = instances.json 속성(arch/gen/family/size/vcpu/mem_mb/price/flex) + 봉투마다
+`<bench>.<dot-path>`(aggregates.metric_paths와 같은 숫자 leaf) + `<bench>.<unit_cost 키>`(unit_cost.py).
+빌드마다 site/data/_query_index.json으로 미리 만들어 두고(build_data.py 끝에 자동), CLI와 사이트 '인스턴스
+찾기' 탭(site/js/tabs/query.js — 같은 문법)이 그 파일 하나만 읽는다. --sizes로 2xlarge가 섞이면 같은
+테이블에 들어가므로 size=2xlarge 같은 제약으로 고른다.
+
+인덱스(컬럼 지향, 인스턴스 순서 배열):
+- 숫자 컬럼: values + order(값 오름차순 인스턴스 번호, null 제외). 범위 제약은 order 위 이분 탐색 —
+  인스턴스 수에 대해 O(log n) + 결과 크기.
+- 범주 컬럼(arch/family/size/flex): values + groups(값 -> 인스턴스 번호). =, !=만(쉼표 = 여러 값 중 하나).
+- direction: 복합 점수에서 클수록 좋은지(max)/작을수록 좋은지(min). 헤드라인은 봉투 값, unit_cost는 min,
+  나머지는 이름 규칙(MIN_PATTERN — 지연/시간/변동/실패/비용). 항 앞 +/-로 강제.
+
+제약: <컬럼><연산자><값>, 연산자 <, <=, >, >=, =, !=. 값이 없는(null) 인스턴스는 어떤 제약도 통과하지 못한다.
+목표(--objective): min:<컬럼> | max:<컬럼> | max:<항>,<항>,... — 복합 점수는 항마다 전체 인스턴스 최고값을
+1로 정규화(max 항은 v/최대, min 항은 최소/v)한 기하평균이고, 항 중 하나라도 null이면 순위에서 빠진다.
+비율이라 0 이하 값이 있는 컬럼(kafka/clickhouse.failed_count처럼 0이 최고값인 지표)은 복합 항이 될 수
+없다 — ValueError. 그런 지표는 단일 목표나 제약(kafka.failed_count=0)으로 쓴다. 기본 min:price.
+"""
+import bisect
+import json
+import math
+import re
+import sys
+
+from aggregates import dget, metric_paths
+from common import BASE_DIR, SITE_DATA_DIR, build_instances, is_number
+from scaling import load_envelopes
+
+INDEX_NAME = "_query_index.json"
+CATEGORICAL = ["arch", "family", "size", "flex"]
+NUMERIC_ATTRS = ["price", "gen", "vcpu", "mem_mb"]
+MIN_PATTERN = re.compile(r"(_ms|_s|_stddev|_cv|_cost|_usd|_pct)$|(^|[._])(lat|jitter|failed|usd_)")
+CONSTRAINT = re.compile(r"^\s*([\w.\-]+?)\s*(<=|>=|!=|<|>|=)\s*(\S.*?)\s*$")
+DEFAULT_OBJECTIVE = "min:price"
+
+
+def default_direction(path):
+    return "min" if MIN_PATTERN.search(path) else "max"
+
+
+def _numeric(values, direction):
+    return {"direction": direction, "values": values,
+            "order": sorted((i for i, v in enumerate(values) if v is not None), key=lambda i: values[i])}
+
+
+def _categorical(values):
+    groups = {}
+    for i, v in enumerate(values):
+        groups.setdefault(str(v).lower(), []).append(i)
+    return {"values": values, "groups": groups}
+
+
+def build(envelopes, meta=None):
+    """{bench: 봉투} + instances.json -> 인덱스 페이로드."""
+    meta = meta or build_instances()
+    names = list(meta)
+    exclude = set(next(iter(meta.values()), {}))
+    columns = {attr: _categorical([meta[n][attr] for n in names]) for attr in CATEGORICAL}
+    columns.update({attr: _numeric([meta[n][attr] for n in names], "min" if attr == "price" else "max")
+                    for attr in NUMERIC_ATTRS})
+    for bench, env in envelopes.items():
+        instances = env["instances"]
+        head = env.get("headline") or {}
+        for path in metric_paths(instances, exclude):
+            values = [v if is_number(v := dget(instances.get(n), path)) else None for n in names]
+            direction = head.get("direction", "max") if path == head.get("field") else default_direction(path)
+            columns[f"{bench}.{path}"] = _numeric(values, direction)
+        env_names = list(instances)
+        for key, m in ((env.get("unit_cost") or {}).get("metrics") or {}).items():
+            by_name = dict(zip(env_names, m["values"]))
+            columns[f"{bench}.{key}"] = _numeric([by_name.get(n) for n in names], "min")
+    return {"instances": names, "columns": columns}
+
+
+def parse_constraint(text):
+    """'redis.set_p99_ms<1' -> (컬럼, 연산자, 값 문자열). 형식이 틀리면 ValueError."""
+    m = CONSTRAINT.match(text)
+    if not m:
+        raise ValueError(f"제약 형식: <컬럼><연산자><값> (연산자 <, <=, >, >=, =, !=): {text!r}")
+    return m.groups()
+
+
+def match(index, col, op, raw):
+    """제약 1개를 만족하는 인스턴스 번호 집합."""
+    column = index["columns"].get(col)
+    if column is None:
+        raise ValueError(f"알 수 없는 컬럼: {col} (query.py columns로 목록 확인)")
+    if "groups" in column:
+        if op not in ("=", "!="):
+            raise ValueError(f"{col}은 범주 컬럼 — =, !=만 가능")
+        hit = {i for v in raw.lower().split(",") for i in column["groups"].get(v.strip(), [])}
+        return hit if op == "=" else set(range(len(index["instances"]))) - hit
+    try:
+        x = float(raw)
+    except ValueError:
+        raise ValueError(f"{col}은 숫자 컬럼 — 값이 숫자가 아님: {raw!r}") from None
+    order, values = column["order"], column["values"]
+    keys = column.setdefault("_sorted", [values[i] for i in order])
+    lo, hi = bisect.bisect_left(keys, x), bisect.bisect_right(keys, x)
+    span = {"<": order[:lo], "<=": order[:hi], ">": order[hi:], ">=": order[lo:], "=": order[lo:hi]}
+    return set(span[op]) if op in span else set(order[:lo] + order[hi:])
+
+
+def parse_objective(text, index):
+    """'min:price' | 'max:a,b,-c' -> (kind, [(컬럼, direction)])."""
+    kind, _, terms = text.partition(":")
+    if kind not in ("min", "max") or not terms:
+        raise ValueError(f"목표 형식: min:<컬럼> | max:<컬럼>[,<컬럼>...]: {text!r}")
+    out = []
+    for term in terms.split(","):
+        term = term.strip()
+        col = term.lstrip("+-")
+        column = index["columns"].get(col)
+        if column is None or "groups" in column:
+            raise ValueError(f"목표 컬럼은 숫자 컬럼이어야 함: {col}")
+        out.append((col, {"+": "max", "-": "min"}.get(term[0], column["direction"])))
+    if kind == "min" and len(out) > 1:
+        raise ValueError("복합 점수는 max:만 가능(클수록 좋음)")
+    for col, _ in out if len(out) > 1 else []:
+        if any(v is not None and v <= 0 for v in index["columns"][col]["values"]):
+            raise ValueError(f"복합 점수 항 {col}에 0 이하 값이 있어 비율로 정규화할 수 없음 — "
+                             f"단일 목표나 제약({col}=0 등)으로 쓰기")
+    return kind, out
+
+
+def score(index, kind, terms, i):
+    """인스턴스 i의 목표값(정렬 키 — 작을수록 앞). 값이 없으면 None."""
+    if len(terms) == 1 and kind == "min":
+        return index["columns"][terms[0][0]]["values"][i]
+    if len(terms) == 1:
+        v = index["columns"][terms[0][0]]["values"][i]
+        return None if v is None else -v
+    logs = []
+    for col, direction in terms:
+        column = index["columns"][col]
+        v = column["values"][i]
+        if v is None:
+            return None
+        best = column["values"][column["order"][-1 if direction == "max" else 0]]
+        logs.append(math.log(v / best if direction == "max" else best / v))
+    return -math.exp(math.fsum(logs) / len(logs))
+
+
+def query(index, constraints, objective=DEFAULT_OBJECTIVE, top=None):
+    """-> {"matched": n, "rows": [{"instance", "objective", 컬럼: 값...}]} — 목표값 순."""
+    parsed = [parse_constraint(c) for c in constraints]
+    kind, terms = parse_objective(objective, index)
+    hit = set(range(len(index["instances"])))
+    for col, op, raw in parsed:
+        hit &= match(index, col, op, raw)
+    ranked = sorted((s, index["instances"][i], i) for i in hit if (s := score(index, kind, terms, i)) is not None)
+    shown = list(dict.fromkeys(["price", *(c for c, _, _ in parsed), *(c for c, _ in terms)]))
+    rows = []
+    for s, name, i in ranked[:top]:
+        row = {"instance": name, "objective": -s if kind == "max" else s}
+        row.update({c: index["columns"][c]["values"][i] for c in shown})
+        rows.append(row)
+    return {"matched": len(hit), "ranked": len(ranked), "rows": rows}
+
+
+def load_index(path=SITE_DATA_DIR / INDEX_NAME):
+    if path.exists():
+        return json.loads(path.read_text())
+    from build_data import BENCHMARKS
+    return build(load_envelopes(BENCHMARKS))
+
+
+def main(names):
+    payload = build(load_envelopes(names))
+    SITE_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    path = SITE_DATA_DIR / INDEX_NAME
+    # 기계용 인덱스 — order 배열이 컬럼마다 수십 줄이 되지 않게 공백 없는 JSON
+    path.write_text(json.dumps(payload, separators=(",", ":"), ensure_ascii=False))
+    print(f"{INDEX_NAME}: 인스턴스 {len(payload['instances'])}개 × 컬럼 {len(payload['columns'])}개 "
+          f"-> {path.relative_to(BASE_DIR)}")
+
+
+def _fmt(v):
+    if v is None:
+        return "—"
+    if isinstance(v, float):
+        return f"{v:.4g}" if abs(v) < 1000 else f"{v:,.0f}"
+    return str(v)
+
+
+def cli(argv):
+    import argparse
+    if argv[:1] == ["columns"]:
+        index = load_index()
+        needle = argv[1] if len(argv) > 1 else ""
+        for col, c in index["columns"].items():
+            if needle in col:
+                kind = "범주" if "groups" in c else c["direction"]
+                print(f"{col:<48} {kind:<4} {len([v for v in c['values'] if v is not None])}/{len(c['values'])}")
+        return 0
+    p = argparse.ArgumentParser(description="제약 + 목표로 인스턴스 고르기(site/data/_query_index.json)")
+    p.add_argument("constraints", nargs="*", help="예: 'redis.set_p99_ms<1' 'nginx.req_sec>=80000' 'arch!=intel'")
+    p.add_argument("--objective", default=DEFAULT_OBJECTIVE, help="min:<컬럼> | max:<컬럼>[,<컬럼>...]")
+    p.add_argument("--top", type=int, default=10)
+    args = p.parse_args(argv)
+    index = load_index()
+    try:
+        result = query(index, args.constraints, args.objective, args.top)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    cols = [c for c in (result["rows"][0] if result["rows"] else {}) if c not in ("instance", "objective")]
+    print(f"조건 만족 {result['matched']}/{len(index['instances'])}개, 목표값 있음 {result['ranked']}개 "
+          f"({args.objective})")
+    if result["rows"]:
+        print(f"{'#':>3} {'instance':<18} {'objective':>10} " + " ".join(f"{c:>14}" for c in cols))
+    for n, row in enumerate(result["rows"], 1):
+        print(f"{n:>3} {row['instance']:<18} {_fmt(row['objective']):>10} "
+              + " ".join(f"{_fmt(row[c]):>14}" for c in cols))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(cli(sys.argv[1:]))
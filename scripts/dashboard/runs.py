@@ -0,0 +1,100 @@
+"""run 단위 값 — 로그 1개 -> 대표 값 1개. 적응형 run 수(campaign/adaptive.py)와 스냅샷 이력(history.py)이 공유.
+
+봉투(site/data/<bench>.json)는 run 평균만 담으므로 run 사이 분산이 필요한 곳은 여기서 로그를 다시 읽는다.
+RUN_METRICS 키는 orchestrate.py 벤치마크 이름(kafka-max는 codec별로 따로). 값은 대시보드 파서의
+로그 단위 함수를 재사용하고, health가 failed로 판정한 run은 뺀다. direction은 봉투 headline과 같은
+뜻(max = 클수록 좋음). geekbench는 원시 로그의 MULTI_CORE_SCORE가 0이라 run 단위 값이 없다.
+"""
+import re
+
+from common import RESULTS_DIR, RUN_DIR_ALIASES, geomean
+from health import run_status
+from parsers.kafka import CODECS
+
+PASSMARK_CPU = re.compile(r"SUMM_CPU:\s*([\d.]+)")
+KAFKA_PRODUCE = re.compile(r"^PRODUCE_MB_PER_SEC:\s*([\d.]+)", re.M)
+KAFKA_MAX_PRODUCE = re.compile(r"^PRODUCE_TOTAL_MB_PER_SEC:\s*([\d.]+)", re.M)
+CLICKHOUSE_ROW = re.compile(r"^q\d+,\d+,(\d+),(\d+)", re.M)
+DATE_HEADER = re.compile(r"^Date:\s*(\d{4}-\d{2}-\d{2})", re.M)
+
+
+def _regex(pattern):
+    def extract(_, path):
+        m = pattern.search(path.read_text(errors="replace"))
+        return float(m.group(1)) if m else None
+    return extract
+
+
+def _clickhouse_hot(_, path):
+    """set<N>.log -> 쿼리별 hot(2·3회차 중 작은 값) 합, ms."""
+    rows = CLICKHOUSE_ROW.findall(path.read_text(errors="replace"))
+    return float(sum(min(int(a), int(b)) for a, b in rows)) if rows else None
+
+
+def _stress_geo(m, path):
+    """stressor별 ops_real의 기하평균 — 한 run을 대표하는 단일 값."""
+    return geomean([row["ops_real"] for row in m.parse_log(path)["stressors"].values()])
+
+
+def _metric(results, log, label, direction, module, extract):
+    return {"results": results, "log": log, "label": label, "direction": direction, "module": module,
+            "extract": extract}
+
+
+RUN_METRICS = {
+    "sysbench-cpu": _metric("sysbench-cpu", "run{run}.log", "events/s (multi)", "max", "sysbench",
+                            lambda m, p: m.parse_cpu_log(p)[0]),
+    "sysbench-memory": _metric("sysbench-memory", "run{run}.log", "seq read MiB/s", "max", "sysbench",
+                               lambda m, p: m.parse_memory_log(p)["mem_seq_read"]),
+    "stress-ng": _metric("stress-ng", "run{run}.log", "bogo ops/s (geomean)", "max", "stress_ng", _stress_geo),
+    "passmark": _metric("passmark", "run{run}.log", "CPU Mark", "max", None, _regex(PASSMARK_CPU)),
+    "iperf3": _metric("iperf3", "run{run}.log", "8-way Gbps", "max", "iperf3",
+                      lambda m, p: m.parse_log(p)["parallel_gbps"]),
+    "redis": _metric("redis", "run{run}.log", "SET rps", "max", "redis", lambda m, p: m.parse_log(p)["set_rps"]),
+    "nginx": _metric("nginx", "run{run}.log", "req/s", "max", "nginx", lambda m, p: m.parse_log(p)[0]),
+    "springboot": _metric("springboot", "wrk{run}.log", "req/s (200)", "max", "springboot",
+                          lambda m, p: m.parse_wrk_log(p)["rps200"]),
+    "springboot-coldstart": _metric("springboot", "coldstart{run}.log", "cold start s", "min", "springboot",
+                                    lambda m, p: m.parse_coldstart_log(p)),
+    "elasticsearch": _metric("elasticsearch", "rally{run}.log", "index-append docs/s", "max", "elasticsearch",
+                             lambda m, p: m.parse_rally_log(p)["throughput"]),
+    "elasticsearch-coldstart": _metric("elasticsearch", "coldstart{run}.log", "cold start ms", "min",
+                                       "elasticsearch", lambda m, p: m.parse_coldstart_log(p)["avg_ms"]),
+    "kafka": _metric("kafka", "run{run}.log", "produce MB/s", "max", None, _regex(KAFKA_PRODUCE)),
+    "clickhouse": _metric("clickhouse", "set{run}.log", "hot 합 ms", "min", None, _clickhouse_hot),
+    **{f"kafka-max-{codec}": _metric("kafka-max", f"{codec}-run{{run}}.log", f"{codec} produce MB/s", "max", None,
+                                     _regex(KAFKA_MAX_PRODUCE)) for codec in CODECS},
+}
+
+
+def run_logs(metric, instance, results_dir=RESULTS_DIR):
+    """-> [(run 번호, 경로)] 번호순 — failed run 제외."""
+    spec = RUN_METRICS[metric]
+    inst_dir = results_dir / spec["results"] / RUN_DIR_ALIASES.get((spec["results"], instance), instance)
+    prefix, _, suffix = spec["log"].partition("{run}")
+    numbered = re.compile(rf"{re.escape(prefix)}(\d+){re.escape(suffix)}")
+    out = []
+    for path in inst_dir.glob(spec["log"].format(run="*")) if inst_dir.is_dir() else []:
+        m = numbered.fullmatch(path.name)
+        if m and run_status(spec["results"], path)["status"] != "failed":
+            out.append((int(m.group(1)), path))
+    return sorted(out)
+
+
+def run_values(metric, instance, results_dir=RESULTS_DIR):
+    """-> [(run 번호, 값)] 번호순. failed run/값을 못 뽑은 run 제외."""
+    spec = RUN_METRICS[metric]
+    module = __import__(f"parsers.{spec['module']}", fromlist=["build"]) if spec["module"] else None
+    out = []
+    for run, path in run_logs(metric, instance, results_dir):
+        value = spec["extract"](module, path)
+        if value is not None:
+            out.append((run, value))
+    return out
+
+
+def run_date(path):
+    """로그의 'Date: 2026-01-21T...' 헤더 -> 'YYYY-MM-DD' 또는 None(헤더를 남기는 건 redis 로그뿐)."""
+    with path.open(errors="replace") as f:
+        m = DATE_HEADER.search(f.read(4096))
+    return m.group(1) if m else None
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""크기 확장(4 -> 8 vCPU) 효율 — 같은 패밀리의 xlarge/2xlarge 쌍을 벤치마크 헤드라인 지표로 비교.
+
+    python scripts/dashboard/build_data.py --sizes=xlarge,2xlarge   # 빌드 끝에 자동 실행
+
+패밀리 × 벤치마크마다:
+- ratio = 2xlarge 처리량 / xlarge 처리량(헤드라인 direction=min이면 시간 지표라 xlarge/2xlarge).
+- efficiency = ratio / vCPU 배수(2) — 1.0이면 선형 확장, 0.8이면 vCPU 2배에 80%만큼만 빨라짐.
+- per_dollar_ratio = (2xlarge 처리량/가격) / (xlarge 처리량/가격) — canonical PRICE 기준.
+- recommendation: per_dollar_ratio ≥ 1이면 scale_up(큰 노드 1대가 작은 노드 2대 이상으로 가성비),
+  아니면 scale_out(xlarge 2대). scale-out은 작업이 노드 간에 선형으로 나뉜다는 가정 — 샤딩/복제
+  비용은 반영하지 않는다.
+패밀리 요약은 벤치마크별 efficiency/per_dollar_ratio의 기하평균. 산출물: site/data/_scaling.json.
+봉투는 site/data/<bench>.json을 다시 읽는다(부분 빌드여도 전체 벤치마크 기준으로 갱신).
+"""
+import json
+import statistics
+
+from aggregates import dget
+from columnar import decode_envelope
+from common import (BASE_DIR, BASE_SIZE, SITE_DATA_DIR, SIZE_VCPU, build_instances, geomean, instance_family,
+                    is_number)
+
+
+def family_pairs(instances, meta, field, direction):
+    """봉투 instances -> {family: {size: 값, ratio, efficiency, per_dollar_ratio, recommendation}}."""
+    out = {}
+    for name, metrics in instances.items():
+        base = meta.get(name)
+        if not base or base["size"] != BASE_SIZE:
+            continue
+        v_base = dget(metrics, field)
+        for size in SIZE_VCPU:
+            big_name = f"{instance_family(name)}.{size}"
+            big = meta.get(big_name)
+            if size == BASE_SIZE or not big or big_name not in instances:
+                continue
+            v_big = dget(instances[big_name], field)
+            if not (is_number(v_base) and is_number(v_big)) or v_base <= 0 or v_big <= 0:
+                continue
+            ratio = v_big / v_base if direction == "max" else v_base / v_big
+            per_dollar = ratio * base["price"] / big["price"]
+            out[instance_family(name)] = {
+                BASE_SIZE: v_base, size: v_big,
+                "ratio": round(ratio, 4),
+                "efficiency": round(ratio / (big["vcpu"] / base["vcpu"]), 4),
+                "per_dollar_ratio": round(per_dollar, 4),
+                "recommendation": "scale_up" if per_dollar >= 1 else "scale_out",
+            }
+    return out
+
+
+def build(envelopes, meta=None):
+    """{bench: 봉투} -> _scaling.json 페이로드."""
+    meta = meta or build_instances()
+    benchmarks, by_family = {}, {}
+    for bench, env in envelopes.items():
+        head = env.get("headline") or {}
+        if not head.get("field"):
+            continue
+        pairs = family_pairs(env["instances"], meta, head["field"], head.get("direction", "max"))
+        effs = [p["efficiency"] for p in pairs.values()]
+        benchmarks[bench] = {
+            "field": head["field"], "direction": head.get("direction", "max"), "label": head.get("label"),
+            "families": dict(sorted(pairs.items())),
+            "median_efficiency": round(statistics.median(effs), 4) if effs else None,
+        }
+        for fam, p in pairs.items():
+            by_family.setdefault(fam, []).append(p)
+    families = {}
+    for fam, rows in sorted(by_family.items()):
+        per_dollar = geomean([p["per_dollar_ratio"] for p in rows])
+        families[fam] = {
+            "benchmarks": len(rows),
+            "efficiency_geo": geomean([p["efficiency"] for p in rows]),
+            "per_dollar_geo": per_dollar,
+            "recommendation": "scale_up" if per_dollar and per_dollar >= 1 else "scale_out",
+        }
+    return {
+        "notes": {
+            "method": "같은 패밀리 xlarge/2xlarge 쌍의 헤드라인 지표 비. efficiency = 처리량 비 ÷ vCPU 배수, "
+                      "per_dollar_ratio = 가격 대비 처리량 비(≥1이면 scale_up). 패밀리 요약은 벤치마크별 기하평균.",
+            "sizes": list(SIZE_VCPU),
+        },
+        "benchmarks": benchmarks,
+        "families": families,
+    }
+
+
+def load_envelopes(names):
+    envelopes = {}
+    for name in names:
+        path = SITE_DATA_DIR / f"{name}.json"
+        if path.exists():
+            envelopes[name] = decode_envelope(json.loads(path.read_text()))
+    return envelopes
+
+
+def main(names):
+    payload = build(load_envelopes(names))
+    SITE_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    path = SITE_DATA_DIR / "_scaling.json"
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+    print(f"_scaling.json: 크기 쌍이 있는 패밀리 {len(payload['families'])}개 -> {path.relative_to(BASE_DIR)}")
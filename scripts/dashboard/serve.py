@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""로컬 개발 서버 — site/ 서빙 + results/·파서 변경 감시 + 증분 재빌드 + SSE 라이브 리로드(표준 라이브러리만).
+
+    python serve.py [--port 8000] [--host 127.0.0.1]
+
+- POLL_INTERVAL마다 WATCH_DIRS의 (mtime_ns, size)를 훑어 바뀐 파일을 찾는다(파일 ~5천 개 기준 수십 ms).
+- results/<dir> 변경 -> RESULTS_TO_BENCH의 벤치마크만 build_data.build_benchmark()로 재빌드.
+  iperf3/redis/stress-ng 파서와 health/hardware는 로그 단위 캐시(cache.py)를 타서 바뀐 run만 다시 파싱하고,
+  sysbench/nginx/elasticsearch/springboot는 그 벤치마크 로그를 전부 다시 읽는다.
+- results/kafka(-max/-ramp)|clickhouse의 로그 변경 -> 파서가 data.json만 읽으므로 common.REPORT_SCRIPTS의
+  generate-*-report.py로 data.json을 먼저 다시 만든다. 그 산출물(data.json, report-charts.html)은
+  REPORT_OUTPUTS로 감시에서 빼서 재빌드가 자기 출력에 다시 걸리지 않게 한다.
+- parsers/<name>.py 변경 -> 그 모듈만 importlib.reload 후 그 벤치마크 + PARSER_DEPENDENTS 재빌드.
+- 벤치마크를 하나라도 재빌드하면 봉투를 교차해 만드는 산출물(_scaling/_predicted/_pricing/_query_index.json)도
+  build_data.build_derived()로 다시 만든다 — 전체 빌드와 같은 단계라 개발 서버에서도 낡지 않는다.
+- site/ 자체(js/css/tabs) 변경 -> 재빌드 없이 리로드만. site/data는 빌드 산출물이라 감시하지 않음.
+- 그 밖의 scripts/dashboard/*.py(common/health/cache 등 공유 모듈) 변경 -> 전체 빌드 후 프로세스
+  재시작(os.execv). 모듈 간 참조가 얽혀 있어 부분 reload는 안전하지 않다.
+- _manifest.json(build_data.write_manifest)은 site/data 쓰기가 모두 끝난 뒤 마지막에 갱신 — 같이 띄운
+  api.py가 새 빌드 전체(_run_health/_hardware.json 포함)를 한 hash로 본다.
+- 재빌드 단계(파서/리포트 스크립트/health/hardware)의 오류는 출력만 하고 감시를 계속한다 — 감시 스레드가
+  죽으면 서버는 떠 있는데 리로드가 조용히 멈춘다. 훑는 도중 사라진 파일(.tmp -> 최종 rename)도 건너뛴다.
+- 재빌드가 끝나면 /__reload(Server-Sent Events)를 구독 중인 탭에 알린다. index.html 응답에만
+  구독 스크립트를 끼워 넣으므로 site/ 원본은 바뀌지 않는다. 재시작으로 연결이 끊겼다 다시 붙으면
+  탭이 스스로 새로고침한다.
+- run 건강도/하드웨어 인덱스(_run_health.json, _hardware.json)는 리로드 알림 뒤에 갱신한다(hardware
+  하위 결과 재집계가 ~0.5s라 편집→차트 지연에서 뺀다). 탭이 조인하는 instances.json의
+  heterogeneous/cpu_models가 그 결과로 바뀌었을 때만 리로드를 한 번 더 알린다.
+"""
+import importlib
+import os
+import subprocess
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import build_data
+import hardware
+import health
+from common import (BASE_DIR, LEGACY_DIR, REPORT_SCRIPTS, RESULTS_DIR, RESULTS_TO_BENCH, SCRIPT_DIR, SITE_DATA_DIR,
+                    report_scripts)
+
+SITE_DIR = BASE_DIR / "site"
+POLL_INTERVAL = 0.3
+KEEPALIVE_S = 15
+WATCH_DIRS = [RESULTS_DIR, LEGACY_DIR, SCRIPT_DIR, SITE_DIR]
+SKIP_DIRS = {".cache", "__pycache__", str(SITE_DIR / "data")}
+# 리포트 스크립트가 쓰는 파일 — 로그 변경으로 서버가 직접 다시 만든다(감시하면 자기 출력에 재빌드 루프)
+REPORT_OUTPUTS = {str(RESULTS_DIR / d / f) for d in ("kafka", "clickhouse") for f in ("data.json", "report-charts.html")}
+
+LEGACY_TO_BENCH = {"geekbench.json": ["geekbench"], "passmark.json": ["passmark"], "stress-ng.json": ["stress-ng"]}
+# parsers/<a>의 산출물(site/data/<a>.json 봉투)을 읽는 파서 — a 파서가 바뀌면 a 다음에 같이 재빌드
+PARSER_DEPENDENTS = {"sysbench": ["clickhouse"], "iperf3": ["kafka"]}
+
+RELOAD_SCRIPT = (
+    "<script>(()=>{let lost=false;const es=new EventSource('/__reload');"
+    "es.onmessage=()=>location.reload();es.onerror=()=>{lost=true};"
+    "es.onopen=()=>{if(lost)location.reload()}})();</script>"
+)
+
+
+class ReloadHub:
+    """재빌드 버전 카운터 — SSE 핸들러 스레드들이 wait()로 대기."""
+
+    def __init__(self):
+        self.version = 0
+        self.cond = threading.Condition()
+
+    def bump(self):
+        with self.cond:
+            self.version += 1
+            self.cond.notify_all()
+
+    def wait(self, seen, timeout):
+        with self.cond:
+            self.cond.wait_for(lambda: self.version != seen, timeout)
+            return self.version
+
+
+HUB = ReloadHub()
+
+
+class DevHandler(SimpleHTTPRequestHandler):
+    def end_headers(self):
+        self.send_header("Cache-Control", "no-store")
+        super().end_headers()
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/__reload":
+            return self.stream_reloads()
+        if path in ("/", "/index.html"):
+            html = (SITE_DIR / "index.html").read_text().replace("</body>", f"{RELOAD_SCRIPT}\n</body>")
+            body = html.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return None
+        return super().do_GET()
+
+    def stream_reloads(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        seen = HUB.version
+        try:
+            self.wfile.write(b": connected\n\n")
+            self.wfile.flush()
+            while True:
+                version = HUB.wait(seen, KEEPALIVE_S)
+                self.wfile.write(f"data: {version}\n\n".encode() if version != seen else b": ping\n\n")
+                self.wfile.flush()
+                seen = version
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, fmt, *args):
+        if "/__reload" not in self.path:
+            super().log_message(fmt, *args)
+
+
+def snapshot():
+    """WATCH_DIRS 아래 파일 -> (mtime_ns, size). SKIP_DIRS/REPORT_OUTPUTS(빌드 부산물)는 제외.
+    훑는 사이 사라진 파일/디렉터리(write_atomic·collect의 .tmp -> 최종 rename)는 건너뛴다 — 다음 폴링에서 잡힌다."""
+    out = {}
+    stack = list(WATCH_DIRS)
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except FileNotFoundError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS and entry.path not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and entry.path not in REPORT_OUTPUTS:
+                        st = entry.stat()
+                        out[entry.path] = (st.st_mtime_ns, st.st_size)
+                except FileNotFoundError:
+                    continue
+    return out
+
+
+def plan(changed):
+    """바뀐 경로들 -> (재빌드할 벤치마크 set, reload할 파서 모듈명 set, 재시작 필요 여부, 정적 파일 변경 여부,
+    리포트 스크립트로 data.json을 다시 만들 results/<dir> set)."""
+    benches, parsers, restart, static, reports = set(), set(), False, False, set()
+    for p in changed:
+        path = os.path.relpath(p, BASE_DIR).split(os.sep)
+        if path[0] == "results" and len(path) > 1:
+            benches.update(RESULTS_TO_BENCH.get(path[1], []))
+            if path[1] in REPORT_SCRIPTS and path[-1].endswith(".log"):
+                reports.add(path[1])
+        elif path[0] == "site":
+            static = True
+        elif path[0] == "legacy":
+            benches.update(LEGACY_TO_BENCH.get(path[-1], []))
+        elif p.endswith(".py") and path[-2] == "parsers" and path[-1] != "__init__.py":
+            module = path[-1][:-3]
+            parsers.add(module)
+            name = module.replace("_", "-")
+            benches.update([name, *PARSER_DEPENDENTS.get(name, [])])
+        elif p.endswith(".py") and os.path.dirname(p) == str(SCRIPT_DIR) and path[-1] != "serve.py":
+            restart = True
+    return benches, parsers, restart, static, reports
+
+
+def rebuild(changed):
+    benches, parsers, restart, static, reports = plan(changed)
+    if restart:
+        print("공유 모듈 변경 — 전체 빌드 후 서버 재시작")
+        subprocess.run([sys.executable, str(SCRIPT_DIR / "build_data.py")], cwd=SCRIPT_DIR, check=False)
+        os.execv(sys.executable, [sys.executable, str(SCRIPT_DIR / "serve.py"), *sys.argv[1:]])
+    if not benches:
+        if static:
+            HUB.bump()
+            print("site/ 변경 — 리로드 알림")
+        return
+    t0 = time.monotonic()
+    for script in report_scripts(reports):
+        done = subprocess.run([sys.executable, str(script)], cwd=script.parent, capture_output=True, text=True)
+        if done.returncode:
+            print(f"{script.name}: data.json 재생성 실패 — 이전 data.json으로 빌드\n{done.stderr.strip()}")
+    order = [b for b in build_data.EXPECTED_COVERAGE if b in benches]  # 의존 대상(sysbench/iperf3)이 먼저
+    for name in order:
+        try:
+            module = name.replace("-", "_")
+            if module in parsers:
+                importlib.reload(importlib.import_module(f"parsers.{module}"))
+            build_data.build_benchmark(name)
+        except Exception as e:  # 편집 중 문법/런타임 오류로 서버가 죽지 않게 — 다음 저장에서 다시 시도
+            print(f"{name}: 빌드 실패 — {type(e).__name__}: {e}")
+    try:
+        build_data.build_derived()
+    except Exception as e:
+        print(f"교차 산출물 빌드 실패 — {type(e).__name__}: {e}")
+    HUB.bump()
+    via = f" (data.json 재생성: {', '.join(s.name for s in report_scripts(reports))})" if reports else ""
+    print(f"재빌드 {', '.join(order)}{via} — {time.monotonic() - t0:.2f}s, 리로드 알림")
+    instances_path = SITE_DATA_DIR / "instances.json"
+    before = instances_path.read_bytes() if instances_path.exists() else None
+    try:
+        health.main()
+        build_data.write_instances_json(hardware_payload=hardware.main())
+    except Exception as e:
+        print(f"run 건강도/하드웨어 인덱스 빌드 실패 — {type(e).__name__}: {e}")
+    # 이질 하드웨어 표시(탭이 조인)가 바뀐 경우만 한 번 더 리로드
+    if instances_path.exists() and instances_path.read_bytes() != before:
+        HUB.bump()
+    build_data.write_manifest()  # 모든 site/data 쓰기 뒤 — hash가 _run_health/_hardware.json까지 덮도록
+
+
+def watch():
+    before = snapshot()
+    while True:
+        time.sleep(POLL_INTERVAL)
+        after = snapshot()
+        changed = {p for p in before.keys() | after.keys() if before.get(p) != after.get(p)}
+        before = after
+        if changed:
+            rebuild(changed)
+
+
+def main():
+    args = sys.argv[1:]
+    port = int(args[args.index("--port") + 1]) if "--port" in args else 8000
+    host = args[args.index("--host") + 1] if "--host" in args else "127.0.0.1"
+    threading.Thread(target=watch, daemon=True).start()
+    server = ThreadingHTTPServer((host, port), partial(DevHandler, directory=str(SITE_DIR)))
+    server.daemon_threads = True
+    print(f"http://{host}:{port}/ 서빙 중 (site/), results/·parsers/ 감시 — Ctrl+C로 종료")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""봉투 `unit_cost` 키 — 측정 처리량 × 시간당 가격 -> 작업 단위당 비용($ / 1M 요청, $ / TB 등).
+
+per_dollar(값 / $/hr)는 단위가 섞여 예산 담당자가 읽기 어렵다. 여기서는 "이 인스턴스로 그 일을 하면
+얼마"를 바로 쓴다: 비용 = (가격 $/hr ÷ 3600) ÷ (초당 처리 단위 × 목표 사용률) × 단위 수.
+- 가격은 instances.json의 price(build_instances — --region/--price-mix를 주면 실효 가격).
+- 목표 사용률(build_data.py --utilization=, 기본 DEFAULT_UTILIZATION): 벤치마크는 포화 처리량이므로
+  운영에서 남겨 두는 여유만큼 비용이 1/사용률 배로 커진다. 봉투에 함께 기록.
+- 바이트 단위: kafka producer-perf의 MB/s는 2^20 바이트, iperf3 Gbps는 10^9 비트. TB = 10^12 바이트.
+- clickhouse는 hot 세트 1회(43쿼리, hot_total_s초)가 작업 단위 — 초당 처리 단위 = 1 / hot_total_s.
+
+values/rank는 봉투 instances와 같은 순서의 배열(aggregates per_dollar와 같은 규칙 — 값/가격이 없으면
+null). rank 1 = 가장 싸다. 유효숫자는 aggregates.SIG_DIGITS.
+"""
+from aggregates import dget, sig
+from common import build_instances, is_number
+
+DEFAULT_UTILIZATION = 0.7
+TB = 1e12
+
+
+def _unit(field, label, per_second, amount):
+    return {"field": field, "label": label, "per_second": per_second, "amount": amount}
+
+
+# 봉투 이름 -> {키: (측정 필드, 표시, 측정값 -> 초당 처리 단위, 비용을 매기는 단위 수)}
+UNITS = {
+    "nginx": {"usd_per_1m_requests": _unit("req_sec", "$ / 1M requests", lambda v: v, 1e6)},
+    "springboot": {"usd_per_1m_requests": _unit("wrk.rps200", "$ / 1M requests (200 conn)", lambda v: v, 1e6)},
+    "redis": {
+        "usd_per_1m_set": _unit("set_rps", "$ / 1M SET ops", lambda v: v, 1e6),
+        "usd_per_1m_get": _unit("get_rps", "$ / 1M GET ops", lambda v: v, 1e6),
+    },
+    "kafka": {"usd_per_tb_produced": _unit("produce_mb_per_sec", "$ / TB produced",
+                                           lambda v: v * 2 ** 20, TB)},
+    "iperf3": {"usd_per_tb_transferred": _unit("parallel_gbps", "$ / TB transferred (8-way)",
+                                               lambda v: v * 1e9 / 8, TB)},
+    "clickhouse": {"usd_per_1k_query_sets": _unit("hot_total_s", "$ / 1000 hot query sets",
+                                                  lambda v: 1 / v, 1e3)},
+    "elasticsearch": {"usd_per_1m_docs": _unit("rally.throughput", "$ / 1M docs indexed", lambda v: v, 1e6)},
+}
+
+
+def cost(value, price, spec, utilization=DEFAULT_UTILIZATION):
+    """측정값 1개 -> 단위당 $ (값/가격이 없거나 0 이하면 None)."""
+    if not is_number(value) or value <= 0 or not price:
+        return None
+    return price / 3600 / (spec["per_second"](value) * utilization) * spec["amount"]
+
+
+def ranks(values):
+    """작을수록 좋은 비용 배열 -> 순위 배열(1 = 최저, null은 null)."""
+    order = sorted((v, i) for i, v in enumerate(values) if v is not None)
+    out = [None] * len(values)
+    for pos, (_, i) in enumerate(order, 1):
+        out[i] = pos
+    return out
+
+
+def build(name, instances, utilization=DEFAULT_UTILIZATION, meta=None):
+    """봉투 이름 + instances -> unit_cost dict(단위 정의가 없는 벤치마크는 None)."""
+    units = UNITS.get(name)
+    if not units:
+        return None
+    meta = meta or build_instances()
+    metrics = {}
+    for key, spec in units.items():
+        values = [sig(cost(dget(m, spec["field"]), (meta.get(inst) or {}).get("price"), spec, utilization))
+                  for inst, m in instances.items()]
+        metrics[key] = {"field": spec["field"], "label": spec["label"], "values": values, "rank": ranks(values)}
+    return {"utilization": utilization, "metrics": metrics}
@@ -4,21 +4,43 @@
 
 파생 효율 필드(사이트 JSON엔 없음)는 여기서 legacy의 자체 가격으로 재계산해 legacy 값과 비교.
 """
+import functools
 import json
 import sys
 
-from common import LEGACY_DIR, SITE_DATA_DIR
+from columnar import decode_envelope
+from common import LEGACY_DIR, RESULTS_DIR, RUN_DIR_ALIASES, SITE_DATA_DIR
+from health import run_status, usable_logs
+from parsers import elasticsearch, iperf3, nginx, redis, springboot, sysbench
 
 TOLERANCE = 0.005  # 0.5%
 
-# 알려진 원본 데이터 결손 — 파서 버그가 아니라 원시 로그 자체가 5회 중 1회 완전 실패
-# ("iperf3: error - unable to send control message: Broken pipe")해 그 run의 값이 로그에
-# 없음(4/5 표본). 이 3개는 headline 필드인 parallel_gbps는 0건 불일치로 완벽히 검증되지만,
-# single_gbps만 유실된 5번째 run을 복원할 수 없어 legacy(5-run 평균)와 값이 갈린다.
-KNOWN_INCOMPLETE_SAMPLES = {
-    ("iperf3", "c7g.xlarge", "single_gbps"),
-    ("iperf3", "c7i.xlarge", "single_gbps"),
-    ("iperf3", "m8i.xlarge", "single_gbps"),
+# 원본 run 결손(예: iperf3 "unable to send control message: Broken pipe"로 5회 중 1회의 TCP Single
+# Stream이 통째로 없음)은 더 이상 손으로 나열하지 않는다 — 필드별 표본 수에서 유도한다(known_incomplete).
+# 집계 대상 로그(health.usable_logs) 중 그 필드를 못 뽑은 run이 있고 그 run이 health상 ok가 아닐 때만,
+# 즉 결손 run 때문에 그 필드의 표본이 실제로 줄었을 때만 면책한다. 다른 필드나 다른 run의 결손은
+# 상관없고, 설계상 일부 run에서만 재는 필드(ES search_*는 coldstart1만)는 ok run이라 면책되지 않는다.
+# RUN_SOURCES = 벤치마크 -> [(results 디렉터리, 로그 glob, 로그 1개 -> {site 필드: 값})] — 파서의 로그 단위
+# 함수를 그대로 쓴다. legacy/*.json을 재구성하는 geekbench/passmark/stress-ng는 원시 로그에서 값을 만들지
+# 않으므로 항목이 없고, 따라서 면책도 없다.
+RUN_SOURCES = {
+    "sysbench": [
+        ("sysbench-cpu", "run*.log", lambda p: dict(zip(["cpu_mt", "cpu_st"], sysbench.parse_cpu_log(p)))),
+        ("sysbench-memory", "run*.log", sysbench.parse_memory_log),
+    ],
+    "iperf3": [("iperf3", "run*.log", iperf3.parse_log)],
+    "nginx": [("nginx", "run*.log", lambda p: dict(zip(["req_sec", "latency_ms"], nginx.parse_log(p))))],
+    "redis": [("redis", "run*.log", redis.parse_log)],
+    "elasticsearch": [
+        ("elasticsearch", "rally*.log",
+         lambda p: {f"rally.{k}": v for k, v in elasticsearch.parse_rally_log(p).items()}),
+        ("elasticsearch", "coldstart*.log",
+         lambda p: {f"coldstart.{k}": v for k, v in elasticsearch.parse_coldstart_log(p).items()}),
+    ],
+    "springboot": [
+        ("springboot", "wrk*.log", lambda p: {f"wrk.{k}": v for k, v in springboot.parse_wrk_log(p).items()}),
+        ("springboot", "coldstart*.log", lambda p: {"cold_s": springboot.parse_coldstart_log(p)}),
+    ],
 }
 
 # redis: legacy 리포트의 opsSec/setLatency/getLatency는 이 저장소의 results/redis/<inst>/run*.log
@@ -27,6 +49,10 @@ KNOWN_INCOMPLETE_SAMPLES = {
 # 현재 원시 로그 5회 값의 최대치 235294보다도 높아 같은 실행이 아님이 확정적). 이 저장소의 원시
 # 로그만으로 만드는 새 파서는 legacy를 재현할 수 없는 게 당연하므로 3필드 전부 화이트리스트 —
 # validate.py 통과가 "새 파서가 맞다"는 뜻이지 "legacy와 같은 실행"이라는 뜻은 아님을 이 주석으로 남긴다.
+# 같은 일이 반복되지 않게 이후 수집은 history/ 스냅샷(run 단위 값)으로 남기고 history.py diff로 비교한다.
+# 이 목록은 run 건강도로 유도할 수 없는(로그는 멀쩡하고 legacy가 다른 수집에서 온) 유일한 수동 목록이다.
+# "legacy 값이 원시 run 값 범위 밖" 같은 규칙으로 유도하면 redis 16개·springboot 1개 인스턴스가 빠지고,
+# 파서 버그도 같은 증상이라 가려진다 — 그래서 근거를 적어 둔 채 손으로 유지한다.
 KNOWN_DIFFERENT_SOURCE = (
     {
         ("redis", inst, field)
@@ -130,6 +156,25 @@ def relative_diff(a, b):
     return abs(a - b) / abs(b)
 
 
+@functools.lru_cache(maxsize=None)
+def sample_counts(name, inst):
+    """(벤치마크, 인스턴스) -> {site 필드: (값을 뽑은 run 수, 집계 대상 로그 수, 값이 없는 비-ok run 수)}."""
+    counts = {}
+    for results, pattern, parse in RUN_SOURCES.get(name, []):
+        inst_dir = RESULTS_DIR / results / RUN_DIR_ALIASES.get((results, inst), inst)
+        logs = usable_logs(results, sorted(inst_dir.glob(pattern))) if inst_dir.is_dir() else []
+        parsed = [(parse(lp), run_status(results, lp)["status"] != "ok") for lp in logs]
+        for field in parsed[0][0] if parsed else []:
+            n = sum(1 for r, _ in parsed if r.get(field) is not None)
+            counts[field] = (n, len(logs), sum(1 for r, bad in parsed if bad and r.get(field) is None))
+    return counts
+
+
+def known_incomplete(name, inst, site_field):
+    """이 (벤치마크, 인스턴스, 필드)의 표본이 결손 run 때문에 원본부터 모자란가."""
+    return sample_counts(name, inst).get(site_field, (0, 0, 0))[2] > 0
+
+
 def load_legacy_rows(name):
     raw = json.loads((LEGACY_DIR / f"{name}.json").read_text())
     rows = raw["rows"] if isinstance(raw, dict) and "rows" in raw else raw
@@ -142,7 +187,7 @@ def validate_benchmark(name):
         print(f"[{name}] SKIP — {site_path} 없음(파서 미실행)")
         return True
 
-    site = json.loads(site_path.read_text())
+    site = decode_envelope(json.loads(site_path.read_text()))  # --compact 빌드 출력도 허용
     legacy_rows = load_legacy_rows(name)
     spec = FIELD_MAPS[name]
     id_key = spec["id_key"]
@@ -160,8 +205,9 @@ def validate_benchmark(name):
             site_val = dget(site_inst, site_field)
             checked += 1
             diff = relative_diff(site_val, legacy_val)
-            known = (name, inst, site_field) in KNOWN_INCOMPLETE_SAMPLES or (name, inst, site_field) in KNOWN_DIFFERENT_SOURCE
-            if (diff is None or diff > TOLERANCE) and not known:
+            if (diff is None or diff > TOLERANCE) and not (
+                (name, inst, site_field) in KNOWN_DIFFERENT_SOURCE or known_incomplete(name, inst, site_field)
+            ):
                 mismatches.append((inst, site_field, f"site={site_val} legacy={legacy_val} diff={diff}"))
 
     print(f"[{name}] {len(legacy_rows)}개 인스턴스 × 필드 {checked}건 검사, coverage={site.get('coverage')}")
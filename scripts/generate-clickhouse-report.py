@@ -11,6 +11,7 @@ results/clickhouse/report-charts.html 의 __CLICKHOUSE_DATA__ placeholder에 JSO
 import json
 import re
 import statistics
+import sys
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -24,23 +25,9 @@ DATASET_BYTES = 13.44 * 1024 * 1024 * 1024  # 13.44 GiB hits on-disk
 
 NQUERIES = 43
 
-# On-demand 시간당 가격 (USD, ap-northeast-2) — nginx/redis 리포트와 동일 출처
-PRICE = {
-    "c5.xlarge": 0.192, "c5a.xlarge": 0.172, "c5d.xlarge": 0.220, "c5n.xlarge": 0.244,
-    "c6g.xlarge": 0.154, "c6gd.xlarge": 0.176, "c6gn.xlarge": 0.195, "c6i.xlarge": 0.192,
-    "c6id.xlarge": 0.231, "c6in.xlarge": 0.256, "c7g.xlarge": 0.163, "c7gd.xlarge": 0.208,
-    "c7i-flex.xlarge": 0.192, "c7i.xlarge": 0.202, "c8g.xlarge": 0.180, "c8gn.xlarge": 0.268,
-    "c8i-flex.xlarge": 0.201, "r8gd.xlarge": 0.353, "m8i-flex.xlarge": 0.247,
-    "c8i.xlarge": 0.212, "m5.xlarge": 0.236, "m5a.xlarge": 0.212, "m5ad.xlarge": 0.254,
-    "m5d.xlarge": 0.278, "m5zn.xlarge": 0.406, "m6g.xlarge": 0.188, "m6gd.xlarge": 0.222,
-    "m6i.xlarge": 0.236, "m6id.xlarge": 0.292, "m6idn.xlarge": 0.386, "m6in.xlarge": 0.337,
-    "m7g.xlarge": 0.201, "m7gd.xlarge": 0.263, "m7i-flex.xlarge": 0.235, "m7i.xlarge": 0.248,
-    "m8g.xlarge": 0.221, "m8i.xlarge": 0.260, "r5.xlarge": 0.304, "r5a.xlarge": 0.272,
-    "r5ad.xlarge": 0.316, "r5b.xlarge": 0.356, "r5d.xlarge": 0.346, "r5dn.xlarge": 0.398,
-    "r5n.xlarge": 0.356, "r6g.xlarge": 0.244, "r6gd.xlarge": 0.277, "r6i.xlarge": 0.304,
-    "r6id.xlarge": 0.363, "r7g.xlarge": 0.258, "r7gd.xlarge": 0.327, "r7i.xlarge": 0.319,
-    "r8g.xlarge": 0.284, "r8i-flex.xlarge": 0.318, "r8i.xlarge": 0.335,
-}
+# On-Demand 시간당 가격 — config/pricing/on-demand.csv(canonical, 대시보드 common.PRICE와 같은 표)
+sys.path.insert(0, str(SCRIPT_DIR / "dashboard"))
+from common import PRICE  # noqa: E402
 
 
 def load_instance_meta():
@@ -84,9 +71,9 @@ def gen_family(instance):
 
 
 def parse_log(path):
-    """단일 setN.log → dict(per-query hot ms 리스트, insert_rps, join_ms, failed)."""
+    """단일 setN.log → dict(per-query hot/cold ms 리스트, insert_rps, join_ms, failed)."""
     text = path.read_text(errors="replace")
-    out = {"queries": {}, "insert_rps": None, "join_ms": None, "failed": 0,
+    out = {"queries": {}, "cold": {}, "insert_rps": None, "join_ms": None, "failed": 0,
            "version": None, "arch": None}
     for line in text.splitlines():
         line = line.strip()
@@ -106,6 +93,9 @@ def parse_log(path):
                 hot = [int(v) for v in vals[1:] if v.isdigit()]  # hot1, hot2
                 if hot:
                     out["queries"].setdefault(qid, []).append(min(hot))
+                    # cold = 세트 내 쿼리 첫 실행(캐시 미적재 가능). hot이 유효한 쿼리만 짝으로 보관
+                    if vals[0].isdigit():
+                        out["cold"].setdefault(qid, []).append(int(vals[0]))
             except ValueError:
                 out["failed"] += 1
         elif line.startswith("INSERT_ROWS_PER_SEC:"):
@@ -121,6 +111,27 @@ def parse_log(path):
     return out
 
 
+def warmup_cost(cold_total_ms, hot_total_ms, mem_mb, price):
+    """cold-hot 차이로 page-cache 워밍업 비용 추정.
+
+    warmup_s = 43쿼리 cold 합 - hot 합 (첫 패스에서 디스크→page cache 적재에 추가로 쓴 시간).
+    cache_fraction = 메모리가 덮는 데이터셋 비율(상한 1.0). fits_in_ram=false면 작업집합이
+    page cache에 다 올라가지 못해 cold 페널티가 쿼리마다 재발 — warmup_recurring=true로 표시.
+    warmup_cost_usd = warmup_s 동안의 On-Demand 비용(노드 1대, 1회 워밍업 기준).
+    """
+    out = {"warmup_s": None, "warmup_cost_usd": None, "cache_fraction": None, "warmup_recurring": None}
+    if mem_mb:
+        cache_fraction = min(1.0, mem_mb * 1024 * 1024 / DATASET_BYTES)
+        out["cache_fraction"] = round(cache_fraction, 3)
+        out["warmup_recurring"] = cache_fraction < 1.0
+    if cold_total_ms and hot_total_ms:
+        warmup_s = max(0.0, (cold_total_ms - hot_total_ms) / 1000)
+        out["warmup_s"] = round(warmup_s, 2)
+        if price:
+            out["warmup_cost_usd"] = round(warmup_s / 3600 * price, 6)
+    return out
+
+
 def aggregate():
     meta = load_instance_meta()
     instances = {}
@@ -134,6 +145,7 @@ def aggregate():
                 continue
             instance = inst_dir.name
             q_hot = {}      # qid -> list of best-hot across sets
+            q_cold = {}     # qid -> list of cold(첫 실행) across sets
             insert_rps, join_ms, failed = [], [], 0
             version = None
             for lp in logs:
@@ -142,6 +154,8 @@ def aggregate():
                 failed += r["failed"]
                 for qid, vals in r["queries"].items():
                     q_hot.setdefault(qid, []).extend(vals)
+                for qid, vals in r["cold"].items():
+                    q_cold.setdefault(qid, []).extend(vals)
                 if r["insert_rps"]:
                     insert_rps.append(r["insert_rps"])
                 if r["join_ms"] is not None:
@@ -155,10 +169,13 @@ def aggregate():
             else:
                 hot_total_ms = None
                 failed += NQUERIES - len(per_q)
+            per_q_cold = {q: round(statistics.median(v)) for q, v in q_cold.items() if v}
+            cold_total_ms = sum(per_q_cold.values()) if len(per_q_cold) >= NQUERIES else None
             cls = gen_family(instance)
             mem_mb = meta.get(instance, {}).get("mem_mb")
             price = PRICE.get(instance)
             hot_s = hot_total_ms / 1000 if hot_total_ms else None
+            warmup = warmup_cost(cold_total_ms, hot_total_ms, mem_mb, price)
             # speed score: 데이터셋(43쿼리) 처리율 환산 (높을수록 좋음). value = speed/price.
             speed = round(1000 / hot_s, 2) if hot_s else None
             value = round(speed / price, 2) if (speed and price) else None
@@ -178,6 +195,13 @@ def aggregate():
                 "value": value,              # speed/$ (가성비, 높을수록 좋음)
                 "queries_measured": len(per_q),
                 "per_query_ms": per_q,
+                "per_query_cold_ms": per_q_cold,
+                "cold_hot_ratio": {q: round(per_q_cold[q] / per_q[q], 3)
+                                   for q in per_q if per_q_cold.get(q) and per_q[q]},
+                "cold_total_ms": cold_total_ms,
+                "cold_total_s": round(cold_total_ms / 1000, 2) if cold_total_ms else None,
+                "cold_hot_total_ratio": round(cold_total_ms / hot_total_ms, 3) if (cold_total_ms and hot_total_ms) else None,
+                **warmup,
                 "insert_rps": round(statistics.median(insert_rps)) if insert_rps else None,
                 "join_ms": round(statistics.median(join_ms)) if join_ms else None,
                 "failed_count": failed,
@@ -206,6 +230,9 @@ def main():
     payload = {
         "dataset": "ClickBench hits (~100M rows, 13.44GiB)",
         "note_ebs": "per-instance EBS 대역폭 상한이 교란변수. hot_total은 memory>=dataset(fits_in_ram=true) 인스턴스에서만 순수 page-cache-bound.",
+        "note_cold": "cold = 세트별 쿼리 첫 실행(해당 쿼리 데이터가 아직 page cache에 없을 수 있는 런) 5세트 중앙값. warmup_s = cold 합 - hot 합, "
+                     "warmup_cost_usd = 그 시간의 On-Demand 비용. fits_in_ram=false(cache_fraction<1)면 "
+                     "워밍업이 1회로 끝나지 않고 반복된다(warmup_recurring).",
         "instances": data,
         "queries": load_queries(),
     }
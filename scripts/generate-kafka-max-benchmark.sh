@@ -28,7 +28,11 @@ FORCE_RERUN=false; [ "${1:-}" == "--force" ] && FORCE_RERUN=true
 GREEN='\033[0;32m'; YELLOW='\033[1;33m'; RED='\033[0;31m'; NC='\033[0m'
 log(){ echo -e "[$(date '+%H:%M:%S')] $*"; }
 
-get_arch(){ local a; a=$(awk -v i="$1" '$1==i{print $2}' "$INSTANCE_FILE"); [ "$a" = arm64 ] && echo arm64 || echo amd64; }
+# 템플릿 렌더는 scripts/campaign/render.py — 타입 검사 + 단일 패스 치환 + 인스턴스 용량 검증.
+# (예전 sed "s/CODEC/.../g"는 스크립트 안의 CODEC="CODEC"/${CODEC}까지 바꿔 버렸음)
+render(){ local tpl="$1" instance="$2" run="$3"; shift 3
+  python3 "$SCRIPT_DIR/campaign/render.py" --template "$tpl" --instances "$instance" --runs "$run" \
+    --instance-file "$INSTANCE_FILE" --set "KAFKA_VERSION=${KAFKA_VERSION}" "$@"; }
 
 mapfile -t INSTANCES < <(grep -vE '^\s*#|^\s*$' "$INSTANCE_FILE" | awk '{print $1}')
 log "인스턴스 ${#INSTANCES[@]}개 x 시나리오 ${#CODECS[@]}개 x run ${RUNS}회"
@@ -47,7 +51,7 @@ find_pod(){ local job="$1" p; for t in 1 2 3 4 5; do
   [ -n "$p" ] && { echo "$p"; return 0; }; sleep 2; done; return 1; }
 
 run_instance(){
-  local instance="$1" safe arch; safe=$(echo "$instance"|tr '.' '-'); arch=$(get_arch "$instance")
+  local instance="$1" safe; safe=$(echo "$instance"|tr '.' '-')
   mkdir -p "$RESULTS_DIR/$instance"
 
   local done_count=0 total=$(( ${#CODECS[@]} * RUNS ))
@@ -58,11 +62,7 @@ run_instance(){
     log "${GREEN}스킵(완료됨)${NC}: $instance"; return
   fi
 
-  cat "$SERVER_TEMPLATE" \
-    | sed "s/INSTANCE_SAFE/${safe}/g" | sed "s/INSTANCE_TYPE/${instance}/g" \
-    | sed "s/KAFKA_VERSION/${KAFKA_VERSION}/g" \
-    | sed "s|kubernetes.io/arch: ARCH|kubernetes.io/arch: ${arch}|g" \
-    | kubectl apply -f - >/dev/null 2>&1
+  render "$SERVER_TEMPLATE" "$instance" 1 | kubectl apply -f - >/dev/null 2>&1
 
   if ! wait_server_schedulable "$instance"; then
     log "${YELLOW}브로커 스케줄 불가 — skip${NC}: $instance"
@@ -78,11 +78,7 @@ run_instance(){
       local lf="$RESULTS_DIR/$instance/${codec}-run${RUN}.log"
       [ "$FORCE_RERUN" = false ] && [ -s "$lf" ] && continue
       local job="kafka-max-${safe}-${codec}-run${RUN}"
-      cat "$CLIENT_TEMPLATE" \
-        | sed "s/INSTANCE_SAFE/${safe}/g" | sed "s/INSTANCE_TYPE/${instance}/g" \
-        | sed "s/RUN_NUMBER/${RUN}/g"     | sed "s/KAFKA_VERSION/${KAFKA_VERSION}/g" \
-        | sed "s/CODEC/${codec}/g" \
-        | kubectl apply -f - >/dev/null 2>&1
+      render "$CLIENT_TEMPLATE" "$instance" "$RUN" --set "CODEC=${codec}" | kubectl apply -f - >/dev/null 2>&1
 
       if kubectl wait --for=condition=complete "job/$job" -n "$NAMESPACE" --timeout="${JOB_TIMEOUT}s" >/dev/null 2>&1; then
         local pod; pod=$(find_pod "$job")
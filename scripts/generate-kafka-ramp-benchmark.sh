@@ -26,7 +26,11 @@ FORCE_RERUN=false; [ "${1:-}" == "--force" ] && FORCE_RERUN=true
 GREEN='\033[0;32m'; YELLOW='\033[1;33m'; RED='\033[0;31m'; NC='\033[0m'
 log(){ echo -e "[$(date '+%H:%M:%S')] $*"; }
 
-get_arch(){ local a; a=$(awk -v i="$1" '$1==i{print $2}' "$INSTANCE_FILE"); [ "$a" = arm64 ] && echo arm64 || echo amd64; }
+# 템플릿 렌더는 scripts/campaign/render.py — 타입 검사 + 단일 패스 치환 + 인스턴스 용량 검증.
+# (예전 sed "s/CODEC/.../g"는 스크립트 안의 CODEC="CODEC"/${CODEC}까지 바꿔 버렸음)
+render(){ local tpl="$1" instance="$2" run="$3"; shift 3
+  python3 "$SCRIPT_DIR/campaign/render.py" --template "$tpl" --instances "$instance" --runs "$run" \
+    --instance-file "$INSTANCE_FILE" --set "KAFKA_VERSION=${KAFKA_VERSION}" "$@"; }
 
 # Phase 2(uncompressed 8-way) 5회 median MB/s → 램프의 100% 기준점. 없으면 250(베이스라인 근사) 대체.
 baseline_mb(){
@@ -51,7 +55,7 @@ wait_server_schedulable(){ local instance="$1" t p; for t in $(seq 1 $((SCHED_WA
   [ "$p" = Running ] && return 0; sleep 5; done; return 1; }
 
 run_instance(){
-  local instance="$1" safe arch base; safe=$(echo "$instance"|tr '.' '-'); arch=$(get_arch "$instance")
+  local instance="$1" safe base; safe=$(echo "$instance"|tr '.' '-')
   mkdir -p "$RESULTS_DIR/$instance"
   local lf="$RESULTS_DIR/$instance/run1.log"
   if [ "$FORCE_RERUN" = false ] && [ -s "$lf" ]; then
@@ -59,11 +63,7 @@ run_instance(){
   fi
   base=$(baseline_mb "$instance")
 
-  cat "$SERVER_TEMPLATE" \
-    | sed "s/INSTANCE_SAFE/${safe}/g" | sed "s/INSTANCE_TYPE/${instance}/g" \
-    | sed "s/KAFKA_VERSION/${KAFKA_VERSION}/g" \
-    | sed "s|kubernetes.io/arch: ARCH|kubernetes.io/arch: ${arch}|g" \
-    | kubectl apply -f - >/dev/null 2>&1
+  render "$SERVER_TEMPLATE" "$instance" 1 | kubectl apply -f - >/dev/null 2>&1
 
   if ! wait_server_schedulable "$instance"; then
     log "${YELLOW}브로커 스케줄 불가 — skip${NC}: $instance"
@@ -75,11 +75,7 @@ run_instance(){
   kubectl wait --for=condition=available "deployment/kafka-server-${safe}" -n "$NAMESPACE" --timeout=300s >/dev/null 2>&1
 
   local job="kafka-ramp-${safe}-run1"
-  cat "$CLIENT_TEMPLATE" \
-    | sed "s/INSTANCE_SAFE/${safe}/g" | sed "s/INSTANCE_TYPE/${instance}/g" \
-    | sed "s/RUN_NUMBER/1/g"          | sed "s/KAFKA_VERSION/${KAFKA_VERSION}/g" \
-    | sed "s/BASELINE_MB/${base}/g" \
-    | kubectl apply -f - >/dev/null 2>&1
+  render "$CLIENT_TEMPLATE" "$instance" 1 --set "BASELINE_MB=${base}" | kubectl apply -f - >/dev/null 2>&1
 
   # pod 조회를 재시도(최대 5회) — job-name 라벨 조회가 API 순간 부하로 빈 값을 줄 때가 있어,
   # 예전엔 이 경우도 "수집 완료"로 잘못 로그되면서 실제로는 빈 로그 파일이 남는 버그가 있었음.
@@ -1,5 +1,6 @@
 #!/bin/bash
 # 51개 인스턴스 병렬 벤치마크 실행 스크립트
+# 대체됨: scripts/campaign/orchestrate.py (config/instances-4vcpu.txt 기반, 재시도·재개 지원)
 # Geekbench, Passmark, Spring Boot Cold Start
 
 set -e
@@ -1,7 +1,7 @@
 // Hash 라우터. 탭은 최초 방문 시에만 fetch+import되고(파셜 HTML은 캐시), 이후 재방문은
 // DOM 재사용. 한 번에 한 탭만 마운트되므로 탭 간 id 충돌이 없다 — 새 탭 추가 시 TABS 배열에
 // 1줄만 추가하면 된다(reports/report-nav.js의 REPORTS 배열과 같은 패턴).
-import { loadData } from './shared.js';
+import { assetUrl, loadData } from './shared.js';
 
 const TABS = [
   { id: 'overview', name: '종합' },
@@ -16,6 +16,7 @@ const TABS = [
   { id: 'elasticsearch', name: 'Elasticsearch' },
   { id: 'clickhouse', name: 'ClickHouse' },
   { id: 'kafka', name: 'Kafka' },
+  { id: 'query', name: '인스턴스 찾기' },
 ];
 
 const partialCache = new Map(); // tabId -> html string
@@ -47,7 +48,7 @@ function setActiveNav(tabId) {
 
 async function getPartial(tabId) {
   if (!partialCache.has(tabId)) {
-    const html = await fetch(`tabs/${tabId}.html`).then((r) => {
+    const html = await fetch(assetUrl(`tabs/${tabId}.html`)).then((r) => {
       if (!r.ok) throw new Error(`tabs/${tabId}.html 로드 실패 (${r.status})`);
       return r.text();
     });
@@ -93,6 +94,7 @@ async function activateTab(tabId) {
 
 async function loadDataFor(tabId) {
   if (tabId === 'overview') return null; // overview.js가 자체적으로 11개 fetch
+  if (tabId === 'query') return null; // query.js는 data/_query_index.json만 읽는다
   return loadData(tabId);
 }
 
@@ -9,6 +9,10 @@ export const ARCH_COLOR = { graviton: '#10b981', intel: '#3b82f6', amd: '#ef4444
 export const ARCH_LABEL = { graviton: 'Graviton', intel: 'Intel', amd: 'AMD' };
 const GENS = [5, 6, 7, 8];
 const ARCHES = ['intel', 'amd', 'graviton'];
+const FAMILIES = ['C', 'M', 'R'];
+// 그룹 평균은 기준 크기만(aggregates.py BASE_SIZE와 동일) — 2xlarge가 섞인 빌드에서도 세대 비교 유지
+const BASE_SIZE = 'xlarge';
+const baseSize = (r) => !r.size || r.size === BASE_SIZE;
 
 export function archColor(arch, alpha = 0.7) {
   const hex = ARCH_COLOR[arch] || ARCH_COLOR.intel;
@@ -21,6 +25,14 @@ export function badge(arch) {
   return `<span class="badge badge-${a}">${ARCH_LABEL[a] || arch}</span>`;
 }
 
+/** 같은 인스턴스 이름의 run이 서로 다른 CPU 모델에서 측정됐으면(instances.json heterogeneous — hardware.py) 표시.
+ * 모델별 하위 결과는 data/_hardware.json의 by_model. */
+export function hardwareMark(row) {
+  if (!row.heterogeneous) return '';
+  const models = (row.cpu_models || []).join(', ');
+  return ` <span class="badge badge-hetero" title="run마다 다른 CPU에서 측정됨: ${models}">CPU 혼재</span>`;
+}
+
 /** dot-path getter: get({rally:{throughput:5}}, 'rally.throughput') -> 5. 중간 경로가 null/undefined면 undefined. */
 export function get(obj, path) {
   return path.split('.').reduce((o, k) => (o == null ? undefined : o[k]), obj);
@@ -34,26 +46,91 @@ export function fmt(value, digits = 0) {
   return value.toLocaleString('en-US', { maximumFractionDigits: d, minimumFractionDigits: 0 });
 }
 
-/** row(조인된 인스턴스)에서 path 필드를 canonical price로 나눈 가성비. */
+/** row(조인된 인스턴스)에서 path 필드를 canonical price로 나눈 가성비. loadData()가 만든 row면
+ * 빌드 시 계산값(envelope.aggregates.metrics[path].per_dollar)을 쓴다. */
 export function perDollar(row, path) {
+  const pre = precomputedRows.get(row);
+  const list = pre && pre.aggregates.metrics[path] && pre.aggregates.metrics[path].per_dollar;
+  if (list) return list[pre.i];
   const v = get(row, path);
   if (v == null || !row.price) return null;
   return v / row.price;
 }
 
+/** 빌드 시 계산한 작업 단위당 비용(envelope.unit_cost — scripts/dashboard/unit_cost.py). loadData()가 만든
+ * row가 아니거나 그 벤치마크에 단위 정의가 없으면 []. -> [{key, label, cost(row), utilization}] */
+export function unitCosts(rows) {
+  const pre = rows.map((r) => precomputedRows.get(r)).find((p) => p && p.unitCost);
+  if (!pre) return [];
+  const { utilization, metrics } = pre.unitCost;
+  return Object.entries(metrics).map(([key, m]) => ({
+    key, label: m.label, utilization,
+    cost: (row) => { const p = precomputedRows.get(row); return p && p.unitCost ? p.unitCost.metrics[key].values[p.i] : null; },
+  }));
+}
+
 // ---------------------------------------------------------------------------
 // 데이터 로딩
 // ---------------------------------------------------------------------------
 
 let instancesCache = null;
+// loadData()가 만든 row -> {aggregates, i(봉투 instances 순서)}. 탭이 {...r}로 복사한 row는 여기 없으므로 직접 계산.
+const precomputedRows = new WeakMap();
+
+/** 논리 경로('data/x.json', 'tabs/x.html') -> 배포 경로. scripts/dashboard/publish.py가 index.html에
+ * 심은 window.ASSET_MANIFEST(콘텐츠 해시 파일명)로 풀고, 없으면(site/ 직접 서빙) 그대로. */
+export function assetUrl(path) {
+  const manifest = globalThis.ASSET_MANIFEST;
+  return (manifest && manifest[path]) || path;
+}
+
+// columnar-v1(build_data.py --compact) 디코더 — scripts/dashboard/columnar.py decode_table과 동일 규칙.
+// 테이블: {format, index:[name], columns:[{k:[경로], t, v, p?, n?, d?}]}. p/n은 LSB 우선 base64
+// 비트맵(p 생략 = 전 행 존재, n 생략 = null 없음, n === '*' = 전 행 null). v는 존재+non-null 행의 값만.
+const COLUMNAR = 'columnar-v1';
+
+function unbitmap(b64, n, dflt) {
+  if (b64 == null) return () => dflt;
+  if (b64 === '*') return () => true;
+  const bin = atob(b64);
+  return (i) => ((bin.charCodeAt(i >> 3) >> (i & 7)) & 1) === 1;
+}
+
+/** columnar-v1 테이블 -> {name: {...}} (행 지향 JSON과 같은 모양). 테이블이 아니면 그대로. */
+export function decodeTable(table) {
+  if (!table || table.format !== COLUMNAR) return table;
+  const { index, columns } = table;
+  const rows = index.map(() => ({}));
+  for (const col of columns) {
+    const present = unbitmap(col.p, index.length, true);
+    const isNull = unbitmap(col.n, index.length, false);
+    const parents = col.k.slice(0, -1);
+    const leaf = col.k[col.k.length - 1];
+    let j = 0;
+    for (let i = 0; i < index.length; i++) {
+      if (!present(i)) continue;
+      let target = rows[i];
+      for (const k of parents) target = target[k] ??= {};
+      if (isNull(i)) {
+        target[leaf] = null;
+      } else {
+        const v = col.v[j++];
+        target[leaf] = col.d ? col.d[v] : v;
+      }
+    }
+  }
+  return Object.fromEntries(index.map((name, i) => [name, rows[i]]));
+}
 
-/** data/<name>.json + data/instances.json을 fetch해 조인된 rows[]와 원본 envelope를 반환. */
+/** data/<name>.json + data/instances.json을 fetch해 조인된 rows[]와 원본 envelope를 반환.
+ * 행 지향/컬럼 지향(--compact) 어느 쪽이든 envelope.instances는 {name: metrics}로 디코드된다. */
 export async function loadData(name) {
-  const [payload, instances] = await Promise.all([
-    fetch(`data/${name}.json`).then((r) => r.json()),
-    instancesCache || fetch('data/instances.json').then((r) => r.json()),
+  const [raw, instances] = await Promise.all([
+    fetch(assetUrl(`data/${name}.json`)).then((r) => r.json()),
+    instancesCache || fetch(assetUrl('data/instances.json')).then((r) => r.json()).then(decodeTable),
   ]);
   instancesCache = instances;
+  const payload = { ...raw, instances: decodeTable(raw.instances) };
   // metrics를 먼저 펴고 instances.json(canonical)을 나중에 덮어쓴다 — kafka/clickhouse의
   // data.json은 자체 arch/gen/family/price를 이미 갖고 있는데(대문자 'Graviton', 문자열 '8' 등)
   // canonical 값이 항상 이겨야 한다(설계 §3.1 "클라이언트 조인 값이 우선").
@@ -62,6 +139,12 @@ export async function loadData(name) {
     ...metrics,
     ...(instances[instName] || {}),
   }));
+  // 빌드 시 집계(scripts/dashboard/aggregates.py)는 이 rows 배열에만 붙인다 — 탭이 filter/map한
+  // 새 배열에는 없으므로 헬퍼가 자동으로 직접 계산 경로로 떨어진다(부분집합에 전체 집계 사용 방지).
+  if (payload.aggregates) {
+    Object.defineProperty(rows, 'aggregates', { value: payload.aggregates });
+    rows.forEach((row, i) => precomputedRows.set(row, { aggregates: payload.aggregates, unitCost: payload.unit_cost, i }));
+  }
   return { envelope: payload, rows, instances };
 }
 
@@ -198,12 +281,61 @@ function aggregateByGenArch(rows, field) {
   GENS.forEach((g) => { out[g] = { intel: [], amd: [], graviton: [] }; });
   rows.forEach((r) => {
     const v = get(r, field);
-    if (v != null && out[r.gen] && out[r.gen][r.arch]) out[r.gen][r.arch].push(v);
+    if (v != null && baseSize(r) && out[r.gen] && out[r.gen][r.arch]) out[r.gen][r.arch].push(v);
   });
   return out;
 }
 const avg = (arr) => (arr.length ? arr.reduce((a, b) => a + b, 0) / arr.length : null);
 
+/** loadData() rows 그대로면 빌드 시 집계(aggregates.metrics[field]), 아니면 null. */
+function precomputed(rows, field) {
+  return (rows.aggregates && rows.aggregates.metrics[field]) || null;
+}
+
+/** {gen: {arch: 평균|null}} — 빌드 시 집계가 있으면 그것, 없으면 rows에서 계산. */
+function genArchMeans(rows, field) {
+  const pre = precomputed(rows, field);
+  if (pre) return pre.gen_arch;
+  const data = aggregateByGenArch(rows, field);
+  const out = {};
+  GENS.forEach((g) => { out[g] = {}; ARCHES.forEach((a) => { out[g][a] = avg(data[g][a]); }); });
+  return out;
+}
+
+/** {family: {arch: 평균|null}} (C/M/R). */
+function familyMeans(rows, field) {
+  const pre = precomputed(rows, field);
+  if (pre) return pre.family;
+  const byFamilyArch = {};
+  FAMILIES.forEach((f) => { byFamilyArch[f] = { intel: [], amd: [], graviton: [] }; });
+  rows.forEach((r) => {
+    const v = get(r, field);
+    if (v != null && baseSize(r) && byFamilyArch[r.family] && byFamilyArch[r.family][r.arch]) byFamilyArch[r.family][r.arch].push(v);
+  });
+  const out = {};
+  FAMILIES.forEach((f) => { out[f] = {}; ARCHES.forEach((a) => { out[f][a] = avg(byFamilyArch[f][a]); }); });
+  return out;
+}
+
+/** [{arch, from, to, pct}] — intel 5→8, graviton 6→8 연속 세대 개선율(%), 소수 1자리. */
+function genUplift(rows, field) {
+  const pre = precomputed(rows, field);
+  if (pre) return pre.uplift;
+  const means = genArchMeans(rows, field);
+  const out = [];
+  ['intel', 'graviton'].forEach((arch) => {
+    for (let i = 1; i < GENS.length; i++) {
+      const prevGen = GENS[i - 1], curGen = GENS[i];
+      if (arch === 'graviton' && prevGen === 5) continue;
+      const prev = means[prevGen][arch];
+      const cur = means[curGen][arch];
+      if (prev == null || cur == null || prev === 0) continue;
+      out.push({ arch, from: prevGen, to: curGen, pct: Math.round(((cur - prev) / prev) * 1000) / 10 });
+    }
+  });
+  return out;
+}
+
 /** metrics: [{field,label,unit,direction,divisor=1,icon?,insightHtml?}] */
 export function metricTabChart(hostEl, rows, metrics) {
   hostEl.innerHTML = `
@@ -216,14 +348,14 @@ export function metricTabChart(hostEl, rows, metrics) {
   let chart = null;
 
   function render(metric) {
-    const data = aggregateByGenArch(rows, metric.field);
+    const means = genArchMeans(rows, metric.field);
     const divisor = metric.divisor || 1;
     const datasets = ARCHES.map((arch) => ({
       label: ARCH_LABEL[arch],
       data: GENS.map((g) => {
         if (arch === 'amd' && g !== 5) return null;
         if (arch === 'graviton' && g === 5) return null;
-        const a = avg(data[g][arch]);
+        const a = means[g][arch];
         return a == null ? null : Math.round(a / divisor);
       }),
       backgroundColor: ARCH_COLOR[arch],
@@ -264,21 +396,15 @@ export function metricTabChart(hostEl, rows, metrics) {
 export function familyChart(hostEl, rows, metric) {
   hostEl.innerHTML = `<div class="chart-container"><canvas></canvas></div>`;
   const canvas = hostEl.querySelector('canvas');
-  const families = ['C', 'M', 'R'];
-  const byFamilyArch = {};
-  families.forEach((f) => { byFamilyArch[f] = { intel: [], amd: [], graviton: [] }; });
-  rows.forEach((r) => {
-    const v = get(r, metric.field);
-    if (v != null && byFamilyArch[r.family] && byFamilyArch[r.family][r.arch]) byFamilyArch[r.family][r.arch].push(v);
-  });
+  const means = familyMeans(rows, metric.field);
   const datasets = ARCHES.map((arch) => ({
     label: ARCH_LABEL[arch],
-    data: families.map((f) => { const a = avg(byFamilyArch[f][arch]); return a == null ? null : Math.round(a); }),
+    data: FAMILIES.map((f) => { const a = means[f][arch]; return a == null ? null : Math.round(a); }),
     backgroundColor: ARCH_COLOR[arch],
   }));
   const chart = new Chart(canvas, {
     type: 'bar',
-    data: { labels: families, datasets },
+    data: { labels: FAMILIES, datasets },
     options: {
       responsive: true, maintainAspectRatio: false,
       plugins: { legend: { position: 'top' } },
@@ -295,20 +421,9 @@ export function familyChart(hostEl, rows, metric) {
 export function genImprovement(hostEl, rows, metric) {
   hostEl.innerHTML = `<div class="chart-container"><canvas></canvas></div>`;
   const canvas = hostEl.querySelector('canvas');
-  const byGenArch = aggregateByGenArch(rows, metric.field);
-  const labels = [];
-  const values = [];
-  ['intel', 'graviton'].forEach((arch) => {
-    for (let i = 1; i < GENS.length; i++) {
-      const prevGen = GENS[i - 1], curGen = GENS[i];
-      if (arch === 'graviton' && prevGen === 5) continue;
-      const prev = avg(byGenArch[prevGen][arch]);
-      const cur = avg(byGenArch[curGen][arch]);
-      if (prev == null || cur == null) continue;
-      labels.push(`${ARCH_LABEL[arch]} ${prevGen}→${curGen}세대`);
-      values.push(Math.round(((cur - prev) / prev) * 1000) / 10);
-    }
-  });
+  const uplift = genUplift(rows, metric.field);
+  const labels = uplift.map((u) => `${ARCH_LABEL[u.arch]} ${u.from}→${u.to}세대`);
+  const values = uplift.map((u) => u.pct);
   const chart = new Chart(canvas, {
     type: 'bar',
     data: { labels, datasets: [{ data: values, backgroundColor: labels.map((l) => (l.includes('Graviton') ? ARCH_COLOR.graviton : ARCH_COLOR.intel)) }] },
@@ -328,12 +443,15 @@ export function genImprovement(hostEl, rows, metric) {
 /** opts: {mainMetric: {field,label,unit,direction}, gridMetrics: [{field,label,unit,direction}] (grid-3, 최대 3개)} */
 export function priceSection(hostEl, rows, opts) {
   const { mainMetric, gridMetrics = [] } = opts;
-  const tabs = ['버블 차트', '가성비 순위', '지표별 가성비'].slice(0, gridMetrics.length ? 3 : 2);
+  const units = unitCosts(rows);
+  const tabs = ['버블 차트', '가성비 순위', ...(gridMetrics.length ? ['지표별 가성비'] : []), ...(units.length ? ['단위 비용'] : [])];
+  const canvasGrid = (n) => (n > 1 ? `<div class="grid-3">${'<div class="chart-container"><canvas></canvas></div>'.repeat(n)}</div>` : '<div class="chart-container"><canvas></canvas></div>');
   hostEl.innerHTML = `
     <div class="tab-buttons">${tabs.map((t, i) => `<button class="tab-btn${i === 0 ? ' active' : ''}" data-i="${i}">${t}</button>`).join('')}</div>
     <div class="tab-content active" data-i="0"><div class="chart-container"><canvas></canvas></div></div>
     <div class="tab-content" data-i="1"><div class="chart-container"><canvas></canvas></div></div>
     ${gridMetrics.length ? `<div class="tab-content" data-i="2"><div class="grid-3">${gridMetrics.map(() => '<div class="chart-container"><canvas></canvas></div>').join('')}</div></div>` : ''}
+    ${units.length ? `<div class="tab-content" data-i="${tabs.length - 1}">${canvasGrid(units.length)}</div>` : ''}
   `;
   const charts = [];
   const contents = [...hostEl.querySelectorAll('.tab-content')];
@@ -384,6 +502,23 @@ export function priceSection(hostEl, rows, opts) {
     });
   }
 
+  // 마지막 탭: 작업 단위당 비용 Top-N(낮을수록 좋음) — 빌드 시 목표 사용률 기준
+  if (units.length) {
+    const unitCanvases = contents[contents.length - 1].querySelectorAll('canvas');
+    units.forEach((u, i) => {
+      const uRows = rows.map((r) => ({ name: r.name, arch: r.arch, __cost: u.cost(r) }))
+        .filter((r) => r.__cost != null).sort((a, b) => a.__cost - b.__cost).slice(0, 15);
+      charts.push(new Chart(unitCanvases[i], {
+        type: 'bar',
+        data: { labels: uRows.map((r) => r.name), datasets: [{ label: u.label, data: uRows.map((r) => r.__cost), backgroundColor: uRows.map((r) => archColor(r.arch)) }] },
+        options: {
+          responsive: true, maintainAspectRatio: false, indexAxis: 'y', plugins: { legend: { display: false }, title: { display: true, text: `${u.label} (사용률 ${Math.round(u.utilization * 100)}%)` } },
+          scales: { x: { title: { display: true, text: u.label } } },
+        },
+      }));
+    });
+  }
+
   const listeners = [];
   hostEl.querySelectorAll('.tab-btn').forEach((btn) => {
     const onClick = () => {
@@ -448,9 +583,10 @@ export function resultTable(hostEl, rows, columns, opts = {}) {
 
     tbody.innerHTML = sorted.map((r, i) => `<tr${opts.onRowClick ? ` class="clickable-row" data-i="${i}"` : ''}>${columns.map((c) => {
       const v = get(r, c.field);
-      return `<td>${c.fmt ? c.fmt(v, r) : (v == null ? '—' : v)}</td>`;
+      return `<td>${c.fmt ? c.fmt(v, r) : (v == null ? '—' : v)}${c.field === 'name' ? hardwareMark(r) : ''}</td>`;
     }).join('')}</tr>`).join('');
-    countEl.textContent = `${sorted.length}개 인스턴스 표시`;
+    const mixed = sorted.filter((r) => r.heterogeneous).length;
+    countEl.textContent = `${sorted.length}개 인스턴스 표시${mixed ? ` — CPU 혼재 ${mixed}개(run마다 다른 CPU 모델, 평균에 섞여 있음)` : ''}`;
 
     if (opts.onRowClick) {
       tbody.querySelectorAll('tr').forEach((tr, i) => {
@@ -0,0 +1,160 @@
+// 인스턴스 찾기 — data/_query_index.json(scripts/dashboard/query.py가 빌드) 위의 제약 + 목표 질의.
+// 평가 규칙은 query.py match/parse_objective/score와 동일(숫자 컬럼은 order 위 이분 탐색, 범주 컬럼은 groups).
+// 다른 탭과 달리 봉투를 읽지 않으므로 app.js loadDataFor가 null을 넘긴다.
+import { assetUrl, fmt } from '../shared.js';
+
+const CONSTRAINT = /^\s*([\w.-]+?)\s*(<=|>=|!=|<|>|=)\s*(\S.*?)\s*$/;
+const DEFAULT_CONSTRAINTS = 'redis.set_p99_ms<1\nnginx.req_sec>=80000\narch!=intel';
+const DEFAULT_OBJECTIVE = 'min:price';
+
+function lowerBound(keys, x) {
+  let lo = 0; let hi = keys.length;
+  while (lo < hi) { const mid = (lo + hi) >> 1; if (keys[mid] < x) lo = mid + 1; else hi = mid; }
+  return lo;
+}
+
+function upperBound(keys, x) {
+  let lo = 0; let hi = keys.length;
+  while (lo < hi) { const mid = (lo + hi) >> 1; if (keys[mid] <= x) lo = mid + 1; else hi = mid; }
+  return lo;
+}
+
+function column(index, col) {
+  const c = index.columns[col];
+  if (!c) throw new Error(`알 수 없는 컬럼: ${col}`);
+  return c;
+}
+
+function match(index, col, op, raw) {
+  const c = column(index, col);
+  if (c.groups) {
+    if (op !== '=' && op !== '!=') throw new Error(`${col}은 범주 컬럼 — =, !=만 가능`);
+    const hit = new Set(raw.toLowerCase().split(',').flatMap((v) => c.groups[v.trim()] || []));
+    return op === '=' ? hit : new Set(index.instances.map((_, i) => i).filter((i) => !hit.has(i)));
+  }
+  const x = Number(raw);
+  if (raw.trim() === '' || Number.isNaN(x)) throw new Error(`${col}은 숫자 컬럼 — 값이 숫자가 아님: ${raw}`);
+  if (!c.sorted) c.sorted = c.order.map((i) => c.values[i]);
+  const lo = lowerBound(c.sorted, x); const hi = upperBound(c.sorted, x);
+  const span = { '<': c.order.slice(0, lo), '<=': c.order.slice(0, hi), '>': c.order.slice(hi), '>=': c.order.slice(lo), '=': c.order.slice(lo, hi) };
+  return new Set(span[op] || [...c.order.slice(0, lo), ...c.order.slice(hi)]);
+}
+
+function parseObjective(text, index) {
+  const [kind, terms] = [text.split(':')[0], text.split(':').slice(1).join(':')];
+  if ((kind !== 'min' && kind !== 'max') || !terms) throw new Error(`목표 형식: min:<컬럼> | max:<컬럼>[,<컬럼>...]`);
+  const out = terms.split(',').map((t) => {
+    const term = t.trim();
+    const col = term.replace(/^[+-]+/, '');
+    const c = index.columns[col];
+    if (!c || c.groups) throw new Error(`목표 컬럼은 숫자 컬럼이어야 함: ${col}`);
+    return [col, { '+': 'max', '-': 'min' }[term[0]] || c.direction];
+  });
+  if (kind === 'min' && out.length > 1) throw new Error('복합 점수는 max:만 가능(클수록 좋음)');
+  if (out.length > 1) {
+    out.forEach(([col]) => {
+      if (index.columns[col].values.some((v) => v != null && v <= 0)) {
+        throw new Error(`복합 점수 항 ${col}에 0 이하 값이 있어 비율로 정규화할 수 없음 — 단일 목표나 제약(${col}=0 등)으로 쓰기`);
+      }
+    });
+  }
+  return { kind, terms: out };
+}
+
+/** 정렬 키(작을수록 앞) — 값이 없으면 null. */
+function score(index, { kind, terms }, i) {
+  if (terms.length === 1) {
+    const v = index.columns[terms[0][0]].values[i];
+    return v == null ? null : (kind === 'min' ? v : -v);
+  }
+  let logs = 0;
+  for (const [col, direction] of terms) {
+    const c = index.columns[col];
+    const v = c.values[i];
+    if (v == null) return null;
+    const best = c.values[c.order[direction === 'max' ? c.order.length - 1 : 0]];
+    logs += Math.log(direction === 'max' ? v / best : best / v);
+  }
+  return -Math.exp(logs / terms.length);
+}
+
+export function runQuery(index, constraintLines, objectiveText, top) {
+  const parsed = constraintLines.map((line) => {
+    const m = CONSTRAINT.exec(line);
+    if (!m) throw new Error(`제약 형식: <컬럼><연산자><값>: ${line}`);
+    return m.slice(1);
+  });
+  const objective = parseObjective(objectiveText, index);
+  let hit = new Set(index.instances.map((_, i) => i));
+  parsed.forEach(([col, op, raw]) => {
+    const m = match(index, col, op, raw);
+    hit = new Set([...hit].filter((i) => m.has(i)));
+  });
+  const ranked = [...hit].map((i) => ({ i, s: score(index, objective, i) })).filter((r) => r.s != null)
+    .sort((a, b) => a.s - b.s || (index.instances[a.i] < index.instances[b.i] ? -1 : 1));
+  const shown = [...new Set(['price', ...parsed.map((p) => p[0]), ...objective.terms.map((t) => t[0])])];
+  return {
+    matched: hit.size,
+    ranked: ranked.length,
+    shown,
+    rows: ranked.slice(0, top).map(({ i, s }) => ({
+      instance: index.instances[i],
+      objective: objective.kind === 'max' ? -s : s,
+      values: shown.map((c) => index.columns[c].values[i]),
+    })),
+  };
+}
+
+const cell = (v) => (typeof v === 'number' ? fmt(v, Math.abs(v) < 1 ? 4 : Math.abs(v) < 1000 ? 2 : 0) : (v ?? '—'));
+
+export async function render(root) {
+  const index = await fetch(assetUrl('data/_query_index.json')).then((r) => r.json());
+  const cols = Object.keys(index.columns);
+  const queryEl = root.querySelector('[data-slot="query"]');
+  const resultsEl = root.querySelector('[data-slot="results"]');
+  const columnsEl = root.querySelector('[data-slot="columns"]');
+
+  queryEl.innerHTML = `
+    <datalist id="query-columns">${cols.map((c) => `<option value="${c}">`).join('')}</datalist>
+    <div class="table-filters">
+      <textarea class="q-constraints" rows="4" cols="48" spellcheck="false">${DEFAULT_CONSTRAINTS}</textarea>
+      <input type="text" class="q-objective" list="query-columns" value="${DEFAULT_OBJECTIVE}" size="40" spellcheck="false">
+      <select class="q-top">${[10, 20].map((n) => `<option value="${n}">상위 ${n}</option>`).join('')}<option value="${index.instances.length}">전체</option></select>
+    </div>
+    <p class="description q-status"></p>
+  `;
+  const constraintsEl = queryEl.querySelector('.q-constraints');
+  const objectiveEl = queryEl.querySelector('.q-objective');
+  const topEl = queryEl.querySelector('.q-top');
+  const statusEl = queryEl.querySelector('.q-status');
+
+  const update = () => {
+    try {
+      const lines = constraintsEl.value.split('\n').filter((l) => l.trim());
+      const t0 = performance.now();
+      const res = runQuery(index, lines, objectiveEl.value.trim() || DEFAULT_OBJECTIVE, Number(topEl.value));
+      statusEl.textContent = `조건 만족 ${res.matched}/${index.instances.length}개, 목표값 있음 ${res.ranked}개 (${(performance.now() - t0).toFixed(1)} ms)`;
+      resultsEl.innerHTML = `<table>
+        <thead><tr><th>#</th><th>인스턴스</th><th>목표값</th>${res.shown.map((c) => `<th>${c}</th>`).join('')}</tr></thead>
+        <tbody>${res.rows.map((r, n) => `<tr><td>${n + 1}</td><td><strong>${r.instance}</strong></td><td>${cell(r.objective)}</td>${r.values.map((v) => `<td>${cell(v)}</td>`).join('')}</tr>`).join('')}</tbody>
+      </table>`;
+    } catch (err) {
+      statusEl.textContent = err.message;
+      resultsEl.innerHTML = '';
+    }
+  };
+
+  columnsEl.innerHTML = `<table>
+    <thead><tr><th>컬럼</th><th>종류</th><th>값 있음</th></tr></thead>
+    <tbody>${cols.map((c) => {
+      const col = index.columns[c];
+      const kind = col.groups ? `범주: ${Object.keys(col.groups).join(', ')}` : col.direction;
+      return `<tr><td><code>${c}</code></td><td>${kind}</td><td>${col.values.filter((v) => v != null).length}/${col.values.length}</td></tr>`;
+    }).join('')}</tbody>
+  </table>`;
+
+  const inputs = [constraintsEl, objectiveEl, topEl];
+  inputs.forEach((el) => el.addEventListener('input', update));
+  update();
+  return { destroy() { inputs.forEach((el) => el.removeEventListener('input', update)); } };
+}
@@ -0,0 +1,172 @@
+#!/bin/bash
+# 읽기 전용 HTTP JSON API(scripts/dashboard/api.py) 검증 게이트.
+# 빈 포트에 서버를 띄워 엔드포인트/필터/ETag·304/오류 코드를, 임시 site/data 사본으로 빌드 변경 시 캐시 무효화를 본다.
+set -uo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+BASE="$(cd "$SCRIPT_DIR/../.." && pwd)"
+DASH="$BASE/scripts/dashboard"
+TMP=$(mktemp -d)
+PASS=0; FAIL=0
+ok(){ echo "  ✓ $1"; PASS=$((PASS+1)); }
+no(){ echo "  ✗ $1"; FAIL=$((FAIL+1)); }
+
+PORT=$(python3 -c "import socket; s = socket.socket(); s.bind(('127.0.0.1', 0)); print(s.getsockname()[1])")
+(cd "$DASH" && exec python3 api.py --port "$PORT") >"$TMP/api.log" 2>&1 &
+PID=$!
+trap 'kill $PID 2>/dev/null; rm -rf "$TMP"' EXIT
+for _ in $(seq 50); do python3 -c "import urllib.request; urllib.request.urlopen('http://127.0.0.1:$PORT/api')" 2>/dev/null && break; sleep 0.1; done
+
+# get <경로> [헤더 ...] -> 1행 "상태 ETag 본문바이트", 2행 본문
+get(){ python3 - "$PORT" "$@" <<'PY'
+import sys, urllib.error, urllib.request
+port, path, *headers = sys.argv[1:]
+req = urllib.request.Request(f"http://127.0.0.1:{port}{path}", headers=dict(h.split(": ", 1) for h in headers))
+try:
+    with urllib.request.urlopen(req) as r:
+        status, body, etag = r.status, r.read(), r.headers.get("ETag")
+except urllib.error.HTTPError as e:
+    status, body, etag = e.code, e.read(), e.headers.get("ETag")
+print(status, etag or "-", len(body))
+print(body.decode() or "{}")
+PY
+}
+
+echo "== Task 1: 엔드포인트 =="
+out=$(get /api)
+[ "$(head -1 <<<"$out" | cut -d' ' -f1)" = "200" ] && tail -1 <<<"$out" | grep -q '"instances":54' && ok "/api: 엔드포인트 목록 + 빌드 hash" || no "/api: $out"
+out=$(get "/api/instances/c8g.xlarge")
+tail -1 <<<"$out" | python3 -c "
+import json, sys
+d = json.load(sys.stdin)
+sys.exit(0 if d['attrs']['price'] == 0.18 and len(d['benchmarks']) >= 10 and d['unit_cost']['nginx']['usd_per_1m_requests']['rank'] else 1)" \
+  && ok "인스턴스 프로필: 속성 + 벤치마크 지표 + 단위 비용/순위" || no "프로필: $(head -c 300 <<<"$out")"
+out=$(get "/api/metrics/redis/set_p99_ms?arch=graviton&gen=8,7&limit=3")
+tail -1 <<<"$out" | python3 -c "
+import json, sys
+d = json.load(sys.stdin)
+v = [r['value'] for r in d['rows']]
+sys.exit(0 if d['direction'] == 'min' and len(v) == 3 and v == sorted(v) and d['count'] == 11 else 1)" \
+  && ok "지표: 필터(arch, gen 쉼표) + 방향 기본 정렬 + limit" || no "지표: $out"
+size=$(head -1 <<<"$out" | cut -d' ' -f3)
+[ "$size" -lt 2000 ] && ok "지표 응답 ${size}B (정적 봉투 통째 대비)" || no "응답 크기 $size"
+out=$(get "/api/aggregates/nginx/req_sec?by=arch&size=xlarge")
+tail -1 <<<"$out" | python3 -c "
+import json, sys
+g = json.load(sys.stdin)['groups']
+sys.exit(0 if sorted(g) == ['amd', 'graviton', 'intel'] and sum(x['n'] for x in g.values()) == 54 else 1)" \
+  && ok "그룹 집계: arch별 n/mean/median/min/max" || no "집계: $out"
+out=$(get "/api/runs/redis/c8g.xlarge")
+tail -1 <<<"$out" | python3 -c "
+import json, sys
+d = json.load(sys.stdin)
+sys.exit(0 if [r['run'] for r in d['runs']] == [1, 2, 3, 4, 5] and d['stdev'] > 0 else 1)" \
+  && ok "run 단위 원시 값 5개 + 평균/표준편차" || no "runs: $out"
+out=$(get "/api/query?c=redis.set_p99_ms%3C1&c=nginx.req_sec%3E%3D80000&c=arch!%3Dintel&top=1")
+tail -1 <<<"$out" | grep -q '"matched":18,.*"instance":"c6g.xlarge"' && ok "질의: query.py와 같은 결과" || no "query: $out"
+
+echo "== Task 2: ETag / 캐시 =="
+a=$(get "/api/metrics/nginx/req_sec?limit=2&arch=amd"); a=$(head -1 <<<"$a")
+b=$(get "/api/metrics/nginx/req_sec?arch=amd&limit=2"); b=$(head -1 <<<"$b")
+etag=$(cut -d' ' -f2 <<<"$a")
+build=$(python3 -c "import json; print(json.load(open('$BASE/site/data/_manifest.json'))['hash'])")
+[ "$a" = "$b" ] && [[ "$etag" == \"$build-* ]] && ok "ETag = 빌드 hash + 정규화 요청 키(쿼리 순서 무관)" || no "ETag: $a / $b"
+out=$(get "/api/metrics/nginx/req_sec?limit=2&arch=amd" "If-None-Match: $etag")
+[ "$(head -1 <<<"$out" | cut -d' ' -f1,3)" = "304 0" ] && ok "If-None-Match 일치 -> 304, 본문 없음" || no "304: $out"
+out=$(get "/api/metrics/nginx/req_sec?limit=3&arch=amd" "If-None-Match: $etag")
+[ "$(head -1 <<<"$out" | cut -d' ' -f1)" = "200" ] && ok "다른 요청의 ETag로는 304 아님" || no "ETag 충돌: $out"
+
+echo "== Task 3: 오류 =="
+codes=""
+for path in "/api/nope" "/api/instances/x1.xlarge" "/api/metrics/nope/x" "/api/metrics/nginx/nope" "/api/runs/nope/c8g.xlarge" \
+            "/api/metrics/nginx/req_sec?limit=x" "/api/metrics/nginx/req_sec?sort=up" "/api/aggregates/nginx/req_sec?by=price" "/api/query?c=bad" \
+            "/api/metrics/nginx/req_sec?limit=-1" "/api/query?c=vcpu>=4&top=-1"; do
+  out=$(get "$path")  # 응답 전체를 받은 뒤 자른다 — 파이프로 head에 넘기면 BrokenPipeError
+  codes+="$(head -1 <<<"$out" | cut -d' ' -f1) "
+done
+[ "$codes" = "404 404 404 404 404 400 400 400 400 400 400 " ] && ok "없는 리소스 404, 잘못된 파라미터(음수 limit/top 포함) 400" || no "오류 코드: $codes"
+out=$(get "/api/metrics/nginx/req_sec?limit=0")
+[ "$(head -1 <<<"$out" | cut -d' ' -f1)" = "200" ] && tail -1 <<<"$out" | grep -q '"rows":\[\]' && ok "limit=0 -> 빈 rows(200)" || no "limit=0: $out"
+code=$(python3 -c "
+import urllib.request, urllib.error
+try:
+    urllib.request.urlopen(urllib.request.Request('http://127.0.0.1:$PORT/api', data=b'x', method='POST'))
+except urllib.error.HTTPError as e:
+    print(e.code)")
+[ "$code" = "405" ] && ok "읽기 전용: POST -> 405" || no "POST: $code"
+
+echo "== Task 4: 빌드 변경 시 무효화 (임시 site/data 사본) =="
+cp -r "$BASE/site/data" "$TMP/data"
+out=$(cd "$DASH" && python3 -c "
+import json, os, pathlib
+import api, scaling
+d = pathlib.Path('$TMP/data')
+api.SITE_DATA_DIR = scaling.SITE_DATA_DIR = d
+store = api.Store(cache_size=2)
+h1 = store.refresh()
+for k in 'abc':
+    store.cache.get(k, lambda: k)
+print(list(store.cache.entries))
+store.cache.get('b', lambda: 'x'); store.cache.get('d', lambda: 'd')
+print(list(store.cache.entries), store.cache.hits)
+m = json.loads((d / '_manifest.json').read_text())
+os.utime(d / '_manifest.json', ns=(1, 1))
+print(store.refresh() == h1, len(store.cache.entries))
+m['hash'] = 'feedfacefeedface'
+(d / '_manifest.json').write_text(json.dumps(m))
+print(store.refresh(), len(store.cache.entries))
+(d / '_manifest.json').unlink()
+try:
+    store.refresh()
+except api.ApiError as e:
+    print(e.status)" 2>&1)
+[ "$(sed -n 1p <<<"$out")" = "['b', 'c']" ] && [ "$(sed -n 2p <<<"$out")" = "['b', 'd'] 1" ] && ok "LRU: 크기 초과 시 가장 오래 안 쓴 항목부터 제거" || no "LRU: $out"
+[ "$(sed -n 3p <<<"$out")" = "True 0" ] && ok "manifest 서명 변경 -> 다시 읽고 캐시 비움, 내용이 같으면 hash 유지" || no "재로딩: $out"
+[ "$(sed -n 4p <<<"$out")" = "feedfacefeedface 0" ] && ok "새 빌드 hash -> 새 ETag 기준" || no "hash: $out"
+[ "$(sed -n 5p <<<"$out")" = "503" ] && ok "manifest 없음 -> 503" || no "503: $out"
+
+echo "== Task 5: 예기치 않은 예외 -> JSON 500 (임시 site/data 사본) =="
+rm -rf "$TMP/data"; cp -r "$BASE/site/data" "$TMP/data"
+out=$(cd "$DASH" && python3 -c "
+import json, pathlib, threading, urllib.error, urllib.request
+from http.server import ThreadingHTTPServer
+import api, scaling
+d = pathlib.Path('$TMP/data')
+api.SITE_DATA_DIR = scaling.SITE_DATA_DIR = d
+class H(api.ApiHandler):
+    store = api.Store()
+    def log_message(self, *a):
+        pass
+srv = ThreadingHTTPServer(('127.0.0.1', 0), H)
+threading.Thread(target=srv.serve_forever, daemon=True).start()
+def get(path):
+    try:
+        with urllib.request.urlopen(f'http://127.0.0.1:{srv.server_port}{path}') as r:
+            return r.status, json.loads(r.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+good = (d / 'instances.json').read_text()
+m = json.loads((d / '_manifest.json').read_text())
+(d / 'instances.json').write_text(good[:len(good) // 2])  # 빌드 도중: 반쯤 쓰인 JSON + 새 manifest
+m['hash'] = 'midbuild'
+(d / '_manifest.json').write_text(json.dumps(m))
+code, body = get('/api')
+print(code, body['error'].split(':')[0])
+(d / 'instances.json').write_text(good)
+m['hash'] = 'done'
+(d / '_manifest.json').write_text(json.dumps(m))
+code, body = get('/api')
+print(code, body.get('build'))
+def boom(store, params):
+    raise KeyError('bug')
+api.ep_index = boom
+H.store.cache.clear()
+print(*get('/api'))
+srv.shutdown()" 2>&1)
+[ "$(sed -n 1p <<<"$out")" = "500 내부 오류 — JSONDecodeError" ] && ok "빌드 중 반쯤 쓰인 JSON -> 연결 끊김 대신 {\"error\"} 500" || no "JSONDecodeError: $out"
+[ "$(sed -n 2p <<<"$out")" = "200 done" ] && ok "빌드가 끝나면 다음 요청에서 정상(500은 캐시하지 않음)" || no "복구: $out"
+[ "$(sed -n 3p <<<"$out")" = "500 {'error': \"내부 오류 — KeyError: 'bug'\"}" ] && ok "엔드포인트 버그 -> JSON 500" || no "엔드포인트 예외: $out"
+
+echo ""
+echo "결과: PASS=$PASS FAIL=$FAIL"
+[ "$FAIL" -eq 0 ]
@@ -0,0 +1,280 @@
+#!/bin/bash
+# 캠페인 오케스트레이터(scripts/campaign/orchestrate.py) 검증 게이트.
+# 라이브 클러스터 불필요 — tests/campaign/fake-kubectl로 apply/폴링/로그/삭제를 흉내.
+set -uo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+BASE="$(cd "$SCRIPT_DIR/../.." && pwd)"
+ORCH="$BASE/scripts/campaign/orchestrate.py"
+FAKE="$SCRIPT_DIR/fake-kubectl"
+TMP=$(mktemp -d)
+trap 'rm -rf "$TMP"' EXIT
+PASS=0; FAIL=0
+ok(){ echo "  ✓ $1"; PASS=$((PASS+1)); }
+no(){ echo "  ✗ $1"; FAIL=$((FAIL+1)); }
+
+orch(){ python3 "$ORCH" --kubectl "$FAKE" --poll 0.01 --backoff 0.01 --results "$TMP/results" "$@"; }
+
+echo "== Task 1: 인스턴스 목록 = config/instances-4vcpu.txt =="
+n_cfg=$(grep -cvE '^\s*(#|$)' "$BASE/config/instances-4vcpu.txt")
+orch sysbench-cpu --dry-run --state "$TMP/dry.json" >/dev/null 2>&1 && ok "dry-run 실행" || no "dry-run 실행"
+n_plan=$(python3 -c "import json;print(len(json.load(open('$TMP/dry.json'))['instances']))" 2>/dev/null)
+[ "$n_plan" = "$n_cfg" ] && ok "계획 인스턴스 $n_plan개 = 설정 $n_cfg개" || no "계획 $n_plan개 ≠ 설정 $n_cfg개"
+n_cfg8=$(grep -cvE '^\s*(#|$)' "$BASE/config/instances-8vcpu.txt")
+orch sysbench-cpu --dry-run --sizes xlarge,2xlarge --state "$TMP/dry8.json" >/dev/null 2>&1
+n_plan8=$(python3 -c "import json;print(len(json.load(open('$TMP/dry8.json'))['instances']))" 2>/dev/null)
+[ "$n_plan8" = $((n_cfg + n_cfg8)) ] && ok "--sizes xlarge,2xlarge = 4vcpu + 8vcpu 설정 ${n_plan8}개" || no "--sizes 계획 $n_plan8개"
+orch sysbench-cpu --dry-run --instances no.such --state "$TMP/x.json" >/dev/null 2>&1 \
+  && no "모르는 인스턴스가 통과" || ok "모르는 인스턴스는 에러"
+
+echo "== Task 2: 실행 + 동시성 한도 =="
+export FAKE_KUBE_DIR="$TMP/kube1"
+I4="c8g.xlarge,c7i.xlarge,m6g.xlarge,r5.xlarge"
+orch sysbench-cpu --instances "$I4" --runs 2 --limit benchmark-server=2 --state "$TMP/s1.json" >/dev/null 2>&1 \
+  && ok "종료 코드 0" || no "종료 코드 != 0"
+n_log=$(find "$TMP/results/sysbench-cpu" -name 'run*.log' | wc -l)
+[ "$n_log" -eq 8 ] && ok "로그 8개(4 인스턴스 × 2 run)" || no "로그 $n_log개 (기대 8)"
+grep -q "Complete" "$TMP/results/sysbench-cpu/c8g.xlarge/run2.log" && ok "로그 내용 저장" || no "로그 내용"
+[ -z "$(find "$TMP/results" -name '.*.tmp')" ] && ok "임시 파일 잔류 0" || no "임시 파일 잔류"
+peak=$(cat "$FAKE_KUBE_DIR/max_active")
+[ "$peak" -le 2 ] && ok "동시 Job 최대 $peak ≤ 2" || no "동시 Job $peak > 2"
+[ -z "$(ls "$FAKE_KUBE_DIR/jobs")" ] && ok "Job 정리" || no "Job 잔류: $(ls "$FAKE_KUBE_DIR/jobs")"
+
+echo "== Task 3: 재개(기존 로그 skip) =="
+orch sysbench-cpu --instances "$I4" --runs 2 --state "$TMP/s2.json" >/dev/null 2>&1
+python3 -c "import json;c=json.load(open('$TMP/s2.json'))['counts'];assert c=={'skipped':8},c" 2>/dev/null \
+  && ok "8개 모두 skipped로 기록" || no "재개 skip"
+
+echo "== Task 4: 재시도 + 실패 보고 =="
+export FAKE_KUBE_DIR="$TMP/kube2" FAKE_FAIL_FIRST="m6g-xlarge-run1"
+orch sysbench-memory --instances "$I4" --runs 1 --retries 1 --state "$TMP/s3.json" >/dev/null 2>&1 \
+  && ok "첫 시도 실패 후 재시도 성공" || no "재시도 실패"
+python3 -c "import json;s=json.load(open('$TMP/s3.json'))['state']['sysbench-memory']['m6g.xlarge']['1'];assert s['attempts']==2,s" 2>/dev/null \
+  && ok "attempts=2 기록" || no "attempts 기록"
+export FAKE_KUBE_DIR="$TMP/kube3"
+out=$(orch sysbench-memory --instances "$I4" --runs 1 --retries 0 --force --state "$TMP/s4.json" 2>&1); rc=$?
+[ "$rc" -ne 0 ] && ok "재시도 소진 시 종료 코드 != 0" || no "실패가 종료 코드에 안 드러남"
+echo "$out" | grep -q "FAILED sysbench-memory m6g.xlarge run1" && ok "실패 목록 출력" || no "실패 목록"
+unset FAKE_FAIL_FIRST
+
+echo "== Task 5: 서버-클라이언트형(redis) =="
+export FAKE_KUBE_DIR="$TMP/kube4"
+orch redis --instances "$I4" --runs 1 --limit benchmark-client=1 --state "$TMP/s5.json" >/dev/null 2>&1 \
+  && ok "redis 실행" || no "redis 실행"
+peak=$(cat "$FAKE_KUBE_DIR/max_active")
+[ "$peak" -le 1 ] && ok "client 한도 1 준수(최대 $peak)" || no "client 동시 $peak > 1"
+grep -q "Deployment/redis-server-c8g-xlarge" "$FAKE_KUBE_DIR/deleted.log" && ok "인스턴스 서버 정리" || no "서버 정리"
+grep -q "ConfigMap/redis-config" "$FAKE_KUBE_DIR/deleted.log" && no "공유 ConfigMap 삭제됨" || ok "공유 ConfigMap 유지"
+
+echo "== Task 6: 로그 수집기(collect.py) =="
+COLLECT="$BASE/scripts/campaign/collect.py"
+collect(){ python3 "$COLLECT" --kubectl "$FAKE" --results "$TMP/collected" --no-build "$@"; }
+export FAKE_KUBE_DIR="$TMP/kube5"
+mkdir -p "$FAKE_KUBE_DIR/jobs"
+for s in c8g-xlarge c7i-xlarge m6g-xlarge r5-xlarge; do
+  for r in 1 2 3; do printf "0,succeeded" > "$FAKE_KUBE_DIR/jobs/sysbench-cpu-$s-run$r"; done
+done
+printf "1,succeeded" > "$FAKE_KUBE_DIR/jobs/sysbench-cpu-c8g-xlarge-run4"   # 아직 실행 중
+printf "0,succeeded" > "$FAKE_KUBE_DIR/jobs/kafka-max-c8g-xlarge-lz4-run1"  # 모르는 템플릿
+# 느린 로그로 중단시킨 뒤 재개 — 반쯤 받은 파일이 남지 않고, 받은 것은 다시 받지 않아야 함
+FAKE_LOG_DELAY=0.4 timeout -s INT 1.5 python3 "$COLLECT" sysbench-cpu --instances "$I4" --jobs 2 \
+  --kubectl "$FAKE" --results "$TMP/collected" --no-build >/dev/null 2>&1
+n_first=$(find "$TMP/collected" -name 'run*.log' | wc -l)
+[ -z "$(find "$TMP/collected" -name '.*.tmp')" ] && ok "중단 후 임시 파일 잔류 0" || no "임시 파일 잔류"
+[ "$n_first" -gt 0 ] && [ "$n_first" -lt 12 ] && ok "중단 시점까지 $n_first개 수집" || no "중단 수집 $n_first개 (0<n<12 기대)"
+python3 -c "import json;assert len(json.load(open('$TMP/collected/.collect-manifest.json')))==$n_first" 2>/dev/null \
+  && ok "중단 시 매니페스트 저장" || no "중단 매니페스트"
+calls0=$(cat "$FAKE_KUBE_DIR/log_calls")
+out=$(FAKE_LOG_LINES=20000 collect sysbench-cpu --instances "$I4" 2>&1)
+n_log=$(find "$TMP/collected" -name 'run*.log' | wc -l)
+[ "$n_log" -eq 12 ] && ok "재개 후 로그 12개" || no "로그 $n_log개 (기대 12)"
+echo "$out" | grep -q "not complete 1" && ok "미완료 Job 보고" || no "미완료 보고: $out"
+echo "$out" | grep -q "unmapped 1" && ok "대응 안 되는 Job 보고" || no "unmapped 보고: $out"
+grep -q "line 19999" "$TMP/collected/sysbench-cpu/r5.xlarge/run3.log" && ok "스트리밍 큰 로그 온전" || no "큰 로그 잘림"
+calls1=$(cat "$FAKE_KUBE_DIR/log_calls")
+out=$(collect sysbench-cpu --instances "$I4" 2>&1)
+[ "$(cat "$FAKE_KUBE_DIR/log_calls")" = "$calls1" ] && echo "$out" | grep -q "up to date 12" \
+  && ok "재실행 시 다시 받지 않음" || no "재실행 재수집: $out"
+[ $((calls1 - calls0)) -eq $((12 - n_first)) ] && ok "재개는 남은 $((12 - n_first))개만 요청" || no "재개 요청 $((calls1 - calls0))개"
+touch -d '+1 hour' "$FAKE_KUBE_DIR/jobs/sysbench-cpu-m6g-xlarge-run2"  # Job 재실행(completionTime 변경)
+out=$(collect sysbench-cpu --instances "$I4" 2>&1)
+echo "$out" | grep -q "collected 1" && ok "completionTime 변경된 Job만 재수집" || no "재수집: $out"
+collect sysbench-cpu --instances "$I4" --gzip --results "$TMP/gz" >/dev/null 2>&1
+python3 -c "import gzip;assert b'Complete' in gzip.open('$TMP/gz/sysbench-cpu/c8g.xlarge/run1.log.gz').read()" 2>/dev/null \
+  && ok "--gzip 압축 저장" || no "--gzip"
+mkdir -p "$TMP/old/sysbench-cpu/c7i.xlarge"; echo "legacy" > "$TMP/old/sysbench-cpu/c7i.xlarge/run1.log"
+collect sysbench-cpu --instances "$I4" --results "$TMP/old" >/dev/null 2>&1
+[ "$(cat "$TMP/old/sysbench-cpu/c7i.xlarge/run1.log")" = "legacy" ] && ok "매니페스트 밖 기존 로그 보존" || no "기존 로그 덮어씀"
+out=$(cd "$BASE/scripts/campaign" && python3 -c "
+import os, collect
+calls = []
+collect.subprocess.run = lambda cmd, **kw: calls.append(' '.join(os.path.basename(c) for c in cmd[1:]))
+collect.rebuild({'kafka-max', 'clickhouse', 'nginx'})
+collect.rebuild({'redis'})
+print(calls)" 2>/dev/null | tail -1)
+[ "$out" = "['generate-clickhouse-report.py', 'generate-kafka-report.py', 'build_data.py clickhouse kafka nginx', 'build_data.py redis']" ] \
+  && ok "data.json 기반(kafka-max/clickhouse) 재빌드는 리포트 스크립트 먼저" || no "재빌드 순서: $out"
+
+echo "== Task 7: 노드 시간 스케줄러(schedule.py) + --plan 실행 =="
+SCHED="$BASE/scripts/campaign/schedule.py"
+python3 "$SCHED" --out "$TMP/plan.json" >"$TMP/sched.out" 2>&1 && ok "전체 계획 생성" || no "계획 생성"
+python3 - "$TMP/plan.json" "$n_cfg" <<'PY' 2>/dev/null && ok "인스턴스당 체인 1개, 벤치마크 각 1회" || no "계획 커버리지"
+import json, sys
+p = json.load(open(sys.argv[1]))
+chains = p["chains"]
+assert len(chains) == int(sys.argv[2]) == len({c["instance"] for c in chains})
+for c in chains:
+    benches = [s["bench"] for s in c["steps"]]
+    assert sorted(benches) == sorted(p["durations"]) and len(set(benches)) == len(benches), c["instance"]
+    assert all(a["end_s"] <= b["start_s"] for a, b in zip(c["steps"], c["steps"][1:])), c["instance"]
+PY
+python3 -c "import json;s=json.load(open('$TMP/plan.json'))['summary'];b,c=s['baseline'],s['chained'];assert c['provisions']<b['provisions'] and c['server_node_h']<=b['server_node_h'] and c['cost_usd']<=b['cost_usd'],s" 2>/dev/null \
+  && ok "체인 계획이 노드 생성/노드시간/비용 모두 현행 이하" || no "체인 계획 비용: $(tail -4 "$TMP/sched.out")"
+python3 "$SCHED" sysbench-cpu redis --instances c8g.xlarge,r5.xlarge --runs 1 --limit benchmark-server=1 \
+  --out "$TMP/plan2.json" >/dev/null 2>&1
+export FAKE_KUBE_DIR="$TMP/kube6"
+orch --plan "$TMP/plan2.json" --force --state "$TMP/s6.json" >/dev/null 2>&1 && ok "--plan 실행" || no "--plan 실행"
+python3 -c "import json;c=json.load(open('$TMP/s6.json'))['counts'];assert c=={'done':4},c" 2>/dev/null \
+  && ok "체인 4 run(2 인스턴스 × 2 벤치마크) 완료" || no "체인 run 상태"
+first=$(python3 -c "import json;print(json.load(open('$TMP/plan2.json'))['chains'][0]['instance'].replace('.','-'))")
+python3 - "$FAKE_KUBE_DIR/applied.log" "$first" <<'PY' 2>/dev/null && ok "server 한도 1: 체인이 계획 순서대로 이어서 실행" || no "체인 순서: $(cat "$FAKE_KUBE_DIR/applied.log")"
+import sys
+names = open(sys.argv[1]).read().split()
+owner = [sys.argv[2] in n for n in names]
+assert owner[0] and owner == sorted(owner, reverse=True), names
+PY
+
+echo "== Task 8: 매니페스트 렌더러(render.py) — 단일 패스 치환 + 용량 검증 =="
+REND="$BASE/scripts/campaign/render.py"
+python3 "$REND" --out "$TMP/rendered" 2>"$TMP/render.err" && ok "전체 매트릭스 렌더 + 검증 통과" || no "매트릭스 검증: $(head -3 "$TMP/render.err")"
+python3 "$REND" --instance-file "$BASE/config/instances-8vcpu.txt" --runs 1 >/dev/null 2>&1 \
+  && ok "2xlarge(8vcpu) 매트릭스 용량 검증 통과" || no "2xlarge 매트릭스 검증"
+n_files=$(find "$TMP/rendered/sysbench-cpu" -name '*-run*.yaml' | wc -l)
+[ "$n_files" -eq $((n_cfg * 5)) ] && ok "--out 디렉터리 sysbench-cpu ${n_files}개(인스턴스 × 5 run)" || no "--out 파일 $n_files개"
+CH="$TMP/rendered/clickhouse/c8g.xlarge-run1.yaml"
+grep -q 'kubernetes.io/arch: arm64' "$CH" && grep -q 'ARCH="$(uname -m)"' "$CH" && grep -q 'echo "ARCH: ${ARCH}"' "$CH" \
+  && ok "ARCH는 nodeSelector 값만 치환(스크립트 변수/로그 계약 보존)" || no "clickhouse ARCH 치환"
+KMAX="$BASE/benchmarks/kafka/kafka-benchmark-max.yaml"
+out=$(python3 "$REND" --template "$KMAX" --instances c8g.xlarge --runs 2 --set CODEC=lz4 2>/dev/null)
+echo "$out" | grep -q 'CODEC="lz4"' && echo "$out" | grep -q 'compression.type="${CODEC}"' \
+  && echo "$out" | grep -q 'name: kafka-max-c8g-xlarge-lz4-run2' && ok "CODEC 셸 변수 보존 + 이름 치환" || no "kafka-max CODEC 치환"
+python3 "$REND" --template "$KMAX" --instances c8g.xlarge --runs 1 >/dev/null 2>&1 && no "값 없는 placeholder 통과" || ok "값 없는 placeholder는 에러"
+python3 "$REND" --template "$KMAX" --instances c8g.xlarge --runs 1 --set 'CODEC=lz4;x' >/dev/null 2>&1 && no "형식 틀린 값 통과" || ok "형식 틀린 값은 에러"
+cat > "$TMP/big.yaml" <<'YAML'
+apiVersion: batch/v1
+kind: Job
+metadata:
+  name: big-INSTANCE_SAFE-runRUN_NUMBER
+spec:
+  template:
+    spec:
+      nodeSelector:
+        node.kubernetes.io/instance-type: INSTANCE_TYPE
+        kubernetes.io/arch: amd64
+      containers:
+        - name: bench
+          command: ["sh", "-c"]
+          args:
+            - |
+              cat <<EOF
+              requests:
+                cpu: "64"
+              EOF
+          resources:
+            requests:
+              cpu: "3500m"
+              memory: "16Gi"
+YAML
+err=$(python3 "$REND" --template "$TMP/big.yaml" --instances c8g.xlarge --runs 1 2>&1 >/dev/null)
+echo "$err" | grep -q 'requests.memory' && ok "인스턴스 allocatable 초과 request 검출" || no "용량 초과 미검출: $err"
+echo "$err" | grep -q 'kubernetes.io/arch amd64' && ok "arch nodeSelector 불일치 검출" || no "arch 불일치 미검출: $err"
+echo "$err" | grep -q 'requests.cpu' && no "block scalar 안의 cpu를 request로 오인" || ok "block scalar(스크립트 본문)는 파싱 제외"
+# Job 문서가 2개인 템플릿: 그 단위만 실패로 기록되고 다른 단위는 끝까지 돈다(gather가 중단되지 않음)
+sed 's/^  name: big-/  name: two-/; s/"16Gi"/"1Gi"/; s/amd64/arm64/' "$TMP/big.yaml" > "$TMP/two.yaml"
+printf -- "---\n" >> "$TMP/two.yaml"; sed 's/^  name: big-/  name: two-b-/; s/"16Gi"/"1Gi"/; s/amd64/arm64/' "$TMP/big.yaml" >> "$TMP/two.yaml"
+mkdir -p "$TMP/kube-two"
+out=$(cd "$BASE/scripts/campaign" && FAKE_KUBE_DIR="$TMP/kube-two" timeout 60 python3 -c "
+import asyncio
+from pathlib import Path
+import orchestrate as o
+from kube import Kubectl
+o.BENCHMARKS['two'] = {'template': '$TMP/two.yaml', 'results': 'two', 'log': 'run{run}.log', 'timeout': 5}
+c = o.Campaign(Kubectl('$FAKE'), ['two', 'sysbench-cpu'], [('c8g.xlarge', 'arm64')], runs=1, poll_s=0.01,
+               backoff_s=0.01, results_dir=Path('$TMP/two-results'))
+s = asyncio.run(c.run())
+print(s['two']['c8g.xlarge']['1']['status'], 'Job 문서가 2개' in s['two']['c8g.xlarge']['1']['error'],
+      s['sysbench-cpu']['c8g.xlarge']['1']['status'])" 2>&1 | tail -1)
+[ "$out" = "failed True done" ] && ok "Job 문서 수가 틀린 템플릿은 그 단위만 failed로 기록, 다른 단위는 계속" || no "Job 문서 수 오류: $out"
+
+echo "== Task 9: 적응형 run 수(adaptive.py) — CI 목표 도달 단위는 멈추고 나머지만 계획 =="
+ADAPT="$BASE/scripts/campaign/adaptive.py"
+AR="$TMP/adaptive"
+mkdir -p "$AR/sysbench-cpu/c8g.xlarge" "$AR/sysbench-cpu/c7i.xlarge"
+stable=(1000 1004 998); noisy=(800 1000 1200)
+for r in 1 2 3; do
+  printf -- "--- Run 1/3 ---\n    events per second:  %s\n" "${stable[$((r-1))]}" > "$AR/sysbench-cpu/c8g.xlarge/run$r.log"
+  printf -- "--- Run 1/3 ---\n    events per second:  %s\n" "${noisy[$((r-1))]}" > "$AR/sysbench-cpu/c7i.xlarge/run$r.log"
+done
+printf -- "--- Run 1/3 ---\nFATAL: sysbench error\n" > "$AR/sysbench-cpu/c8g.xlarge/run4.log"  # 실패 run은 값에서 제외
+printf -- "--- Run 1/3 ---\nFATAL: sysbench error\n" > "$AR/sysbench-cpu/c7i.xlarge/run4.log"  # more 단위 안의 실패 run
+python3 "$ADAPT" sysbench-cpu --instances c8g.xlarge,c7i.xlarge --results "$AR" --max-runs 6 --out "$TMP/adaptive.json" \
+  >/dev/null 2>&1 && ok "계획 생성" || no "계획 생성 실패"
+st=$(python3 -c "import json;d=json.load(open('$TMP/adaptive.json'))['decisions']['sysbench-cpu'];print(d['c8g.xlarge']['status'],d['c8g.xlarge']['n'],d['c7i.xlarge']['status'],d['c7i.xlarge']['runs'])" 2>/dev/null)
+[ "$st" = "done 3 more 6" ] && ok "안정 단위 done(n=3, 실패 run 제외), 잡음 단위 more(목표 6 = max-runs 상한)" || no "판정: $st"
+rr=$(python3 -c "import json;c=json.load(open('$TMP/adaptive.json'))['chains'];print([(x['instance'],s['rerun']) for x in c for s in x['steps']])" 2>/dev/null)
+[ "$rr" = "[('c7i.xlarge', [4, 5, 6])]" ] && ok "rerun = 실패 run4 자리 + 새 run5..6 (모자란 3개)" || no "rerun: $rr"
+export FAKE_KUBE_DIR="$TMP/kube9"
+python3 "$ORCH" --kubectl "$FAKE" --poll 0.01 --backoff 0.01 --results "$AR" --plan "$TMP/adaptive.json" \
+  --state "$TMP/s9.json" >/dev/null 2>&1 && ok "orchestrate --plan 실행" || no "orchestrate --plan 실패"
+n7=$(ls "$AR/sysbench-cpu/c7i.xlarge" | wc -l); n8=$(ls "$AR/sysbench-cpu/c8g.xlarge" | wc -l)
+[ "$n7" -eq 6 ] && [ "$n8" -eq 4 ] && ok "모자란 run만 실행(c7i run4..6, c8g 그대로)" || no "로그 c7i $n7개, c8g $n8개 (기대 6, 4)"
+grep -q FATAL "$AR/sysbench-cpu/c7i.xlarge/run4.log" && no "실패 run4가 그대로 남음(쓸 수 있는 run 5 < 목표 6)" \
+  || ok "실패 run4 자리를 다시 측정(덮어씀) — 쓸 수 있는 run이 목표 6개"
+python3 "$ADAPT" sysbench-cpu --min-runs 1 >/dev/null 2>&1 && no "--min-runs 1 통과" || ok "--min-runs < 2는 에러"
+# 계획의 rerun 6은 collect 기본 범위(DEFAULT_RUNS=5) 밖 — --plan이면 계획에서 범위를 잡아 수집
+export FAKE_KUBE_DIR="$TMP/kube9c"
+mkdir -p "$FAKE_KUBE_DIR/jobs"
+for r in 4 5 6; do printf "0,succeeded" > "$FAKE_KUBE_DIR/jobs/sysbench-cpu-c7i-xlarge-run$r"; done
+out=$(python3 "$COLLECT" sysbench-cpu --instances c7i.xlarge --kubectl "$FAKE" --results "$TMP/c9a" --no-build 2>&1)
+echo "$out" | grep -q "unmapped 1" && ok "collect 기본 --runs 5: run6 Job은 unmapped(회귀 재현)" || no "기본 범위: $out"
+out=$(python3 "$COLLECT" --plan "$TMP/adaptive.json" --kubectl "$FAKE" --results "$TMP/c9b" --no-build 2>&1)
+echo "$out" | grep -q "collected 3" && ! echo "$out" | grep -q unmapped && [ -s "$TMP/c9b/sysbench-cpu/c7i.xlarge/run6.log" ] \
+  && ok "collect --plan: 계획의 rerun(4..6) Job 모두 대응·수집" || no "collect --plan: $out"
+python3 "$COLLECT" --plan "$TMP/adaptive.json" sysbench-cpu --kubectl "$FAKE" --results "$TMP/c9b" >/dev/null 2>&1 \
+  && no "--plan + 벤치마크 지정 통과" || ok "--plan과 벤치마크/인스턴스 동시 지정은 에러"
+# run 단위 값이 없는 벤치마크(geekbench)는 로그 개수로 판정 — --max-runs까지 센다(DEFAULT_MAX_RUNS 10 고정 아님)
+mkdir -p "$AR/geekbench/c8g.xlarge"
+for r in $(seq 1 12); do echo "MULTI_CORE_SCORE: 0" > "$AR/geekbench/c8g.xlarge/run$r.log"; done
+n=$(python3 "$ADAPT" geekbench --instances c8g.xlarge --results "$AR" --max-runs 12 --out "$TMP/a12.json" >/dev/null 2>&1 \
+  && python3 -c "import json;print(json.load(open('$TMP/a12.json'))['decisions']['geekbench']['c8g.xlarge']['n'])")
+[ "$n" = "12" ] && ok "고정 run 벤치마크: --max-runs 12면 run11..12 로그까지 셈" || no "nonempty_runs: $n"
+
+echo "== Task 10: 커버리지 구멍(gaps.py) — 모자란 run만 인스턴스별로 재실행 =="
+GAPS="$BASE/scripts/campaign/gaps.py"
+GR="$TMP/gaps"
+mkdir -p "$GR/sysbench-cpu/c8g.xlarge" "$GR/sysbench-cpu/c7i.xlarge" "$GR/kafka-max/c8g.xlarge"
+for r in 1 2 3 4 5; do printf "    events per second:  1000\n" > "$GR/sysbench-cpu/c8g.xlarge/run$r.log"; done
+printf "FATAL: sysbench error\n" > "$GR/sysbench-cpu/c8g.xlarge/run3.log"      # failed(헤드라인 없음)
+: > "$GR/sysbench-cpu/c7i.xlarge/run1.log"                                    # 빈 run1 대신 run6으로 채운 단위
+for r in 2 3 4 5 6; do printf "    events per second:  1000\n" > "$GR/sysbench-cpu/c7i.xlarge/run$r.log"; done
+for c in uncompressed lz4 zstd; do for r in 1 2 3 4 5; do
+  printf "PRODUCE_TOTAL_MB_PER_SEC: 100\n" > "$GR/kafka-max/c8g.xlarge/$c-run$r.log"; done; done
+rm "$GR/kafka-max/c8g.xlarge/zstd-run2.log"
+python3 "$GAPS" sysbench-cpu kafka-max --instances c8g.xlarge,c7i.xlarge --results "$GR" --out "$TMP/gaps.json" \
+  >/dev/null 2>&1 && ok "계획 생성" || no "계획 생성 실패"
+got=$(python3 -c "
+import json;d=json.load(open('$TMP/gaps.json'))
+print(';'.join(c['instance']+':'+','.join(s['bench']+str(s['rerun']) for s in c['steps']) for c in d['chains']),
+      list(d['manual']['kafka-max']['instances']['c8g.xlarge']))" 2>/dev/null)
+[ "$got" = "c8g.xlarge:sysbench-cpu[3] ['2']" ] && ok "failed run3만 재실행, run6로 채운 단위는 구멍 아님, kafka-max zstd-run2는 수동" \
+  || no "계획: $got"
+export FAKE_KUBE_DIR="$TMP/kube10"
+python3 "$ORCH" --kubectl "$FAKE" --poll 0.01 --backoff 0.01 --results "$GR" --plan "$TMP/gaps.json" \
+  --state "$TMP/s10.json" >/dev/null 2>&1 && ok "orchestrate --plan 실행" || no "orchestrate --plan 실패"
+done_runs=$(python3 -c "import json;s=json.load(open('$TMP/s10.json'))['state'];print(sorted((b,i,r) for b,x in s.items() for i,y in x.items() for r,v in y.items() if v['status']=='done'))" 2>/dev/null)
+[ "$done_runs" = "[('sysbench-cpu', 'c8g.xlarge', '3')]" ] && ok "깨진 run3만 덮어쓰기(나머지 run 미실행)" || no "실행: $done_runs"
+grep -q "Complete" "$GR/sysbench-cpu/c8g.xlarge/run3.log" && ok "run3 로그 교체" || no "run3 로그 그대로"
+
+echo ""
+echo "결과: PASS=$PASS FAIL=$FAIL"
+[ "$FAIL" -eq 0 ]
@@ -0,0 +1,66 @@
+#!/bin/bash
+# 통합 CLI(ec2bench/cli.py) 검증 게이트.
+# --help가 저장소 모듈 없이 뜨는지, 서브커맨드가 스크립트 직접 실행과 같은 결과/종료 코드인지, 저장소 밖에서도 도는지 본다.
+# site/data를 다시 쓰는 build는 돌리지 않는다.
+set -uo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+BASE="$(cd "$SCRIPT_DIR/../.." && pwd)"
+DASH="$BASE/scripts/dashboard"
+TMP=$(mktemp -d)
+trap 'rm -rf "$TMP"' EXIT
+PASS=0; FAIL=0
+ok(){ echo "  ✓ $1"; PASS=$((PASS+1)); }
+no(){ echo "  ✗ $1"; FAIL=$((FAIL+1)); }
+ec2bench(){ (cd "$BASE" && python3 -m ec2bench "$@"); }
+
+echo "== Task 1: 지연 로드 =="
+out=$(cd "$BASE" && python3 -c "
+import sys
+from ec2bench import cli
+try:
+    cli.main(['--help'])
+except SystemExit as e:
+    code = e.code
+loaded = sorted(m for m in ('common', 'health', 'cache', 'build_data', 'query', 'runpy', 'argparse') if m in sys.modules)
+print(code, loaded)" | tail -1)
+[ "$out" = "0 []" ] && ok "--help: 저장소 모듈/runpy/argparse import 없음" || no "--help: $out"
+usage=$(ec2bench --help)
+missing=""
+for c in build validate legacy publish query history pricing serve plan campaign report; do
+  grep -q "^  $c " <<<"$usage" || missing+="$c "
+done
+[ -z "$missing" ] && ok "사용법에 모든 커맨드" || no "빠진 커맨드: $missing"
+out=$(ec2bench report); code=$?
+[ "$code" = "2" ] && [ "$(grep -c "^  " <<<"$out")" = "8" ] && ok "그룹만 주면 하위 커맨드 목록 + 종료 2 (report 8종)" || no "report: $code $out"
+ec2bench nope >/dev/null 2>&1; code=$?
+[ "$code" = "2" ] && ok "알 수 없는 커맨드 -> 종료 2" || no "nope: $code"
+
+echo "== Task 2: 스크립트 직접 실행과 같은 결과 =="
+args=("redis.set_p99_ms<1" "nginx.req_sec>=80000" "arch!=intel" --top 3)
+a=$(ec2bench query "${args[@]}")
+b=$(cd "$DASH" && python3 query.py "${args[@]}")
+[ -n "$a" ] && [ "$a" = "$b" ] && ok "query = scripts/dashboard/query.py" || no "query: $a / $b"
+ec2bench query "bogus<1" >/dev/null 2>&1; code=$?
+[ "$code" = "1" ] && ok "스크립트의 오류 종료 코드 그대로" || no "query 오류: $code"
+ec2bench query --help | grep -q -- "--objective" && ok "하위 커맨드 --help는 스크립트의 argparse로" || no "query --help"
+a=$(ec2bench plan gaps --instances c8g.xlarge 2>&1)
+b=$(cd "$BASE/scripts/campaign" && python3 gaps.py --instances c8g.xlarge 2>&1)
+[ -n "$a" ] && [ "$a" = "$b" ] && ok "plan gaps = scripts/campaign/gaps.py" || no "gaps: $a / $b"
+before=$(git -C "$BASE" status --porcelain site/data)
+ec2bench validate nginx | grep -q "OK" && ok "validate nginx" || no "validate"
+[ "$(git -C "$BASE" status --porcelain site/data)" = "$before" ] && ok "site/data 변경 없음" || no "site/data가 바뀜"
+
+echo "== Task 3: 저장소 밖 실행 =="
+cp -r "$BASE/ec2bench" "$TMP/ec2bench"
+rm -rf "$TMP/ec2bench/__pycache__"
+(cd "$TMP" && python3 -m ec2bench query --top 1 >/dev/null 2>"$TMP/err"); code=$?
+[ "$code" != "0" ] && grep -q "EC2BENCH_HOME" "$TMP/err" && ok "저장소를 못 찾으면 EC2BENCH_HOME 안내" || no "루트 탐색: $code $(cat "$TMP/err")"
+a=$(cd "$TMP" && EC2BENCH_HOME="$BASE" python3 -m ec2bench query arch=graviton --top 2)
+b=$(ec2bench query arch=graviton --top 2)
+[ -n "$a" ] && [ "$a" = "$b" ] && ok "EC2BENCH_HOME으로 다른 위치 설치본 실행" || no "EC2BENCH_HOME: $a"
+grep -q '^ec2bench = "ec2bench.cli:main"' "$BASE/pyproject.toml" && ok "pyproject 콘솔 스크립트 ec2bench" || no "pyproject"
+
+echo ""
+echo "결과: PASS=$PASS FAIL=$FAIL"
+[ "$FAIL" -eq 0 ]
@@ -88,6 +88,32 @@ class P(html.parser.HTMLParser):
     pass
 P().feed(open('$h').read())" 2>/dev/null && ok "HTML 파싱" || no "HTML 파싱"
 
+echo "== Task 10: 쿼리 속도비 분석 (scripts/dashboard/parsers/clickhouse.py) =="
+out=$(cd "$BASE/scripts/dashboard" && python3 -c "
+import json
+from columnar import decode_envelope
+from common import SITE_DATA_DIR
+from parsers import clickhouse, sysbench
+def boom():
+    raise AssertionError('sysbench 재파싱')
+sysbench.build = boom
+data = clickhouse.build()
+site = decode_envelope(json.loads((SITE_DATA_DIR / 'clickhouse.json').read_text()))
+print(json.loads(json.dumps(data['speedup'])) == site['speedup'], len(data['speedup']['instances']))" 2>&1)
+[ "$out" = "True 54" ] && ok "build_speedup은 site/data/sysbench.json 봉투를 읽음(재파싱 없음), 결과 = site/data/clickhouse.json" || no "speedup: $out"
+out=$(cd "$BASE/scripts/dashboard" && python3 -c "
+import sys
+import build_data as b
+order = []
+b.build_benchmark = lambda name, *a: order.append(name)
+for f in ('health', 'hardware'):
+    setattr(getattr(b, f), 'main', lambda *a: None)
+b.write_instances_json = b.build_derived = b.write_manifest = lambda *a, **k: None
+sys.argv = ['build_data.py', 'clickhouse', 'kafka', 'sysbench', 'iperf3']
+b.main()
+print(order)" 2>&1 | tail -1)
+[ "$out" = "['sysbench', 'iperf3', 'kafka', 'clickhouse']" ] && ok "build_data.py 대상은 인자 순서와 무관하게 BENCHMARKS 순(sysbench/iperf3 봉투가 먼저)" || no "빌드 순서: $out"
+
 echo ""
 echo "결과: PASS=$PASS FAIL=$FAIL"
 [ "$FAIL" -eq 0 ]
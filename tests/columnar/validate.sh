@@ -0,0 +1,125 @@
+#!/bin/bash
+# 컬럼 지향 인코딩(scripts/dashboard/columnar.py, build_data.py --compact) 검증 게이트.
+# decode_table(encode_table(x)) == x를 site/data의 모든 봉투와 합성 테이블(null/중첩/결측 경로)에서 보고,
+# 브라우저 디코더(site/js/shared.js decodeTable)가 같은 결과를 내는지, --compact 빌드가 validate.py를 통과하는지 본다.
+# --compact 빌드는 $TMP의 작업 트리(scripts/site 복사, 나머지는 심볼릭 링크)에서만 돈다 — site/data는 건드리지 않음.
+set -uo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+BASE="$(cd "$SCRIPT_DIR/../.." && pwd)"
+DASH="$BASE/scripts/dashboard"
+TMP=$(mktemp -d)
+trap 'rm -rf "$TMP"' EXIT
+PASS=0; FAIL=0
+ok(){ echo "  ✓ $1"; PASS=$((PASS+1)); }
+no(){ echo "  ✗ $1"; FAIL=$((FAIL+1)); }
+py(){ (cd "$DASH" && python3 -c "$1" 2>&1); }
+
+# 합성 테이블: null 일부/전부, 중첩 dict, 행마다 다른 경로, '.'이 든 키, 빈 dict, bool/리스트(any),
+# enum 문자열, 같은 경로가 어떤 행에선 leaf이고 다른 행에선 dict — 비트맵이 1바이트를 넘도록 11행 + 빈 행
+py "
+import json
+rows = {}
+for i in range(11):
+    r = {'score': i * 1.5 if i % 3 else None, 'none': None, 'arch': ['intel', 'amd', 'graviton'][i % 3],
+         'name.with.dots': f'n{i}', 'nested': {'a': {'b': i, 'c': None if i % 2 else 'x'}, 'list': [i, None]},
+         'flag': i % 2 == 0}
+    if i % 4 == 0:
+        r['sparse'] = {'only': i}
+    if i == 5:
+        r['nested']['a'] = {}
+        r['mixed'] = 1
+    if i == 6:
+        r['mixed'] = {'deep': None}
+    rows[f'm{i}.xlarge'] = r
+rows['empty.xlarge'] = {}
+json.dump({'synthetic': rows}, open('$TMP/synthetic.json', 'w'))
+" >/dev/null
+
+echo "== Task 1: Python 왕복 =="
+out=$(py "
+import json
+from pathlib import Path
+from columnar import decode_envelope, decode_table, encode_envelope, encode_table, is_table
+from common import SITE_DATA_DIR
+tables, bad, n = {}, [], 0
+for p in sorted(SITE_DATA_DIR.glob('*.json')):
+    data = json.loads(p.read_text())
+    inst = data if p.name == 'instances.json' else data.get('instances')
+    if not isinstance(inst, dict) or not inst or not all(isinstance(v, dict) for v in inst.values()):
+        continue
+    n += 1
+    table = json.loads(json.dumps(encode_table(inst)))
+    tables[p.name] = table
+    if decode_table(table) != inst or (p.name != 'instances.json' and decode_envelope(json.loads(json.dumps(encode_envelope(data)))) != data):
+        bad.append(p.name)
+print(n, bad)
+syn = json.loads(Path('$TMP/synthetic.json').read_text())['synthetic']
+t = json.loads(json.dumps(encode_table(syn)))
+tables['synthetic'] = t
+cols = {tuple(c['k']): c for c in t['columns']}
+all_null = {'a': {'x': None, 'y': 1}, 'b': {'x': None}}
+t2 = encode_table(all_null)
+print(decode_table(t) == syn, is_table(t), decode_table(t2) == all_null, t2['columns'][0]['n'], cols[('arch',)]['t'],
+      cols[('flag',)]['t'], 'p' in cols[('sparse', 'only')], ('name.with.dots',) in cols)
+json.dump(tables, open('$TMP/tables.json', 'w'))
+json.dump({k: decode_table(v) for k, v in tables.items()}, open('$TMP/py.json', 'w'))")
+n=$(sed -n 1p <<<"$out" | cut -d' ' -f1)
+[ "$(sed -n 1p <<<"$out" | cut -d' ' -f2-)" = "[]" ] && [ "${n:-0}" -ge 10 ] \
+  && ok "site/data 봉투 ${n}개(instances.json 포함): decode(encode(x)) == x, 최상위 키 보존" || no "봉투: $out"
+[ "$(sed -n 2p <<<"$out")" = "True True True * enum any True True" ] \
+  && ok "합성: null 일부/전부(n='*'), 중첩·결측 경로(p 비트맵), '.' 키, 빈 dict, leaf/dict 혼재, enum/any" || no "합성: $out"
+
+echo "== Task 2: 브라우저 디코더(site/js/shared.js decodeTable) =="
+if command -v node >/dev/null; then
+  cp "$BASE/site/js/shared.js" "$TMP/shared.mjs"
+  node --input-type=module -e "
+import { readFileSync, writeFileSync } from 'node:fs';
+const { decodeTable } = await import('$TMP/shared.mjs');
+const tables = JSON.parse(readFileSync('$TMP/tables.json', 'utf8'));
+const out = Object.fromEntries(Object.entries(tables).map(([k, t]) => [k, decodeTable(t)]));
+writeFileSync('$TMP/js.json', JSON.stringify(out));
+const raw = { index: ['x'] };
+if (decodeTable(raw) !== raw) throw new Error('비-테이블은 그대로 반환해야 함');
+" 2>&1 | head -5
+  out=$(py "
+import json
+js, pyd = json.load(open('$TMP/js.json')), json.load(open('$TMP/py.json'))
+print(sorted(k for k in pyd if js.get(k) != pyd[k]), len(js) == len(pyd))")
+  [ "$out" = "[] True" ] && ok "decodeTable 결과 = Python decode_table (봉투 전부 + 합성), 비-테이블은 통과" || no "JS 디코더: $out"
+else
+  echo "  - node 없음: 건너뜀"
+fi
+
+echo "== Task 3: --compact 빌드가 validate.py 통과 =="
+W="$TMP/tree"
+mkdir -p "$W"
+for e in "$BASE"/*; do
+  case "$(basename "$e")" in scripts|site) cp -r "$e" "$W/" ;; *) ln -s "$e" "$W/" ;; esac
+done
+(cd "$W/scripts/dashboard" && python3 build_data.py --compact >/dev/null 2>"$TMP/build.err") \
+  && ok "build_data.py --compact 성공" || no "빌드: $(tail -3 "$TMP/build.err")"
+out=$(cd "$W/scripts/dashboard" && python3 validate.py 2>&1); code=$?
+[ "$code" -eq 0 ] && [ "$(grep -c '^  OK' <<<"$out")" -eq 9 ] && ok "validate.py: 9개 벤치마크 OK(종료 0)" || no "validate: $(grep -v '^  OK' <<<"$out" | head -5)"
+out=$(py "
+import json
+from pathlib import Path
+from columnar import decode_envelope, decode_table, is_table
+from common import SITE_DATA_DIR
+W = Path('$W/site/data')
+names = [p.name for p in sorted(SITE_DATA_DIR.glob('*.json')) if not p.name.startswith('_')]
+diff, row_oriented, size = [], [], [0, 0]
+for name in names:
+    raw = (W / name).read_text()
+    c, r = json.loads(raw), json.loads((SITE_DATA_DIR / name).read_text())
+    if not is_table(c if name == 'instances.json' else c.get('instances')):
+        row_oriented.append(name)
+    if (decode_table(c) if name == 'instances.json' else decode_envelope(c)) != r:
+        diff.append(name)
+    size[0] += len(raw); size[1] += len((SITE_DATA_DIR / name).read_text())
+print(row_oriented, diff, size[0] < size[1])")
+[ "$out" = "[] [] True" ] && ok "compact 봉투는 모두 columnar-v1이고 디코드하면 site/data(행 지향)와 같음, 크기 감소" || no "compact 산출물: $out"
+
+echo ""
+echo "결과: PASS=$PASS FAIL=$FAIL"
+[ "$FAIL" -eq 0 ]
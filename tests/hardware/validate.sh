@@ -0,0 +1,59 @@
+#!/bin/bash
+# 하드웨어 지문 인덱스(scripts/dashboard/hardware.py)의 모델별 하위 결과(sub_results) 검증 게이트.
+# 하위 결과가 파서 집계와 같은 로그 집합(health.usable_logs — failed 제외, RUN_DIR_ALIASES 디렉터리)을 쓰는지
+# $TMP의 픽스처 results/로 보고, 실제 _hardware.json의 by_model을 다시 계산해 대조한다. site/data는 읽기만.
+set -uo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+BASE="$(cd "$SCRIPT_DIR/../.." && pwd)"
+DASH="$BASE/scripts/dashboard"
+TMP=$(mktemp -d)
+trap 'rm -rf "$TMP"' EXIT
+PASS=0; FAIL=0
+ok(){ echo "  ✓ $1"; PASS=$((PASS+1)); }
+no(){ echo "  ✗ $1"; FAIL=$((FAIL+1)); }
+py(){ (cd "$DASH" && python3 -c "$1" 2>&1); }
+
+echo "== Task 1: failed run 제외 / 디렉터리 별칭 (픽스처) =="
+# 실제 c5.xlarge redis run1/run2를 복사 — run3은 run1에서 헤드라인("SET" 행)만 뺀 로그: failed지만 GET 값은 뽑힘
+for d in c5.xlarge x.flex.xlarge; do
+  mkdir -p "$TMP/results/redis/$d"
+  cp "$BASE/results/redis/c5.xlarge/run1.log" "$BASE/results/redis/c5.xlarge/run2.log" "$TMP/results/redis/$d/"
+  grep -v '^"SET",' "$BASE/results/redis/c5.xlarge/run1.log" > "$TMP/results/redis/$d/run3.log"
+done
+out=$(py "
+from pathlib import Path
+import common, hardware, health
+from parsers import redis
+common.RESULTS_DIR = Path('$TMP/results')
+common.RUN_DIR_ALIASES[('redis', 'x-flex.xlarge')] = 'x.flex.xlarge'
+hardware.SUB_RESULTS = {k: v for k, v in hardware.SUB_RESULTS.items() if k == 'redis.get_rps'}
+d = common.RESULTS_DIR / 'redis' / 'c5.xlarge'
+print(health.run_status('redis', d / 'run3.log')['status'], redis.parse_log(d / 'run3.log')['get_rps'] is not None)
+v1, v2 = (redis.parse_log(d / f'run{i}.log')['get_rps'] for i in (1, 2))
+models = {('redis', 'run1.log'): 'A', ('redis', 'run2.log'): 'B', ('redis', 'run3.log'): 'B'}
+for name in ('c5.xlarge', 'x-flex.xlarge'):
+    got = hardware.sub_results(name, models)
+    print(got == {'A': {'redis.get_rps': v1}, 'B': {'redis.get_rps': v2}}, got)")
+[ "$(sed -n 1p <<<"$out")" = "failed True" ] && [ "$(sed -n 2p <<<"$out" | cut -d' ' -f1)" = "True" ] \
+  && ok "failed run(run3 — 값은 뽑히지만 헤드라인 없음)은 모델별 평균에서 제외" || no "failed 제외: $out"
+[ "$(sed -n 3p <<<"$out" | cut -d' ' -f1)" = "True" ] && ok "RUN_DIR_ALIASES 디렉터리(x-flex -> x.flex)에서도 같은 결과" || no "별칭: $out"
+
+echo "== Task 2: 실제 _hardware.json by_model =="
+out=$(py "
+import json
+import hardware
+from common import SITE_DATA_DIR
+d = json.loads((SITE_DATA_DIR / '_hardware.json').read_text())
+index = hardware.build_index()
+bad = []
+for name in d['heterogeneous']:
+    models = {(r['bench'], r['file']): r['cpu_model'] for r in index[name]}
+    if hardware.sub_results(name, models) != d['instances'][name]['by_model']:
+        bad.append(name)
+print(len(d['heterogeneous']), bad)")
+[ "$(cut -d' ' -f2- <<<"$out")" = "[]" ] && ok "이질 인스턴스 $(cut -d' ' -f1 <<<"$out")개: by_model = 다시 계산한 값" || no "by_model: $out"
+
+echo ""
+echo "결과: PASS=$PASS FAIL=$FAIL"
+[ "$FAIL" -eq 0 ]
@@ -0,0 +1,84 @@
+#!/bin/bash
+# run 건강도 분류기(scripts/dashboard/health.py) 검증 게이트.
+# HEADLINE_MARKERS의 (벤치마크, 접두어)마다 실제 ok 로그(c5.xlarge)에서 ok/partial/failed 픽스처를 만들어
+# classify() 판정과 usable_logs()가 failed만 빼는지 본다. 픽스처는 $TMP(저장소 밖 — 캐시를 타지 않음)에만 쓴다.
+set -uo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+BASE="$(cd "$SCRIPT_DIR/../.." && pwd)"
+DASH="$BASE/scripts/dashboard"
+TMP=$(mktemp -d)
+trap 'rm -rf "$TMP"' EXIT
+PASS=0; FAIL=0
+ok(){ echo "  ✓ $1"; PASS=$((PASS+1)); }
+no(){ echo "  ✗ $1"; FAIL=$((FAIL+1)); }
+py(){ (cd "$DASH" && python3 -c "$1" 2>&1); }
+
+echo "== Task 1: 벤치마크별 ok/partial/failed 픽스처 =="
+out=$(py "
+import re
+from pathlib import Path
+import health
+from common import instance_run_logs
+tmp = Path('$TMP')
+for (bench, prefix), marker in health.HEADLINE_MARKERS.items():
+    base = next((lp for lp in instance_run_logs(bench, 'c5.xlarge') if lp.name.startswith(prefix or '')
+                 and health.headline_marker(bench, lp.name) == marker and health.classify(bench, lp)['status'] == 'ok'), None)
+    if base is None:
+        continue
+    text = base.read_text(errors='replace')
+    cases = {
+        'ok': text,
+        'error': text + '\nERROR: injected failure\n',
+        'truncated': health.FOOTER.sub('', text),
+        'nomarker': text[:re.search(marker, text, re.M).start()],
+        'empty': '',
+    }
+    paths = []
+    for case, body in cases.items():
+        p = tmp / bench / case / base.name
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(body)
+        paths.append(p)
+    got = [health.classify(bench, p)['status'] for p in paths]
+    usable = [p.parent.name for p in health.usable_logs(bench, paths)]
+    print(f'{bench}:{prefix or \"-\"}', *got, ','.join(usable))")
+n=$(grep -c . <<<"$out")
+bad=$(awk '$2" "$3" "$4" "$5" "$6 != "ok partial partial failed failed"' <<<"$out")
+[ "$n" -eq 16 ] && ok "HEADLINE_MARKERS 중 규칙 밖 파일명(springboot 기본)을 뺀 16개 모두 실제 ok 로그로 픽스처 생성" || no "픽스처 $n개: $out"
+[ -z "$bad" ] && ok "원본 ok / ERROR 줄·푸터 누락 partial / 헤드라인 마커 없음·빈 로그 failed" || no "판정: $bad"
+bad=$(awk '$7 != "ok,error,truncated"' <<<"$out")
+[ -z "$bad" ] && ok "usable_logs: failed만 빠지고 partial은 유지(16개 모두)" || no "usable_logs: $bad"
+
+echo "== Task 2: 세부 사유 =="
+{ printf -- "--- TCP Bandwidth (Single Stream, 30s) ---\n"
+  printf "[  5]   0.00-30.00  sec  1.00 GBytes  1.00 Gbits/sec  sender\n"
+  printf -- "--- UDP Test ---\niperf3: error - control socket has closed unexpectedly\nSKIPPED\n===== iperf3 Complete =====\n"; } > "$TMP/iperf.log"
+printf "q%d,1,2,3\n" $(seq 1 40) > "$TMP/set1.log"; echo "===== ClickHouse Complete =====" >> "$TMP/set1.log"
+out=$(py "
+from pathlib import Path
+import health
+r = health.classify('iperf3', Path('$TMP/iperf.log'))
+print(r['status'], r['error_sections'], r['reasons'][-1])
+r = health.classify('clickhouse', Path('$TMP/set1.log'))
+print(r['status'], r['reasons'])
+print(health.classify('elasticsearch', Path('$TMP/iperf.log').rename(Path('$TMP/rally1.log')))['reasons'])")
+[ "$(sed -n 1p <<<"$out")" = "partial ['UDP Test'] 1 FAILED/SKIPPED sentinel(s)" ] && ok "오류 시그니처는 가장 가까운 섹션 헤더로 기록, SKIPPED 센티널" || no "iperf3 사유: $out"
+[ "$(sed -n 2p <<<"$out")" = "partial ['clickhouse queries 40/43']" ] && ok "clickhouse 측정 쿼리 40/43 -> partial" || no "clickhouse: $out"
+[ "$(sed -n 3p <<<"$out")" = "['headline metric missing']" ] && ok "파일명 접두어(rally)로 벤치마크 내 마커 선택" || no "접두어: $out"
+
+echo "== Task 3: 실제 결과의 알려진 failed/partial run =="
+out=$(py "
+import health
+from common import RESULTS_DIR, instance_run_logs
+for bench, inst, fn in [('nginx', 'c8i.xlarge', 'run3.log'), ('passmark', 'c6gd.xlarge', 'run1.log'),
+                        ('elasticsearch', 'm5a.xlarge', 'coldstart1.log'), ('iperf3', 'c5.xlarge', 'run2.log')]:
+    logs = instance_run_logs(bench, inst)
+    st = health.run_status(bench, RESULTS_DIR / bench / inst / fn)['status']
+    print(st, fn in [p.name for p in health.usable_logs(bench, logs)], len(health.usable_logs(bench, logs)) < len(logs))")
+[ "$out" = $'failed False True\nfailed False True\nfailed False True\npartial True False' ] \
+  && ok "nginx c8i run3 / passmark c6gd run1 / ES m5a coldstart1은 제외, iperf3 c5 run2(partial)는 유지" || no "실제 run: $out"
+
+echo ""
+echo "결과: PASS=$PASS FAIL=$FAIL"
+[ "$FAIL" -eq 0 ]
@@ -0,0 +1,71 @@
+#!/bin/bash
+# 스냅샷 이력/회귀 검정(scripts/dashboard/history.py) 검증 게이트.
+# 합성 스냅샷 2개(알려진 이동 1쌍 + 잡음만 있는 쌍들)로 검정/방향/종료 코드 확인.
+set -uo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+BASE="$(cd "$SCRIPT_DIR/../.." && pwd)"
+HIST="$BASE/scripts/dashboard/history.py"
+TMP=$(mktemp -d)
+trap 'rm -rf "$TMP"' EXIT
+PASS=0; FAIL=0
+ok(){ echo "  ✓ $1"; PASS=$((PASS+1)); }
+no(){ echo "  ✗ $1"; FAIL=$((FAIL+1)); }
+
+echo "== Task 1: 통계 함수 =="
+out=$(cd "$BASE/scripts/dashboard" && python3 -c "
+import history as h
+print(round(h.betainc(2, 0.5, 4 / (4 + 2.776 ** 2)), 3))            # t=2.776, df=4 -> p=0.05
+print(round(h.mann_whitney([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])[0], 4)) # 정확 분포 2/252
+print(h.welch([1, 2, 3], [1, 2, 3])[0], h.mann_whitney([1, 2, 3], [1, 2, 3])[0])
+print([round(q, 4) for q in h.bh([0.01, 0.04, 0.03, 0.5])])
+" 2>&1)
+[ "$(sed -n 1p <<<"$out")" = "0.05" ] && ok "Welch p(t=2.776, df=4) = 0.05" || no "betainc: $out"
+[ "$(sed -n 2p <<<"$out")" = "0.0079" ] && ok "MWU 5 vs 5 완전 분리 p = 2/252" || no "MWU: $out"
+[ "$(sed -n 3p <<<"$out")" = "1.0 1.0" ] && ok "같은 표본 p = 1" || no "같은 표본: $out"
+[ "$(sed -n 4p <<<"$out")" = "[0.04, 0.0533, 0.0533, 0.5]" ] && ok "Benjamini-Hochberg q" || no "BH: $out"
+
+echo "== Task 2: diff — 회귀/개선 탐지 =="
+python3 - "$TMP" <<'PY'
+import json, random, sys
+random.seed(7)
+tmp = sys.argv[1]
+def snap(shift, n=5):
+    runs = {"nginx": {}, "elasticsearch-coldstart": {}}
+    for i in range(40):
+        inst = f"x{i}.xlarge"
+        s = shift.get(("nginx", inst), 0)
+        runs["nginx"][inst] = [round(10000 * (1 + s) * random.gauss(1, 0.01), 2) for _ in range(n)]
+        s = shift.get(("elasticsearch-coldstart", inst), 0)
+        runs["elasticsearch-coldstart"][inst] = [round(900 * (1 + s) * random.gauss(1, 0.01), 2) for _ in range(n)]
+    return {"version": 1, "created": "2026-01-01T00:00:00", "label": None, "commit": None,
+            "campaign": {"nginx": None, "elasticsearch-coldstart": None},
+            "metrics": {"nginx": {"label": "req/s", "direction": "max"},
+                        "elasticsearch-coldstart": {"label": "ms", "direction": "min"}},
+            "runs": runs}
+json.dump(snap({}), open(f"{tmp}/a.json", "w"))
+json.dump(snap({("nginx", "x3.xlarge"): -0.05, ("elasticsearch-coldstart", "x7.xlarge"): -0.08,
+                ("nginx", "x9.xlarge"): 0.01}), open(f"{tmp}/b.json", "w"))
+json.dump(snap({}, 12), open(f"{tmp}/a12.json", "w"))
+json.dump(snap({("nginx", "x3.xlarge"): -0.05, ("elasticsearch-coldstart", "x7.xlarge"): -0.08}, 12),
+          open(f"{tmp}/b12.json", "w"))
+PY
+python3 "$HIST" diff "$TMP/a.json" "$TMP/b.json" --json > "$TMP/d.json"; rc=$?
+flags=$(python3 -c "import json;print(sorted((r['flag'],r['metric'],r['instance']) for r in json.load(open('$TMP/d.json'))['rows'] if r['flag']))")
+[ "$flags" = "[('improvement', 'elasticsearch-coldstart', 'x7.xlarge'), ('regression', 'nginx', 'x3.xlarge')]" ] \
+  && ok "nginx -5% = regression, coldstart -8% = improvement(direction=min), 잡음/1% 이동은 미표시" || no "표시: $flags"
+[ "$rc" -eq 1 ] && ok "회귀가 있으면 종료 코드 1" || no "종료 코드 $rc"
+flags=$(python3 "$HIST" diff "$TMP/a12.json" "$TMP/b12.json" --test mwu --json | python3 -c "import json,sys;print(sorted(r['instance'] for r in json.load(sys.stdin)['rows'] if r['flag']))")
+[ "$flags" = "['x3.xlarge', 'x7.xlarge']" ] && ok "Mann-Whitney(12 run)도 같은 2건" || no "mwu 표시: $flags"
+python3 "$HIST" diff "$TMP/a.json" "$TMP/a.json" >/dev/null && ok "같은 스냅샷 -> 종료 코드 0" || no "같은 스냅샷이 회귀"
+
+echo "== Task 3: 현재 results/ 스냅샷 =="
+n=$(cd "$BASE/scripts/dashboard" && python3 -c "
+import history
+s = history.snapshot()
+print(len(s['runs']), len(s['runs']['sysbench-cpu']), s['campaign']['redis']['first'])" 2>&1)
+[ "$n" = "16 54 2026-01-21" ] && ok "지표 16개, sysbench-cpu 54개 인스턴스, redis Date: 헤더 2026-01-21" || no "스냅샷: $n"
+
+echo ""
+echo "결과: PASS=$PASS FAIL=$FAIL"
+[ "$FAIL" -eq 0 ]
@@ -101,7 +101,8 @@ grep -q "kafka-log-dirs.sh" "$f" && ok "압축률 계산용 kafka-log-dirs.sh 
 echo "== Task 3c: 포화(max) 실행 스크립트 =="
 sm="$BASE/scripts/generate-kafka-max-benchmark.sh"
 bash -n "$sm" 2>/dev/null && ok "bash -n" || no "bash -n"
-grep -q '| sed ' "$sm" && ok "chained-pipe sed 사용" || no "chained-pipe sed"
+grep -q 'campaign/render.py' "$sm" && ok "템플릿 렌더 = campaign/render.py" || no "render.py 렌더 누락"
+grep -vE '^\s*#' "$sm" | grep -qE 'sed +(-e +)?"s/' && no "sed \"s/...\" 치환 파이프라인 잔류" || ok "sed 치환 파이프라인 없음"
 grep -qE '^\s*sed -e .*-e ' "$sm" && no "multi -e sed 사용 (금지 패턴)" || ok "multi -e sed 없음"
 grep -q "results/kafka-max" "$sm" && ok "결과 디렉터리 분리 (results/kafka-max)" || no "결과 디렉터리"
 grep -q 'kubectl(){ command kubectl --context mall-apne2-mgmt' "$sm" && ok "kubectl context 고정 (공유 kubeconfig 대비)" || no "kubectl context 고정 누락"
@@ -132,7 +133,8 @@ grep -q "DEPLETION_DURATION_S" "$fr" && ok "버스트크레딧 고갈 단계 존
 echo "== Task 3e: 램프업 실행 스크립트 =="
 srp="$BASE/scripts/generate-kafka-ramp-benchmark.sh"
 bash -n "$srp" 2>/dev/null && ok "bash -n" || no "bash -n"
-grep -q '| sed ' "$srp" && ok "chained-pipe sed 사용" || no "chained-pipe sed"
+grep -q 'campaign/render.py' "$srp" && ok "템플릿 렌더 = campaign/render.py" || no "render.py 렌더 누락"
+grep -vE '^\s*#' "$srp" | grep -qE 'sed +(-e +)?"s/' && no "sed \"s/...\" 치환 파이프라인 잔류" || ok "sed 치환 파이프라인 없음"
 grep -qE '^\s*sed -e .*-e ' "$srp" && no "multi -e sed 사용 (금지 패턴)" || ok "multi -e sed 없음"
 grep -q "results/kafka-ramp" "$srp" && ok "결과 디렉터리 분리 (results/kafka-ramp)" || no "결과 디렉터리"
 grep -q 'kubectl(){ command kubectl --context mall-apne2-mgmt' "$srp" && ok "kubectl context 고정" || no "kubectl context 고정 누락"
@@ -164,6 +166,37 @@ class P(html.parser.HTMLParser):
     pass
 P().feed(open('$h').read())" 2>/dev/null && ok "HTML 파싱" || no "HTML 파싱"
 
+echo "== Task 6: codec 효율 분류/추천 사유 (scripts/dashboard/parsers/kafka.py) =="
+out=$(cd "$BASE/scripts/dashboard" && python3 -c "
+from parsers.kafka import codec_efficiency as ce
+mb = lambda **kw: {c: {'produce_mb_per_sec': v} for c, v in kw.items()}
+for args in [(mb(uncompressed=100), 10), (mb(uncompressed=100), 0.5),
+             (mb(uncompressed=100, lz4=98.9, zstd=38.3), 10), (mb(uncompressed=100, lz4=101, zstd=99), 10),
+             (mb(uncompressed=100, lz4=120, zstd=40), 10), (mb(uncompressed=100, lz4=80, zstd=90), 10)]:
+    r = ce(args[0], 1.0, args[1])
+    print(r['bound'], '|', r['recommendation']['reason'])
+print(ce(mb(lz4=100), 1.0, 10))" 2>&1)
+chk(){ [ "$(sed -n "$1p" <<<"$out")" = "$2" ] && ok "$3" || no "$3: $(sed -n "$1p" <<<"$out")"; }
+chk 1 "balanced | 비교할 압축 codec 없음(uncompressed만 측정)" "uncompressed만 있으면 ±2% 문구 대신 '비교할 압축 codec 없음'"
+chk 2 "network | 네트워크 포화 — 비교할 압축 codec 없음" "네트워크 포화 + 압축 codec 없음 -> 추천 codec None 문구 없음"
+chk 3 "balanced | 균형 — lz4가 uncompressed와 ±2% 이내(-1.1%), zstd -61.7%" "최고 codec만 ±2% 이내면 다른 codec의 실제 편차 보고"
+chk 4 "balanced | 균형 — codec 간 처리량 차이가 ±2% 이내" "모든 압축 codec이 ±2% 이내일 때만 ±2% 문구"
+chk 5 "network | 네트워크 바운드 — 압축으로 전송량을 줄이는 쪽이 유리(lz4 최고 처리량)" "압축 이득 > 2% -> 네트워크 바운드"
+chk 6 "cpu | CPU 바운드 — 압축 시 처리량 감소, 압축이 필요하면 zstd" "압축 시 감소 -> CPU 바운드(zstd >= lz4×0.9면 zstd)"
+chk 7 "None" "uncompressed 결측 -> None"
+out=$(cd "$BASE/scripts/dashboard" && python3 -c "
+import json
+from columnar import decode_envelope
+from common import SITE_DATA_DIR
+from parsers import iperf3, kafka
+def boom():
+    raise AssertionError('iperf3 재파싱')
+iperf3.build = boom
+got = {n: e.get('codec_efficiency') for n, e in kafka.build()['instances'].items()}
+site = decode_envelope(json.loads((SITE_DATA_DIR / 'kafka.json').read_text()))['instances']
+print(got == {n: e.get('codec_efficiency') for n, e in site.items()})" 2>&1)
+[ "$out" = "True" ] && ok "iperf3 대역폭은 site/data/iperf3.json 봉투에서(재파싱 없음), 결과 = site/data/kafka.json" || no "iperf3 봉투: $out"
+
 echo ""
 echo "결과: PASS=$PASS FAIL=$FAIL"
 [ "$FAIL" -eq 0 ]
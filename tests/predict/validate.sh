@@ -0,0 +1,81 @@
+#!/bin/bash
+# 결측 지표 예측(scripts/dashboard/predict.py) 검증 게이트.
+# 합성 선형 데이터로 _solve/Ridge(닫힌 꼴 LOO = 하나씩 빼고 다시 적합한 LOO, λ=0에서 정확)를, 실제 _predicted.json으로
+# 예측 구간 불변식을, rank CLI의 종료 코드를 본다. site/data를 다시 쓰지 않는다(build()만 메모리에서 호출).
+set -uo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+BASE="$(cd "$SCRIPT_DIR/../.." && pwd)"
+DASH="$BASE/scripts/dashboard"
+PASS=0; FAIL=0
+ok(){ echo "  ✓ $1"; PASS=$((PASS+1)); }
+no(){ echo "  ✗ $1"; FAIL=$((FAIL+1)); }
+py(){ (cd "$DASH" && python3 -c "$1" 2>&1); }
+
+echo "== Task 1: _solve / Ridge (합성 선형 데이터) =="
+out=$(py "
+import random
+import predict
+from predict import Ridge, _solve
+a = [[4.0, 1.0, 2.0], [1.0, 5.0, -1.0], [2.0, -1.0, 6.0]]
+x = [[1.0, -2.0], [0.5, 3.0], [-1.5, 0.25]]
+b = [[sum(a[i][k] * x[k][j] for k in range(3)) for j in range(2)] for i in range(3)]
+got = _solve(a, b)
+print(max(abs(got[i][j] - x[i][j]) for i in range(3) for j in range(2)) < 1e-9)
+try:
+    _solve([[1.0, 2.0], [2.0, 4.0]], [[1.0], [2.0]])
+    print('no error')
+except ValueError:
+    print('singular ok')
+rnd = random.Random(7)
+rows = [[rnd.uniform(0, 3), rnd.uniform(-1, 1), float(rnd.random() < 0.4)] for _ in range(30)]
+f = lambda r: 2.0 + 1.5 * r[0] - 0.7 * r[1] + 0.3 * r[2]
+ys = [f(r) + rnd.gauss(0, 0.05) for r in rows]
+m = Ridge(rows, ys, 0.0)
+slopes = [c / s for c, s in zip(m.coef, m.sd)]
+print(all(abs(g - w) < 0.05 for g, w in zip(slopes, [1.5, -0.7, 0.3])), abs(m.predict([1.0, 0.5, 1.0])[0] - f([1.0, 0.5, 1.0])) < 0.05)
+brute = []
+for i in range(len(rows)):
+    sub = Ridge(rows[:i] + rows[i + 1:], ys[:i] + ys[i + 1:], 0.0)
+    brute.append(ys[i] - sub.predict(rows[i])[0])
+print(max(abs(c - b) for c, b in zip(m.loo, brute)) < 1e-6)
+rms = lambda e: (sum(x * x for x in e) / len(e)) ** 0.5
+drift = []
+for lam in [l for l in predict.LAMBDAS if l > 0]:
+    brute = [ys[i] - Ridge(rows[:i] + rows[i + 1:], ys[:i] + ys[i + 1:], lam).predict(rows[i])[0] for i in range(len(rows))]
+    drift.append(abs(rms(Ridge(rows, ys, lam).loo) / rms(brute) - 1) < 0.02)
+print(all(drift))
+big = Ridge(rows, ys, 3.0)
+print(sum(c * c for c in big.coef) < sum(c * c for c in m.coef), all(0 < big.predict(r)[1] < 1 for r in rows))")
+[ "$(sed -n 1p <<<"$out")" = "True" ] && ok "_solve: 3×3, 우변 2열 해 복원" || no "_solve: $out"
+[ "$(sed -n 2p <<<"$out")" = "singular ok" ] && ok "_solve: 특이 행렬은 ValueError" || no "특이 행렬: $out"
+[ "$(sed -n 3p <<<"$out")" = "True True" ] && ok "Ridge(λ=0): 원 공간 기울기·예측이 생성식과 일치" || no "Ridge 계수: $out"
+[ "$(sed -n 4p <<<"$out")" = "True" ] && ok "닫힌 꼴 LOO 잔차 e_i/(1-h_ii) = 하나씩 빼고 다시 적합한 LOO (30점)" || no "LOO: $out"
+[ "$(sed -n 5p <<<"$out")" = "True" ] && ok "λ>0: 닫힌 꼴 LOO RMS가 재적합 LOO RMS와 2% 이내(표준화를 고정하는 근사)" || no "λ>0 LOO: $out"
+[ "$(sed -n 6p <<<"$out")" = "True True" ] && ok "λ>0: 계수 수축, 0 < h < 1" || no "λ: $out"
+
+echo "== Task 2: _predicted.json =="
+out=$(py "
+import json
+from common import SITE_DATA_DIR
+import predict
+d = json.loads((SITE_DATA_DIR / '_predicted.json').read_text())
+preds = [(t, n, p) for t, m in d['models'].items() for n, p in m['predictions'].items()]
+bad = [(t, n) for t, n, p in preds if p.get('predicted') is not True or not p['lo'] <= p['value'] <= p['hi']]
+print(len(preds) > 0, bad)
+print(d['gaps'] == sorted({n for _, n, _ in preds}), all(m['lambda'] in predict.LAMBDAS and m['n_train'] >= predict.MIN_TRAIN for m in d['models'].values()))
+print(predict.build() == d)")
+[ "$(sed -n 1p <<<"$out")" = "True []" ] && ok "모든 gap 예측: predicted=true, lo <= value <= hi" || no "예측 구간: $out"
+[ "$(sed -n 2p <<<"$out")" = "True True" ] && ok "gaps = 예측 인스턴스 합집합, λ ∈ LAMBDAS, n_train >= MIN_TRAIN" || no "모델 메타: $out"
+[ "$(sed -n 3p <<<"$out")" = "True" ] && ok "_predicted.json = 현재 봉투로 다시 계산한 build()" || no "오래된 _predicted.json: $out"
+
+echo "== Task 3: rank CLI =="
+out=$(cd "$DASH" && python3 predict.py rank zz9.xlarge 2>&1); code=$?
+[ "$code" != "0" ] && grep -q "usable 로그가 없음" <<<"$out" && ok "rank: 로그 없는 인스턴스는 안내 후 non-zero 종료" || no "rank 미지 인스턴스: $code $out"
+out=$(cd "$DASH" && python3 predict.py rank c7g.xlarge 2>&1); code=$?
+[ "$code" = "0" ] && [ "$(grep -c "순위 " <<<"$out")" = "6" ] && ok "rank: 측정된 인스턴스는 MODELS 6개 지표 추정 + 순위" || no "rank c7g: $code $out"
+(cd "$DASH" && python3 predict.py bogus >/dev/null 2>&1) && no "잘못된 인자가 exit 0" || ok "잘못된 인자는 사용법과 함께 non-zero"
+
+echo ""
+echo "결과: PASS=$PASS FAIL=$FAIL"
+[ "$FAIL" -eq 0 ]
@@ -0,0 +1,144 @@
+#!/bin/bash
+# 가격 엔진(scripts/dashboard/pricing.py)과 작업 단위당 비용(unit_cost.py) 검증 게이트.
+# 합성 가격표(리전 2개, SP, spot 이력, 중단 버킷)로 실효 가격/대체/파레토 확인 — site/data는 건드리지 않음.
+set -uo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+BASE="$(cd "$SCRIPT_DIR/../.." && pwd)"
+DASH="$BASE/scripts/dashboard"
+TMP=$(mktemp -d)
+trap 'rm -rf "$TMP"' EXIT
+PASS=0; FAIL=0
+ok(){ echo "  ✓ $1"; PASS=$((PASS+1)); }
+no(){ echo "  ✗ $1"; FAIL=$((FAIL+1)); }
+py(){ (cd "$DASH" && python3 -c "$1" 2>&1); }
+
+echo "== Task 1: canonical On-Demand 표 =="
+out=$(py "
+from common import PRICE
+print(len([n for n in PRICE if n.endswith('.xlarge')]), PRICE['c8g.xlarge'], PRICE['c8g.2xlarge'])")
+[ "$out" = "54 0.18 0.36" ] && ok "config/pricing/on-demand.csv 54개, 2xlarge = xlarge × 2" || no "PRICE: $out"
+dup=$(grep -l "^PRICE = {" "$BASE/scripts/generate-kafka-report.py" "$BASE/scripts/generate-clickhouse-report.py" 2>/dev/null)
+[ -z "$dup" ] && ok "리포트 스크립트의 중복 PRICE dict 제거" || no "중복 PRICE: $dup"
+
+echo "== Task 2: 실효 가격 =="
+P="$TMP/pricing"; mkdir -p "$P/spot"
+cat > "$P/on-demand.csv" <<'CSV'
+# 주석
+region,instance,usd_hour
+r1,a.xlarge,0.20
+r1,b.xlarge,0.10
+r1,c.xlarge,0.30
+r2,a.xlarge,0.40
+CSV
+printf "region,instance,term,usd_hour\nr1,a.xlarge,1y,0.14\n" > "$P/savings-plans.csv"
+printf "region,instance,bucket\nr1,b.xlarge,>20%%\n" > "$P/spot-interruption.csv"
+cat > "$P/spot/hist.json" <<'JSON'
+{"SpotPriceHistory": [
+ {"AvailabilityZone": "r1a", "InstanceType": "a.xlarge", "SpotPrice": "0.10", "Timestamp": "2026-01-01T00:00:00Z"},
+ {"AvailabilityZone": "r1a", "InstanceType": "a.xlarge", "SpotPrice": "0.04", "Timestamp": "2026-01-03T00:00:00Z"},
+ {"AvailabilityZone": "r1b", "InstanceType": "a.xlarge", "SpotPrice": "0.06", "Timestamp": "2026-01-01T00:00:00Z"},
+ {"AvailabilityZone": "r1a", "InstanceType": "b.xlarge", "SpotPrice": "0.03", "Timestamp": "2026-01-01T00:00:00Z"},
+ {"AvailabilityZone": "r1a", "InstanceType": "c.xlarge", "SpotPrice": "0.09", "Timestamp": "2026-01-05T00:00:00Z"}
+]}
+JSON
+(cd "$DASH" && python3 pricing.py import-spot "$P/spot/hist.json" --out "$P/spot/r1.csv" >/dev/null 2>&1) \
+  && [ "$(wc -l < "$P/spot/r1.csv")" -eq 6 ] && ok "import-spot: JSON 5행 -> CSV" || no "import-spot"
+rm "$P/spot/hist.json"
+out=$(py "
+from pathlib import Path
+import pricing as pr
+t = pr.load_tables(Path('$P'))
+print(round(t['spot'][('r1', 'a.xlarge')], 4))
+p, n = pr.effective_prices(t, ['a.xlarge', 'b.xlarge', 'c.xlarge', 'a.2xlarge'], 'r1', {'on_demand': 0.3, 'spot': 0.7})
+print(p['a.xlarge'], p['b.xlarge'], p['a.2xlarge'])
+print(n['b.xlarge'][0])
+print(n['a.2xlarge'][0])
+p, n = pr.effective_prices(t, ['a.xlarge', 'c.xlarge'], 'r1', {'sp1y': 1.0})
+print(p['a.xlarge'], p['c.xlarge'], n['c.xlarge'][0])
+try:
+    pr.effective_prices(t, ['b.xlarge'], 'r2')
+except ValueError as e:
+    print('ValueError')
+try:
+    pr.parse_mix('spot=0.7,on_demand=0.2')
+except ValueError as e:
+    print('ValueError')
+")
+# a.xlarge spot: r1a 1/1~1/3 0.10, 1/3~1/5 0.04 -> 0.07 (기준 시각 = 이력 마지막 1/5), r1b 0.06 -> 평균 0.065
+[ "$(sed -n 1p <<<"$out")" = "0.065" ] && ok "spot = AZ별 시간 가중 평균의 평균(0.065)" || no "spot: $out"
+[ "$(sed -n 2p <<<"$out")" = "0.1055 0.1 0.211" ] && ok "혼합 0.3·OD + 0.7·spot, 중단 >20%는 OD 대체, 2xlarge는 ×2 유도" || no "실효 가격: $out"
+sed -n 3p <<<"$out" | grep -q "spot 중단 >20%" && ok "대체 사유 기록" || no "대체 사유: $out"
+sed -n 4p <<<"$out" | grep -q "유도" && ok "유도 가격 표시" || no "유도: $out"
+[ "$(sed -n 5p <<<"$out")" = "0.14 0.3 sp1y 가격 없음 -> on_demand" ] && ok "SP 1y 적용, 없는 인스턴스는 OD" || no "SP: $out"
+[ "$(sed -n 6p <<<"$out")" = "ValueError" ] && ok "리전에 OD 가격이 없으면 에러" || no "리전 누락: $out"
+[ "$(sed -n 7p <<<"$out")" = "ValueError" ] && ok "비중 합 ≠ 1이면 에러" || no "mix 검증: $out"
+
+echo "== Task 3: 가성비/파레토 =="
+out=$(py "
+import pricing as pr
+names = ['a', 'b', 'c', 'd']
+print(pr.pareto(names, [100, 80, 120, 90], [0.2, 0.1, 0.3, 0.25], 'max'))
+print(pr.pareto(names, [10, 12, 9, 20], [0.2, 0.1, 0.3, 0.35], 'min'))
+s = pr.scores([100, None, 50], [0.2, 0.1, 0.1], 'max')
+print(s, pr.ranks(s))")
+[ "$(sed -n 1p <<<"$out")" = "['b', 'a', 'c']" ] && ok "파레토(max): 지배되는 d 제외" || no "pareto max: $out"
+[ "$(sed -n 2p <<<"$out")" = "['b', 'a', 'c']" ] && ok "파레토(min): 값이 작을수록 좋음, 지배되는 d 제외" || no "pareto min: $out"
+[ "$(sed -n 3p <<<"$out")" = "[500.0, None, 500.0] [2, None, 1]" ] || [ "$(sed -n 3p <<<"$out")" = "[500.0, None, 500.0] [1, None, 2]" ] \
+  && ok "score = 값/가격, 결측 None" || no "scores: $out"
+out=$(py "
+import json
+d = json.load(open('$BASE/site/data/_pricing.json'))
+print(len(d['instances']), sorted(d['scenarios']), len(d['metrics']))")
+[ "$out" = "54 ['fleet', 'on_demand'] 11" ] && ok "_pricing.json: 54개 인스턴스 × 시나리오 2 × 헤드라인 11" || no "_pricing.json: $out"
+
+echo "== Task 4: 작업 단위당 비용(unit_cost) =="
+out=$(py "
+import json, unit_cost as uc
+from common import PRICE
+e = json.load(open('$BASE/site/data/nginx.json'))
+names = list(e['instances'])
+m = e['unit_cost']['metrics']['usd_per_1m_requests']
+i = names.index('c8g.xlarge')
+want = PRICE['c8g.xlarge'] / 3600 / (e['instances']['c8g.xlarge']['req_sec'] * e['unit_cost']['utilization']) * 1e6
+print(abs(m['values'][i] / want - 1) < 1e-5, m['values'][m['rank'].index(1)] == min(v for v in m['values'] if v is not None))
+s = uc.UNITS['kafka']['usd_per_tb_produced']
+print(round(uc.cost(1e12 / 2 ** 20 / 3600, 1.0, s, 1.0), 6))
+s = uc.UNITS['iperf3']['usd_per_tb_transferred']
+print(round(uc.cost(8e12 / 1e9 / 3600, 1.0, s, 1.0), 6))
+s = uc.UNITS['clickhouse']['usd_per_1k_query_sets']
+print(round(uc.cost(3.6, 1.0, s, 1.0), 6), round(uc.cost(3.6, 1.0, s, 0.5), 6), uc.cost(None, 1.0, s), uc.cost(3.6, None, s))
+inst = {'a': {'req_sec': 100.0}, 'b': {'req_sec': None}, 'c': {'req_sec': 400.0}}
+meta = {'a': {'price': 0.36}, 'b': {'price': 0.36}, 'c': {'price': 0.36}}
+r = uc.build('nginx', inst, 1.0, meta)['metrics']['usd_per_1m_requests']
+print(r['values'], r['rank'], uc.build('sysbench', inst, 1.0, meta))")
+[ "$(sed -n 1p <<<"$out")" = "True True" ] && ok "nginx \$/1M 요청 = 가격/3600/(req_sec × 사용률) × 1e6, rank 1 = 최저" || no "nginx: $out"
+[ "$(sed -n 2p <<<"$out")" = "1.0" ] && ok "kafka \$/TB: MB/s는 2^20 바이트, 1시간에 1 TB → 1시간 가격" || no "kafka: $out"
+[ "$(sed -n 3p <<<"$out")" = "1.0" ] && ok "iperf3 \$/TB: 1시간에 1 TB 전송 → 1시간 가격" || no "iperf3: $out"
+[ "$(sed -n 4p <<<"$out")" = "1.0 2.0 None None" ] && ok "clickhouse \$/1000 세트: 사용률 50%면 2배, 결측 None" || no "clickhouse: $out"
+[ "$(sed -n 5p <<<"$out")" = "[1.0, None, 0.25] [2, None, 1] None" ] && ok "봉투 순서 배열 + 순위, 단위 정의 없는 벤치마크는 None" || no "build: $out"
+
+echo "== Task 5: data.json 기반 봉투(clickhouse/kafka)도 실효 가격으로 =="
+out=$(py "
+import json
+from common import PRICE, RESULTS_DIR, set_prices
+from parsers import clickhouse, kafka
+raw = json.loads((RESULTS_DIR / 'clickhouse' / 'data.json').read_text())['instances']['c5.xlarge']
+c0, k0 = clickhouse.build()['instances']['c5.xlarge'], kafka.build()['instances']['c5.xlarge']
+print(all(c0[f] == raw[f] for f in ('price', 'value', 'warmup_cost_usd')))
+od = dict(PRICE)
+set_prices({n: p / 2 if n == 'c5.xlarge' else p for n, p in od.items()})
+c = clickhouse.build()
+c1, k1 = c['instances']['c5.xlarge'], kafka.build()['instances']['c5.xlarge']
+print(c1['price'] == od['c5.xlarge'] / 2, abs(c1['value'] / c0['value'] - 2) < 0.01,
+      abs(c1['warmup_cost_usd'] / c0['warmup_cost_usd'] - 0.5) < 0.01, abs(k1['value'] / k0['value'] - 2) < 0.01)
+set_prices({n: 1e-6 if n == 'c5.xlarge' else p for n, p in od.items()})
+print(clickhouse.build()['speedup']['winners']['all']['per_dollar'])")
+[ "$(sed -n 1p <<<"$out")" = "True" ] && ok "기본 가격: clickhouse price/value/warmup_cost_usd = data.json 그대로" || no "기본 가격: $out"
+[ "$(sed -n 2p <<<"$out")" = "True True True True" ] && ok "set_prices: clickhouse price/value/warmup_cost_usd, kafka value가 실효 가격으로" || no "재가격: $out"
+[ "$(sed -n 3p <<<"$out")" = "c5.xlarge" ] && ok "speedup per_dollar 승자도 common.PRICE 기준" || no "per_dollar 승자: $out"
+grep -q "_is_number\|import _sig" "$DASH"/*.py && no "모듈 간 private 헬퍼 import 잔류" || ok "is_number는 common의 공개 헬퍼"
+
+echo ""
+echo "결과: PASS=$PASS FAIL=$FAIL"
+[ "$FAIL" -eq 0 ]
@@ -0,0 +1,79 @@
+#!/bin/bash
+# 배포 트리 생성(scripts/dashboard/publish.py) 검증 게이트.
+# 콘텐츠 해시 파일명, .gz 형제 파일, index.html의 ASSET_MANIFEST 인라인, 그리고 --out 보호(publish 표식이
+# 없는 비어 있지 않은 디렉터리는 지우지 않음)를 본다. 출력은 $TMP에만 쓴다 — site/와 dist/는 건드리지 않음.
+set -uo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+BASE="$(cd "$SCRIPT_DIR/../.." && pwd)"
+DASH="$BASE/scripts/dashboard"
+TMP=$(mktemp -d)
+trap 'rm -rf "$TMP"' EXIT
+PASS=0; FAIL=0
+ok(){ echo "  ✓ $1"; PASS=$((PASS+1)); }
+no(){ echo "  ✗ $1"; FAIL=$((FAIL+1)); }
+py(){ (cd "$DASH" && python3 -c "$1" 2>&1); }
+
+echo "== Task 1: 해시 파일명 / .gz / 매니페스트 =="
+(cd "$DASH" && python3 publish.py --out "$TMP/dist" >/dev/null 2>"$TMP/err") && ok "publish.py --out <새 경로> 성공" || no "publish: $(tail -3 "$TMP/err")"
+out=$(py "
+import gzip, hashlib, json, re
+from pathlib import Path
+import publish
+from columnar import decode_envelope, decode_table
+out = Path('$TMP/dist')
+manifest = json.loads((out / publish.MANIFEST_NAME).read_text())
+site = publish.SITE_DIR
+logical = sorted(p.relative_to(site).as_posix() for d in publish.HASHED_DIRS for p in (site / d).rglob('*') if p.is_file())
+print(sorted(manifest) == logical, len(manifest))
+bad = []
+for rel, hashed in manifest.items():
+    data = (out / hashed).read_bytes()
+    m = re.fullmatch(re.escape(Path(rel).stem) + r'\.([0-9a-f]{%d})' % publish.HASH_LEN + re.escape(Path(rel).suffix), Path(hashed).name)
+    if not m or m.group(1) != hashlib.sha256(data).hexdigest()[:publish.HASH_LEN] or (out / rel).exists():
+        bad.append(rel)
+print(bad)
+bad = []
+for f in out.rglob('*'):
+    if f.is_file() and f.suffix in publish.COMPRESSIBLE:
+        gz = f.with_name(f.name + '.gz')
+        if not gz.is_file() or gzip.decompress(gz.read_bytes()) != f.read_bytes():
+            bad.append(f.relative_to(out).as_posix())
+print(bad, (out / 'js' / 'shared.js').read_bytes() == (site / 'js' / 'shared.js').read_bytes())
+diff = []
+for rel, hashed in manifest.items():
+    if rel.startswith('data/') and not Path(rel).name.startswith('_'):
+        c, r = json.loads((out / hashed).read_text()), json.loads((site / rel).read_text())
+        if (decode_table(c) if rel == 'data/instances.json' else decode_envelope(c)) != r:
+            diff.append(rel)
+print(diff)
+index = (out / 'index.html').read_text()
+m = re.search(r'<script>window\.ASSET_MANIFEST=(\{.*?\});</script>\s*' + re.escape(publish.APP_SCRIPT_TAG), index)
+print(bool(m) and json.loads(m.group(1)) == manifest, index.count('ASSET_MANIFEST'),
+      index.replace(m.group(0), publish.APP_SCRIPT_TAG) == (site / 'index.html').read_text() if m else None)")
+[ "$(sed -n 1p <<<"$out" | cut -d' ' -f1)" = "True" ] && ok "매니페스트 키 = site/data·site/tabs의 모든 파일($(sed -n 1p <<<"$out" | cut -d' ' -f2)개)" || no "매니페스트 키: $out"
+[ "$(sed -n 2p <<<"$out")" = "[]" ] && ok "해시 경로 = <stem>.<sha256 앞 10자리><ext>, 최종 바이트 기준, 해시 없는 원래 이름은 없음" || no "해시: $out"
+[ "$(sed -n 3p <<<"$out")" = "[] True" ] && ok "압축 가능한 파일마다 .gz 형제(풀면 원본과 같음), 해시 없는 자산은 바이트 그대로" || no ".gz: $out"
+[ "$(sed -n 4p <<<"$out")" = "[]" ] && ok "data/*.json(columnar-v1 압축)을 디코드하면 site/data와 같음" || no "data: $out"
+[ "$(sed -n 5p <<<"$out")" = "True 1 True" ] && ok "index.html: app.js 태그 바로 앞에 ASSET_MANIFEST 1회 인라인(= asset-manifest.json), 나머지는 원본 그대로" || no "index.html: $out"
+(cd "$DASH" && python3 publish.py --out "$TMP/dist2" >/dev/null 2>&1)
+diff -r "$TMP/dist" "$TMP/dist2" >/dev/null && ok "같은 site/ -> 같은 파일명·바이트(.gz mtime=0 포함)" || no "재현성: $(diff -rq "$TMP/dist" "$TMP/dist2" | head -3)"
+
+echo "== Task 2: --out 보호 =="
+mkdir -p "$TMP/work/src" "$TMP/empty"; echo keep > "$TMP/work/src/main.py"; echo x > "$TMP/afile"
+out=$(cd "$DASH" && python3 publish.py --out "$TMP/work" 2>&1); code=$?
+[ "$code" -ne 0 ] && grep -q "표식" <<<"$out" && [ "$(cat "$TMP/work/src/main.py")" = keep ] \
+  && ok "표식 없는 비어 있지 않은 디렉터리는 거부하고 내용 보존" || no "남의 디렉터리: $code $out"
+(cd "$DASH" && python3 publish.py --out "$TMP/afile" >/dev/null 2>&1); code=$?
+[ "$code" -ne 0 ] && [ "$(cat "$TMP/afile")" = x ] && ok "--out이 파일이면 거부" || no "파일 경로: $code"
+(cd "$DASH" && python3 publish.py --out "$TMP/empty" >/dev/null 2>&1) && [ -f "$TMP/empty/index.html" ] \
+  && ok "빈 디렉터리는 그대로 사용" || no "빈 디렉터리"
+touch "$TMP/dist/stale.txt"
+(cd "$DASH" && python3 publish.py --out "$TMP/dist" >/dev/null 2>&1) && [ ! -e "$TMP/dist/stale.txt" ] && [ -f "$TMP/dist/.ec2bench-publish" ] \
+  && ok "이전 publish 출력(표식 있음)은 통째로 지우고 다시 씀" || no "재publish"
+(cd "$DASH" && python3 publish.py --out "$BASE/site/data" >/dev/null 2>&1); code=$?
+[ "$code" -ne 0 ] && [ -z "$(cd "$BASE" && git status --short site)" ] && ok "site/와 겹치는 경로는 거부" || no "site 겹침: $code"
+
+echo ""
+echo "결과: PASS=$PASS FAIL=$FAIL"
+[ "$FAIL" -eq 0 ]
@@ -0,0 +1,107 @@
+#!/bin/bash
+# 인스턴스 질의 엔진(scripts/dashboard/query.py + site/js/tabs/query.js) 검증 게이트.
+# 합성 봉투로 인덱스 의미(이분 탐색 = 전수 비교, null 제외, 범주/복합 목표)를, 실제 인덱스로 CLI/JS 일치를 본다.
+set -uo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+BASE="$(cd "$SCRIPT_DIR/../.." && pwd)"
+DASH="$BASE/scripts/dashboard"
+PASS=0; FAIL=0
+ok(){ echo "  ✓ $1"; PASS=$((PASS+1)); }
+no(){ echo "  ✗ $1"; FAIL=$((FAIL+1)); }
+py(){ (cd "$DASH" && python3 -c "$1" 2>&1); }
+
+echo "== Task 1: 인덱스 =="
+out=$(py "
+import json
+d = json.load(open('$BASE/site/data/_query_index.json'))
+c = d['columns']
+print(len(d['instances']), len(c) >= 100)
+print(c['price']['direction'], c['redis.set_p99_ms']['direction'], c['elasticsearch.coldstart.avg_ms']['direction'],
+      c['nginx.req_sec']['direction'], c['nginx.usd_per_1m_requests']['direction'], sorted(c['arch']['groups']))
+bad = [k for k, v in c.items() if 'order' in v and [v['values'][i] for i in v['order']] != sorted(x for x in v['values'] if x is not None)]
+print(bad)")
+[ "$(sed -n 1p <<<"$out")" = "54 True" ] && ok "_query_index.json: 54개 인스턴스 × 100+ 컬럼" || no "인덱스 크기: $out"
+[ "$(sed -n 2p <<<"$out")" = "min min min max min ['amd', 'graviton', 'intel']" ] && ok "direction: 가격/지연/헤드라인/unit_cost, 범주 groups" || no "direction: $out"
+[ "$(sed -n 3p <<<"$out")" = "[]" ] && ok "숫자 컬럼 order = 값 오름차순(null 제외)" || no "order: $out"
+
+echo "== Task 2: 제약 의미 =="
+out=$(py "
+import random, query as q
+meta = {n: {'arch': a, 'gen': g, 'family': 'C', 'mem_mb': 8192, 'price': p, 'flex': False, 'graviton_gen': None,
+            'size': 'xlarge', 'vcpu': 4} for n, a, g, p in
+        [('a', 'intel', 6, 0.2), ('b', 'graviton', 7, 0.1), ('c', 'amd', 7, 0.3), ('d', 'graviton', 8, 0.15)]}
+env = {'x': {'headline': {'field': 'rps', 'direction': 'max'},
+             'instances': {'a': {'rps': 100.0, 'p99_ms': 2.0}, 'b': {'rps': 80.0, 'p99_ms': 1.0},
+                           'c': {'rps': 100.0, 'p99_ms': None}, 'd': {'rps': 120.0, 'p99_ms': 0.5}}}}
+idx = q.build(env, meta)
+names = idx['instances']
+ops = {'<': lambda v, x: v < x, '<=': lambda v, x: v <= x, '>': lambda v, x: v > x, '>=': lambda v, x: v >= x,
+       '=': lambda v, x: v == x, '!=': lambda v, x: v != x}
+bad = 0
+for col in ['x.rps', 'x.p99_ms', 'price', 'gen']:
+    for op, f in ops.items():
+        for x in [0.5, 1.0, 1.5, 7, 80, 100, 120, 0.15, 1000]:
+            want = {i for i, v in enumerate(idx['columns'][col]['values']) if v is not None and f(v, x)}
+            bad += q.match(idx, col, op, str(x)) != want
+print(bad)
+r = lambda c, o='min:price': [row['instance'] for row in q.query(idx, c, o)['rows']]
+print(r(['x.p99_ms<5']), r(['x.p99_ms!=1']), r(['arch=graviton,AMD']), r(['arch!=graviton', 'gen>=7']))
+print(r([], 'max:x.rps'), r([], 'max:x.rps,x.p99_ms'), r([], 'max:x.rps,+x.p99_ms'))
+for c, o in [(['x.rps~1'], 'min:price'), (['nope<1'], 'min:price'), (['arch<1'], 'min:price'), (['price<abc'], 'min:price'),
+             ([], 'min:x.rps,price'), ([], 'max:arch'), ([], 'price')]:
+    try:
+        q.query(idx, c, o)
+        print('no error', c, o)
+    except ValueError:
+        pass
+print('errors ok')
+env['x']['instances']['b']['fails'] = 0.0
+env['x']['instances']['d']['fails'] = 2.0
+idx = q.build(env, meta)
+try:
+    q.query(idx, [], 'max:x.rps,x.fails')
+    print('no error')
+except ValueError as e:
+    print('x.fails' in str(e) and 'domain' not in str(e), r([], 'min:x.fails'))")
+[ "$(sed -n 1p <<<"$out")" = "0" ] && ok "이분 탐색 결과 = 전수 비교(4컬럼 × 6연산자 × 9값)" || no "match: $out"
+[ "$(sed -n 2p <<<"$out")" = "['b', 'd', 'a'] ['d', 'a'] ['b', 'd', 'c'] ['c']" ] && ok "null은 어떤 제약도 불통과, 범주 =/!= 쉼표·대소문자" || no "제약: $out"
+# 복합: rps/120, 0.5/p99 기하평균 — d 1.0, b 0.577, a 0.456, c(p99 null) 제외. +p99(클수록 좋음)면 a 0.913, b 0.577, d 0.5
+[ "$(sed -n 3p <<<"$out")" = "['d', 'a', 'c', 'b'] ['d', 'b', 'a'] ['a', 'b', 'd']" ] && ok "목표: max 단일(동점은 이름순), 복합 기하평균(null 제외), +로 방향 강제" || no "목표: $out"
+[ "$(sed -n 4p <<<"$out")" = "errors ok" ] && ok "잘못된 제약/컬럼/연산자/값/목표는 ValueError" || no "에러: $out"
+[ "$(sed -n 5p <<<"$out")" = "True ['b', 'd']" ] && ok "0이 최고값인 min 항(failed 0건)은 복합 항 거부, 단일 목표로는 1위" || no "0 값 항: $out"
+
+echo "== Task 3: CLI / 사이트 =="
+out=$(cd "$DASH" && python3 query.py "redis.set_p99_ms<1" "nginx.req_sec>=80000" "arch!=intel" --top 3 2>&1)
+grep -q "^조건 만족 18/54개" <<<"$out" && sed -n 3p <<<"$out" | grep -q " c6g.xlarge " && ok "CLI: p99<1 ∧ nginx≥80k ∧ ¬intel 최저가 c6g.xlarge" || no "CLI: $out"
+(cd "$DASH" && python3 query.py "bogus<1" >/dev/null 2>&1) && no "CLI: 알 수 없는 컬럼이 exit 0" || ok "CLI: 알 수 없는 컬럼은 exit 1"
+out=$(cd "$DASH" && python3 query.py --objective max:nginx.req_sec,kafka.failed_count 2>&1); code=$?
+[ "$code" = "1" ] && grep -q "kafka.failed_count에 0 이하 값" <<<"$out" && ok "CLI: 0 값이 있는 컬럼(failed_count)의 복합 항은 명확한 오류로 exit 1" || no "0 값 복합 항: $code $out"
+grep -q "id: 'query'" "$BASE/site/js/app.js" && [ -f "$BASE/site/tabs/query.html" ] && ok "사이트: 인스턴스 찾기 탭 등록" || no "탭 등록"
+if command -v node >/dev/null; then
+  CASES='[[["redis.set_p99_ms<1","nginx.req_sec>=80000","arch!=intel"],"min:price"],[["size=xlarge","gen>=7"],"max:nginx.req_sec,redis.set_rps,-redis.set_p99_ms"],[["family=c,m","price!=0.18","clickhouse.usd_per_1k_query_sets<=8"],"min:clickhouse.hot_total_s"],[["iperf3.loss_pct>=0.01"],"max:iperf3.parallel_gbps"]]'
+  js=$(node --input-type=module -e "
+import fs from 'fs';
+const { runQuery } = await import('$BASE/site/js/tabs/query.js');
+const index = JSON.parse(fs.readFileSync('$BASE/site/data/_query_index.json'));
+for (const [c, o] of JSON.parse(process.argv[1])) { const r = runQuery(index, c, o, 1000); console.log(JSON.stringify([r.matched, r.rows.map((x) => x.instance)])); }" "$CASES" 2>&1)
+  pyo=$(py "
+import json, query as q
+idx = q.load_index()
+for c, o in json.loads('''$CASES'''):
+    r = q.query(idx, c, o)
+    print(json.dumps([r['matched'], [x['instance'] for x in r['rows']]], separators=(',', ':')))")
+  [ -n "$js" ] && [ "$js" = "$pyo" ] && ok "query.js = query.py (질의 4건 결과·순서 동일)" || no "JS/Python 불일치: $js / $pyo"
+  js=$(node --input-type=module -e "
+import fs from 'fs';
+const { runQuery } = await import('$BASE/site/js/tabs/query.js');
+const index = JSON.parse(fs.readFileSync('$BASE/site/data/_query_index.json'));
+try { runQuery(index, [], 'max:nginx.req_sec,kafka.failed_count', 10); console.log('no error'); } catch (e) { console.log(e.message.split(' ')[3]); }" 2>&1)
+  [ "$js" = "kafka.failed_count에" ] && ok "query.js: 0 값 컬럼의 복합 항도 같은 오류" || no "JS 0 값 복합 항: $js"
+else
+  echo "  - node 없음: JS 일치 검사 생략"
+fi
+
+echo ""
+echo "결과: PASS=$PASS FAIL=$FAIL"
+[ "$FAIL" -eq 0 ]
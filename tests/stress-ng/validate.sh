@@ -0,0 +1,104 @@
+#!/bin/bash
+# stress-ng stressor 분해(scripts/dashboard/parsers/stress_ng.py)와 로그 단위 파싱 캐시(cache.ParseCache) 검증 게이트.
+# 합성 로그로 섹션 -> 필드 대응을, 실제 로그로 stressor 평균/cpu_util을, 임시 캐시 디렉터리로 적중/무효화를 본다.
+# 캐시는 $TMP에만 쓴다 — scripts/dashboard/.cache와 site/data는 건드리지 않음.
+set -uo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+BASE="$(cd "$SCRIPT_DIR/../.." && pwd)"
+DASH="$BASE/scripts/dashboard"
+TMP=$(mktemp -d)
+trap 'rm -rf "$TMP"' EXIT
+PASS=0; FAIL=0
+ok(){ echo "  ✓ $1"; PASS=$((PASS+1)); }
+no(){ echo "  ✗ $1"; FAIL=$((FAIL+1)); }
+py(){ (cd "$DASH" && python3 -c "$1" 2>&1); }
+
+echo "== Task 1: 합성 로그 파싱 =="
+row(){ printf "stress-ng: info:  [%s] %-12s %10s %9s %9s %9s %12s %12s\n" "$@"; }
+{ echo "CPUs: 2"
+  echo "--- CPU Float Operations ---"
+  echo "stress-ng: info:  [1] stressor       bogo ops real time  usr time  sys time   bogo ops/s     bogo ops/s"
+  row 1 cpu 1000 10.00 19.00 1.00 100.00 50.00
+  echo "--- CPU Integer Operations ---"
+  row 2 cpu 4000 10.00 18.00 0.00 400.00 222.22
+  echo "--- Memory Bandwidth (memmove) ---"
+  row 3 memmove 30 10.00 5.00 5.00 3.00 1.50
+  echo "--- Context Switch ---"
+  row 4 switch 800 10.00 2.00 8.00 80.00 80.00
+  echo "--- Branch Prediction ---"
+  echo "stress-ng: info:  [5] dispatching hogs: 2 branch"; } > "$TMP/run1.log"
+out=$(py "
+from pathlib import Path
+from parsers import stress_ng
+p = stress_ng.parse_log(Path('$TMP/run1.log'))
+s = p['stressors']
+print(p['cpus'], sorted(s))
+print(s['float']['bogo_ops'], s['int']['bogo_ops'], s['int']['ops_cpu'], s['ctx_switch']['sys_s'], s['memmove']['ops_real'])")
+[ "$(sed -n 1p <<<"$out")" = "2 ['ctx_switch', 'float', 'int', 'memmove']" ] \
+  && ok "같은 cpu stressor를 섹션으로 float/int 구분, 모르는 섹션은 stressor명, 행 없는 섹션/헤더 줄은 무시" || no "키: $out"
+[ "$(sed -n 2p <<<"$out")" = "1000.0 4000.0 222.22 8.0 3.0" ] && ok "행 6열 -> bogo_ops/real/usr/sys/ops_real/ops_cpu" || no "값: $out"
+
+echo "== Task 2: 실제 로그 stressor 평균 (c7g.xlarge) =="
+out=$(py "
+import json, statistics
+import cache
+cache.CACHE_DIR = __import__('pathlib').Path('$TMP/cache')
+from cache import ParseCache
+from columnar import decode_envelope
+from common import RESULTS_DIR, SITE_DATA_DIR
+from health import usable_logs
+from parsers import stress_ng
+logs = usable_logs('stress-ng', sorted((RESULTS_DIR / 'stress-ng' / 'c7g.xlarge').glob('run*.log')))
+parsed = [stress_ng.parse_log(lp) for lp in logs]
+got = stress_ng.build_stressors('c7g.xlarge', ParseCache('gate', 1))
+m = got['matrix']
+rows = [p['stressors']['matrix'] for p in parsed]
+util = statistics.fmean((r['usr_s'] + r['sys_s']) / (r['real_s'] * p['cpus']) for r, p in zip(rows, parsed))
+print(m['runs'] == len(logs) == 5, abs(m['ops_real'] - round(statistics.fmean(r['ops_real'] for r in rows), 4)) < 1e-9, abs(m['cpu_util'] - round(util, 4)) < 1e-9)
+print(sorted(stress_ng.SECTION_KEYS.values()) == sorted(k for k in got if k in stress_ng.SECTION_KEYS.values()), all(0 < v['cpu_util'] <= 1.05 for v in got.values()))
+env = decode_envelope(json.loads((SITE_DATA_DIR / 'stress-ng.json').read_text()))
+print(env['instances']['c7g.xlarge']['stressors'] == json.loads(json.dumps(got)))")
+[ "$(sed -n 1p <<<"$out")" = "True True True" ] && ok "matrix: runs 5, ops_real = run 평균, cpu_util = (usr+sys)/(real×CPUs) 평균(common.mean 4자리)" || no "평균: $out"
+[ "$(sed -n 2p <<<"$out")" = "True True" ] && ok "SECTION_KEYS 7개 모두 존재, cpu_util 0~1" || no "섹션: $out"
+[ "$(sed -n 3p <<<"$out")" = "True" ] && ok "site/data/stress-ng.json stressors = 다시 계산한 값" || no "봉투: $out"
+
+echo "== Task 3: ParseCache 적중/무효화 =="
+out=$(py "
+import json
+from pathlib import Path
+import cache
+cache.CACHE_DIR = Path('$TMP/cache')
+from cache import ParseCache
+from common import RESULTS_DIR
+from parsers import stress_ng
+lp = RESULTS_DIR / 'stress-ng' / 'c7g.xlarge' / 'run1.log'
+def boom(p):
+    raise AssertionError('적중이어야 함')
+c1 = ParseCache('hit', 1)
+v1 = c1.get(lp, stress_ng.parse_log)
+c1.save()
+c2 = ParseCache('hit', 1)
+v2 = c2.get(lp, boom)
+print(c1.misses, c2.hits, c2.misses, v2 == v1 == json.loads(json.dumps(stress_ng.parse_log(lp))))
+c3 = ParseCache('hit', 2)
+c3.get(lp, stress_ng.parse_log)
+raw = json.loads((cache.CACHE_DIR / 'hit.json').read_text())
+raw['entries'][str(lp.relative_to(cache.BASE_DIR))]['sig'][0] -= 1
+(cache.CACHE_DIR / 'hit.json').write_text(json.dumps(raw))
+c4 = ParseCache('hit', 1)
+c4.get(lp, stress_ng.parse_log)
+print(c3.misses, c4.misses)
+c5 = ParseCache('two', 1)
+a = stress_ng.build_stressors('c7g.xlarge', c5)
+c5.save()
+c6 = ParseCache('two', 1)
+b = stress_ng.build_stressors('c7g.xlarge', c6)
+print(a == b, c6.hits, c6.misses)")
+[ "$(sed -n 1p <<<"$out")" = "1 1 0 True" ] && ok "저장 후 새 인스턴스: 같은 서명이면 parse 호출 없이 같은 결과(JSON 왕복)" || no "적중: $out"
+[ "$(sed -n 2p <<<"$out")" = "1 1" ] && ok "PARSER_VERSION이 다르거나 (mtime_ns, size) 서명이 다르면 다시 파싱" || no "무효화: $out"
+[ "$(sed -n 3p <<<"$out")" = "True 5 0" ] && ok "build_stressors: 캐시 적중 5/5, 결과 동일" || no "build_stressors 캐시: $out"
+
+echo ""
+echo "결과: PASS=$PASS FAIL=$FAIL"
+[ "$FAIL" -eq 0 ]
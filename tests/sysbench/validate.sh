@@ -0,0 +1,61 @@
+#!/bin/bash
+# sysbench 파서(scripts/dashboard/parsers/sysbench.py) 검증 게이트.
+# 실제 로그 1개의 inner run 파싱(events/s·Latency·Threads fairness)과 합성 로그의 경계(Single Thread 섹션 분리,
+# 3블록 상한)를 보고, 봉투의 cpu_mt = mean(cpu_mt_all)을 전 인스턴스에서 확인한다. site/data는 읽기만.
+set -uo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+BASE="$(cd "$SCRIPT_DIR/../.." && pwd)"
+DASH="$BASE/scripts/dashboard"
+TMP=$(mktemp -d)
+trap 'rm -rf "$TMP"' EXIT
+PASS=0; FAIL=0
+ok(){ echo "  ✓ $1"; PASS=$((PASS+1)); }
+no(){ echo "  ✗ $1"; FAIL=$((FAIL+1)); }
+py(){ (cd "$DASH" && python3 -c "$1" 2>&1); }
+
+echo "== Task 1: 실제 로그 inner run 파싱 (results/sysbench-cpu/c7g.xlarge/run1.log) =="
+out=$(py "
+from common import RESULTS_DIR
+from parsers import sysbench
+mt, st, runs = sysbench.parse_cpu_log(RESULTS_DIR / 'sysbench-cpu' / 'c7g.xlarge' / 'run1.log')
+col = lambda k: [r[k] for r in runs]
+print(len(runs), col('events_per_sec'), round(mt, 4) == round((4493.13 + 4543.32 + 4544.84) / 3, 4), st is not None)
+print(col('lat_min_ms'), col('lat_avg_ms'), col('lat_max_ms'), col('lat_p95_ms'))
+print(col('fairness_avg'), col('fairness_stddev'))")
+[ "$(sed -n 1p <<<"$out")" = "3 [4493.13, 4543.32, 4544.84] True True" ] && ok "멀티스레드 3블록 events/s, cpu_mt = 3회 평균, single thread 별도" || no "events: $out"
+[ "$(sed -n 2p <<<"$out")" = "[0.87, 0.87, 0.87] [0.89, 0.88, 0.88] [33.86, 30.88, 30.9] [0.89, 0.89, 0.89]" ] \
+  && ok "Latency min/avg/max/p95 블록별" || no "latency: $out"
+[ "$(sed -n 3p <<<"$out")" = "[67399.0, 68152.5, 68174.25] [101.64, 97.89, 126.53]" ] && ok "Threads fairness events avg/stddev" || no "fairness: $out"
+
+echo "== Task 2: 합성 로그 경계 =="
+block(){ printf -- "--- Run %s/3 ---\n    events per second:  %s\nLatency (ms):\n         min:   %s\n         avg:   2.00\n         max:   9.00\n         95th percentile:   3.00\nThreads fairness:\n    events (avg/stddev):           100.0000/%s\n\n" "$@"; }
+{ block 1 100.00 1.00 5.00; block 2 200.00 1.10; block 3 300.00 1.20 7.00; block 4 900.00 0.50 1.00
+  printf "===== Single Thread Performance =====\n    events per second:  55.50\nLatency (ms):\n         min:   0.01\n"; } > "$TMP/cpu.log"
+out=$(py "
+from pathlib import Path
+from parsers import sysbench
+mt, st, runs = sysbench.parse_cpu_log(Path('$TMP/cpu.log'))
+print(mt, st, [r['events_per_sec'] for r in runs], [r['lat_min_ms'] for r in runs], [r['fairness_stddev'] for r in runs])")
+[ "$out" = "200.0 55.5 [100.0, 200.0, 300.0] [1.0, 1.1, 1.2] [5.0, None, 7.0]" ] \
+  && ok "3블록 상한, Single Thread 값이 inner run에 새지 않음, 빠진 필드는 None" || no "합성 로그: $out"
+
+echo "== Task 3: 봉투 불변식 (site/data/sysbench.json) =="
+out=$(py "
+import json, statistics
+from columnar import decode_envelope
+from common import RESULTS_DIR, SITE_DATA_DIR
+from health import usable_logs
+d = decode_envelope(json.loads((SITE_DATA_DIR / 'sysbench.json').read_text()))['instances']
+print(len(d), [n for n, e in d.items() if abs(e['cpu_mt'] - statistics.fmean(e['cpu_mt_all'])) > 1e-6 * e['cpu_mt']])
+n_logs = {n: len(usable_logs('sysbench-cpu', sorted((RESULTS_DIR / 'sysbench-cpu' / n).glob('run*.log')))) for n in d}
+print([n for n, e in d.items() if len(e['cpu_mt_all']) != 3 * n_logs[n]])
+print([n for n, e in d.items() if not e['cpu_latency_min_ms'] <= e['cpu_latency_avg_ms'] <= e['cpu_latency_max_ms']
+       or abs(e['cpu_mt_stddev'] - statistics.stdev(e['cpu_mt_all'])) > 0.01 or e['cpu_fairness_cv'] is None])")
+[ "$(sed -n 1p <<<"$out")" = "54 []" ] && ok "54개 인스턴스 모두 cpu_mt = mean(cpu_mt_all)" || no "cpu_mt: $out"
+[ "$(sed -n 2p <<<"$out")" = "[]" ] && ok "cpu_mt_all = usable 로그 수 × 3 inner run" || no "cpu_mt_all 길이: $out"
+[ "$(sed -n 3p <<<"$out")" = "[]" ] && ok "latency min <= avg <= max, cpu_mt_stddev = stdev(cpu_mt_all), fairness cv 존재" || no "파생 필드: $out"
+
+echo ""
+echo "결과: PASS=$PASS FAIL=$FAIL"
+[ "$FAIL" -eq 0 ]